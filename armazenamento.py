@@ -0,0 +1,436 @@
+# armazenamento.py
+
+"""
+armazenamento.py
+
+Descrição:
+-----------
+Este módulo implementa um armazenamento colunar intermediário em arquivos mapeados em memória (numpy memmap),
+permitindo gerar datasets maiores que a memória RAM disponível. Em vez de manter todo o dataset como uma lista de
+listas de objetos Python, cada coluna do cabeçalho é gravada em um arquivo ".npy" próprio dentro de um diretório,
+e as etapas seguintes do pipeline do modo original (ordenação por data e exportação) operam diretamente sobre
+esses arquivos, processando blocos de linhas de tamanho limitado.
+
+Sem diretório (`diretorio=None`), as mesmas colunas tipadas ficam em arrays NumPy na memória RAM
+(`--armazenamento colunar`): uma linha do modo original como lista Python ocupa alguns KB (89 objetos, cada
+número com seu próprio objeto), enquanto as colunas tipadas ocupam poucas centenas de bytes por linha.
+
+Representação das Colunas (conforme TIPOS_COLUNAS_ORIGINAL em config.py):
+--------------------------------------------------------------------------
+- "inteiro": int64.
+- "decimal": float64; valores None são gravados como NaN e voltam a ser vazios na exportação.
+- "data": datetime64[D].
+- "categoria": códigos int32 + dicionário de valores (código -1 representa None).
+- "texto": bytes UTF-8 de largura fixa (LARGURA_TEXTO); textos maiores são truncados.
+
+Na memória RAM, as colunas começam com o menor tipo inteiro (int8) e são alargadas (int16, int32, int64) quando
+um bloco anexado não cabe nelas:
+- "inteiro": o próprio valor.
+- "decimal": centavos (os geradores arredondam as métricas para duas casas). Se um bloco tiver um valor que não
+  volte idêntico dos centavos (mais casas decimais), a coluna passa a float64. float32 não é usado: valores como
+  123456.78 não voltariam iguais no CSV. Os None (métricas que o segmento da linha não possui) ficam em um bitmap
+  de validade por coluna (`validade`, 1 bit por linha, criado no primeiro None), e não nos valores; a leitura
+  devolve NaN onde o bit é zero, e os escritores gravam vazio.
+- "categoria" e "texto": códigos + dicionário (sem truncamento dos textos), com o tipo dos códigos dado pelo
+  tamanho do dicionário (`categorias.tipo_codigo`).
+
+Funcionalidades:
+-----------------
+- ArmazenamentoColunar(diretorio, cabecalho, tipos, capacidade): cria os arquivos das colunas (ou, com
+  diretorio=None, as colunas na memória).
+- ArmazenamentoColunar.abrir(diretorio): reabre um armazenamento gravado anteriormente.
+- anexar(linhas): acrescenta um bloco de linhas (lista de listas, na ordem do cabeçalho).
+- aplicar_outliers(probabilidade): versão colunar de `gerar_dados_com_outliers`, aplicada bloco a bloco.
+- ordenar(coluna): calcula a ordem estável das linhas por uma coluna de data, com counting sort externo
+  (dois passes em blocos); a ordem é gravada em "ordem.npy", sem reescrever as colunas.
+- colunas_bloco(inicio, fim): devolve um bloco (na ordem calculada) como dicionário {coluna: array}, com as
+  colunas codificadas como ColunaCategorica, no mesmo formato do motor em lote.
+- ler_bloco(inicio, fim): devolve um bloco de linhas (na ordem calculada) já convertidas para valores Python.
+- exportar_csv(nome_arquivo, estatisticas): grava o CSV final percorrendo a ordem em blocos.
+- exportar_particionado(escritor, estatisticas): envia as colunas, na mesma ordem e em blocos, a um
+  EscritorParticionado (particionamento.py).
+- As duas exportações consomem os blocos de `colunas_bloco` (os valores só viram objetos Python no momento da
+  escrita), e um AcumuladorEstatisticas (estatisticas.py) opcional recebe cada bloco gravado, sem uma leitura
+  adicional das colunas.
+- salvar_metadados(): grava cabeçalho, tipos, tamanho e dicionários, permitindo reabrir o armazenamento
+  (apenas com diretório).
+- memoria_utilizada(): bytes ocupados pelas colunas, pelos dicionários e pela ordem.
+
+Observações:
+-------------
+- A memória utilizada depende apenas do tamanho do bloco (`TAMANHO_BLOCO`) e da quantidade de dias distintos,
+  e não da quantidade total de linhas. As linhas geradas são anexadas em blocos de `TAMANHO_BLOCO_ANEXAR`, para
+  que a lista de linhas pendentes não ocupe mais memória do que as próprias colunas.
+- O main.py aplica os outliers em cada linha antes de anexá-la (como no modo em memória), para que a sequência
+  aleatória e a autocorrelação sejam as mesmas: com a mesma semente, o CSV exportado é idêntico ao de
+  `--armazenamento memoria`. `aplicar_outliers` continua disponível para aplicar outliers a um armazenamento já
+  gravado; nos dois casos, colunas inteiras que recebem outliers são arredondadas para o inteiro mais próximo.
+"""
+
+import csv
+import json
+import os
+import sys
+
+import numpy as np
+
+from categorias import ColunaCategorica, tipo_codigo
+from geradores import gerar_dados_com_outliers_colunar
+from util import linhas_de_colunas
+
+TAMANHO_BLOCO = 100_000
+TAMANHO_BLOCO_ANEXAR = 10_000
+LARGURA_TEXTO = 96
+
+_DTYPES = {
+    "inteiro": np.int64,
+    "decimal": np.float64,
+    "data": "datetime64[D]",
+    "categoria": np.int32,
+    "texto": f"S{LARGURA_TEXTO}",
+}
+
+_LARGURAS = (np.int8, np.int16, np.int32, np.int64)
+
+_ARQUIVO_METADADOS = "metadados.json"
+_ARQUIVO_ORDEM = "ordem.npy"
+
+
+def _largura(valores):
+    """
+    Retorna o menor tipo inteiro de _LARGURAS que comporta os valores.
+    """
+    if len(valores) == 0:
+        return _LARGURAS[0]
+    minimo, maximo = valores.min(), valores.max()
+    for dtype in _LARGURAS:
+        limites = np.iinfo(dtype)
+        if limites.min <= minimo and maximo <= limites.max:
+            return dtype
+    raise ValueError(f"Valores fora do intervalo de int64 ({minimo}, {maximo}).")
+
+
+def _para_centavos(valores):
+    """
+    Converte decimais (sem NaN) em centavos; retorna None se algum valor não voltar idêntico da divisão por 100
+    ou passar de 2**53.
+    """
+    centavos = np.rint(valores * 100)
+    if not ((centavos / 100 == valores) & (np.abs(centavos) < 2 ** 53)).all():
+        return None
+    return centavos
+
+
+def _gravar_bits(bitmap, inicio, bits):
+    """
+    Grava um vetor booleano em um bitmap (bit menos significativo primeiro) a partir da posição `inicio`.
+    """
+    primeiro, ultimo = inicio // 8, (inicio + len(bits) + 7) // 8
+    trecho = np.unpackbits(bitmap[primeiro:ultimo], bitorder="little")
+    deslocamento = inicio - 8 * primeiro
+    trecho[deslocamento:deslocamento + len(bits)] = bits
+    bitmap[primeiro:ultimo] = np.packbits(trecho, bitorder="little")
+
+
+def _ler_bits(bitmap, posicoes):
+    return ((bitmap[posicoes >> 3] >> (posicoes & 7)) & 1).astype(bool)
+
+
+class ArmazenamentoColunar:
+    """
+    Armazenamento colunar em arquivos mapeados em memória, com uma coluna por arquivo.
+    - diretorio: diretório onde os arquivos serão criados (None = colunas na memória RAM).
+    - cabecalho: lista com os nomes das colunas, na ordem das linhas.
+    - tipos: dicionário nome da coluna -> tipo lógico (ver TIPOS_COLUNAS_ORIGINAL).
+    - capacidade: quantidade máxima de linhas.
+    """
+
+    def __init__(self, diretorio, cabecalho, tipos, capacidade, _modo="w+"):
+        self.diretorio = diretorio
+        self.cabecalho = list(cabecalho)
+        self.tipos = {nome: tipos[nome] for nome in self.cabecalho}
+        self.capacidade = capacidade
+        self.tamanho = 0
+        self.dicionarios = {nome: [] for nome, tipo in self.tipos.items()
+                            if tipo == "categoria" or (tipo == "texto" and diretorio is None)}
+        self._codigos = {nome: {} for nome in self.dicionarios}
+        self._centavos = {nome for nome, tipo in self.tipos.items() if tipo == "decimal" and diretorio is None}
+        self.validade = {}
+        self.ordem = None
+
+        if diretorio is None:
+            self.colunas = {nome: np.empty(capacidade, dtype=_DTYPES["data"] if tipo == "data" else _LARGURAS[0])
+                            for nome, tipo in self.tipos.items()}
+            return
+        os.makedirs(diretorio, exist_ok=True)
+        self.colunas = {
+            nome: np.lib.format.open_memmap(
+                self._caminho(nome), mode=_modo, dtype=_DTYPES[tipo], shape=(capacidade,)
+            ) if _modo == "w+" else np.load(self._caminho(nome), mmap_mode=_modo)
+            for nome, tipo in self.tipos.items()
+        }
+
+    @classmethod
+    def abrir(cls, diretorio, modo="r+"):
+        """
+        Reabre um armazenamento gravado anteriormente (colunas, dicionários e ordem).
+        """
+        with open(os.path.join(diretorio, _ARQUIVO_METADADOS), encoding="utf-8") as arquivo:
+            metadados = json.load(arquivo)
+        armazenamento = cls(diretorio, metadados["cabecalho"], metadados["tipos"],
+                            metadados["capacidade"], _modo=modo)
+        armazenamento.tamanho = metadados["tamanho"]
+        armazenamento.dicionarios = metadados["dicionarios"]
+        armazenamento._codigos = {
+            nome: {valor: codigo for codigo, valor in enumerate(valores)}
+            for nome, valores in armazenamento.dicionarios.items()
+        }
+        caminho_ordem = os.path.join(diretorio, _ARQUIVO_ORDEM)
+        if os.path.exists(caminho_ordem):
+            armazenamento.ordem = np.load(caminho_ordem, mmap_mode="r")
+        return armazenamento
+
+    def _caminho(self, nome):
+        return os.path.join(self.diretorio, f"{nome}.npy")
+
+    # ------------------------------------------------------------------
+    # Escrita
+    # ------------------------------------------------------------------
+
+    def _codificar_categoria(self, nome, valores):
+        """
+        Converte os valores de uma coluna categórica em códigos, ampliando o dicionário quando necessário.
+        """
+        codigos = self._codigos[nome]
+        dicionario = self.dicionarios[nome]
+        resultado = np.empty(len(valores), dtype=np.int32)
+        for i, valor in enumerate(valores):
+            if valor is None:
+                resultado[i] = -1
+                continue
+            codigo = codigos.get(valor)
+            if codigo is None:
+                codigo = codigos[valor] = len(dicionario)
+                dicionario.append(valor)
+            resultado[i] = codigo
+        return resultado
+
+    def _converter_coluna(self, nome, valores):
+        """
+        Converte uma coluna de valores Python para a representação NumPy do seu tipo.
+        """
+        tipo = self.tipos[nome]
+        if tipo == "decimal":
+            return np.array(valores, dtype=np.float64)
+        if tipo == "inteiro":
+            return np.rint(np.array(valores, dtype=np.float64)).astype(np.int64)
+        if tipo == "data":
+            return np.array(valores, dtype="datetime64[D]")
+        if nome in self.dicionarios:
+            return self._codificar_categoria(nome, valores)
+        return np.array([("" if v is None else str(v)).encode("utf-8")[:LARGURA_TEXTO] for v in valores],
+                        dtype=_DTYPES["texto"])
+
+    def anexar(self, linhas):
+        """
+        Acrescenta um bloco de linhas (lista de listas, na ordem do cabeçalho) ao armazenamento.
+        """
+        if not linhas:
+            return
+        inicio, fim = self.tamanho, self.tamanho + len(linhas)
+        if fim > self.capacidade:
+            raise ValueError(f"Capacidade do armazenamento excedida ({fim} > {self.capacidade} linhas).")
+        for nome, valores in zip(self.cabecalho, zip(*linhas)):
+            self._gravar(nome, inicio, fim, self._converter_coluna(nome, valores))
+        self.tamanho = fim
+        self.ordem = None
+
+    def _gravar(self, nome, inicio, fim, valores):
+        """
+        Grava um trecho de coluna. Na memória RAM:
+        - os None das colunas decimais vão para o bitmap de validade da coluna (criado no primeiro None);
+        - uma coluna de centavos passa a float64 se o trecho não puder ser representado em centavos;
+        - a coluna é alargada quando o trecho não cabe no tipo inteiro atual.
+        """
+        if self.diretorio is None and self.tipos[nome] == "decimal":
+            nulos = np.isnan(valores)
+            if nome not in self.validade and nulos.any():
+                self.validade[nome] = np.full((self.capacidade + 7) // 8, 0xFF, dtype=np.uint8)
+            if nome in self.validade:
+                _gravar_bits(self.validade[nome], inicio, ~nulos)
+                valores = np.where(nulos, 0.0, valores)
+            if nome in self._centavos:
+                centavos = _para_centavos(valores)
+                if centavos is None:
+                    self.colunas[nome] = self.colunas[nome] / 100
+                    self._centavos.discard(nome)
+                else:
+                    valores = centavos
+        coluna = self.colunas[nome]
+        if self.diretorio is None and coluna.dtype.kind == "i":
+            largura = tipo_codigo(len(self.dicionarios[nome])) if nome in self.dicionarios else _largura(valores)
+            largura = np.promote_types(coluna.dtype, largura)
+            if largura != coluna.dtype:
+                coluna = self.colunas[nome] = coluna.astype(largura)
+        coluna[inicio:fim] = valores
+
+    def aplicar_outliers(self, probabilidade_outlier=0.01, tamanho_bloco=TAMANHO_BLOCO):
+        """
+        Aplica outliers com a mesma regra de `gerar_dados_com_outliers`, de forma vetorizada e bloco a bloco:
+        cada linha é sorteada com a probabilidade informada e, para as sorteadas, uma coluna de
+        INDICES_OUTLIERS é multiplicada por um fator entre 0.5 e 2.0 e ajustada aos limites da coluna.
+        Na memória RAM, as colunas numéricas são convertidas em decimais bloco a bloco e regravadas após os
+        outliers.
+        """
+        for inicio in range(0, self.tamanho, tamanho_bloco):
+            fim = min(inicio + tamanho_bloco, self.tamanho)
+            if self.diretorio is not None:
+                gerar_dados_com_outliers_colunar(self.colunas, self.tipos, probabilidade_outlier,
+                                                 rng=np.random, inicio=inicio, fim=fim)
+                continue
+            numericas = {nome: self._coluna(nome, self.colunas[nome][inicio:fim], np.arange(inicio, fim))
+                         for nome, tipo in self.tipos.items() if tipo in ("inteiro", "decimal")}
+            gerar_dados_com_outliers_colunar(numericas, self.tipos, probabilidade_outlier, rng=np.random)
+            for nome, valores in numericas.items():
+                self._gravar(nome, inicio, fim, valores)
+
+    def ordenar(self, coluna="data", tamanho_bloco=TAMANHO_BLOCO):
+        """
+        Calcula a ordem estável das linhas pela coluna de data informada, com counting sort externo:
+        1) primeiro passe: conta quantas linhas existem em cada dia;
+        2) segundo passe: posiciona os índices de cada bloco a partir do início de cada dia.
+        A ordem é gravada em "ordem.npy" e usada por `ler_bloco` e `exportar_csv`.
+        """
+        valores = self.colunas[coluna]
+        if self.tamanho == 0:
+            self.ordem = np.zeros(0, dtype=np.int64)
+            return self.ordem
+        def dias(a, b):
+            return valores[a:b].astype(np.int64)
+
+        menor, maior = None, None
+        for inicio in range(0, self.tamanho, tamanho_bloco):
+            bloco = dias(inicio, min(inicio + tamanho_bloco, self.tamanho))
+            menor = bloco.min() if menor is None else min(menor, bloco.min())
+            maior = bloco.max() if maior is None else max(maior, bloco.max())
+
+        contagem = np.zeros(maior - menor + 1, dtype=np.int64)
+        for inicio in range(0, self.tamanho, tamanho_bloco):
+            fim = min(inicio + tamanho_bloco, self.tamanho)
+            contagem += np.bincount(dias(inicio, fim) - menor, minlength=len(contagem))
+        cursor = np.concatenate(([0], np.cumsum(contagem)[:-1]))
+
+        if self.diretorio is None:
+            ordem = np.empty(self.tamanho, dtype=tipo_codigo(self.tamanho))
+        else:
+            ordem = np.lib.format.open_memmap(os.path.join(self.diretorio, _ARQUIVO_ORDEM), mode="w+",
+                                              dtype=np.int64, shape=(self.tamanho,))
+        for inicio in range(0, self.tamanho, tamanho_bloco):
+            fim = min(inicio + tamanho_bloco, self.tamanho)
+            chaves = dias(inicio, fim) - menor
+            ordem_bloco = np.argsort(chaves, kind="stable")
+            chaves_ordenadas = chaves[ordem_bloco]
+            # posição de cada linha dentro do seu dia, considerando apenas este bloco
+            inicio_grupo = np.searchsorted(chaves_ordenadas, chaves_ordenadas, side="left")
+            posicao = cursor[chaves_ordenadas] + (np.arange(fim - inicio) - inicio_grupo)
+            ordem[posicao] = inicio + ordem_bloco
+            cursor += np.bincount(chaves, minlength=len(cursor))
+        if isinstance(ordem, np.memmap):
+            ordem.flush()
+        self.ordem = ordem
+        return ordem
+
+    def salvar_metadados(self):
+        """
+        Grava os metadados (cabeçalho, tipos, tamanho e dicionários) e descarrega as colunas no disco.
+        """
+        if self.diretorio is None:
+            raise ValueError("Os metadados só podem ser gravados em um armazenamento com diretório.")
+        for coluna in self.colunas.values():
+            if isinstance(coluna, np.memmap):
+                coluna.flush()
+        with open(os.path.join(self.diretorio, _ARQUIVO_METADADOS), "w", encoding="utf-8") as arquivo:
+            json.dump({"cabecalho": self.cabecalho, "tipos": self.tipos, "capacidade": self.capacidade,
+                       "tamanho": self.tamanho, "dicionarios": self.dicionarios}, arquivo, ensure_ascii=False)
+
+    # ------------------------------------------------------------------
+    # Leitura
+    # ------------------------------------------------------------------
+
+    def memoria_utilizada(self):
+        """
+        Retorna os bytes ocupados pelas colunas, pelos bitmaps de validade, pelos dicionários e pela ordem (na RAM
+        ou nos arquivos).
+        """
+        total = sum(coluna.nbytes for coluna in self.colunas.values())
+        total += sum(bitmap.nbytes for bitmap in self.validade.values())
+        for nome, valores in self.dicionarios.items():
+            total += sys.getsizeof(valores) + sys.getsizeof(self._codigos[nome])
+            total += sum(sys.getsizeof(valor) for valor in valores)
+        return total + (self.ordem.nbytes if self.ordem is not None else 0)
+
+    def _coluna(self, nome, valores, posicoes):
+        """
+        Converte um bloco de uma coluna (as linhas `posicoes`) para o formato do motor em lote (aceito pelos
+        escritores de util.py).
+        """
+        if nome in self.dicionarios:
+            return ColunaCategorica(valores, self.dicionarios[nome])
+        if self.diretorio is None and self.tipos[nome] == "decimal":
+            decimais = valores / 100 if nome in self._centavos else valores.astype(np.float64)
+            if nome in self.validade:
+                decimais[~_ler_bits(self.validade[nome], posicoes)] = np.nan
+            return decimais
+        if self.tipos[nome] == "texto":
+            return np.array([valor.decode("utf-8", errors="ignore") for valor in valores.tolist()], dtype=object)
+        return valores
+
+    def colunas_bloco(self, inicio, fim):
+        """
+        Retorna as linhas [inicio, fim) como dicionário {coluna: array}, na ordem calculada por `ordenar`
+        (ou na ordem de inserção, se a ordenação não foi feita).
+        """
+        fim = min(fim, self.tamanho)
+        if self.ordem is not None:
+            posicoes = np.asarray(self.ordem[inicio:fim])
+            return {nome: self._coluna(nome, np.asarray(self.colunas[nome][posicoes]), posicoes)
+                    for nome in self.cabecalho}
+        posicoes = np.arange(inicio, fim)
+        return {nome: self._coluna(nome, np.asarray(self.colunas[nome][inicio:fim]), posicoes)
+                for nome in self.cabecalho}
+
+    def ler_bloco(self, inicio, fim):
+        """
+        Retorna as linhas [inicio, fim) como lista de listas, na ordem calculada por `ordenar`
+        (ou na ordem de inserção, se a ordenação não foi feita).
+        """
+        colunas = self.colunas_bloco(inicio, fim)
+        return list(linhas_de_colunas(self.cabecalho, colunas, tamanho_bloco=max(1, fim - inicio)))
+
+    def _blocos(self, tamanho_bloco, estatisticas):
+        for inicio in range(0, self.tamanho, tamanho_bloco):
+            colunas = self.colunas_bloco(inicio, inicio + tamanho_bloco)
+            if estatisticas is not None:
+                estatisticas.atualizar(colunas)
+            yield colunas
+
+    def exportar_csv(self, nome_arquivo, tamanho_bloco=TAMANHO_BLOCO, estatisticas=None):
+        """
+        Grava o conteúdo do armazenamento em um arquivo CSV, percorrendo as linhas em blocos.
+        - estatisticas: AcumuladorEstatisticas (opcional) que recebe cada bloco gravado.
+        """
+        with open(nome_arquivo, mode="w", newline="", encoding="utf-8") as arquivo:
+            writer = csv.writer(arquivo)
+            writer.writerow(self.cabecalho)
+            for colunas in self._blocos(tamanho_bloco, estatisticas):
+                writer.writerows(linhas_de_colunas(self.cabecalho, colunas, tamanho_bloco))
+
+    def exportar_particionado(self, escritor, tamanho_bloco=TAMANHO_BLOCO, estatisticas=None):
+        """
+        Envia o conteúdo do armazenamento a um EscritorParticionado, percorrendo as colunas em blocos, e o fecha.
+        - estatisticas: AcumuladorEstatisticas (opcional) que recebe cada bloco gravado.
+        Retorna a lista de arquivos gravados.
+        """
+        for colunas in self._blocos(tamanho_bloco, estatisticas):
+            escritor.escrever_colunas(colunas, tamanho_bloco)
+        return escritor.fechar()
@@ -0,0 +1,158 @@
+# autorregressivo.py
+
+"""
+autorregressivo.py
+
+Descrição:
+-----------
+Este módulo implementa o motor autorregressivo (AR(1)) das métricas do modo original. O ramo `dados_anteriores`
+de `gerar_dados_empresa` evoluía cada métrica com uma regra escalar escrita à mão (`numero_clientes ×
+normal(1, 0.05)`, `normal(loc=anterior, scale=2.0)` para taxa_ocupacao, `uniform(anterior - 2, anterior + 2)` para
+giro_estoque, ...), uma chamada ao numpy por métrica e por linha.
+
+Aqui, cada coluna declara um `PassoAR` (coeficiente, ruído e limites), e o `MotorAR` avança uma matriz de estado
+(entidades × métricas) inteira a cada chamada:
+
+   centro = media + coeficiente × (anterior - media)        (sem media: centro = anterior, passeio aleatório)
+   novo   = centro + ruído, arredondado e limitado a [minimo, maximo]
+
+Ruídos:
+- "normal": centro + N(0, escala).
+- "uniforme": uniforme na janela [centro - escala, centro + escala], recortada pelos limites (com inteiro=True, a
+  janela inteira [int(centro) - escala, int(centro) + escala], inclusive).
+- "multiplicativo": centro × N(1, escala).
+- "lognormal": log-normal com média log(max(1, centro)) e sigma = escala (valores <= 0 contam como ausentes).
+
+Funcionalidades:
+-----------------
+- PassoAR(ruido, escala, coeficiente, media, minimo, maximo, casas, inteiro): regra de uma coluna.
+- MotorAR(passos): compila um dicionário {coluna: PassoAR} em vetores (uma operação numpy por tipo de ruído).
+  - avancar(estado, rng, mascara): um passo de tempo para todas as entidades e métricas.
+  - simular(inicial, n_passos, rng, mascara): série completa, {coluna: array} em ordem de tempo (passo 0 =
+    estado inicial; entidades agrupadas em cada passo).
+
+Observações:
+-------------
+- Valores ausentes (NaN) no estado continuam NaN após o passo; quem chama decide o valor inicial (no motor escalar,
+  um novo sorteio da distribuição da métrica; em `simular`, o valor do estado inicial da entidade).
+- Células fora da `mascara` (ex.: métricas que o segmento da entidade não possui) são mantidas sem alteração.
+"""
+
+import numpy as np
+
+RUIDOS = ("normal", "uniforme", "multiplicativo", "lognormal")
+
+
+class PassoAR:
+    """
+    Regra autorregressiva de uma coluna.
+    - ruido: um de RUIDOS; escala: desvio (normal, multiplicativo, lognormal) ou meia largura da janela (uniforme).
+    - coeficiente, media: reversão à média (coeficiente 1 ou media None = passeio aleatório).
+    - minimo, maximo: limites (None = sem limite); casas: arredondamento; inteiro: valores inteiros.
+    """
+
+    __slots__ = ("ruido", "escala", "coeficiente", "media", "minimo", "maximo", "casas", "inteiro")
+
+    def __init__(self, ruido, escala, coeficiente=1.0, media=None, minimo=None, maximo=None, casas=2,
+                 inteiro=False):
+        if ruido not in RUIDOS:
+            raise ValueError(f"Ruído '{ruido}' inválido. Use um de {RUIDOS}.")
+        self.ruido, self.escala = ruido, escala
+        self.coeficiente, self.media = coeficiente, media
+        self.minimo, self.maximo = minimo, maximo
+        self.casas, self.inteiro = casas, inteiro
+
+
+class MotorAR:
+    """
+    Motor AR(1) vetorizado sobre uma matriz de estado (entidades × colunas, na ordem de `passos`).
+    """
+
+    def __init__(self, passos):
+        self.colunas = tuple(passos)
+        p = [passos[coluna] for coluna in self.colunas]
+        self.coeficiente = np.array([passo.coeficiente for passo in p], dtype=np.float64)
+        self.media = np.array([np.nan if passo.media is None else passo.media for passo in p], dtype=np.float64)
+        self.escala = np.array([passo.escala for passo in p], dtype=np.float64)
+        self.minimo = np.array([-np.inf if passo.minimo is None else passo.minimo for passo in p], dtype=np.float64)
+        self.maximo = np.array([np.inf if passo.maximo is None else passo.maximo for passo in p], dtype=np.float64)
+        self.inteiro = np.array([bool(passo.inteiro) for passo in p])
+        self.lognormal = np.array([passo.ruido == "lognormal" for passo in p])
+
+        # Colunas agrupadas por (ruído, inteiro) e por casas decimais: uma operação por grupo em cada passo
+        self.grupos = {}
+        for j, passo in enumerate(p):
+            self.grupos.setdefault((passo.ruido, bool(passo.inteiro)), []).append(j)
+        self.grupos = {chave: np.array(indices) for chave, indices in self.grupos.items()}
+        self.casas = {}
+        for j, passo in enumerate(p):
+            if not passo.inteiro and passo.casas is not None:
+                self.casas.setdefault(passo.casas, []).append(j)
+        self.casas = {casas: np.array(indices) for casas, indices in self.casas.items()}
+
+    def avancar(self, estado, rng, mascara=None):
+        """
+        Avança um passo de tempo.
+        - estado: matriz (entidades × colunas) ou vetor de uma entidade; NaN = valor ausente.
+        - rng: numpy.random.Generator (ou o módulo numpy.random).
+        - mascara: matriz booleana opcional; células False são mantidas.
+        Retorna o novo estado (float64, mesma forma).
+        """
+        estado = np.asarray(estado, dtype=np.float64)
+        forma = estado.shape
+        estado = estado.reshape(-1, len(self.colunas))
+        faltando = np.isnan(estado) | (self.lognormal & (estado <= 0))
+        anterior = np.where(faltando, 1.0, estado)
+        centro = np.where(np.isnan(self.media), anterior, self.media + self.coeficiente * (anterior - self.media))
+
+        novo = np.empty_like(centro)
+        for (ruido, inteiro), indices in self.grupos.items():
+            c, escala = centro[:, indices], self.escala[indices]
+            if ruido == "normal":
+                valores = c + escala * rng.standard_normal(c.shape)
+            elif ruido == "multiplicativo":
+                valores = c * (1.0 + escala * rng.standard_normal(c.shape))
+            elif ruido == "lognormal":
+                valores = np.exp(np.log(np.maximum(1.0, c)) + escala * rng.standard_normal(c.shape))
+            else:
+                if inteiro:
+                    c = np.trunc(c)
+                inferior = np.maximum(self.minimo[indices], c - escala)
+                superior = np.minimum(self.maximo[indices], c + escala)
+                inferior, superior = np.minimum(inferior, superior), np.maximum(inferior, superior)
+                if inteiro:
+                    valores = inferior + np.floor(rng.random(c.shape) * (superior - inferior + 1))
+                else:
+                    valores = inferior + rng.random(c.shape) * (superior - inferior)
+            novo[:, indices] = valores
+
+        novo[:, self.inteiro] = np.trunc(novo[:, self.inteiro])
+        for casas, indices in self.casas.items():
+            novo[:, indices] = np.round(novo[:, indices], casas)
+        novo = np.clip(novo, self.minimo, self.maximo)
+        novo[faltando] = np.nan
+        if mascara is not None:
+            novo = np.where(np.asarray(mascara).reshape(novo.shape), novo, estado)
+        return novo.reshape(forma)
+
+    def simular(self, inicial, n_passos, rng, mascara=None):
+        """
+        Gera a série de todas as entidades: o passo 0 é o estado inicial e cada passo seguinte avança o anterior.
+        Valores que ficarem ausentes voltam ao valor inicial da entidade.
+        Retorna {coluna: array de n_passos × entidades}, em ordem de tempo.
+        """
+        inicial = np.asarray(inicial, dtype=np.float64)
+        n_entidades = len(inicial)
+        serie = {coluna: np.empty(n_passos * n_entidades) for coluna in self.colunas}
+        estado = inicial
+        for passo in range(n_passos):
+            if passo > 0:
+                estado = self.avancar(estado, rng, mascara)
+                estado = np.where(np.isnan(estado), inicial, estado)
+            trecho = slice(passo * n_entidades, (passo + 1) * n_entidades)
+            for j, coluna in enumerate(self.colunas):
+                serie[coluna][trecho] = estado[:, j]
+        for j, coluna in enumerate(self.colunas):
+            if self.inteiro[j] and not np.isnan(serie[coluna]).any():
+                serie[coluna] = serie[coluna].astype(np.int64)
+        return serie
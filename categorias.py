@@ -0,0 +1,228 @@
+# categorias.py
+
+"""
+categorias.py
+
+Descrição:
+-----------
+Este módulo implementa a codificação por dicionário das colunas categóricas de baixa cardinalidade (tipo_cliente,
+canal_venda, faixa_etaria, genero, dispositivo, sistema_operacional, navegador, tipo_de_quarto,
+forma_de_pagamento, etc.). Essas colunas têm de 3 a 6 valores possíveis, mas, nos geradores escalares, cada linha
+guarda (e serializa) um objeto str resultante de um `random.choice`.
+
+Aqui, cada coluna categórica é representada por uma `ColunaCategorica`: um array de códigos inteiros pequenos
+(int8 na maioria dos casos) mais um dicionário compartilhado com os valores possíveis. Os códigos são sorteados em
+lote, com `Generator.integers` (uniforme) ou por uma tabela de alias (com pesos), e os textos só são materializados
+na saída (CSV, Arrow ou DataFrame).
+
+Funcionalidades:
+-----------------
+- DICIONARIOS: valores possíveis de cada coluna categórica (mesmas listas usadas nos geradores escalares).
+- ColunaCategorica(codigos, dicionario): códigos + dicionário; o código -1 representa None (valor ausente).
+  - valores(): materializa os textos (array de objetos).
+  - coluna[indices]: seleciona/reordena linhas mantendo o mesmo dicionário.
+- amostrar_categoria(rng, dicionario, n, pesos): sorteia n códigos em uma única chamada.
+- PESOS_CATEGORIAS: pesos configurados por coluna (seção "categorias" do arquivo de modelo, modelo.py), usados
+  pelos dois motores; colunas ausentes são sorteadas de forma uniforme.
+- pesos_categoria(nome, pesos): valida os pesos de uma coluna ({valor: peso} ou lista na ordem de DICIONARIOS).
+- TabelaAlias(pesos) / tabela_alias(pesos): método de alias de Walker/Vose; depois de montada a tabela (O(k)),
+  cada sorteio custa O(1): um índice uniforme e uma comparação com a probabilidade da coluna da tabela.
+- sortear_categoria(nome, rng): um único valor, para os geradores escalares.
+- de_valores(valores): cria uma ColunaCategorica a partir de valores já existentes (ex.: pool do Faker), com o
+  dicionário formado pelos valores distintos.
+- categoria_constante(valor, n): coluna com um único valor (ex.: pais = "Brasil", nome_hotel).
+
+Observações:
+-------------
+- Os pesos são opcionais; sem pesos, o sorteio é uniforme, como o `random.choice` dos geradores escalares (que
+  continua sendo usado, para manter os resultados das sementes existentes).
+- O tipo dos códigos é escolhido pelo tamanho do dicionário (int8, int16 ou int32).
+"""
+
+import random
+from functools import lru_cache
+
+import numpy as np
+
+DICIONARIOS = {
+    "tipo_cliente": ("B2B", "B2C", "Pessoa Física", "Pessoa Jurídica"),
+    "canal_venda": ("Loja física", "Online", "Aplicativo", "Telefone", "Representante"),
+    "categoria_produto": ("Eletrônicos", "Roupas", "Alimentos", "Livros", "Móveis", "Outros"),
+    "tipo_servico": ("Consultoria", "Suporte", "Treinamento", "Desenvolvimento", "Outros"),
+    "plano": ("Básico", "Premium", "Gratuito", "Teste"),
+    "faixa_etaria": ("18-25", "26-35", "36-45", "46-55", "55+"),
+    "genero": ("Masculino", "Feminino", "Outro"),
+    "fonte_trafego": ("Busca orgânica", "Anúncio pago", "Rede social", "Email", "Referência", "Direto"),
+    "dispositivo": ("Desktop", "Mobile", "Tablet"),
+    "sistema_operacional": ("Windows", "macOS", "Linux", "Android", "iOS"),
+    "navegador": ("Chrome", "Firefox", "Safari", "Edge", "Outro"),
+    "funcionalidade_mais_usada": ("FuncA", "FuncB", "FuncC", "Outra"),
+    "tipo_de_quarto": ("Standard", "Duplo", "Suite"),
+    "forma_de_pagamento": ("Cartão de Crédito", "Dinheiro", "PIX", "Transferência"),
+}
+
+PESOS_CATEGORIAS = {}
+
+
+def tipo_codigo(tamanho_dicionario):
+    """
+    Retorna o menor tipo inteiro com sinal capaz de representar os códigos (e o -1 de valor ausente).
+    """
+    if tamanho_dicionario < np.iinfo(np.int8).max:
+        return np.int8
+    if tamanho_dicionario < np.iinfo(np.int16).max:
+        return np.int16
+    return np.int32
+
+
+class ColunaCategorica:
+    """
+    Coluna categórica codificada por dicionário.
+    - codigos: array de inteiros (posição no dicionário; -1 para None).
+    - dicionario: tupla com os valores possíveis.
+    """
+
+    __slots__ = ("codigos", "dicionario")
+
+    def __init__(self, codigos, dicionario):
+        self.dicionario = tuple(dicionario)
+        self.codigos = np.asarray(codigos).astype(tipo_codigo(len(self.dicionario)), copy=False)
+
+    def __len__(self):
+        return len(self.codigos)
+
+    def __getitem__(self, indices):
+        return ColunaCategorica(self.codigos[indices], self.dicionario)
+
+    @property
+    def nbytes(self):
+        return self.codigos.nbytes
+
+    def valores(self):
+        """
+        Materializa a coluna como array de objetos (str ou None).
+        """
+        tabela = np.array(self.dicionario + (None,), dtype=object)
+        return tabela[self.codigos]
+
+    def onde(self, mascara):
+        """
+        Retorna uma nova coluna com None (código -1) nas posições em que a máscara é falsa.
+        """
+        return ColunaCategorica(np.where(mascara, self.codigos, -1), self.dicionario)
+
+
+class TabelaAlias:
+    """
+    Tabela de alias (Walker/Vose) de uma distribuição discreta.
+    - pesos: pesos relativos (não negativos, com soma positiva) de cada código.
+    Cada coluna i da tabela devolve o código i com probabilidade `probabilidade[i]` e `alias[i]` no restante.
+    """
+
+    __slots__ = ("probabilidade", "alias")
+
+    def __init__(self, pesos):
+        pesos = np.asarray(pesos, dtype=np.float64)
+        k = len(pesos)
+        escalados = (pesos * k / pesos.sum()).tolist()
+        probabilidade, alias = [1.0] * k, list(range(k))
+        pequenos = [i for i, p in enumerate(escalados) if p < 1.0]
+        grandes = [i for i, p in enumerate(escalados) if p >= 1.0]
+        while pequenos and grandes:
+            menor, maior = pequenos.pop(), grandes.pop()
+            probabilidade[menor], alias[menor] = escalados[menor], maior
+            escalados[maior] -= 1.0 - escalados[menor]
+            (pequenos if escalados[maior] < 1.0 else grandes).append(maior)
+        # As colunas que sobram (só por arredondamento) ficam com probabilidade 1
+        self.probabilidade = np.array(probabilidade)
+        self.alias = np.array(alias, dtype=np.int64)
+
+    def amostrar(self, rng, n):
+        """
+        Sorteia n códigos (int64) com uma única chamada ao Generator: a parte inteira de u × k escolhe a coluna
+        da tabela e a parte fracionária decide entre o código da coluna e o alias.
+        """
+        u = rng.random(n) * len(self.alias)
+        colunas = np.minimum(u.astype(np.int64), len(self.alias) - 1)
+        return np.where(u - colunas < self.probabilidade[colunas], colunas, self.alias[colunas])
+
+    def sortear(self, rng=random):
+        """
+        Sorteia um único código (int) com o módulo random (motor escalar).
+        """
+        coluna = rng.randrange(len(self.alias))
+        return coluna if rng.random() < self.probabilidade[coluna] else int(self.alias[coluna])
+
+
+@lru_cache(maxsize=None)
+def _tabela_alias(pesos):
+    return TabelaAlias(pesos)
+
+
+def tabela_alias(pesos):
+    """
+    Retorna a TabelaAlias dos pesos, montada uma vez para cada vetor de pesos.
+    """
+    return _tabela_alias(tuple(float(peso) for peso in pesos))
+
+
+def pesos_categoria(nome, pesos):
+    """
+    Valida os pesos de uma coluna de DICIONARIOS e os retorna como tupla, na ordem do dicionário.
+    - pesos: {valor: peso} (valores ausentes recebem peso 0) ou sequência com um peso por valor.
+    """
+    if nome not in DICIONARIOS:
+        raise ValueError(f"Coluna categórica '{nome}' desconhecida. Use uma de {sorted(DICIONARIOS)}.")
+    dicionario = DICIONARIOS[nome]
+    if isinstance(pesos, dict):
+        desconhecidos = set(pesos) - set(dicionario)
+        if desconhecidos:
+            raise ValueError(f"Pesos de '{nome}': valores desconhecidos {sorted(desconhecidos)}.")
+        pesos = [pesos.get(valor, 0) for valor in dicionario]
+    pesos = tuple(float(peso) for peso in pesos)
+    if len(pesos) != len(dicionario):
+        raise ValueError(f"Foram informados {len(pesos)} pesos para {len(dicionario)} categorias de '{nome}'.")
+    if min(pesos) < 0 or sum(pesos) <= 0:
+        raise ValueError(f"Os pesos de '{nome}' devem ser não negativos, com soma positiva.")
+    return pesos
+
+
+def amostrar_categoria(rng, dicionario, n, pesos=None):
+    """
+    Sorteia n valores de um dicionário em uma única chamada ao Generator.
+    - dicionario: tupla de valores ou nome de uma coluna de DICIONARIOS.
+    - pesos: pesos relativos de cada valor (opcional; sem pesos, o sorteio é uniforme).
+    """
+    if isinstance(dicionario, str):
+        dicionario = DICIONARIOS[dicionario]
+    if pesos is None:
+        codigos = rng.integers(0, len(dicionario), n, dtype=tipo_codigo(len(dicionario)))
+    else:
+        if len(pesos) != len(dicionario):
+            raise ValueError(f"Foram informados {len(pesos)} pesos para {len(dicionario)} categorias.")
+        codigos = tabela_alias(pesos).amostrar(rng, n)
+    return ColunaCategorica(codigos, dicionario)
+
+
+def sortear_categoria(nome, rng=random):
+    """
+    Sorteia um valor da coluna `nome` de DICIONARIOS (motor escalar), com os pesos de PESOS_CATEGORIAS, se houver.
+    """
+    if nome not in PESOS_CATEGORIAS:
+        return rng.choice(DICIONARIOS[nome])
+    return DICIONARIOS[nome][tabela_alias(PESOS_CATEGORIAS[nome]).sortear(rng)]
+
+
+def de_valores(valores):
+    """
+    Cria uma ColunaCategorica a partir de valores existentes; o dicionário é formado pelos valores distintos.
+    """
+    dicionario, codigos = np.unique(np.asarray(valores, dtype=object), return_inverse=True)
+    return ColunaCategorica(codigos, dicionario.tolist())
+
+
+def categoria_constante(valor, n):
+    """
+    Cria uma coluna categórica com o mesmo valor em todas as linhas.
+    """
+    return ColunaCategorica(np.zeros(n, dtype=np.int8), (valor,))
@@ -0,0 +1,132 @@
+# config.py
+
+"""
+config.py
+
+Descrição:
+-----------
+Este módulo centraliza as definições compartilhadas entre os scripts do projeto, evitando que as mesmas listas
+sejam repetidas em vários lugares (main.py, servidor, executor de lotes, etc.).
+
+Conteúdo:
+----------
+- CABECALHO_ORIGINAL: nomes das 90 colunas do CSV gerado no modo original (registro_id + 89 colunas retornadas por
+  `gerar_dados_empresa`).
+- CABECALHO_HOTEL: nomes das 37 colunas do CSV gerado no modo hotel único (`gerar_dados_hotel_unico`): as 31
+  colunas originais mais a ocupação (%) e a receita de quartos de cada tipo de quarto na noite (tarifas.py).
+- CABECALHO_HOTEL_HOSPEDES / CABECALHO_HOTEL_KPIS_DIARIOS: layout normalizado do modo hotel único, com uma tabela
+  de fatos por hóspede e uma tabela de KPIs com uma linha por dia (COLUNAS_DIARIAS_HOTEL ficam apenas nela).
+- SEGMENTOS_PADRAO: segmentos utilizados quando nenhum segmento é informado.
+- TIPOS_COLUNAS_ORIGINAL: tipo lógico de cada coluna do modo original, usado pelo armazenamento colunar
+  (armazenamento.py). Os tipos possíveis são:
+    • "inteiro": números inteiros;
+    • "decimal": números reais (None é representado como valor ausente);
+    • "data": datas no formato YYYY-MM-DD;
+    • "categoria": textos com poucos valores distintos (armazenados como códigos + dicionário);
+    • "texto": textos livres, com muitos valores distintos (ex.: nome da empresa).
+- TIPOS_COLUNAS_HOTEL: tipo lógico de cada coluna do modo hotel único, com os mesmos tipos acima.
+
+Observações:
+-------------
+- Qualquer alteração na ordem das colunas retornadas pelos geradores deve ser refletida aqui.
+"""
+
+SEGMENTOS_PADRAO = [
+    "Educação", "Hotelaria", "Saúde", "TI", "Varejo", "Serviços", "Finanças", "Indústria", "Banco", "Hospital"
+]
+
+CABECALHO_ORIGINAL = [
+    "registro_id", "data", "ano", "mes", "dia", "segmento", "empresa", "cidade",
+    "numero_clientes", "ticket_medio", "receita", "custo", "lucro",
+    "indice_satisfacao", "taxa_ocupacao", "taxa_crescimento",
+    "custo_marketing", "investimento_publicidade",
+    "previsao_vendas", "previsao_custos",
+    "sensibilidade_negocios", "indice_correcao", "programacao_linear",
+    "regiao", "estado", "pais", "tipo_cliente", "canal_venda",
+    "categoria_produto", "tipo_servico", "plano", "faixa_etaria",
+    "genero", "fonte_trafego", "dispositivo", "sistema_operacional",
+    "navegador", "quantidade_produtos", "custo_por_cliente",
+    "receita_por_cliente", "lucro_por_cliente", "desconto_medio",
+    "percentual_desconto", "taxa_conversao", "vendas_por_vendedor",
+    "comissao_vendas", "valor_impostos", "frete_medio",
+    "pedidos_por_cliente", "LTV", "CAC", "MRR", "ARR",
+    "receita_media_diaria", "custo_por_clique", "custo_por_mil_impressoes",
+    "taxa_de_clique", "impressoes", "cliques", "leads_gerados",
+    "custo_por_lead", "ROAS", "avaliacao_media", "numero_avaliacoes",
+    "NPS", "CSAT", "reclamacoes", "tempo_medio_resposta",
+    "tempo_medio_entrega", "taxa_devolucao", "nivel_estoque",
+    "giro_estoque", "custo_estoque", "numero_fornecedores",
+    "taxa_de_defeito", "usuarios_ativos", "tempo_medio_sessao",
+    "taxa_retencao", "churn_rate", "funcionalidade_mais_usada",
+    "numero_sessoes", "RevPAR", "taxa_evasao",
+    "tempo_medio_atendimento", "despesa_administrativa",
+    "despesa_com_pessoal", "despesa_fixa", "despesa_variavel",
+    "despesa_tributaria", "despesa_financeira"
+]
+
+CABECALHO_HOTEL = [
+    "id_registro", "data", "ano", "mes", "dia",
+    "nome_hotel", "total_quartos", "ocupacao_diaria",
+    "nome_cliente", "tipo_de_quarto", "forma_de_pagamento",
+    "quantidade_quartos", "quantidade_diarias", "valor_diaria",
+    "valor_total_diarias", "valor_outros_consumos", "total_pago",
+    "despesa_fixa", "despesa_variavel", "despesa_mao_obra_direta",
+    "despesa_financeira", "despesa_administrativa",
+    "quartos_ocupados_dia", "receita_quartos_dia", "receita_total_dia",
+    "custo_total_dia", "lucro_operacional_bruto_dia", "adr_dia",
+    "revpar_dia", "trevpar_dia", "goppar_dia"
+] + [
+    f"{metrica}_{tipo}_dia"
+    for tipo in ("standard", "duplo", "suite")
+    for metrica in ("ocupacao", "receita_quartos")
+]
+
+# Colunas do modo hotel com um único valor por dia (despesas e métricas diárias), separadas da tabela de hóspedes
+# no layout normalizado (--layout_hotel normalizado)
+COLUNAS_DIARIAS_HOTEL = [
+    "ocupacao_diaria", "despesa_fixa", "despesa_variavel", "despesa_mao_obra_direta", "despesa_financeira",
+    "despesa_administrativa",
+] + CABECALHO_HOTEL[CABECALHO_HOTEL.index("quartos_ocupados_dia"):]
+
+CABECALHO_HOTEL_HOSPEDES = [nome for nome in CABECALHO_HOTEL if nome not in COLUNAS_DIARIAS_HOTEL]
+
+CABECALHO_HOTEL_KPIS_DIARIOS = ["data", "ano", "mes", "dia", "nome_hotel", "total_quartos"] + COLUNAS_DIARIAS_HOTEL
+
+_COLUNAS_INTEIRAS = {
+    "registro_id", "ano", "mes", "dia", "numero_clientes", "quantidade_produtos", "vendas_por_vendedor",
+    "impressoes", "cliques", "leads_gerados", "numero_avaliacoes", "NPS", "CSAT", "reclamacoes",
+    "nivel_estoque", "numero_fornecedores", "usuarios_ativos", "numero_sessoes",
+}
+_COLUNAS_CATEGORICAS = {
+    "segmento", "regiao", "estado", "pais", "tipo_cliente", "canal_venda", "categoria_produto",
+    "tipo_servico", "plano", "faixa_etaria", "genero", "fonte_trafego", "dispositivo",
+    "sistema_operacional", "navegador", "funcionalidade_mais_usada",
+}
+_COLUNAS_TEXTO = {"empresa", "cidade"}
+
+
+def _tipo_coluna(nome):
+    if nome == "data":
+        return "data"
+    if nome in _COLUNAS_INTEIRAS:
+        return "inteiro"
+    if nome in _COLUNAS_CATEGORICAS:
+        return "categoria"
+    if nome in _COLUNAS_TEXTO:
+        return "texto"
+    return "decimal"
+
+
+TIPOS_COLUNAS_ORIGINAL = {nome: _tipo_coluna(nome) for nome in CABECALHO_ORIGINAL}
+
+TIPOS_COLUNAS_HOTEL = {
+    nome: (
+        "data" if nome == "data"
+        else "inteiro" if nome in ("id_registro", "ano", "mes", "dia", "total_quartos", "quantidade_quartos",
+                                   "quantidade_diarias", "quartos_ocupados_dia")
+        else "categoria" if nome in ("nome_hotel", "tipo_de_quarto", "forma_de_pagamento")
+        else "texto" if nome == "nome_cliente"
+        else "decimal"
+    )
+    for nome in CABECALHO_HOTEL
+}
@@ -0,0 +1,166 @@
+# correlacao.py
+
+"""
+correlacao.py
+
+Descrição:
+-----------
+Este módulo gera blocos de métricas correlacionadas do modo original. Nos geradores, cada métrica era sorteada de
+forma independente (numero_clientes, investimento_publicidade, leads_gerados, LTV, CAC, ...), e as únicas
+relações entre elas eram multiplicações pontuais (receita = numero_clientes × ticket_medio).
+
+Com a correlação habilitada (`--correlacionar`, com `--motor lote`), as métricas de cada bloco são sorteadas juntas
+por uma cópula gaussiana:
+
+   Z = N(0, 1)^(n × k) · Lᵀ        (L: fator de Cholesky da matriz de correlação, calculado no registro do bloco)
+   metrica_j = distribuicao_j.transformar(Z[:, j])
+
+Cada métrica mantém a sua distribuição marginal (os amostradores de DISTRIBUICOES_EMPRESA), e as métricas do bloco
+passam a variar juntas. Para as marginais LogNormal e Normal, o resultado é exatamente a log-normal / normal
+multivariada com essa correlação (na escala logarítmica, no caso da log-normal).
+
+Funcionalidades:
+-----------------
+- BlocoCorrelacionado(nome, metricas, correlacao): valida a matriz (quadrada, simétrica, diagonal 1, definida
+  positiva) e guarda o fator de Cholesky.
+  - normais(rng, n): matriz n × k de normais padrão correlacionadas (uma multiplicação de matrizes por lote).
+  - amostrar(rng, n, distribuicoes): {metrica: coluna} com as marginais informadas.
+- BLOCOS_CORRELACAO / registrar_bloco(nome, metricas, correlacao): blocos em uso (padrões abaixo; o arquivo de
+  modelo, modelo.py, pode substituí-los, removê-los ou acrescentar outros).
+- verificar_blocos(blocos): garante que cada métrica pertence a um único bloco.
+- amostrar_correlacionados(rng, n, distribuicoes): todas as métricas de todos os blocos (motor em lote).
+- fixar_correlacionados(distribuicoes, rng): cópia de `distribuicoes` em que as métricas dos blocos são
+  constantes já sorteadas juntas (motor escalar, uma linha por vez).
+
+Observações:
+-------------
+- No motor escalar, a correlação vale apenas para as linhas geradas sem `dados_anteriores` (no main.py, a
+  primeira); as linhas seguintes continuam evoluindo a partir dos valores anteriores (autocorrelação). Por isso,
+  o `--correlacionar` do main.py exige `--motor lote`.
+- Uma métrica pode pertencer a um único bloco.
+"""
+
+import numpy as np
+
+from nucleo import Constante
+
+BLOCOS_CORRELACAO = {}
+
+
+class BlocoCorrelacionado:
+    """
+    Métricas sorteadas juntas, com a matriz de correlação informada (cópula gaussiana).
+    - metricas: nomes das métricas (chaves de DISTRIBUICOES_EMPRESA).
+    - correlacao: matriz k × k (listas ou numpy.ndarray).
+    """
+
+    __slots__ = ("nome", "metricas", "correlacao", "cholesky")
+
+    def __init__(self, nome, metricas, correlacao):
+        metricas = tuple(metricas)
+        correlacao = np.asarray(correlacao, dtype=np.float64)
+        k = len(metricas)
+        if len(set(metricas)) != k:
+            raise ValueError(f"Bloco '{nome}': métricas repetidas em {list(metricas)}.")
+        if correlacao.shape != (k, k):
+            raise ValueError(f"Bloco '{nome}': a matriz de correlação deve ser {k} × {k} "
+                             f"(recebida {correlacao.shape}).")
+        if not np.allclose(correlacao, correlacao.T) or not np.allclose(np.diag(correlacao), 1.0):
+            raise ValueError(f"Bloco '{nome}': a matriz de correlação deve ser simétrica, com diagonal 1.")
+        try:
+            cholesky = np.linalg.cholesky(correlacao)
+        except np.linalg.LinAlgError:
+            raise ValueError(f"Bloco '{nome}': a matriz de correlação não é definida positiva.") from None
+        self.nome, self.metricas, self.correlacao, self.cholesky = nome, metricas, correlacao, cholesky
+
+    def normais(self, rng, n):
+        """
+        Retorna uma matriz n × k de normais padrão com a correlação do bloco.
+        - rng: numpy.random.Generator (ou o módulo numpy.random).
+        """
+        return rng.standard_normal((n, len(self.metricas))) @ self.cholesky.T
+
+    def amostrar(self, rng, n, distribuicoes):
+        """
+        Gera as colunas das métricas do bloco com as marginais de `distribuicoes` ({metrica: amostrador}).
+        """
+        z = self.normais(rng, n)
+        return {metrica: distribuicoes[metrica].transformar(z[:, j]) for j, metrica in enumerate(self.metricas)}
+
+
+def verificar_blocos(blocos):
+    """
+    Verifica que nenhuma métrica pertence a mais de um dos blocos informados (ValueError).
+    """
+    vistas = {}
+    for bloco in blocos:
+        for metrica in bloco.metricas:
+            if metrica in vistas:
+                raise ValueError(f"A métrica '{metrica}' pertence aos blocos '{vistas[metrica]}' e '{bloco.nome}'.")
+            vistas[metrica] = bloco.nome
+
+
+def registrar_bloco(nome, metricas, correlacao):
+    """
+    Declara (ou substitui) um bloco de métricas correlacionadas e o retorna.
+    """
+    bloco = BlocoCorrelacionado(nome, metricas, correlacao)
+    verificar_blocos({**BLOCOS_CORRELACAO, nome: bloco}.values())
+    BLOCOS_CORRELACAO[nome] = bloco
+    return bloco
+
+
+def amostrar_correlacionados(rng, n, distribuicoes):
+    """
+    Gera as colunas de todas as métricas dos blocos registrados (motor em lote).
+    """
+    colunas = {}
+    for bloco in BLOCOS_CORRELACAO.values():
+        colunas.update(bloco.amostrar(rng, n, distribuicoes))
+    return colunas
+
+
+def fixar_correlacionados(distribuicoes, rng=np.random):
+    """
+    Retorna uma cópia de `distribuicoes` em que as métricas dos blocos são constantes, sorteadas juntas (motor
+    escalar: uma linha por chamada).
+    """
+    fixadas = dict(distribuicoes)
+    for metrica, valor in amostrar_correlacionados(rng, 1, distribuicoes).items():
+        fixadas[metrica] = Constante(valor[0].item())
+    return fixadas
+
+
+# --------------------------------------------------------------------------------
+# Blocos padrão
+# --------------------------------------------------------------------------------
+# Aquisição: mais investimento traz mais impressões, leads e clientes, mas encarece o cliente adquirido
+registrar_bloco(
+    "aquisicao",
+    ["numero_clientes", "investimento_publicidade", "impressoes", "leads_gerados", "CAC"],
+    [[1.0, 0.6, 0.5, 0.6, -0.2],
+     [0.6, 1.0, 0.7, 0.6, 0.4],
+     [0.5, 0.7, 1.0, 0.6, 0.2],
+     [0.6, 0.6, 0.6, 1.0, -0.1],
+     [-0.2, 0.4, 0.2, -0.1, 1.0]],
+)
+# Valor do cliente: ticket e retenção altos elevam o LTV; churn anda no sentido oposto da retenção
+registrar_bloco(
+    "valor_cliente",
+    ["ticket_medio", "LTV", "pedidos_por_cliente", "taxa_retencao", "churn_rate"],
+    [[1.0, 0.6, 0.3, 0.2, -0.1],
+     [0.6, 1.0, 0.5, 0.6, -0.5],
+     [0.3, 0.5, 1.0, 0.3, -0.2],
+     [0.2, 0.6, 0.3, 1.0, -0.7],
+     [-0.1, -0.5, -0.2, -0.7, 1.0]],
+)
+# Satisfação: as medidas de satisfação concordam entre si e caem com as reclamações
+registrar_bloco(
+    "satisfacao",
+    ["indice_satisfacao", "avaliacao_media", "NPS", "CSAT", "reclamacoes"],
+    [[1.0, 0.7, 0.6, 0.6, -0.5],
+     [0.7, 1.0, 0.6, 0.6, -0.5],
+     [0.6, 0.6, 1.0, 0.5, -0.4],
+     [0.6, 0.6, 0.5, 1.0, -0.4],
+     [-0.5, -0.5, -0.4, -0.4, 1.0]],
+)
@@ -0,0 +1,121 @@
+# dataframes.py
+
+"""
+dataframes.py
+
+Descrição:
+-----------
+Este módulo permite obter o dataset gerado diretamente como um DataFrame (pandas ou Polars), sem gravar um CSV e
+relê-lo em seguida. Os dados são gerados pelo motor em lote (geradores_lote.py), que já produz uma coluna NumPy
+por campo; o DataFrame é montado a partir dessas colunas, sem listas de linhas Python intermediárias.
+
+Funcionalidades:
+-----------------
+- gerar_dataframe(modo, biblioteca, semente, **parametros):
+  - modo: "original" ou "hotel".
+  - biblioteca: "pandas" (padrão) ou "polars".
+  - semente: semente do numpy.random.Generator (opcional).
+  - parametros: os mesmos de `gerar_colunas_original` (registros, segmentos, data_inicio, data_fim, outliers)
+    ou de `gerar_colunas_hotel` (nome_hotel, total_quartos, data_inicio, data_fim, max_clientes_por_dia).
+    Com `dimensoes` (dimensoes.Dimensoes), as colunas de chave (empresa_id, cidade_id, hospede_id) são inteiras.
+
+- colunas_para_dataframe(colunas, tipos, biblioteca):
+  - Converte um dicionário {coluna: numpy.ndarray} em DataFrame. Colunas do tipo "categoria" (segmento,
+    tipo_de_quarto, forma_de_pagamento, etc.) viram colunas categóricas; a coluna "data" vira data.
+  - Colunas `ColunaCategorica` (categorias.py) são convertidas diretamente a partir dos códigos e do dicionário,
+    sem materializar os textos linha a linha.
+
+Uso:
+-----
+   from dataframes import gerar_dataframe
+   df = gerar_dataframe("original", registros=100_000, data_inicio="2022-01-01", data_fim="2022-12-31", semente=1)
+   df_hotel = gerar_dataframe("hotel", biblioteca="polars", total_quartos=300,
+                              data_inicio="2022-01-01", data_fim="2022-12-31")
+
+Observações:
+-------------
+- pandas e Polars são dependências opcionais: apenas a biblioteca escolhida precisa estar instalada.
+- Colunas numéricas são repassadas sem cópia sempre que a biblioteca permite.
+"""
+
+import numpy as np
+
+from categorias import ColunaCategorica
+from config import SEGMENTOS_PADRAO, TIPOS_COLUNAS_HOTEL, TIPOS_COLUNAS_ORIGINAL
+from dimensoes import TIPOS_COLUNAS_CHAVE
+from geradores_lote import gerar_colunas_hotel, gerar_colunas_original
+
+try:
+    import pandas as pd
+except ImportError:  # dependência opcional
+    pd = None
+
+try:
+    import polars as pl
+except ImportError:  # dependência opcional
+    pl = None
+
+
+def colunas_para_dataframe(colunas, tipos, biblioteca="pandas"):
+    """
+    Converte um dicionário {coluna: numpy.ndarray} em DataFrame.
+    - tipos: dicionário coluna -> tipo lógico (TIPOS_COLUNAS_ORIGINAL ou TIPOS_COLUNAS_HOTEL).
+    - biblioteca: "pandas" ou "polars".
+    """
+    if biblioteca == "pandas":
+        if pd is None:
+            raise RuntimeError("A biblioteca 'pandas' não está instalada (pip install pandas).")
+        dados = {nome: _categoria_pandas(valores) if tipos[nome] == "categoria" else valores
+                 for nome, valores in colunas.items()}
+        return pd.DataFrame(dados, copy=False)
+
+    if biblioteca == "polars":
+        if pl is None:
+            raise RuntimeError("A biblioteca 'polars' não está instalada (pip install polars).")
+        series = []
+        for nome, valores in colunas.items():
+            if isinstance(valores, ColunaCategorica):
+                dicionario = pl.Series(nome, list(valores.dicionario), dtype=pl.Utf8)
+                codigos = pl.Series(nome, valores.codigos.astype(np.int32)).set(
+                    pl.Series(valores.codigos < 0), None
+                )
+                series.append(dicionario.gather(codigos).cast(pl.Categorical))
+            elif tipos[nome] == "categoria":
+                series.append(pl.Series(nome, valores.tolist(), dtype=pl.Categorical))
+            elif tipos[nome] == "texto":
+                series.append(pl.Series(nome, valores.tolist(), dtype=pl.Utf8))
+            elif tipos[nome] == "decimal":
+                series.append(pl.Series(nome, valores, nan_to_null=True))
+            else:
+                series.append(pl.Series(nome, valores))
+        return pl.DataFrame(series)
+
+    raise ValueError(f"Biblioteca '{biblioteca}' inválida. Use 'pandas' ou 'polars'.")
+
+
+def _categoria_pandas(valores):
+    if isinstance(valores, ColunaCategorica):
+        return pd.Categorical.from_codes(valores.codigos, categories=list(valores.dicionario))
+    return pd.Categorical(valores)
+
+
+def gerar_dataframe(modo="original", biblioteca="pandas", semente=None, **parametros):
+    """
+    Gera o dataset do modo informado e o retorna como DataFrame (pandas ou Polars).
+    """
+    rng = np.random.default_rng(semente)
+    if modo == "original":
+        parametros.setdefault("registros", 2000)
+        parametros.setdefault("segmentos", SEGMENTOS_PADRAO)
+        parametros.setdefault("data_inicio", "2020-01-01")
+        parametros.setdefault("data_fim", "2020-12-31")
+        colunas = gerar_colunas_original(rng=rng, **parametros)
+        tipos = {**TIPOS_COLUNAS_ORIGINAL, **TIPOS_COLUNAS_CHAVE}
+    elif modo == "hotel":
+        parametros.setdefault("data_inicio", "2020-01-01")
+        parametros.setdefault("data_fim", "2020-12-31")
+        colunas = gerar_colunas_hotel(rng=rng, **parametros)
+        tipos = {**TIPOS_COLUNAS_HOTEL, **TIPOS_COLUNAS_CHAVE}
+    else:
+        raise ValueError(f"Modo '{modo}' inválido. Use 'original' ou 'hotel'.")
+    return colunas_para_dataframe(colunas, tipos, biblioteca)
@@ -0,0 +1,140 @@
+# demanda.py
+
+"""
+demanda.py
+
+Descrição:
+-----------
+Este módulo implementa o modelo de demanda (chegadas de hóspedes por dia) do modo hotel único. Nos geradores
+anteriores, as chegadas de cada dia vinham de `random.randint(1, max_clientes_por_dia)`: um hotel de 500 quartos
+nunca lotava, a não ser com um `--max_clientes_por_dia` enorme, e a demanda não variava com o dia da semana, a
+estação ou os feriados.
+
+Aqui, as chegadas de todo o período são sorteadas em uma única chamada, a partir de uma intensidade diária:
+
+   intensidade(dia) = media × curva(dia da semana) × curva(mês) × multiplicador de feriado
+
+com distribuição de Poisson ou binomial negativa (para demandas mais dispersas que a Poisson).
+
+Funcionalidades:
+-----------------
+- MODELOS_DEMANDA: "poisson" e "binomial_negativa". Sem modelo de demanda (`--demanda uniforme`, o padrão), os
+  geradores mantêm o sorteio uniforme entre 1 e max_clientes_por_dia.
+- CURVA_DIA_SEMANA / CURVA_MES: multiplicadores da intensidade (segunda a domingo; janeiro a dezembro).
+- feriados_nacionais(anos): feriados nacionais fixos e móveis (Carnaval, Sexta-feira Santa, Corpus Christi).
+- ModeloDemanda(modelo, media, dispersao, ocupacao_alvo, feriados, multiplicador_feriado):
+  - intensidades(data_inicio, n_dias, total_quartos): intensidade de cada dia (vetorizado).
+  - chegadas(rng, data_inicio, n_dias, total_quartos): número de chegadas de cada dia.
+
+Parâmetros:
+------------
+- media: chegadas esperadas em um dia "neutro". Se não for informada, é calculada a partir do total de quartos e
+  da `ocupacao_alvo`: media = total_quartos × ocupacao_alvo / (diárias médias × quartos médios por reserva).
+- dispersao: parâmetro k da binomial negativa (variância = media + media² / k); quanto menor, mais dispersa.
+- feriados: datas adicionais (YYYY-MM-DD) tratadas como feriado, além dos feriados nacionais.
+- Nos modelos "poisson" e "binomial_negativa", `max_clientes_por_dia` não limita as chegadas.
+
+Uso:
+-----
+   python main.py --modo_hotel_unico --total_quartos 500 --demanda binomial_negativa --dispersao_demanda 8
+"""
+
+from datetime import date, timedelta
+
+import numpy as np
+
+from nucleo import dia_semana
+from reservas import MAX_DIARIAS
+
+MODELOS_DEMANDA = ("poisson", "binomial_negativa")
+
+CURVA_DIA_SEMANA = (0.85, 0.85, 0.9, 1.0, 1.3, 1.2, 0.9)  # segunda a domingo
+CURVA_MES = (1.3, 1.2, 1.0, 0.95, 0.85, 0.9, 1.25, 1.0, 0.9, 0.95, 1.05, 1.25)  # janeiro a dezembro
+
+FERIADOS_FIXOS = ("01-01", "04-21", "05-01", "09-07", "10-12", "11-02", "11-15", "12-25")
+
+# Médias das estadias geradas (quantidade_diarias entre 1 e MAX_DIARIAS; 1 ou 2 quartos por reserva)
+DIARIAS_MEDIAS = (1 + MAX_DIARIAS) / 2
+QUARTOS_MEDIOS = 1.5
+
+
+def _pascoa(ano):
+    """
+    Data do domingo de Páscoa (algoritmo de Meeus/Jones/Butcher, calendário gregoriano).
+    """
+    a, b, c = ano % 19, ano // 100, ano % 100
+    d, e = b // 4, b % 4
+    g = (8 * b + 13) // 25
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = c // 4, c % 4
+    ll = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * ll) // 451
+    mes = (h + ll - 7 * m + 114) // 31
+    dia = (h + ll - 7 * m + 114) % 31 + 1
+    return date(ano, mes, dia)
+
+
+def feriados_nacionais(anos):
+    """
+    Retorna os feriados nacionais (fixos e móveis) dos anos informados, como array datetime64[D].
+    """
+    datas = []
+    for ano in anos:
+        datas.extend(f"{ano}-{dia}" for dia in FERIADOS_FIXOS)
+        pascoa = _pascoa(ano)
+        for deslocamento in (-47, -2, 60):  # Carnaval, Sexta-feira Santa, Corpus Christi
+            datas.append((pascoa + timedelta(days=deslocamento)).isoformat())
+    return np.array(datas, dtype="datetime64[D]")
+
+
+class ModeloDemanda:
+    """
+    Modelo de chegadas diárias de hóspedes.
+    - modelo: "poisson" ou "binomial_negativa".
+    - media: chegadas esperadas em um dia neutro (None = calculada pela ocupacao_alvo).
+    - dispersao: parâmetro k da binomial negativa.
+    - ocupacao_alvo: ocupação média desejada (0 a 1) usada para calcular a media.
+    - feriados: datas adicionais de feriado (YYYY-MM-DD).
+    - multiplicador_feriado: aumento da demanda no feriado e na véspera.
+    """
+
+    def __init__(self, modelo="poisson", media=None, dispersao=5.0, ocupacao_alvo=0.75, feriados=(),
+                 multiplicador_feriado=1.4):
+        if modelo not in MODELOS_DEMANDA:
+            raise ValueError(f"Modelo de demanda '{modelo}' inválido. Use um de {MODELOS_DEMANDA}.")
+        if dispersao <= 0:
+            raise ValueError("A dispersão da demanda deve ser maior que zero.")
+        self.modelo = modelo
+        self.media = media
+        self.dispersao = dispersao
+        self.ocupacao_alvo = ocupacao_alvo
+        self.feriados = np.array(list(feriados), dtype="datetime64[D]")
+        self.multiplicador_feriado = multiplicador_feriado
+
+    def intensidades(self, data_inicio, n_dias, total_quartos):
+        """
+        Retorna a intensidade (chegadas esperadas) de cada dia do período.
+        """
+        dias = np.datetime64(data_inicio, "D") + np.arange(n_dias)
+        media = self.media
+        if media is None:
+            media = total_quartos * self.ocupacao_alvo / (DIARIAS_MEDIAS * QUARTOS_MEDIOS)
+
+        mes = dias.astype("datetime64[M]").astype(np.int64) % 12
+        anos = np.unique(dias.astype("datetime64[Y]").astype(np.int64) + 1970)
+        feriados = np.concatenate((feriados_nacionais(anos.tolist()), self.feriados))
+        em_feriado = np.isin(dias, feriados) | np.isin(dias + 1, feriados)
+
+        return (media * np.asarray(CURVA_DIA_SEMANA)[dia_semana(dias)] * np.asarray(CURVA_MES)[mes]
+                * np.where(em_feriado, self.multiplicador_feriado, 1.0))
+
+    def chegadas(self, rng, data_inicio, n_dias, total_quartos):
+        """
+        Sorteia o número de chegadas de cada dia do período em uma única chamada.
+        - rng: numpy.random.Generator (ou o módulo numpy.random).
+        """
+        intensidade = self.intensidades(data_inicio, n_dias, total_quartos)
+        if self.modelo == "poisson":
+            return rng.poisson(intensidade)
+        # Binomial negativa com média = intensidade e variância = intensidade + intensidade² / dispersao
+        return rng.negative_binomial(self.dispersao, self.dispersao / (self.dispersao + intensidade))
@@ -0,0 +1,133 @@
+# dimensoes.py
+
+"""
+dimensoes.py
+
+Descrição:
+-----------
+Este módulo gera tabelas de dimensão (empresas, cidades e hóspedes) com chaves substitutas estáveis, para saídas
+em esquema estrela. Nos geradores, cada linha do modo original recebia um `fake.company()` e um `fake.city()`
+novos, e cada hóspede do modo hotel um `fake.name()` novo: as linhas não podiam ser relacionadas entre si (a
+mesma empresa não aparecia duas vezes) e as colunas de texto dominavam o tamanho do arquivo.
+
+Com dimensões (`--dimensoes`, motor em lote), cada dimensão tem uma cardinalidade fixa e chaves 1..n, e as
+linhas de fatos guardam apenas a chave inteira (empresa_id, cidade_id, hospede_id), sorteada da dimensão de
+forma uniforme ou por uma distribuição de Zipf (poucas empresas com muitas linhas; hóspedes que retornam).
+
+Funcionalidades:
+-----------------
+- COLUNAS_CHAVE: coluna de texto dos fatos -> coluna de chave que a substitui.
+- TIPOS_COLUNAS_CHAVE: tipo lógico ("inteiro") das colunas de chave, para o armazenamento e as estatísticas.
+- CABECALHOS_DIMENSOES: colunas de cada tabela de dimensão.
+- com_chaves(cabecalho): cabeçalho dos fatos com as colunas de texto trocadas pelas chaves.
+- pesos_zipf(tamanho, expoente): pesos 1 / k^s das chaves 1..tamanho.
+- Dimensoes(empresas, cidades, hospedes, zipf, semente):
+  - chaves(rng, dimensao, n): sorteia n chaves da dimensão em uma única chamada (tabela de alias com Zipf).
+  - gerador(rng): gerador das tabelas (o da `semente`, se informada, ou o dos fatos).
+  - gerar(ctx, dimensao, **colunas): gera a tabela da dimensão (chave, nome do pool do Faker e colunas extras,
+    como o segmento de cada empresa) e a guarda em `tabelas`.
+
+Observações:
+-------------
+- Com Zipf, a chave 1 é a mais frequente; as chaves seguem a ordem de popularidade.
+- No modo original, o segmento pertence à empresa (coluna da dimensão); a coluna segmento dos fatos repete o
+  segmento da empresa de cada linha. Com `--entidades`, as empresas da dimensão são as próprias entidades.
+- Os hóspedes que retornam são os que têm a mesma chave em mais de uma linha; com Zipf, os retornos se
+  concentram nos primeiros hóspedes da dimensão.
+- Com `semente`, as tabelas (nomes e segmentos das empresas) não dependem do gerador dos fatos: gerações com
+  sementes de fatos diferentes, como os pedaços de `--fator_escala` (escala.py), compartilham as mesmas tabelas.
+
+Uso:
+-----
+   python main.py --motor lote --registros 1000000 --dimensoes --num_empresas 5000 --zipf 1.1
+"""
+
+import numpy as np
+
+from categorias import TabelaAlias
+from nucleo import ContextoGeracao
+
+COLUNAS_CHAVE = {"empresa": "empresa_id", "cidade": "cidade_id", "nome_cliente": "hospede_id"}
+
+TIPOS_COLUNAS_CHAVE = {chave: "inteiro" for chave in COLUNAS_CHAVE.values()}
+
+# Dimensão -> (coluna de chave, coluna de nome, método do PoolFaker)
+_ESQUEMA = {
+    "empresas": ("empresa_id", "empresa", "company"),
+    "cidades": ("cidade_id", "cidade", "city"),
+    "hospedes": ("hospede_id", "nome_cliente", "name"),
+}
+
+CABECALHOS_DIMENSOES = {
+    "empresas": ["empresa_id", "empresa", "segmento"],
+    "cidades": ["cidade_id", "cidade"],
+    "hospedes": ["hospede_id", "nome_cliente"],
+}
+
+
+def com_chaves(cabecalho):
+    """
+    Retorna o cabeçalho com as colunas de COLUNAS_CHAVE trocadas pelas colunas de chave.
+    """
+    return [COLUNAS_CHAVE.get(nome, nome) for nome in cabecalho]
+
+
+def pesos_zipf(tamanho, expoente):
+    """
+    Pesos de Zipf (1 / k^expoente) das chaves 1..tamanho.
+    """
+    return 1.0 / np.arange(1, tamanho + 1, dtype=np.float64) ** expoente
+
+
+class Dimensoes:
+    """
+    Cardinalidade e distribuição das chaves das dimensões de uma geração, e as tabelas geradas.
+    - empresas, cidades, hospedes: quantidade de linhas de cada dimensão.
+    - zipf: expoente s da distribuição de Zipf das chaves nos fatos (P(chave k) proporcional a 1 / k^s);
+      None = uniforme.
+    - semente: semente própria das tabelas (None = as tabelas usam o gerador dos fatos).
+    """
+
+    def __init__(self, empresas=1000, cidades=500, hospedes=10_000, zipf=None, semente=None):
+        self.cardinalidades = {"empresas": empresas, "cidades": cidades, "hospedes": hospedes}
+        if min(self.cardinalidades.values()) < 1:
+            raise ValueError("As dimensões devem ter pelo menos uma linha.")
+        if zipf is not None and zipf <= 0:
+            raise ValueError("O expoente de Zipf deve ser maior que zero.")
+        self.zipf = zipf
+        self.tabelas = {}
+        self._alias = {}
+        self._rng = np.random.default_rng(semente) if semente is not None else None
+
+    def gerador(self, rng):
+        """
+        Retorna o gerador das tabelas: o da semente própria ou, sem ela, o gerador dos fatos (rng).
+        """
+        return self._rng if self._rng is not None else rng
+
+    def chaves(self, rng, dimensao, n):
+        """
+        Sorteia n chaves (1..cardinalidade, int64) da dimensão em uma única chamada.
+        """
+        tamanho = self.cardinalidades[dimensao]
+        if self.zipf is None:
+            return rng.integers(1, tamanho + 1, n)
+        if (tamanho, self.zipf) not in self._alias:
+            self._alias[tamanho, self.zipf] = TabelaAlias(pesos_zipf(tamanho, self.zipf))
+        return self._alias[tamanho, self.zipf].amostrar(rng, n) + 1
+
+    def gerar(self, ctx, dimensao, **colunas):
+        """
+        Gera a tabela da dimensão com os nomes do pool do Faker (ContextoGeracao) e a guarda em `tabelas`.
+        - colunas: colunas extras, com uma linha por chave (ex.: segmento=ColunaCategorica das empresas); quando
+          informadas, o seu tamanho define a cardinalidade da dimensão.
+        Retorna a tabela {coluna: array} na ordem de CABECALHOS_DIMENSOES.
+        """
+        chave, nome, metodo = _ESQUEMA[dimensao]
+        if colunas:
+            self.cardinalidades[dimensao] = len(next(iter(colunas.values())))
+        n = self.cardinalidades[dimensao]
+        nomes = ContextoGeracao(self.gerador(ctx.rng), ctx.pool).nomes(metodo, n)
+        tabela = {chave: np.arange(1, n + 1), nome: nomes, **colunas}
+        self.tabelas[dimensao] = {coluna: tabela[coluna] for coluna in CABECALHOS_DIMENSOES[dimensao]}
+        return self.tabelas[dimensao]
@@ -0,0 +1,311 @@
+# equivalencia.py
+
+"""
+equivalencia.py
+
+Descrição:
+-----------
+Este script compara, coluna a coluna, um caminho de geração de referência com um caminho otimizado, usando a mesma
+semente. Os motores otimizados (lote, armazenamento mmap, layout normalizado do hotel, ...) precisam produzir os
+mesmos dados que o motor escalar de hoje (`gerar_dados_empresa` / `gerar_dados_hotel_unico`) ou, quando usam outro
+fluxo de números aleatórios, dados estatisticamente equivalentes.
+
+Cada coluna é comparada de forma vetorizada:
+- "exata": igualdade valor a valor (NaN/None iguais entre si), com a quantidade de diferenças e a primeira linha
+  diferente;
+- "ks": colunas numéricas e datas, pelo teste de Kolmogorov-Smirnov de duas amostras (valores não nulos), mais o
+  teste qui-quadrado da proporção de nulos quando alguma das amostras tiver nulos;
+- "qui_quadrado": colunas categóricas, pelo teste de homogeneidade qui-quadrado das frequências;
+- "ignorada": colunas de texto livre (nomes de empresas, cidades e clientes), sem distribuição a comparar.
+
+Cenários (CENARIOS):
+---------------------
+- "original": linhas independentes de `gerar_dados_empresa` (referência) × `gerar_colunas_original` (lote).
+- "original_colunar" / "original_mmap": os dois caminhos reais do main.py com a mesma semente e os mesmos
+  argumentos (inclusive `--outliers`): `main.gerar_dataset` (lista em memória, ordenada por data) ×
+  `main.gerar_dataset_colunar` com `--armazenamento colunar` / `mmap` (colunas tipadas, counting sort externo);
+  todas as colunas são exatas.
+- "hotel": `gerar_dados_hotel_unico` (referência) × `gerar_colunas_hotel` (lote).
+- "hotel_normalizado": `gerar_colunas_hotel` × junção das tabelas de `gerar_tabelas_hotel` (mesma semente);
+  todas as colunas são exatas.
+
+Funcionalidades:
+-----------------
+- ks_duas_amostras(a, b): estatística D de Kolmogorov-Smirnov de duas amostras.
+- qui_quadrado(frequencias_a, frequencias_b): estatística, graus de liberdade e valor-p do teste de homogeneidade.
+- comparar_datasets(referencia, candidata, tipos, exatas, alfa, diarias): lista de resultados por coluna
+  (coluna, método, aprovada, detalhe).
+- main(): executa um cenário e termina com código 1 se alguma coluna for reprovada.
+
+Uso:
+-----
+   python equivalencia.py original --registros 100000 --semente 1
+   python equivalencia.py original_mmap --registros 200000 --outliers 0.05
+   python equivalencia.py hotel --data_inicio 2020-01-01 --data_fim 2021-12-31 --max_clientes_por_dia 30
+
+Observações:
+-------------
+- O nível `alfa` vale para o conjunto das colunas (correção de Bonferroni: cada teste usa alfa / quantidade de
+  testes), para que dezenas de colunas equivalentes não gerem reprovações por acaso.
+- O valor-p do qui-quadrado usa a aproximação de Wilson-Hilferty (sem scipy).
+- Nos cenários entre motores, a referência usa o mesmo PoolFaker do motor em lote, de modo que as categorias
+  sorteadas do Faker (regiao, estado) venham do mesmo conjunto de valores.
+- O motor escalar do main.py encadeia as linhas (autocorrelação); o cenário "original" usa linhas independentes,
+  que é o que o motor em lote gera. Nos cenários de armazenamento, as séries encadeadas e os outliers de cada linha
+  vêm do mesmo fluxo aleatório nos dois caminhos, e por isso podem ser comparados valor a valor.
+- No cenário "hotel", as colunas diárias (COLUNAS_DIARIAS_HOTEL) são testadas com um valor por dia.
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime
+from functools import partial
+
+import numpy as np
+
+from categorias import ColunaCategorica
+from config import (CABECALHO_HOTEL, CABECALHO_ORIGINAL, COLUNAS_DIARIAS_HOTEL, SEGMENTOS_PADRAO,
+                    TIPOS_COLUNAS_HOTEL, TIPOS_COLUNAS_ORIGINAL)
+from geradores import gerar_data_aleatoria, gerar_dados_empresa
+from geradores_hotel import gerar_dados_hotel_unico
+from geradores_lote import gerar_colunas_hotel, gerar_colunas_original, gerar_tabelas_hotel
+from main import construir_parser, gerar_dataset, gerar_dataset_colunar, preparar_argumentos, validar_argumentos
+from nucleo import fda_normal, obter_pool
+from util import definir_semente
+from validacao import colunas_de_linhas
+
+ALFA = 0.01
+
+
+# --------------------------------------------------------------------------------
+# Testes estatísticos
+# --------------------------------------------------------------------------------
+
+def ks_duas_amostras(a, b):
+    """
+    Estatística D de Kolmogorov-Smirnov entre duas amostras numéricas (maior distância entre as distribuições
+    empíricas, avaliada em todos os valores distintos das duas amostras).
+    """
+    a, b = np.sort(a), np.sort(b)
+    pontos = np.concatenate((a, b))
+    fda_a = np.searchsorted(a, pontos, side="right") / len(a)
+    fda_b = np.searchsorted(b, pontos, side="right") / len(b)
+    return float(np.abs(fda_a - fda_b).max())
+
+
+def qui_quadrado(frequencias_a, frequencias_b):
+    """
+    Teste de homogeneidade qui-quadrado entre duas tabelas de frequências ({categoria: contagem}).
+    Retorna (estatística, graus de liberdade, valor-p).
+    """
+    categorias = sorted((c for c in set(frequencias_a) | set(frequencias_b)
+                         if frequencias_a.get(c, 0) + frequencias_b.get(c, 0) > 0), key=str)
+    observados = np.array([[frequencias_a.get(c, 0) for c in categorias],
+                           [frequencias_b.get(c, 0) for c in categorias]], dtype=np.float64)
+    graus = len(categorias) - 1
+    if graus < 1 or observados.sum(axis=1).min() == 0:
+        return 0.0, max(graus, 0), 1.0
+    esperados = observados.sum(axis=1, keepdims=True) * observados.sum(axis=0) / observados.sum()
+    estatistica = float((np.square(observados - esperados) / esperados).sum())
+    # Wilson-Hilferty: (X/k)^(1/3) é aproximadamente normal
+    z = ((estatistica / graus) ** (1 / 3) - (1 - 2 / (9 * graus))) / np.sqrt(2 / (9 * graus))
+    return estatistica, graus, float(1.0 - fda_normal(z))
+
+
+# --------------------------------------------------------------------------------
+# Comparação das colunas
+# --------------------------------------------------------------------------------
+
+def _objetos(valores):
+    if isinstance(valores, ColunaCategorica):
+        return valores.valores()
+    return np.asarray(valores, dtype=object)
+
+
+def _numeros(valores, tipo):
+    if tipo == "data":
+        return np.asarray(valores, dtype="datetime64[D]").astype(np.float64)  # NaT vira NaN
+    return np.asarray(valores, dtype=np.float64)
+
+
+def _comparar_exata(a, b, tipo):
+    if len(a) != len(b):
+        return False, f"quantidades de linhas diferentes ({len(a)} × {len(b)})"
+    if tipo in ("inteiro", "decimal", "data"):
+        a, b = _numeros(a, tipo), _numeros(b, tipo)
+        iguais = (a == b) | (np.isnan(a) & np.isnan(b))
+    else:
+        iguais = _objetos(a) == _objetos(b)
+    diferentes = np.flatnonzero(~iguais)
+    if len(diferentes) == 0:
+        return True, f"{len(a)} valores idênticos"
+    return False, f"{len(diferentes)} de {len(a)} valores diferentes (primeira linha: {diferentes[0]})"
+
+
+def _um_por_dia(colunas, nome):
+    _, primeiras = np.unique(np.asarray(colunas["data"], dtype="datetime64[D]"), return_index=True)
+    return np.asarray(colunas[nome])[primeiras]
+
+
+def comparar_datasets(referencia, candidata, tipos, exatas=(), alfa=ALFA, diarias=()):
+    """
+    Compara dois datasets coluna a coluna.
+    - referencia, candidata: dicionários {coluna: array} (motor em lote ou `colunas_de_linhas`).
+    - tipos: dicionário coluna -> tipo lógico (TIPOS_COLUNAS_ORIGINAL / TIPOS_COLUNAS_HOTEL).
+    - exatas: colunas comparadas valor a valor (True = todas).
+    - alfa: nível de significância do conjunto de testes estatísticos.
+    - diarias: colunas com um único valor por dia, repetido nas linhas do dia (COLUNAS_DIARIAS_HOTEL); nos testes
+      estatísticos entra apenas o valor da primeira linha de cada dia, para que as amostras sejam de dias, e não
+      de linhas repetidas.
+    Retorna a lista de (coluna, método, aprovada, detalhe), na ordem das colunas da referência.
+    """
+    colunas = [nome for nome in referencia if nome in candidata]
+    exatas = set(colunas) if exatas is True else set(exatas)
+    estatisticas = [nome for nome in colunas if nome not in exatas and tipos.get(nome, "decimal") != "texto"]
+    alfa_teste = alfa / max(1, len(estatisticas))
+
+    resultados = []
+    for nome in colunas:
+        tipo = tipos.get(nome, "decimal")
+        a, b = referencia[nome], candidata[nome]
+        if nome in diarias and nome not in exatas:
+            a, b = _um_por_dia(referencia, nome), _um_por_dia(candidata, nome)
+        if nome in exatas:
+            resultados.append((nome, "exata") + _comparar_exata(a, b, tipo))
+        elif tipo == "texto":
+            resultados.append((nome, "ignorada", True, "texto livre"))
+        elif tipo in ("inteiro", "decimal", "data"):
+            a, b = _numeros(a, tipo), _numeros(b, tipo)
+            nulos_a, nulos_b = np.isnan(a), np.isnan(b)
+            a, b = a[~nulos_a], b[~nulos_b]
+            detalhes, aprovada = [], True
+            if len(a) and len(b):
+                d = ks_duas_amostras(a, b)
+                limite = np.sqrt(-np.log(alfa_teste / 2) / 2) * np.sqrt((len(a) + len(b)) / (len(a) * len(b)))
+                aprovada = d <= limite
+                detalhes.append(f"D = {d:.5f} (limite {limite:.5f})")
+            elif len(a) or len(b):
+                aprovada = False
+                detalhes.append("apenas uma das amostras tem valores")
+            if nulos_a.any() or nulos_b.any():
+                _, _, p = qui_quadrado({True: int(nulos_a.sum()), False: len(a)},
+                                       {True: int(nulos_b.sum()), False: len(b)})
+                aprovada = aprovada and p >= alfa_teste
+                detalhes.append(f"nulos {nulos_a.mean():.2%} × {nulos_b.mean():.2%} (p = {p:.3g})")
+            resultados.append((nome, "ks", bool(aprovada), "; ".join(detalhes)))
+        else:
+            frequencias_a, frequencias_b = Counter(_objetos(a).tolist()), Counter(_objetos(b).tolist())
+            estatistica, graus, p = qui_quadrado(frequencias_a, frequencias_b)
+            resultados.append((nome, "qui_quadrado", p >= alfa_teste,
+                               f"X² = {estatistica:.1f}, {graus} g.l., p = {p:.3g} (limite {alfa_teste:.2g})"))
+    return resultados
+
+
+# --------------------------------------------------------------------------------
+# Cenários
+# --------------------------------------------------------------------------------
+
+def _cenario_original(opcoes):
+    pool = obter_pool()
+    definir_semente(opcoes.semente, pool)
+    linhas = []
+    for i in range(1, opcoes.registros + 1):
+        data_registro = gerar_data_aleatoria(opcoes.data_inicio, opcoes.data_fim)
+        linhas.append([i] + gerar_dados_empresa(pool, random.choice(opcoes.segmentos), data_registro))
+    candidata = gerar_colunas_original(opcoes.registros, opcoes.segmentos, opcoes.data_inicio, opcoes.data_fim,
+                                       outliers=0.0, rng=np.random.default_rng(opcoes.semente), pool=pool)
+    return colunas_de_linhas(CABECALHO_ORIGINAL, linhas), candidata, dict(tipos=TIPOS_COLUNAS_ORIGINAL)
+
+
+def _cenario_original_armazenamento(armazenamento, opcoes):
+    pool = obter_pool()
+    with tempfile.TemporaryDirectory() as diretorio:
+        parser = construir_parser()
+        args = parser.parse_args([
+            "--registros", str(opcoes.registros), "--segmentos", *opcoes.segmentos,
+            "--data_inicio", f"{opcoes.data_inicio:%Y-%m-%d}", "--data_fim", f"{opcoes.data_fim:%Y-%m-%d}",
+            "--outliers", str(opcoes.outliers), "--armazenamento", armazenamento, "--diretorio_mmap", diretorio,
+        ])
+        preparar_argumentos(parser, args)
+        validar_argumentos(parser, args)
+        definir_semente(opcoes.semente, pool)
+        _, linhas = gerar_dataset(args, pool)
+        definir_semente(opcoes.semente, pool)
+        colunar = gerar_dataset_colunar(args, pool)
+        candidata = colunas_de_linhas(CABECALHO_ORIGINAL, colunar.ler_bloco(0, colunar.tamanho))
+    return colunas_de_linhas(CABECALHO_ORIGINAL, linhas), candidata, dict(tipos=TIPOS_COLUNAS_ORIGINAL, exatas=True)
+
+
+def _cenario_hotel(opcoes):
+    pool = obter_pool()
+    definir_semente(opcoes.semente, pool)
+    linhas = gerar_dados_hotel_unico(pool, total_quartos=opcoes.total_quartos, data_inicio=opcoes.data_inicio,
+                                     data_fim=opcoes.data_fim, max_clientes_por_dia=opcoes.max_clientes_por_dia)
+    candidata = gerar_colunas_hotel(total_quartos=opcoes.total_quartos, data_inicio=opcoes.data_inicio,
+                                    data_fim=opcoes.data_fim, max_clientes_por_dia=opcoes.max_clientes_por_dia,
+                                    rng=np.random.default_rng(opcoes.semente), pool=pool)
+    return colunas_de_linhas(CABECALHO_HOTEL, linhas), candidata, dict(tipos=TIPOS_COLUNAS_HOTEL, diarias=COLUNAS_DIARIAS_HOTEL)
+
+
+def _cenario_hotel_normalizado(opcoes):
+    parametros = dict(total_quartos=opcoes.total_quartos, data_inicio=opcoes.data_inicio, data_fim=opcoes.data_fim,
+                      max_clientes_por_dia=opcoes.max_clientes_por_dia, pool=obter_pool())
+    referencia = gerar_colunas_hotel(rng=np.random.default_rng(opcoes.semente), **parametros)
+    hospedes, kpis = gerar_tabelas_hotel(rng=np.random.default_rng(opcoes.semente), **parametros)
+    indice_dia = (hospedes["data"] - kpis["data"][0]).astype(np.int64)
+    candidata = dict(hospedes)
+    candidata.update({nome: kpis[nome][indice_dia] for nome in COLUNAS_DIARIAS_HOTEL})
+    return referencia, candidata, dict(tipos=TIPOS_COLUNAS_HOTEL, exatas=True)
+
+
+CENARIOS = {
+    "original": _cenario_original,
+    "original_colunar": partial(_cenario_original_armazenamento, "colunar"),
+    "original_mmap": partial(_cenario_original_armazenamento, "mmap"),
+    "hotel": _cenario_hotel,
+    "hotel_normalizado": _cenario_hotel_normalizado,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara um caminho de geração otimizado com o de referência.")
+    parser.add_argument("cenario", choices=CENARIOS, help="Par de caminhos comparado.")
+    parser.add_argument("--registros", type=int, default=100_000, help="Linhas dos cenários do modo original.")
+    parser.add_argument("--segmentos", nargs="+", default=SEGMENTOS_PADRAO, help="Segmentos do modo original.")
+    parser.add_argument("--data_inicio", type=lambda s: datetime.strptime(s, "%Y-%m-%d"),
+                        default="2020-01-01", help="Data de início (YYYY-MM-DD).")
+    parser.add_argument("--data_fim", type=lambda s: datetime.strptime(s, "%Y-%m-%d"),
+                        default="2020-12-31", help="Data de fim (YYYY-MM-DD).")
+    parser.add_argument("--total_quartos", type=int, default=100, help="Total de quartos (cenários do hotel).")
+    parser.add_argument("--max_clientes_por_dia", type=int, default=20,
+                        help="Máximo de chegadas por dia (cenários do hotel).")
+    parser.add_argument("--outliers", type=float, default=0.01,
+                        help="Probabilidade de outliers dos cenários de armazenamento do main.py.")
+    parser.add_argument("--semente", type=int, default=1, help="Semente dos dois caminhos.")
+    parser.add_argument("--alfa", type=float, default=ALFA,
+                        help="Nível de significância do conjunto de testes estatísticos.")
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    referencia, candidata, opcoes = CENARIOS[args.cenario](args)
+    geracao = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    resultados = comparar_datasets(referencia, candidata, alfa=args.alfa, **opcoes)
+    comparacao = time.perf_counter() - inicio
+
+    for nome, metodo, aprovada, detalhe in resultados:
+        print(f"[{'OK' if aprovada else 'DIFERENTE'}] {nome} ({metodo}): {detalhe}")
+    falhas = sum(not aprovada for _, _, aprovada, _ in resultados)
+    print(f"{len(resultados) - falhas}/{len(resultados)} colunas equivalentes "
+          f"({len(next(iter(referencia.values())))} × {len(next(iter(candidata.values())))} linhas; "
+          f"geração: {geracao:.2f}s, comparação: {comparacao:.2f}s).")
+    if falhas:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
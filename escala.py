@@ -0,0 +1,179 @@
+# escala.py
+
+"""
+escala.py
+
+Descrição:
+-----------
+Este módulo define fatores de escala no estilo TPC para gerar datasets de teste de carga com um único parâmetro:
+SF1 = 1 milhão de linhas, SF100 = 100 milhões. O fator determina, de forma determinística, a quantidade de
+registros, a cardinalidade das dimensões (empresas, cidades e hóspedes), o período das datas e a quantidade de
+hotéis, e a geração é dividida em pedaços executados em paralelo pelo executor de lotes (executor_lote.py), com
+o motor em lote e as tabelas de dimensão (dimensoes.py).
+
+Funcionalidades:
+-----------------
+- LINHAS_POR_FATOR: linhas de fatos de SF1.
+- LINHAS_POR_PEDACO: tamanho máximo de cada pedaço do modo original (um trabalho, um arquivo).
+- QUARTOS_POR_HOTEL: quartos de cada hotel do modo hotel.
+- VAZAO_ALVO_POR_NUCLEO: vazão alvo (linhas/s, geração + gravação do CSV) de um processo em cada modo.
+- parametros_escala(fator): registros, num_empresas, num_cidades, num_hospedes, data_inicio, data_fim, hoteis
+  e linhas_por_hotel de um fator de escala.
+- trabalhos_escala(fator, opcoes, diretorio, semente): lista de trabalhos (opções do main.py) da geração:
+  pedaços de até LINHAS_POR_PEDACO linhas no modo original ou um trabalho por hotel no modo hotel.
+- executar_escala(fator, opcoes, diretorio, trabalhadores, tamanho_pool_faker, semente): executa os trabalhos
+  em paralelo, grava `escala.json` com os parâmetros e a vazão medida e retorna esse resumo.
+
+Regras de escala:
+------------------
+- registros = fator × 1.000.000 (no modo hotel, aproximado: as chegadas são sorteadas e limitadas pelos quartos
+  livres).
+- num_empresas = fator × 10.000 (mínimo 100); num_hospedes = fator × 200.000 (mínimo 1.000).
+- num_cidades = 500 × √fator, entre 50 e 5.570 (a quantidade de municípios do Brasil).
+- período: a partir de 2020-01-01, 1 ano até SF9, 2 anos de SF10 a SF99, 3 anos de SF100 a SF999, etc.
+- hoteis: hotéis de QUARTOS_POR_HOTEL quartos, com demanda de Poisson, em quantidade suficiente para as linhas
+  esperadas (cada hotel gera cerca de 9,5 mil linhas por ano).
+
+Observações:
+-------------
+- Os pedaços recebem sementes derivadas de `semente` (numpy.random.SeedSequence) e numeram registro_id sem
+  repetição; as tabelas de dimensão usam uma semente própria, comum a todos os pedaços, e são gravadas uma única
+  vez (dim_<dimensao>.csv). Com a mesma semente, o resultado é o mesmo para qualquer quantidade de processos.
+- O gerador do modo hotel simula um único hotel; no modo hotel, cada hotel é um trabalho e um arquivo, e todos
+  compartilham a dimensão de hóspedes (hóspedes que visitam vários hotéis da rede).
+- As opções informadas junto com o fator (segmentos, outliers, modelo, zipf, layout, etc.) valem para todos os
+  trabalhos; as opções definidas pelo fator são substituídas.
+
+Uso:
+-----
+   python main.py --fator_escala 10 --arquivo_saida sf10 --semente 1 --trabalhadores 8
+   python main.py --scale-factor 1 --modo_hotel_unico --arquivo_saida hoteis_sf1
+"""
+
+import asyncio
+import json
+import math
+import os
+import time
+
+import numpy as np
+
+from demanda import ModeloDemanda
+from dimensoes import CABECALHOS_DIMENSOES
+from executor_lote import executar_lote
+
+LINHAS_POR_FATOR = 1_000_000
+LINHAS_POR_PEDACO = 250_000
+QUARTOS_POR_HOTEL = 200
+ANO_INICIAL = 2020
+MAX_CIDADES = 5570
+
+# Vazão medida em um núcleo (motor em lote, pool do Faker com 5000 valores, gravação do CSV incluída):
+# a gravação do CSV responde pela maior parte do tempo.
+VAZAO_ALVO_POR_NUCLEO = {"original": 20_000, "hotel": 30_000}
+
+
+def parametros_escala(fator):
+    """
+    Retorna os parâmetros da geração de um fator de escala (fator > 0), sempre os mesmos para o mesmo fator.
+    """
+    if not fator > 0:
+        raise ValueError("O fator de escala deve ser maior que zero.")
+    registros = max(1, round(fator * LINHAS_POR_FATOR))
+    anos = 1 + max(0, math.floor(math.log10(fator)))
+    data_inicio = f"{ANO_INICIAL}-01-01"
+    data_fim = f"{ANO_INICIAL + anos - 1}-12-31"
+    n_dias = int((np.datetime64(data_fim, "D") - np.datetime64(data_inicio, "D")).astype(np.int64)) + 1
+    linhas_por_hotel = float(ModeloDemanda("poisson").intensidades(data_inicio, n_dias, QUARTOS_POR_HOTEL).sum())
+    return {
+        "registros": registros,
+        "num_empresas": max(100, round(fator * 10_000)),
+        "num_cidades": min(MAX_CIDADES, max(50, round(500 * math.sqrt(fator)))),
+        "num_hospedes": max(1000, round(fator * 200_000)),
+        "data_inicio": data_inicio,
+        "data_fim": data_fim,
+        "hoteis": max(1, round(registros / linhas_por_hotel)),
+        "linhas_por_hotel": round(linhas_por_hotel),
+    }
+
+
+def _sementes(semente, quantidade):
+    """
+    Deriva a semente das dimensões e as sementes dos trabalhos de uma semente (None = aleatória).
+    """
+    sequencia = np.random.SeedSequence(semente)
+    filhas = [int(filha.generate_state(1)[0]) for filha in sequencia.spawn(quantidade)]
+    return int(sequencia.generate_state(1)[0]), filhas
+
+
+def trabalhos_escala(fator, opcoes, diretorio, semente=None):
+    """
+    Monta os trabalhos (dicionários de opções do main.py, como em executor_lote.py) de um fator de escala.
+    - opcoes: opções comuns a todos os trabalhos (ex.: {"modo_hotel_unico": True, "zipf": 1.1}).
+    - diretorio: diretório dos arquivos gerados.
+    - semente: semente da geração inteira (None = aleatória).
+    """
+    p = parametros_escala(fator)
+    hotel = bool(opcoes.get("modo_hotel_unico"))
+    comum = {**opcoes, "motor": "lote", "dimensoes": True, "data_inicio": p["data_inicio"],
+             "data_fim": p["data_fim"], "num_empresas": p["num_empresas"], "num_cidades": p["num_cidades"],
+             "num_hospedes": p["num_hospedes"]}
+
+    if hotel:
+        if comum.get("demanda", "uniforme") == "uniforme":
+            comum["demanda"] = "poisson"
+        largura = len(str(p["hoteis"]))
+        pedacos = [{"nome": f"hotel-{i:0{largura}d}", "nome_hotel": f"Hotel {i:0{largura}d}",
+                    "total_quartos": QUARTOS_POR_HOTEL} for i in range(1, p["hoteis"] + 1)]
+    else:
+        quantidade = math.ceil(p["registros"] / LINHAS_POR_PEDACO)
+        base, resto = divmod(p["registros"], quantidade)
+        pedacos, primeiro_id = [], 1
+        for i in range(quantidade):
+            registros = base + (i < resto)
+            pedacos.append({"nome": f"parte-{i:05d}", "registros": registros, "primeiro_id": primeiro_id})
+            primeiro_id += registros
+
+    semente_dimensoes, sementes = _sementes(semente, len(pedacos))
+    trabalhos = []
+    for i, (pedaco, semente_trabalho) in enumerate(zip(pedacos, sementes)):
+        trabalhos.append({**comum, **pedaco, "semente": semente_trabalho, "semente_dimensoes": semente_dimensoes,
+                          # As tabelas de dimensão são as mesmas em todos os trabalhos: só o primeiro as grava
+                          "omitir_tabelas_dimensao": i > 0,
+                          "arquivo_saida": os.path.join(diretorio, pedaco["nome"] + ".csv")})
+    return trabalhos
+
+
+def executar_escala(fator, opcoes, diretorio, trabalhadores=None, tamanho_pool_faker=5000, semente=None):
+    """
+    Executa a geração de um fator de escala em paralelo (executor_lote.executar_lote) e grava
+    `<diretorio>/escala.json` com os parâmetros, a vazão total e por processo e o resultado de cada trabalho.
+    Retorna o resumo gravado.
+    """
+    os.makedirs(diretorio, exist_ok=True)
+    trabalhos = trabalhos_escala(fator, opcoes, diretorio, semente)
+    processos = min(trabalhadores or os.cpu_count(), len(trabalhos))
+    inicio = time.perf_counter()
+    resultados = asyncio.run(executar_lote(trabalhos, processos, tamanho_pool_faker))
+    tempo_total = time.perf_counter() - inicio
+
+    # As tabelas de dimensão do primeiro trabalho passam a ser as do diretório
+    primeiro = os.path.splitext(trabalhos[0]["arquivo_saida"])[0]
+    for dimensao in CABECALHOS_DIMENSOES:
+        if os.path.exists(f"{primeiro}_dim_{dimensao}.csv"):
+            os.replace(f"{primeiro}_dim_{dimensao}.csv", os.path.join(diretorio, f"dim_{dimensao}.csv"))
+
+    modo = "hotel" if opcoes.get("modo_hotel_unico") else "original"
+    linhas = sum(r["linhas"] for r in resultados)
+    vazao = linhas / tempo_total if tempo_total > 0 else 0.0
+    resumo = {
+        "fator": fator, "modo": modo, "parametros": parametros_escala(fator), "processos": processos,
+        "linhas": linhas, "tempo_total": round(tempo_total, 3), "linhas_por_segundo": round(vazao, 1),
+        "linhas_por_segundo_por_processo": round(vazao / processos, 1),
+        "vazao_alvo_por_nucleo": VAZAO_ALVO_POR_NUCLEO[modo],
+        "falhas": sum(1 for r in resultados if r["erro"]),
+        "trabalhos": sorted(resultados, key=lambda r: r["nome"]),
+    }
+    with open(os.path.join(diretorio, "escala.json"), "w", encoding="utf-8") as arquivo:
+        json.dump(resumo, arquivo, ensure_ascii=False, indent=2)
+    return resumo
@@ -0,0 +1,228 @@
+# estatisticas.py
+
+"""
+estatisticas.py
+
+Descrição:
+-----------
+Este módulo calcula estatísticas por coluna de forma incremental (streaming), durante a gravação do dataset, e as
+grava em um arquivo JSON ao lado da saída (`--estatisticas`). A validação dos datasets gerados era feita com uma
+segunda leitura completa do CSV para obter mínimos, máximos, médias e contagens de nulos; com o arquivo de
+estatísticas, essa passagem extra deixa de ser necessária.
+
+As estatísticas são acumuladas bloco a bloco, com memória constante em relação à quantidade de linhas:
+- colunas "inteiro" e "decimal": contagem, nulos, mínimo, máximo, média e desvio padrão (Welford, com a fórmula
+  de combinação de Chan et al. aplicada a cada bloco) e quantis aproximados por uma amostra de reservatório;
+- colunas "data": contagem, nulos, data mínima e máxima;
+- colunas "categoria" e "texto": contagem, nulos e frequência de cada valor (colunas com mais de `max_categorias`
+  valores distintos, como nomes de empresas, passam a registrar apenas a contagem e os nulos).
+
+Funcionalidades:
+-----------------
+- AcumuladorEstatisticas(cabecalho, tipos, tamanho_reservatorio, max_categorias, rng):
+  - atualizar(dados): acrescenta uma lista de linhas ou um dicionário {coluna: array} do motor em lote (colunas
+    categóricas são contadas pelos códigos, com `numpy.bincount`, sem convertê-las em texto).
+  - resultado(): dicionário {"linhas": n, "colunas": {coluna: estatísticas}}.
+  - salvar(caminho): grava o resultado em JSON.
+- QUANTIS: quantis informados para as colunas numéricas.
+
+Observações:
+-------------
+- A amostra de reservatório mantém as `tamanho_reservatorio` linhas com as menores chaves aleatórias (amostra
+  uniforme sem reposição); os quantis são exatos enquanto a coluna tiver menos valores do que o reservatório.
+- Os tipos das colunas vêm de TIPOS_COLUNAS_ORIGINAL / TIPOS_COLUNAS_HOTEL (config.py); colunas sem tipo são
+  tratadas como "decimal".
+- Com outliers, as estatísticas refletem os valores gravados (após os outliers).
+"""
+
+import json
+from collections import Counter
+
+import numpy as np
+
+from categorias import ColunaCategorica
+from util import TAMANHO_BLOCO_ESCRITA
+
+QUANTIS = (0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99)
+TAMANHO_RESERVATORIO = 10_000
+MAX_CATEGORIAS = 1_000
+
+
+def _numero(valor, tipo):
+    """
+    Converte um mínimo/máximo para o JSON (int nas colunas inteiras sem outliers fracionários).
+    """
+    valor = float(valor)
+    return int(valor) if tipo == "inteiro" and valor.is_integer() else valor
+
+
+class _EstatisticasNumericas:
+    """
+    Contagem, mínimo, máximo, média e M2 (Welford/Chan) e amostra de reservatório de uma coluna numérica.
+    """
+
+    def __init__(self, tamanho_reservatorio):
+        self.n = self.nulos = 0
+        self.media = self.m2 = 0.0
+        self.minimo, self.maximo = np.inf, -np.inf
+        self.tamanho_reservatorio = tamanho_reservatorio
+        self.chaves = np.empty(0)
+        self.amostra = np.empty(0)
+
+    def atualizar(self, valores, rng):
+        valores = np.asarray(valores, dtype=np.float64)
+        validos = valores[~np.isnan(valores)]
+        self.nulos += len(valores) - len(validos)
+        n_bloco = len(validos)
+        if n_bloco == 0:
+            return
+        media_bloco = validos.mean()
+        m2_bloco = np.square(validos - media_bloco).sum()
+        n = self.n + n_bloco
+        delta = media_bloco - self.media
+        self.media += delta * n_bloco / n
+        self.m2 += m2_bloco + delta * delta * self.n * n_bloco / n
+        self.n = n
+        self.minimo = min(self.minimo, validos.min())
+        self.maximo = max(self.maximo, validos.max())
+
+        chaves = np.concatenate((self.chaves, rng.random(n_bloco)))
+        amostra = np.concatenate((self.amostra, validos))
+        if len(chaves) > self.tamanho_reservatorio:
+            menores = np.argpartition(chaves, self.tamanho_reservatorio - 1)[:self.tamanho_reservatorio]
+            chaves, amostra = chaves[menores], amostra[menores]
+        self.chaves, self.amostra = chaves, amostra
+
+    def resultado(self, tipo):
+        resultado = {"tipo": tipo, "contagem": self.n, "nulos": self.nulos}
+        if self.n == 0:
+            return resultado
+        quantis = np.quantile(self.amostra, QUANTIS)
+        resultado.update(
+            minimo=_numero(self.minimo, tipo),
+            maximo=_numero(self.maximo, tipo),
+            media=round(float(self.media), 6),
+            desvio=round(float(np.sqrt(self.m2 / (self.n - 1))), 6) if self.n > 1 else 0.0,
+            quantis={f"p{round(q * 100):02d}": round(float(v), 6) for q, v in zip(QUANTIS, quantis)},
+        )
+        return resultado
+
+
+class _EstatisticasDatas:
+    """
+    Contagem, nulos e datas mínima e máxima (em dias desde 1970-01-01).
+    """
+
+    def __init__(self):
+        self.n = self.nulos = 0
+        self.minimo = self.maximo = None
+
+    def atualizar(self, valores, rng):
+        dias = np.asarray(valores, dtype="datetime64[D]")
+        validos = dias[~np.isnat(dias)].astype(np.int64)
+        self.nulos += len(dias) - len(validos)
+        self.n += len(validos)
+        if len(validos):
+            menor, maior = int(validos.min()), int(validos.max())
+            self.minimo = menor if self.minimo is None else min(self.minimo, menor)
+            self.maximo = maior if self.maximo is None else max(self.maximo, maior)
+
+    def resultado(self, tipo):
+        resultado = {"tipo": tipo, "contagem": self.n, "nulos": self.nulos}
+        if self.n:
+            resultado.update(minimo=str(np.datetime64(self.minimo, "D")),
+                             maximo=str(np.datetime64(self.maximo, "D")))
+        return resultado
+
+
+class _EstatisticasCategoricas:
+    """
+    Contagem, nulos e frequências (enquanto a coluna tiver até `max_categorias` valores distintos).
+    """
+
+    def __init__(self, max_categorias):
+        self.n = self.nulos = 0
+        self.max_categorias = max_categorias
+        self.frequencias = Counter()
+
+    def atualizar(self, valores, rng):
+        if isinstance(valores, ColunaCategorica):
+            codigos = valores.codigos
+            validos = codigos[codigos >= 0]
+            contagem = {valores.dicionario[codigo]: int(quantidade)
+                        for codigo, quantidade in enumerate(np.bincount(validos, minlength=len(valores.dicionario)))
+                        if quantidade}
+            nulos = len(codigos) - len(validos)
+        else:
+            contagem = Counter(valores.tolist() if isinstance(valores, np.ndarray) else valores)
+            nulos = contagem.pop(None, 0)
+        self.nulos += nulos
+        self.n += sum(contagem.values())
+        if self.frequencias is not None:
+            self.frequencias.update(contagem)
+            if len(self.frequencias) > self.max_categorias:
+                self.frequencias = None
+
+    def resultado(self, tipo):
+        resultado = {"tipo": tipo, "contagem": self.n, "nulos": self.nulos}
+        if self.frequencias is not None:
+            resultado.update(distintos=len(self.frequencias), frequencias=dict(self.frequencias.most_common()))
+        return resultado
+
+
+class AcumuladorEstatisticas:
+    """
+    Estatísticas por coluna, acumuladas bloco a bloco.
+    - cabecalho: colunas do dataset.
+    - tipos: dicionário coluna -> tipo lógico ("inteiro", "decimal", "data", "categoria" ou "texto").
+    - tamanho_reservatorio: valores guardados por coluna numérica para os quantis.
+    - max_categorias: limite de valores distintos com frequência registrada.
+    - rng: numpy.random.Generator usado na amostra de reservatório.
+    """
+
+    def __init__(self, cabecalho, tipos=None, tamanho_reservatorio=TAMANHO_RESERVATORIO,
+                 max_categorias=MAX_CATEGORIAS, rng=None):
+        tipos = tipos or {}
+        self.cabecalho = list(cabecalho)
+        self.tipos = {nome: tipos.get(nome, "decimal") for nome in self.cabecalho}
+        self.rng = rng if rng is not None else np.random.default_rng(0)
+        self.linhas = 0
+        self.colunas = {}
+        for nome, tipo in self.tipos.items():
+            if tipo in ("inteiro", "decimal"):
+                self.colunas[nome] = _EstatisticasNumericas(tamanho_reservatorio)
+            elif tipo == "data":
+                self.colunas[nome] = _EstatisticasDatas()
+            else:
+                self.colunas[nome] = _EstatisticasCategoricas(max_categorias)
+
+    def atualizar(self, dados, tamanho_bloco=TAMANHO_BLOCO_ESCRITA):
+        """
+        Acrescenta os dados (lista de linhas, na ordem do cabeçalho, ou dicionário {coluna: array}).
+        """
+        if isinstance(dados, dict):
+            total = len(dados[self.cabecalho[0]]) if self.cabecalho else 0
+            for inicio in range(0, total, tamanho_bloco):
+                for nome in self.cabecalho:
+                    self.colunas[nome].atualizar(dados[nome][inicio:inicio + tamanho_bloco], self.rng)
+            self.linhas += total
+            return
+        for inicio in range(0, len(dados), tamanho_bloco):
+            bloco = dados[inicio:inicio + tamanho_bloco]
+            for nome, valores in zip(self.cabecalho, zip(*bloco)):
+                self.colunas[nome].atualizar(valores, self.rng)
+            self.linhas += len(bloco)
+
+    def resultado(self):
+        """
+        Retorna {"linhas": n, "colunas": {coluna: estatísticas}}.
+        """
+        return {"linhas": self.linhas,
+                "colunas": {nome: self.colunas[nome].resultado(tipo) for nome, tipo in self.tipos.items()}}
+
+    def salvar(self, caminho):
+        """
+        Grava o resultado em um arquivo JSON.
+        """
+        with open(caminho, "w", encoding="utf-8") as arquivo:
+            json.dump(self.resultado(), arquivo, ensure_ascii=False, indent=2)
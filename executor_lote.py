@@ -0,0 +1,176 @@
+# executor_lote.py
+
+"""
+executor_lote.py
+
+Descrição:
+-----------
+Este script executa vários trabalhos de geração (datasets) em paralelo a partir de um arquivo de manifesto
+(JSON ou YAML). Ele substitui o uso de um laço no shell chamando `python main.py` várias vezes: os trabalhos são
+distribuídos em um pool limitado de processos, coordenados com asyncio, e cada processo reaproveita o mesmo
+Faker e o mesmo pool de valores pré-gerados (ver trabalhadores.py) entre todos os trabalhos que executar.
+
+Formato do Manifesto:
+----------------------
+Cada trabalho usa exatamente os mesmos parâmetros do main.py (sem os "--"). A chave opcional "padrao" define
+valores comuns a todos os trabalhos, e "nome" identifica o trabalho no relatório (padrão: o arquivo de saída).
+
+   {
+     "trabalhadores": 4,
+     "padrao": {"data_inicio": "2022-01-01", "data_fim": "2022-12-31", "semente": 1},
+     "trabalhos": [
+       {"nome": "varejo", "registros": 50000, "segmentos": ["Varejo"], "arquivo_saida": "varejo_2022.csv"},
+       {"nome": "hotel_luxo", "modo_hotel_unico": true, "nome_hotel": "Hotel Luxo",
+        "total_quartos": 120, "arquivo_saida": "hotel_luxo_2022.csv"}
+     ]
+   }
+
+O manifesto também pode ser apenas a lista de trabalhos. Arquivos ".yaml"/".yml" requerem a biblioteca PyYAML.
+
+Funcionalidades:
+-----------------
+- carregar_manifesto(caminho): lê o manifesto e retorna (lista de trabalhos já combinados com "padrao",
+  quantidade de trabalhadores ou None).
+- executar_lote(trabalhos, trabalhadores): executa os trabalhos em paralelo e retorna a lista de resultados
+  (nome, arquivo, linhas, duração, linhas por segundo, erro).
+- Ao final, imprime a duração e a vazão (linhas/s) de cada trabalho, o tempo total (wall time) e a soma das
+  durações individuais, que corresponde aproximadamente ao tempo de uma execução serial.
+
+Uso:
+-----
+   python executor_lote.py manifesto_noturno.json --trabalhadores 8 --relatorio relatorio.json
+
+Observações:
+-------------
+- Um erro em um trabalho não interrompe os demais; o script termina com código 1 se algum trabalho falhar.
+- Dois trabalhos não podem gravar no mesmo arquivo: além de `arquivo_saida`, são comparados os arquivos derivados
+  (KPIs diários, rollups e `estado_rollups`, estatísticas, dimensões, partições e colunas mmap).
+- Cada trabalho passa pelas mesmas validações do main.py; uma combinação de opções inválida faz o trabalho
+  falhar com a mensagem do erro, em vez de a opção ser ignorada.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from trabalhadores import arquivos_do_trabalho, executar_trabalho, inicializar_trabalhador
+
+try:
+    import yaml
+except ImportError:  # dependência opcional, usada apenas em manifestos YAML
+    yaml = None
+
+
+def carregar_manifesto(caminho):
+    """
+    Lê o manifesto (JSON ou YAML) e retorna uma tupla (trabalhos, trabalhadores).
+    - trabalhos: lista de dicionários de opções, já combinados com os valores de "padrao".
+    - trabalhadores: quantidade de processos definida no manifesto (ou None).
+    """
+    with open(caminho, encoding="utf-8") as arquivo:
+        if caminho.lower().endswith((".yaml", ".yml")):
+            if yaml is None:
+                raise RuntimeError("Manifestos YAML requerem a biblioteca 'PyYAML' (pip install pyyaml).")
+            manifesto = yaml.safe_load(arquivo)
+        else:
+            manifesto = json.load(arquivo)
+
+    if isinstance(manifesto, list):
+        manifesto = {"trabalhos": manifesto}
+    padrao = manifesto.get("padrao", {})
+    trabalhos = [{**padrao, **trabalho} for trabalho in manifesto.get("trabalhos", [])]
+    if not trabalhos:
+        raise ValueError(f"O manifesto '{caminho}' não contém trabalhos.")
+
+    # Arquivo principal e derivados (KPIs diários, rollups e o seu estado, estatísticas, dimensões, mmap)
+    trabalhos_por_caminho = {}
+    for trabalho in trabalhos:
+        opcoes = {nome: valor for nome, valor in trabalho.items() if nome != "nome"}
+        for caminho in set(arquivos_do_trabalho(opcoes)):
+            trabalhos_por_caminho[caminho] = trabalhos_por_caminho.get(caminho, 0) + 1
+    repetidos = sorted(caminho for caminho, quantidade in trabalhos_por_caminho.items() if quantidade > 1)
+    if repetidos:
+        raise ValueError(f"Trabalhos diferentes gravando no mesmo arquivo: {', '.join(repetidos)}.")
+    return trabalhos, manifesto.get("trabalhadores")
+
+
+async def _executar_trabalho(loop, executor, trabalho):
+    """
+    Envia um trabalho ao pool de processos e devolve o dicionário de resultado.
+    """
+    opcoes = dict(trabalho)
+    nome = opcoes.pop("nome", None) or opcoes.get("arquivo_saida", "dados.csv")
+    resultado = {"nome": nome, "arquivo": opcoes.get("arquivo_saida", "dados.csv"),
+                 "linhas": 0, "duracao": 0.0, "linhas_por_segundo": 0.0, "erro": None}
+    try:
+        linhas, duracao = await loop.run_in_executor(executor, partial(executar_trabalho, opcoes))
+    except Exception as erro:  # um trabalho com erro não interrompe os demais
+        resultado["erro"] = str(erro)
+    else:
+        resultado.update(linhas=linhas, duracao=round(duracao, 3),
+                         linhas_por_segundo=round(linhas / duracao, 1) if duracao > 0 else 0.0)
+    return resultado
+
+
+async def executar_lote(trabalhos, trabalhadores=None, tamanho_pool_faker=5000):
+    """
+    Executa os trabalhos em um pool limitado de processos e retorna a lista de resultados,
+    na ordem em que os trabalhos terminaram.
+    """
+    loop = asyncio.get_running_loop()
+    quantidade = min(trabalhadores or os.cpu_count(), len(trabalhos))
+    resultados = []
+    with ProcessPoolExecutor(max_workers=quantidade, initializer=inicializar_trabalhador,
+                             initargs=(tamanho_pool_faker,)) as executor:
+        tarefas = [_executar_trabalho(loop, executor, trabalho) for trabalho in trabalhos]
+        for tarefa in asyncio.as_completed(tarefas):
+            resultado = await tarefa
+            resultados.append(resultado)
+            if resultado["erro"]:
+                print(f"[ERRO] {resultado['nome']}: {resultado['erro']}")
+            else:
+                print(f"[OK] {resultado['nome']}: {resultado['linhas']} linhas em {resultado['duracao']:.2f}s "
+                      f"({resultado['linhas_por_segundo']:.0f} linhas/s)")
+    return resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Executa vários trabalhos de geração a partir de um manifesto.")
+    parser.add_argument("manifesto", type=str, help="Arquivo de manifesto (JSON ou YAML).")
+    parser.add_argument("--trabalhadores", type=int, default=None,
+                        help="Quantidade máxima de processos (padrão: valor do manifesto ou número de CPUs).")
+    parser.add_argument("--tamanho_pool_faker", type=int, default=5000,
+                        help="Valores pré-gerados por método do Faker em cada processo.")
+    parser.add_argument("--relatorio", type=str, default=None,
+                        help="Arquivo JSON onde o relatório por trabalho será gravado.")
+    args = parser.parse_args()
+
+    trabalhos, trabalhadores_manifesto = carregar_manifesto(args.manifesto)
+    inicio = time.perf_counter()
+    resultados = asyncio.run(executar_lote(
+        trabalhos, args.trabalhadores or trabalhadores_manifesto, args.tamanho_pool_faker
+    ))
+    tempo_total = time.perf_counter() - inicio
+
+    total_linhas = sum(r["linhas"] for r in resultados)
+    soma_duracoes = sum(r["duracao"] for r in resultados)
+    falhas = [r for r in resultados if r["erro"]]
+    print(f"{len(resultados) - len(falhas)}/{len(resultados)} trabalhos concluídos, {total_linhas} linhas "
+          f"em {tempo_total:.2f}s (soma das durações: {soma_duracoes:.2f}s).")
+
+    if args.relatorio:
+        with open(args.relatorio, "w", encoding="utf-8") as arquivo:
+            json.dump({"tempo_total": round(tempo_total, 3), "soma_duracoes": round(soma_duracoes, 3),
+                       "total_linhas": total_linhas, "trabalhos": resultados},
+                      arquivo, ensure_ascii=False, indent=2)
+    if falhas:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -15,7 +15,8 @@ ao longo do tempo.
 Funcionalidades Principais:
 -----------------------------
 1. Geração de Datas:
-   - Função `gerar_data_aleatoria`: Gera uma data aleatória entre duas datas fornecidas (início e fim).
+   - Função `gerar_data_aleatoria` (nucleo.py, reexportada aqui): Gera uma data aleatória entre duas datas
+     fornecidas (início e fim).
 
 2. Geração de Dados Gerais:
    - Função `_gerar_dados_gerais`: Utiliza a biblioteca Faker para criar dados gerais (como região, estado, país,
@@ -31,6 +32,8 @@ Funcionalidades Principais:
            - "Saúde" e "Hospital": tempo médio de atendimento;
            - "TI", "SaaS" e segmentos relacionados: geração de métricas de uso (usuários ativos, tempo médio de sessão),
              receita recorrente (MRR/ARR) e funcionalidades utilizadas.
+         As métricas e categorias de cada segmento são declaradas no registro de segmentos (segmentos.py); cada
+         linha consulta o perfil do seu segmento uma única vez.
        * Métricas de marketing, satisfação, operações e despesas.
    - Suporta dois modos:
        a) Geração inicial (quando não há dados anteriores);
@@ -41,9 +44,13 @@ Funcionalidades Principais:
    - Função `gerar_dados_com_outliers`: Com uma probabilidade configurável, aplica outliers em determinadas métricas,
      alterando seus valores para simular anomalias ou variações extremas.
 
-5. Tratamento Seguro de Limites:
-   - A função auxiliar `_safe_randint` garante que os limites passados para `random.randint` sejam convertidos para
-     inteiros, evitando erros de tipo ao gerar números aleatórios em intervalos definidos.
+5. Distribuições e Núcleo de Geração:
+   - DISTRIBUICOES_EMPRESA: amostradores (nucleo.py) com as distribuições do bloco inicial; o motor em lote
+     (geradores_lote.py) usa as mesmas entradas para gerar colunas inteiras.
+   - AUTOCORRELACAO_EMPRESA: regra AR(1) de cada métrica autocorrelacionada (autorregressivo.py: ruído, escala e
+     limites), usada pelo ramo com dados anteriores (um passo do motor para uma entidade) e pelas séries do motor
+     em lote (`--entidades`, um passo para todas as entidades).
+   - A etapa de outliers vem de nucleo.py, compartilhado com o modo hotel único.
 
 Uso:
 -----
@@ -56,7 +63,8 @@ Uso:
      * O nome do arquivo de saída (por exemplo, CSV) onde os dados serão salvos.
 - Para segmentos que não possuem tratamento específico (por exemplo, "Finanças", "Aviação", "Metalurgia", etc.),
   as métricas específicas desses segmentos não serão aplicadas (ficarão com valor `None` ou padrão), mas as métricas
-  gerais continuarão sendo geradas normalmente.
+  gerais continuarão sendo geradas normalmente. Um segmento novo pode herdar as métricas de um segmento registrado
+  com `--segmentos "Nome=Base"` (ex.: "Pousada=Hotelaria").
 
 Observações:
 -------------
@@ -68,66 +76,215 @@ Observações:
 Desenvolvido para facilitar a criação de datasets sintéticos e apoiar a validação e performance de sistemas analíticos.
 """
 
-import random
-from datetime import datetime, timedelta
-from faker import Faker
 import numpy as np
 
-def gerar_data_aleatoria(inicio, fim):
+from autorregressivo import MotorAR, PassoAR
+from categorias import sortear_categoria
+from config import CABECALHO_ORIGINAL
+from correlacao import fixar_correlacionados
+from nucleo import (
+    Inteiro, LogNormal, Normal, Uniforme, aplicar_outlier_linha, aplicar_outliers_colunar, gerar_data_aleatoria,
+)
+from segmentos import METRICAS_SEGMENTO, perfil_segmento
+
+# Distribuições do bloco inicial (sem autocorrelação), compartilhadas pelo motor escalar (`sortear`) e pelo
+# motor em lote (geradores_lote.py, `amostrar`). As entradas "fator_*" multiplicam outra métrica
+# (ex.: custo = receita × fator_custo).
+DISTRIBUICOES_EMPRESA = {
+    # -- MÉTRICAS BÁSICAS --
+    "numero_clientes": LogNormal(4.6, 0.8, inteiro=True),
+    "ticket_medio": LogNormal(3.7, 0.5),
+    "fator_custo": Uniforme(0.6, 0.95, casas=None),
+    "indice_satisfacao": Normal(7.5, 1.5, casas=1, minimo=1.0, maximo=10.0),
+    "taxa_crescimento": Uniforme(-10.0, 30.0),
+    "fator_custo_marketing": Uniforme(0.05, 0.2, casas=None),
+    "investimento_publicidade": Uniforme(1000.0, 10000.0),
+    "fator_previsao_vendas": Uniforme(0.05, 0.15, casas=None),
+    "fator_previsao_custos": Uniforme(0.0, 0.1, casas=None),
+    "sensibilidade_negocios": Uniforme(0, 100),
+    "indice_correcao": Uniforme(0.95, 1.05, casas=3),
+    "programacao_linear": Uniforme(0, 1000),
+    # -- MÉTRICAS NOVAS --
+    "desconto_medio": Uniforme(0, 50),
+    "taxa_conversao": Uniforme(1, 10),
+    "fator_impostos": Uniforme(0.1, 0.3, casas=None),
+    "pedidos_por_cliente": Uniforme(1, 3),
+    "LTV": LogNormal(5, 0.7),
+    "CAC": Uniforme(10, 100),
+    # -- MÉTRICAS DE MARKETING --
+    "custo_por_clique": Uniforme(0.5, 5),
+    "custo_por_mil_impressoes": Uniforme(5, 20),
+    "taxa_de_clique": Uniforme(0.5, 5),
+    "impressoes": Inteiro(1000, 10000),
+    "leads_gerados": Inteiro(10, 100),
+    # -- MÉTRICAS DE SATISFAÇÃO --
+    "avaliacao_media": Normal(4.0, 0.5, casas=1, minimo=1.0, maximo=5.0),
+    "numero_avaliacoes": Inteiro(10, 100),
+    "NPS": Inteiro(-100, 100),
+    "CSAT": Inteiro(1, 5),
+    "reclamacoes": Inteiro(0, 10),
+    "tempo_medio_resposta": Uniforme(1, 24),
+    # -- MÉTRICAS DE OPERAÇÕES/LOGÍSTICA --
+    "tempo_medio_entrega": Uniforme(1, 7),
+    "taxa_devolucao": Uniforme(1, 10),
+    "numero_fornecedores": Inteiro(1, 10),
+    "taxa_de_defeito": Uniforme(0.1, 5),
+    # -- MÉTRICAS DE USO DE PRODUTO/SERVIÇO --
+    "tempo_medio_sessao": Uniforme(5, 60),
+    "taxa_retencao": Uniforme(30, 90),
+    "churn_rate": Uniforme(1, 10),
+    "numero_sessoes": Inteiro(1, 50),
+    # -- DESPESAS --
+    "despesa_administrativa": Uniforme(500, 5000),
+    "despesa_com_pessoal": Uniforme(2000, 20000),
+    "despesa_fixa": Uniforme(1000, 10000),
+    "despesa_variavel": Uniforme(500, 5000),
+    "fator_despesa_tributaria": Uniforme(0.05, 0.15, casas=None),
+    "despesa_financeira": Uniforme(100, 1000),
+}
+
+# Autocorrelação (linhas com dados anteriores): regra AR(1) de cada métrica (autorregressivo.py). As métricas de
+# segmento só evoluem nos segmentos que as declaram; as demais colunas do ramo autocorrelacionado (custo,
+# índice de satisfação, fatores, ...) são sorteadas novamente de DISTRIBUICOES_EMPRESA.
+AUTOCORRELACAO_EMPRESA = {
+    # -- MÉTRICAS BÁSICAS --
+    "numero_clientes": PassoAR("multiplicativo", 0.05, minimo=1, inteiro=True),
+    "ticket_medio": PassoAR("multiplicativo", 0.02, minimo=0.01),
+    "taxa_ocupacao": PassoAR("normal", 2.0, minimo=0.0, maximo=100.0),
+    "taxa_crescimento": PassoAR("normal", 5.0),
+    "investimento_publicidade": PassoAR("uniforme", 2000, minimo=0.0),
+    "sensibilidade_negocios": PassoAR("uniforme", 10, minimo=0.0, maximo=100.0),
+    "indice_correcao": PassoAR("uniforme", 0.05, minimo=0.9, maximo=1.10, casas=3),
+    "programacao_linear": PassoAR("uniforme", 200, minimo=0.0),
+    # -- MÉTRICAS NOVAS --
+    "quantidade_produtos": PassoAR("uniforme", 50, minimo=1, inteiro=True),
+    "desconto_medio": PassoAR("normal", 5, minimo=0.0),
+    "taxa_conversao": PassoAR("normal", 1, minimo=0.0, maximo=100.0),
+    "vendas_por_vendedor": PassoAR("uniforme", 10, minimo=0, inteiro=True),
+    "frete_medio": PassoAR("normal", 2, minimo=0.0),
+    "pedidos_por_cliente": PassoAR("uniforme", 0.5, minimo=1.0),
+    "LTV": PassoAR("lognormal", 0.2),
+    "CAC": PassoAR("normal", 5, minimo=0.0),
+    # -- MÉTRICAS DE MARKETING --
+    "custo_por_clique": PassoAR("normal", 0.5, minimo=0.01),
+    "custo_por_mil_impressoes": PassoAR("normal", 2, minimo=0.01),
+    "taxa_de_clique": PassoAR("normal", 0.5, minimo=0.0, maximo=100.0),
+    "impressoes": PassoAR("uniforme", 1000, minimo=100, inteiro=True),
+    "leads_gerados": PassoAR("uniforme", 20, minimo=0, inteiro=True),
+    # -- MÉTRICAS DE SATISFAÇÃO --
+    "avaliacao_media": PassoAR("normal", 0.3, minimo=1.0, maximo=5.0, casas=1),
+    "numero_avaliacoes": PassoAR("uniforme", 20, minimo=0, inteiro=True),
+    "NPS": PassoAR("uniforme", 20, minimo=-100, maximo=100, inteiro=True),
+    "CSAT": PassoAR("uniforme", 1, minimo=1, maximo=5, inteiro=True),
+    "reclamacoes": PassoAR("uniforme", 2, minimo=0, inteiro=True),
+    "tempo_medio_resposta": PassoAR("uniforme", 2, minimo=0.1),
+    # -- MÉTRICAS DE OPERAÇÕES/LOGÍSTICA --
+    "tempo_medio_entrega": PassoAR("uniforme", 1, minimo=0.1),
+    "taxa_devolucao": PassoAR("uniforme", 2, minimo=0.0, maximo=100.0),
+    "nivel_estoque": PassoAR("uniforme", 200, minimo=0, inteiro=True),
+    "giro_estoque": PassoAR("uniforme", 2, minimo=0.1),
+    "numero_fornecedores": PassoAR("uniforme", 2, minimo=1, inteiro=True),
+    "taxa_de_defeito": PassoAR("uniforme", 0.5, minimo=0.0, maximo=100.0),
+    # -- MÉTRICAS DE USO DE PRODUTO/SERVIÇO --
+    "usuarios_ativos": PassoAR("lognormal", 0.2, inteiro=True),
+    "tempo_medio_sessao": PassoAR("uniforme", 10, minimo=0.1),
+    "taxa_retencao": PassoAR("uniforme", 10, minimo=0.0, maximo=100.0),
+    "churn_rate": PassoAR("uniforme", 2, minimo=0.0, maximo=100.0),
+    "numero_sessoes": PassoAR("uniforme", 5, minimo=1, inteiro=True),
+    # -- MÉTRICAS ESPECÍFICAS --
+    "RevPAR": PassoAR("uniforme", 20, minimo=0.0),
+    "taxa_evasao": PassoAR("uniforme", 5, minimo=0.0, maximo=100.0),
+    "tempo_medio_atendimento": PassoAR("uniforme", 15, minimo=0.1),
+    # -- DESPESAS --
+    "despesa_administrativa": PassoAR("normal", 500, minimo=0.0),
+    "despesa_com_pessoal": PassoAR("normal", 1000, minimo=0.0),
+    "despesa_fixa": PassoAR("normal", 500, minimo=0.0),
+    "despesa_variavel": PassoAR("normal", 500, minimo=0.0),
+    "despesa_financeira": PassoAR("normal", 100, minimo=0.0),
+}
+
+_motor_autocorrelacao = (None, None)
+
+
+def motor_autocorrelacao():
     """
-    Gera uma data aleatória entre 'inicio' e 'fim'.
+    Retorna o MotorAR compilado a partir de AUTOCORRELACAO_EMPRESA (recompilado se o esquema mudar, ex.: pelo
+    arquivo de modelo).
     """
-    delta = fim - inicio
-    dias_delta = delta.days
-    data_aleatoria = inicio + timedelta(days=random.randint(0, dias_delta))
-    return data_aleatoria
+    global _motor_autocorrelacao
+    chave = tuple(AUTOCORRELACAO_EMPRESA.items())
+    if _motor_autocorrelacao[0] != chave:
+        _motor_autocorrelacao = (chave, MotorAR(AUTOCORRELACAO_EMPRESA))
+    return _motor_autocorrelacao[1]
 
-def _safe_randint(a, b):
+
+def _avancar_metricas(perfil, dados_anteriores):
     """
-    Versão segura de random.randint, que converte 'a' e 'b' para int,
-    e troca se 'a' ficar maior que 'b'.
+    Avança as métricas de AUTOCORRELACAO_EMPRESA a partir da linha anterior (um passo do motor AR, para uma
+    entidade). A máscara de validade do perfil (segmentos.py) decide, de uma vez, quais métricas de segmento recebem
+    o valor padrão; apenas as métricas válidas ausentes na linha anterior (NaN) são sorteadas novamente.
     """
-    a = int(a)
-    b = int(b)
-    if a > b:
-        a, b = b, a
-    return random.randint(a, b)
-
-def _gerar_dados_gerais(fake, segmento):
+    motor = motor_autocorrelacao()
+    indices, padroes = _esquema_avanco(motor)
+    estado = np.array([dados_anteriores[i] for i in indices], dtype=np.float64)  # None -> NaN
+    validos = perfil.validade(motor.colunas)
+    novos = motor.avancar(estado, np.random)
+    faltando = validos & np.isnan(novos)
+
+    linha = novos.astype(object)
+    inteiros = motor.inteiro & validos & ~faltando
+    linha[inteiros] = novos[inteiros].astype(np.int64)
+    linha[~validos] = padroes[~validos]
+    valores = dict(zip(motor.colunas, linha.tolist()))
+    for posicao in np.flatnonzero(faltando).tolist():
+        coluna = motor.colunas[posicao]
+        if coluna in METRICAS_SEGMENTO:
+            valores[coluna] = perfil.sortear(coluna)
+        else:
+            valores[coluna] = DISTRIBUICOES_EMPRESA[coluna].sortear()
+    return valores
+
+_esquema_motor = (None, None)
+
+
+def _esquema_avanco(motor):
+    """
+    Posições das colunas do motor na linha de `gerar_dados_empresa` e valores padrão das métricas de segmento
+    (array de objetos, com None e inteiros preservados), calculados uma vez por motor.
+    """
+    global _esquema_motor
+    if _esquema_motor[0] is not motor:
+        indices = [CABECALHO_ORIGINAL.index(coluna) - 1 for coluna in motor.colunas]
+        padroes = np.array([METRICAS_SEGMENTO.get(coluna) for coluna in motor.colunas], dtype=object)
+        _esquema_motor = (motor, (indices, padroes))
+    return _esquema_motor[1]
+
+def _gerar_dados_gerais(fake, perfil):
     """
     Função auxiliar para gerar dados gerais (regionais, demográficos, etc.).
+    Os valores possíveis (e os pesos, se configurados) de cada coluna categórica vêm de categorias.py; as colunas
+    que dependem do segmento seguem o perfil do segmento (segmentos.py).
     """
     regiao = fake.estado_nome()
     estado = fake.estado_sigla()
     pais = "Brasil"  # fixo, mas pode ser parametrizado
-    tipo_cliente = random.choice(["B2B", "B2C", "Pessoa Física", "Pessoa Jurídica"])
-    canal_venda = random.choice(["Loja física", "Online", "Aplicativo", "Telefone", "Representante"])
+    tipo_cliente = sortear_categoria("tipo_cliente")
+    canal_venda = sortear_categoria("canal_venda")
 
-    # Segmentos que podem ter produtos
+    # Segmentos que podem ter produtos, serviços e planos (SaaS, etc.)
     categoria_produto = (
-        random.choice(["Eletrônicos", "Roupas", "Alimentos", "Livros", "Móveis", "Outros"])
-        if segmento in ["Varejo", "Indústria"] else None
-    )
-
-    # Segmentos que podem ter serviços
-    tipo_servico = (
-        random.choice(["Consultoria", "Suporte", "Treinamento", "Desenvolvimento", "Outros"])
-        if segmento in ["Serviços", "TI", "Consultoria", "Saúde", "Educação", "Banco", "Hospital"]
-        else None
-    )
-
-    # Segmentos que podem ter planos (SaaS, etc.)
-    plano = (
-        random.choice(["Básico", "Premium", "Gratuito", "Teste"])
-        if segmento in ["TI", "Serviços", "SaaS"] else None
+        sortear_categoria("categoria_produto")
+        if perfil.tem("categoria_produto") else None
     )
+    tipo_servico = sortear_categoria("tipo_servico") if perfil.tem("tipo_servico") else None
+    plano = sortear_categoria("plano") if perfil.tem("plano") else None
 
-    faixa_etaria = random.choice(["18-25", "26-35", "36-45", "46-55", "55+"])
-    genero = random.choice(["Masculino", "Feminino", "Outro"])
-    fonte_trafego = random.choice(["Busca orgânica", "Anúncio pago", "Rede social", "Email", "Referência", "Direto"])
-    dispositivo = random.choice(["Desktop", "Mobile", "Tablet"])
-    sistema_operacional = random.choice(["Windows", "macOS", "Linux", "Android", "iOS"])
-    navegador = random.choice(["Chrome", "Firefox", "Safari", "Edge", "Outro"])
+    faixa_etaria = sortear_categoria("faixa_etaria")
+    genero = sortear_categoria("genero")
+    fonte_trafego = sortear_categoria("fonte_trafego")
+    dispositivo = sortear_categoria("dispositivo")
+    sistema_operacional = sortear_categoria("sistema_operacional")
+    navegador = sortear_categoria("navegador")
 
     return (
         regiao,
@@ -146,89 +303,81 @@ def _gerar_dados_gerais(fake, segmento):
         navegador
     )
 
-def gerar_dados_empresa(fake, segmento, data_registro, dados_anteriores=None):
+def gerar_dados_empresa(fake, segmento, data_registro, dados_anteriores=None, correlacionar=False):
     """
     Gera dados fictícios para uma única empresa, com opção de autocorrelação.
 
     Se 'dados_anteriores' for None, gera a primeira linha.
     Caso contrário, faz a autocorrelação com base nos valores anteriores.
+    Com 'correlacionar', as métricas dos blocos de correlacao.py da primeira linha são sorteadas juntas; as linhas
+    seguintes vêm do passo AR, que não mantém a correlação (o `--correlacionar` do main.py exige --motor lote).
     """
 
+    # Perfil do segmento: métricas e categorias específicas (segmentos.py)
+    perfil = perfil_segmento(segmento)
+
     # Gera dados gerais independentes
     (
         regiao, estado, pais, tipo_cliente, canal_venda, categoria_produto,
         tipo_servico, plano, faixa_etaria, genero, fonte_trafego,
         dispositivo, sistema_operacional, navegador
-    ) = _gerar_dados_gerais(fake, segmento)
+    ) = _gerar_dados_gerais(fake, perfil)
 
     # --------------------------------------------------------------------------------
     # 1) BLOCO INICIAL (SEM autocorrelação)
     # --------------------------------------------------------------------------------
     if dados_anteriores is None:
+        d = fixar_correlacionados(DISTRIBUICOES_EMPRESA) if correlacionar else DISTRIBUICOES_EMPRESA
+
         # -- MÉTRICAS BÁSICAS --
-        numero_clientes = int(np.random.lognormal(mean=4.6, sigma=0.8))  # média ~100
-        ticket_medio = round(np.random.lognormal(mean=3.7, sigma=0.5), 2)  # média ~40
+        numero_clientes = d["numero_clientes"].sortear()  # média ~100
+        ticket_medio = d["ticket_medio"].sortear()  # média ~40
         receita = round(numero_clientes * ticket_medio, 2)
-        custo = round(receita * np.random.uniform(0.6, 0.95), 2)
+        custo = round(receita * d["fator_custo"].sortear(), 2)
         lucro = round(receita - custo, 2)
-        indice_satisfacao = max(1.0, min(10.0, round(np.random.normal(loc=7.5, scale=1.5), 1)))
-        taxa_ocupacao = (
-            round(np.random.uniform(60.0, 100.0), 2)
-            if segmento == "Hotelaria" else None
-        )
-        taxa_crescimento = round(np.random.uniform(-10.0, 30.0), 2)
-        custo_marketing = round(receita * np.random.uniform(0.05, 0.2), 2)
-        investimento_publicidade = round(np.random.uniform(1000.0, 10000.0), 2)
-        previsao_vendas = round(receita * (1 + np.random.uniform(0.05, 0.15)), 2)
-        previsao_custos = round(custo * (1 + np.random.uniform(0.0, 0.1)), 2)
-        sensibilidade_negocios = round(np.random.uniform(0, 100), 2)
-        indice_correcao = round(np.random.uniform(0.95, 1.05), 3)
-        programacao_linear = round(np.random.uniform(0, 1000), 2)
+        indice_satisfacao = d["indice_satisfacao"].sortear()
+        taxa_ocupacao = perfil.sortear("taxa_ocupacao")
+        taxa_crescimento = d["taxa_crescimento"].sortear()
+        custo_marketing = round(receita * d["fator_custo_marketing"].sortear(), 2)
+        investimento_publicidade = d["investimento_publicidade"].sortear()
+        previsao_vendas = round(receita * (1 + d["fator_previsao_vendas"].sortear()), 2)
+        previsao_custos = round(custo * (1 + d["fator_previsao_custos"].sortear()), 2)
+        sensibilidade_negocios = d["sensibilidade_negocios"].sortear()
+        indice_correcao = d["indice_correcao"].sortear()
+        programacao_linear = d["programacao_linear"].sortear()
 
         # -- MÉTRICAS NOVAS (INICIAIS) --
-        quantidade_produtos = (
-            _safe_randint(1, 200)
-            if segmento in ["Varejo", "Indústria"] else 0
-        )
+        quantidade_produtos = perfil.sortear("quantidade_produtos")
         custo_por_cliente = round(custo / numero_clientes, 2) if numero_clientes > 0 else 0.0
         receita_por_cliente = round(receita / numero_clientes, 2) if numero_clientes > 0 else 0.0
         lucro_por_cliente = round(lucro / numero_clientes, 2) if numero_clientes > 0 else 0.0
-        desconto_medio = round(np.random.uniform(0, 50), 2)
+        desconto_medio = d["desconto_medio"].sortear()
         if (ticket_medio + desconto_medio) > 0:
             percentual_desconto = round((desconto_medio / (ticket_medio + desconto_medio)) * 100, 2)
         else:
             percentual_desconto = 0.0
-        taxa_conversao = round(np.random.uniform(1, 10), 2)  # 1–10%
-        vendas_por_vendedor = (
-            _safe_randint(1, 50)
-            if segmento in ["Varejo", "Serviços"] else 0
-        )
+        taxa_conversao = d["taxa_conversao"].sortear()  # 1–10%
+        vendas_por_vendedor = perfil.sortear("vendas_por_vendedor")
         comissao_vendas = (
-            round(receita * np.random.uniform(0.01, 0.05), 2)
+            round(receita * perfil.sortear("fator_comissao_vendas"), 2)
             if vendas_por_vendedor > 0 else 0.0
         )
-        valor_impostos = round(receita * np.random.uniform(0.1, 0.3), 2)
-        frete_medio = (
-            round(np.random.uniform(5, 50), 2)
-            if segmento == "Varejo" else 0.0
-        )
-        pedidos_por_cliente = round(np.random.uniform(1, 3), 2)
-        LTV = round(np.random.lognormal(mean=5, sigma=0.7), 2)
-        CAC = round(np.random.uniform(10, 100), 2)
-        MRR = (
-            round(receita * np.random.uniform(0.8, 1.2), 2)
-            if segmento in ["SaaS", "TI"] else 0.0
-        )
+        valor_impostos = round(receita * d["fator_impostos"].sortear(), 2)
+        frete_medio = perfil.sortear("frete_medio")
+        pedidos_por_cliente = d["pedidos_por_cliente"].sortear()
+        LTV = d["LTV"].sortear()
+        CAC = d["CAC"].sortear()
+        MRR = round(receita * perfil.sortear("fator_MRR"), 2)
         ARR = round(MRR * 12, 2) if MRR > 0 else 0.0
 
         # -- MÉTRICAS DE MARKETING --
         receita_media_diaria = round(receita / 30, 2)
-        custo_por_clique = round(np.random.uniform(0.5, 5), 2)
-        custo_por_mil_impressoes = round(np.random.uniform(5, 20), 2)
-        taxa_de_clique = round(np.random.uniform(0.5, 5), 2)
-        impressoes = _safe_randint(1000, 10000)
+        custo_por_clique = d["custo_por_clique"].sortear()
+        custo_por_mil_impressoes = d["custo_por_mil_impressoes"].sortear()
+        taxa_de_clique = d["taxa_de_clique"].sortear()
+        impressoes = d["impressoes"].sortear()
         cliques = int(impressoes * (taxa_de_clique / 100))
-        leads_gerados = _safe_randint(10, 100)
+        leads_gerados = d["leads_gerados"].sortear()
         custo_por_lead = (
             round(custo_marketing / leads_gerados, 2)
             if leads_gerados > 0 else 0.0
@@ -239,535 +388,165 @@ def gerar_dados_empresa(fake, segmento, data_registro, dados_anteriores=None):
         )
 
         # -- MÉTRICAS DE SATISFAÇÃO --
-        avaliacao_media = max(1.0, min(5.0, round(np.random.normal(loc=4.0, scale=0.5), 1)))
-        numero_avaliacoes = _safe_randint(10, 100)
-        NPS = _safe_randint(-100, 100)
-        CSAT = _safe_randint(1, 5)
-        reclamacoes = _safe_randint(0, 10)
-        tempo_medio_resposta = round(np.random.uniform(1, 24), 2)  # horas
+        avaliacao_media = d["avaliacao_media"].sortear()
+        numero_avaliacoes = d["numero_avaliacoes"].sortear()
+        NPS = d["NPS"].sortear()
+        CSAT = d["CSAT"].sortear()
+        reclamacoes = d["reclamacoes"].sortear()
+        tempo_medio_resposta = d["tempo_medio_resposta"].sortear()  # horas
 
         # -- MÉTRICAS DE OPERAÇÕES/LOGÍSTICA --
-        tempo_medio_entrega = round(np.random.uniform(1, 7), 2)  # dias
-        taxa_devolucao = round(np.random.uniform(1, 10), 2)
-        nivel_estoque = (
-            _safe_randint(100, 1000)
-            if segmento in ["Varejo", "Indústria"] else 0
-        )
-        giro_estoque = (
-            round(np.random.uniform(1, 10), 2)
-            if nivel_estoque > 0 else 0.0
-        )
+        tempo_medio_entrega = d["tempo_medio_entrega"].sortear()  # dias
+        taxa_devolucao = d["taxa_devolucao"].sortear()
+        nivel_estoque = perfil.sortear("nivel_estoque")
+        giro_estoque = perfil.sortear("giro_estoque") if nivel_estoque > 0 else 0.0
         custo_estoque = (
-            round(nivel_estoque * np.random.uniform(5, 20), 2)
+            round(nivel_estoque * perfil.sortear("fator_custo_estoque"), 2)
             if nivel_estoque > 0 else 0.0
         )
-        numero_fornecedores = _safe_randint(1, 10)
-        taxa_de_defeito = round(np.random.uniform(0.1, 5), 2)
+        numero_fornecedores = d["numero_fornecedores"].sortear()
+        taxa_de_defeito = d["taxa_de_defeito"].sortear()
 
         # -- MÉTRICAS DE USO DE PRODUTO/SERVIÇO --
-        if segmento in ["SaaS", "TI", "Aplicativo"]:
-            usuarios_ativos = int(np.random.lognormal(mean=5, sigma=0.9))
-            funcionalidade_mais_usada = random.choice(["FuncA", "FuncB", "FuncC", "Outra"])
-        else:
-            usuarios_ativos = 0
-            funcionalidade_mais_usada = None
-        tempo_medio_sessao = round(np.random.uniform(5, 60), 2)
-        taxa_retencao = round(np.random.uniform(30, 90), 2)
-        churn_rate = round(np.random.uniform(1, 10), 2)
-        numero_sessoes = _safe_randint(1, 50)
+        usuarios_ativos = perfil.sortear("usuarios_ativos")
+        funcionalidade_mais_usada = (
+            sortear_categoria("funcionalidade_mais_usada")
+            if perfil.tem("funcionalidade_mais_usada") else None
+        )
+        tempo_medio_sessao = d["tempo_medio_sessao"].sortear()
+        taxa_retencao = d["taxa_retencao"].sortear()
+        churn_rate = d["churn_rate"].sortear()
+        numero_sessoes = d["numero_sessoes"].sortear()
 
         # -- MÉTRICAS ESPECÍFICAS --
-        RevPAR = (
-            round(np.random.uniform(50, 200), 2)
-            if segmento == "Hotelaria" else None
-        )
-        taxa_evasao = (
-            round(np.random.uniform(5, 20), 2)
-            if segmento == "Educação" else None
-        )
-        tempo_medio_atendimento = (
-            round(np.random.uniform(15, 60), 2)
-            if segmento in ["Saúde", "Hospital"] else None
-        )
+        RevPAR = perfil.sortear("RevPAR")
+        taxa_evasao = perfil.sortear("taxa_evasao")
+        tempo_medio_atendimento = perfil.sortear("tempo_medio_atendimento")
 
         # -- DESPESAS --
-        despesa_administrativa = round(np.random.uniform(500, 5000), 2)
-        despesa_com_pessoal = round(np.random.uniform(2000, 20000), 2)
-        despesa_fixa = round(np.random.uniform(1000, 10000), 2)
-        despesa_variavel = round(np.random.uniform(500, 5000), 2)
-        despesa_tributaria = round(receita * np.random.uniform(0.05, 0.15), 2)
-        despesa_financeira = round(np.random.uniform(100, 1000), 2)
+        despesa_administrativa = d["despesa_administrativa"].sortear()
+        despesa_com_pessoal = d["despesa_com_pessoal"].sortear()
+        despesa_fixa = d["despesa_fixa"].sortear()
+        despesa_variavel = d["despesa_variavel"].sortear()
+        despesa_tributaria = round(receita * d["fator_despesa_tributaria"].sortear(), 2)
+        despesa_financeira = d["despesa_financeira"].sortear()
 
     # --------------------------------------------------------------------------------
     # 2) BLOCO COM AUTOCORRELAÇÃO (SE dados_anteriores NÃO FOR None)
     # --------------------------------------------------------------------------------
     else:
-        # --- MÉTRICAS BÁSICAS ---
-        numero_clientes = int(dados_anteriores[7] * np.random.normal(loc=1.0, scale=0.05))
-        numero_clientes = max(1, numero_clientes)
-
-        ticket_medio = round(dados_anteriores[8] * np.random.normal(loc=1.0, scale=0.02), 2)
-        ticket_medio = max(0.01, ticket_medio)
+        d = DISTRIBUICOES_EMPRESA
+        v = _avancar_metricas(perfil, dados_anteriores)
 
+        # --- MÉTRICAS BÁSICAS ---
+        numero_clientes = v["numero_clientes"]
+        ticket_medio = v["ticket_medio"]
         receita = round(numero_clientes * ticket_medio, 2)
-        custo = round(receita * np.random.uniform(0.6, 0.95), 2)
+        custo = round(receita * d["fator_custo"].sortear(), 2)
         if custo > receita:
             custo = round(receita * 0.95, 2)
 
         lucro = round(receita - custo, 2)
-        indice_satisfacao = max(1.0, min(10.0, round(np.random.normal(loc=7.5, scale=1.5), 1)))
-
-        # taxa_ocupacao (só para Hotelaria)
-        if segmento == "Hotelaria":
-            valor_anterior = dados_anteriores[13]
-            if valor_anterior is None:
-                taxa_ocupacao = round(np.random.uniform(60, 100), 2)
-            else:
-                nova = round(np.random.normal(loc=valor_anterior, scale=2.0), 2)
-                taxa_ocupacao = max(0.0, min(100.0, nova))
-        else:
-            taxa_ocupacao = None
-
-        taxa_crescimento = round(np.random.normal(loc=dados_anteriores[14], scale=5.0), 2)
-        custo_marketing = round(receita * np.random.uniform(0.05, 0.2), 2)
-
-        # investimento_publicidade varia ± 2000 do valor anterior
-        valor_anterior_pub = dados_anteriores[16]
-        investimento_publicidade = round(
-            np.random.uniform(
-                max(0.0, valor_anterior_pub - 2000),
-                valor_anterior_pub + 2000
-            ), 2
-        )
-
-        previsao_vendas = round(receita * (1 + np.random.uniform(0.05, 0.15)), 2)
-        previsao_custos = round(custo * (1 + np.random.uniform(0.0, 0.1)), 2)
-
-        sensibilidade_negocios = round(
-            np.random.uniform(
-                max(0.0, dados_anteriores[19] - 10),
-                min(100, dados_anteriores[19] + 10)
-            ), 2
-        )
-
-        indice_correcao = round(
-            np.random.uniform(
-                max(0.9, dados_anteriores[20] - 0.05),
-                min(dados_anteriores[20] + 0.05, 1.10)
-            ), 3
-        )
-
-        programacao_linear = round(
-            np.random.uniform(
-                max(0.0, dados_anteriores[21] - 200),
-                dados_anteriores[21] + 200
-            ), 2
-        )
+        indice_satisfacao = d["indice_satisfacao"].sortear()
+        taxa_ocupacao = v["taxa_ocupacao"]
+        taxa_crescimento = v["taxa_crescimento"]
+        custo_marketing = round(receita * d["fator_custo_marketing"].sortear(), 2)
+        investimento_publicidade = v["investimento_publicidade"]
+        previsao_vendas = round(receita * (1 + d["fator_previsao_vendas"].sortear()), 2)
+        previsao_custos = round(custo * (1 + d["fator_previsao_custos"].sortear()), 2)
+        sensibilidade_negocios = v["sensibilidade_negocios"]
+        indice_correcao = v["indice_correcao"]
+        programacao_linear = v["programacao_linear"]
 
         # --- MÉTRICAS NOVAS ---
-        # quantidade_produtos (só para Varejo/Indústria)
-        if segmento in ["Varejo", "Indústria"]:
-            valor_anterior_qtd = dados_anteriores[36]
-            if valor_anterior_qtd is None:
-                # Se não houver valor anterior, gera algo inicial
-                quantidade_produtos = _safe_randint(1, 200)
-            else:
-                lower = max(1, int(valor_anterior_qtd) - 50)
-                upper = int(valor_anterior_qtd) + 50
-                quantidade_produtos = _safe_randint(lower, upper)
-        else:
-            quantidade_produtos = 0
-
+        quantidade_produtos = v["quantidade_produtos"]
         custo_por_cliente = round(custo / numero_clientes, 2) if numero_clientes > 0 else 0.0
         receita_por_cliente = round(receita / numero_clientes, 2) if numero_clientes > 0 else 0.0
         lucro_por_cliente = round(lucro / numero_clientes, 2) if numero_clientes > 0 else 0.0
-
-        # desconto_medio
-        valor_anterior_desc = dados_anteriores[40]
-        if valor_anterior_desc is None:
-            desconto_medio = round(np.random.uniform(0, 50), 2)
-        else:
-            desconto_medio = round(np.random.normal(loc=valor_anterior_desc, scale=5), 2)
-        desconto_medio = max(0.0, desconto_medio)
-
+        desconto_medio = v["desconto_medio"]
         if (ticket_medio + desconto_medio) > 0:
             percentual_desconto = round(
                 (desconto_medio / (ticket_medio + desconto_medio)) * 100, 2
             )
         else:
             percentual_desconto = 0.0
-
-        # taxa_conversao
-        valor_anterior_conv = dados_anteriores[42]
-        if valor_anterior_conv is None:
-            taxa_conversao = round(np.random.uniform(1, 10), 2)
-        else:
-            taxa_conversao = round(np.random.normal(loc=valor_anterior_conv, scale=1), 2)
-        taxa_conversao = max(0.0, min(100.0, taxa_conversao))
-
-        # vendas_por_vendedor
-        if segmento in ["Varejo", "Serviços"]:
-            valor_anterior_vpv = dados_anteriores[43]
-            if valor_anterior_vpv is None:
-                vendas_por_vendedor = _safe_randint(1, 50)
-            else:
-                lower = max(0, int(valor_anterior_vpv) - 10)
-                upper = int(valor_anterior_vpv) + 10
-                vendas_por_vendedor = _safe_randint(lower, upper)
-        else:
-            vendas_por_vendedor = 0
-
+        taxa_conversao = v["taxa_conversao"]
+        vendas_por_vendedor = v["vendas_por_vendedor"]
         comissao_vendas = (
-            round(receita * np.random.uniform(0.01, 0.05), 2)
+            round(receita * perfil.sortear("fator_comissao_vendas"), 2)
             if vendas_por_vendedor > 0 else 0.0
         )
+        valor_impostos = round(receita * d["fator_impostos"].sortear(), 2)
+        frete_medio = v["frete_medio"]
+        pedidos_por_cliente = v["pedidos_por_cliente"]
+        LTV = v["LTV"]
+        CAC = v["CAC"]
 
-        valor_impostos = round(receita * np.random.uniform(0.1, 0.3), 2)
-
-        # frete_medio (só se Varejo)
-        if segmento == "Varejo":
-            valor_anterior_frete = dados_anteriores[46]
-            if valor_anterior_frete is None:
-                frete_medio = round(np.random.uniform(5, 50), 2)
-            else:
-                frete_medio = round(np.random.normal(loc=valor_anterior_frete, scale=2), 2)
-            frete_medio = max(0.0, frete_medio)
-        else:
-            frete_medio = 0.0
-
-        # pedidos_por_cliente
-        valor_anterior_ped = dados_anteriores[47]
-        if valor_anterior_ped is None:
-            pedidos_por_cliente = round(np.random.uniform(1, 3), 2)
-        else:
-            pedidos_por_cliente = round(
-                np.random.uniform(
-                    max(1.0, valor_anterior_ped - 0.5),
-                    valor_anterior_ped + 0.5
-                ), 2
-            )
-        pedidos_por_cliente = max(1.0, pedidos_por_cliente)
-
-        # LTV
-        valor_anterior_ltv = dados_anteriores[48]
-        if valor_anterior_ltv and valor_anterior_ltv > 0:
-            LTV = round(
-                np.random.lognormal(mean=np.log(max(1, valor_anterior_ltv)), sigma=0.2),
-                2
-            )
-        else:
-            LTV = round(np.random.lognormal(mean=5, sigma=0.7), 2)
-
-        # CAC
-        valor_anterior_cac = dados_anteriores[49]
-        if valor_anterior_cac is None:
-            CAC = round(np.random.uniform(10, 100), 2)
-        else:
-            CAC = round(np.random.normal(loc=valor_anterior_cac, scale=5), 2)
-        CAC = max(0.0, CAC)
-
-        # MRR e ARR (somente se SaaS/TI)
-        if segmento in ["SaaS", "TI"]:
-            MRR = round(receita * np.random.uniform(0.8, 1.2), 2)
-            ARR = round(MRR * 12, 2)
-        else:
-            MRR = 0.0
-            ARR = 0.0
+        # MRR e ARR (somente para segmentos com receita recorrente, como SaaS/TI)
+        MRR = round(receita * perfil.sortear("fator_MRR"), 2)
+        ARR = round(MRR * 12, 2)
 
         receita_media_diaria = round(receita / 30, 2)
 
         # --- MÉTRICAS DE MARKETING ---
-        valor_anterior_cpc = dados_anteriores[53]
-        if valor_anterior_cpc is None:
-            custo_por_clique = round(np.random.uniform(0.5, 5), 2)
-        else:
-            custo_por_clique = round(np.random.normal(loc=valor_anterior_cpc, scale=0.5), 2)
-        custo_por_clique = max(0.01, custo_por_clique)
-
-        valor_anterior_cpm = dados_anteriores[54]
-        if valor_anterior_cpm is None:
-            custo_por_mil_impressoes = round(np.random.uniform(5, 20), 2)
-        else:
-            custo_por_mil_impressoes = round(np.random.normal(loc=valor_anterior_cpm, scale=2), 2)
-        custo_por_mil_impressoes = max(0.01, custo_por_mil_impressoes)
-
-        valor_anterior_tclique = dados_anteriores[55]
-        if valor_anterior_tclique is None:
-            taxa_de_clique = round(np.random.uniform(0.5, 5), 2)
-        else:
-            taxa_de_clique = round(np.random.normal(loc=valor_anterior_tclique, scale=0.5), 2)
-        taxa_de_clique = max(0.0, min(100.0, taxa_de_clique))
-
-        valor_anterior_impress = dados_anteriores[56]
-        if valor_anterior_impress is None:
-            impressoes = _safe_randint(1000, 10000)
-        else:
-            lower = max(100, int(valor_anterior_impress) - 1000)
-            upper = int(valor_anterior_impress) + 1000
-            impressoes = _safe_randint(lower, upper)
-
+        custo_por_clique = v["custo_por_clique"]
+        custo_por_mil_impressoes = v["custo_por_mil_impressoes"]
+        taxa_de_clique = v["taxa_de_clique"]
+        impressoes = v["impressoes"]
         cliques = int(impressoes * (taxa_de_clique / 100))
-
-        valor_anterior_leads = dados_anteriores[58]
-        if valor_anterior_leads is None:
-            leads_gerados = _safe_randint(10, 100)
-        else:
-            lower = max(0, int(valor_anterior_leads) - 20)
-            upper = int(valor_anterior_leads) + 20
-            leads_gerados = _safe_randint(lower, upper)
-
+        leads_gerados = v["leads_gerados"]
         custo_por_lead = (
             round(custo_marketing / leads_gerados, 2)
             if leads_gerados > 0 else 0.0
         )
-
         ROAS = (
             round(receita / investimento_publicidade, 2)
             if investimento_publicidade > 0 else 0.0
         )
 
         # --- MÉTRICAS DE SATISFAÇÃO ---
-        valor_anterior_av = dados_anteriores[61]
-        if valor_anterior_av is None:
-            avaliacao_media = max(1.0, min(5.0, round(np.random.normal(loc=4.0, scale=0.5), 1)))
-        else:
-            avaliacao_media = max(
-                1.0,
-                min(5.0, round(np.random.normal(loc=valor_anterior_av, scale=0.3), 1))
-            )
-
-        lower = max(0, int(dados_anteriores[62]) - 20)
-        upper = int(dados_anteriores[62]) + 20
-        numero_avaliacoes = _safe_randint(lower, upper)
-
-        nps_lower = max(-100, int(dados_anteriores[63]) - 20)
-        nps_upper = min(100, int(dados_anteriores[63]) + 20)
-        NPS = _safe_randint(nps_lower, nps_upper)
-
-        csat_lower = max(1, int(dados_anteriores[64]) - 1)
-        csat_upper = min(5, int(dados_anteriores[64]) + 1)
-        CSAT = _safe_randint(csat_lower, csat_upper)
-
-        lower = max(0, int(dados_anteriores[65]) - 2)
-        upper = int(dados_anteriores[65]) + 2
-        reclamacoes = _safe_randint(lower, upper)
-
-        valor_anterior_tmr = dados_anteriores[66]
-        if valor_anterior_tmr is None:
-            tempo_medio_resposta = round(np.random.uniform(1, 24), 2)
-        else:
-            tempo_medio_resposta = round(
-                np.random.uniform(
-                    max(0.1, valor_anterior_tmr - 2),
-                    valor_anterior_tmr + 2
-                ), 2
-            )
-        tempo_medio_resposta = max(0.1, tempo_medio_resposta)
+        avaliacao_media = v["avaliacao_media"]
+        numero_avaliacoes = v["numero_avaliacoes"]
+        NPS = v["NPS"]
+        CSAT = v["CSAT"]
+        reclamacoes = v["reclamacoes"]
+        tempo_medio_resposta = v["tempo_medio_resposta"]
 
         # --- MÉTRICAS DE OPERAÇÕES/LOGÍSTICA ---
-        valor_anterior_tent = dados_anteriores[67]
-        if valor_anterior_tent is None:
-            tempo_medio_entrega = round(np.random.uniform(1, 7), 2)
-        else:
-            tempo_medio_entrega = round(
-                np.random.uniform(
-                    max(0.1, valor_anterior_tent - 1),
-                    valor_anterior_tent + 1
-                ), 2
-            )
-        tempo_medio_entrega = max(0.1, tempo_medio_entrega)
-
-        valor_anterior_tdev = dados_anteriores[68]
-        if valor_anterior_tdev is None:
-            taxa_devolucao = round(np.random.uniform(1, 10), 2)
-        else:
-            taxa_devolucao = round(
-                np.random.uniform(
-                    max(0.0, valor_anterior_tdev - 2),
-                    min(valor_anterior_tdev + 2, 100.0)
-                ), 2
-            )
-
-        if segmento in ["Varejo", "Indústria"]:
-            val_estq = dados_anteriores[69]
-            if val_estq is None:
-                nivel_estoque = _safe_randint(100, 1000)
-            else:
-                lower = max(0, int(val_estq) - 200)
-                upper = int(val_estq) + 200
-                nivel_estoque = _safe_randint(lower, upper)
-        else:
-            nivel_estoque = 0
-
-        val_giro = dados_anteriores[70]
-        if nivel_estoque > 0 and val_giro is not None:
-            giro_estoque = round(
-                np.random.uniform(
-                    max(0.1, val_giro - 2),
-                    val_giro + 2
-                ), 2
-            )
-        elif nivel_estoque > 0:
-            giro_estoque = round(np.random.uniform(1, 10), 2)
-        else:
-            giro_estoque = 0.0
-
+        tempo_medio_entrega = v["tempo_medio_entrega"]
+        taxa_devolucao = v["taxa_devolucao"]
+        nivel_estoque = v["nivel_estoque"]
+        giro_estoque = v["giro_estoque"] if nivel_estoque > 0 else 0.0
         custo_estoque = (
-            round(nivel_estoque * np.random.uniform(5, 20), 2)
+            round(nivel_estoque * perfil.sortear("fator_custo_estoque"), 2)
             if nivel_estoque > 0 else 0.0
         )
-
-        nf_lower = max(1, int(dados_anteriores[72]) - 2)
-        nf_upper = int(dados_anteriores[72]) + 2
-        numero_fornecedores = _safe_randint(nf_lower, nf_upper)
-
-        valor_anterior_def = dados_anteriores[73]
-        if valor_anterior_def is None:
-            taxa_de_defeito = round(np.random.uniform(0.1, 5), 2)
-        else:
-            taxa_de_defeito = round(
-                np.random.uniform(
-                    max(0.0, valor_anterior_def - 0.5),
-                    min(valor_anterior_def + 0.5, 100.0)
-                ), 2
-            )
+        numero_fornecedores = v["numero_fornecedores"]
+        taxa_de_defeito = v["taxa_de_defeito"]
 
         # --- MÉTRICAS DE USO DE PRODUTO/SERVIÇO ---
-        if segmento in ["SaaS", "TI", "Aplicativo"]:
-            valor_anterior_ua = dados_anteriores[74]
-            if valor_anterior_ua is None or valor_anterior_ua <= 0:
-                usuarios_ativos = int(np.random.lognormal(mean=5, sigma=0.9))
-            else:
-                usuarios_ativos = int(np.random.lognormal(mean=np.log(max(1, valor_anterior_ua)), sigma=0.2))
-            funcionalidade_mais_usada = random.choice(["FuncA", "FuncB", "FuncC", "Outra"])
+        usuarios_ativos = v["usuarios_ativos"]
+        if perfil.tem("funcionalidade_mais_usada"):
+            funcionalidade_mais_usada = sortear_categoria("funcionalidade_mais_usada")
         else:
-            usuarios_ativos = 0
             funcionalidade_mais_usada = None
-
-        valor_anterior_sessao = dados_anteriores[75]
-        if valor_anterior_sessao is None:
-            tempo_medio_sessao = round(np.random.uniform(5, 60), 2)
-        else:
-            tempo_medio_sessao = round(
-                np.random.uniform(
-                    max(0.1, valor_anterior_sessao - 10),
-                    valor_anterior_sessao + 10
-                ), 2
-            )
-
-        valor_anterior_ret = dados_anteriores[76]
-        if valor_anterior_ret is None:
-            taxa_retencao = round(np.random.uniform(30, 90), 2)
-        else:
-            taxa_retencao = round(
-                np.random.uniform(
-                    max(0.0, valor_anterior_ret - 10),
-                    min(valor_anterior_ret + 10, 100)
-                ), 2
-            )
-
-        valor_anterior_churn = dados_anteriores[77]
-        if valor_anterior_churn is None:
-            churn_rate = round(np.random.uniform(1, 10), 2)
-        else:
-            churn_rate = round(
-                np.random.uniform(
-                    max(0.0, valor_anterior_churn - 2),
-                    min(valor_anterior_churn + 2, 100)
-                ), 2
-            )
-
-        valor_anterior_sessoes = dados_anteriores[79]
-        if valor_anterior_sessoes is None:
-            numero_sessoes = _safe_randint(1, 50)
-        else:
-            lower = max(1, int(valor_anterior_sessoes) - 5)
-            upper = int(valor_anterior_sessoes) + 5
-            numero_sessoes = _safe_randint(lower, upper)
+        tempo_medio_sessao = v["tempo_medio_sessao"]
+        taxa_retencao = v["taxa_retencao"]
+        churn_rate = v["churn_rate"]
+        numero_sessoes = v["numero_sessoes"]
 
         # --- MÉTRICAS ESPECÍFICAS ---
-        # RevPAR (só se Hotelaria)
-        if segmento == "Hotelaria":
-            valor_anterior_revpar = dados_anteriores[80]
-            if valor_anterior_revpar is None:
-                RevPAR = round(np.random.uniform(50, 200), 2)
-            else:
-                RevPAR = round(
-                    np.random.uniform(
-                        max(0.0, valor_anterior_revpar - 20),
-                        valor_anterior_revpar + 20
-                    ), 2
-                )
-        else:
-            RevPAR = None
-
-        # taxa_evasao (só se Educação)
-        if segmento == "Educação":
-            valor_anterior_evasao = dados_anteriores[81]
-            if valor_anterior_evasao is None:
-                taxa_evasao = round(np.random.uniform(5, 20), 2)
-            else:
-                taxa_evasao = round(
-                    np.random.uniform(
-                        max(0.0, valor_anterior_evasao - 5),
-                        min(valor_anterior_evasao + 5, 100)
-                    ), 2
-                )
-        else:
-            taxa_evasao = None
-
-        # tempo_medio_atendimento (só se Saúde/Hospital)
-        if segmento in ["Saúde", "Hospital"]:
-            valor_anterior_tma = dados_anteriores[82]
-            if valor_anterior_tma is None:
-                tempo_medio_atendimento = round(np.random.uniform(15, 60), 2)
-            else:
-                tempo_medio_atendimento = round(
-                    np.random.uniform(
-                        max(0.1, valor_anterior_tma - 15),
-                        valor_anterior_tma + 15
-                    ), 2
-                )
-        else:
-            tempo_medio_atendimento = None
+        RevPAR = v["RevPAR"]
+        taxa_evasao = v["taxa_evasao"]
+        tempo_medio_atendimento = v["tempo_medio_atendimento"]
 
         # --- DESPESAS ---
-        valor_anterior_adm = dados_anteriores[83]
-        if valor_anterior_adm is None:
-            despesa_administrativa = round(np.random.uniform(500, 5000), 2)
-        else:
-            despesa_administrativa = round(np.random.normal(loc=valor_anterior_adm, scale=500), 2)
-        despesa_administrativa = max(0.0, despesa_administrativa)
-
-        valor_anterior_pessoal = dados_anteriores[84]
-        if valor_anterior_pessoal is None:
-            despesa_com_pessoal = round(np.random.uniform(2000, 20000), 2)
-        else:
-            despesa_com_pessoal = round(np.random.normal(loc=valor_anterior_pessoal, scale=1000), 2)
-        despesa_com_pessoal = max(0.0, despesa_com_pessoal)
-
-        valor_anterior_fixa = dados_anteriores[85]
-        if valor_anterior_fixa is None:
-            despesa_fixa = round(np.random.uniform(1000, 10000), 2)
-        else:
-            despesa_fixa = round(np.random.normal(loc=valor_anterior_fixa, scale=500), 2)
-        despesa_fixa = max(0.0, despesa_fixa)
-
-        valor_anterior_var = dados_anteriores[86]
-        if valor_anterior_var is None:
-            despesa_variavel = round(np.random.uniform(500, 5000), 2)
-        else:
-            despesa_variavel = round(np.random.normal(loc=valor_anterior_var, scale=500), 2)
-        despesa_variavel = max(0.0, despesa_variavel)
-
-        despesa_tributaria = round(receita * np.random.uniform(0.05, 0.15), 2)
-
-        valor_anterior_fin = dados_anteriores[88]
-        if valor_anterior_fin is None:
-            despesa_financeira = round(np.random.uniform(100, 1000), 2)
-        else:
-            despesa_financeira = round(np.random.normal(loc=valor_anterior_fin, scale=100), 2)
-        despesa_financeira = max(0.0, despesa_financeira)
+        despesa_administrativa = v["despesa_administrativa"]
+        despesa_com_pessoal = v["despesa_com_pessoal"]
+        despesa_fixa = v["despesa_fixa"]
+        despesa_variavel = v["despesa_variavel"]
+        despesa_tributaria = round(receita * d["fator_despesa_tributaria"].sortear(), 2)
+        despesa_financeira = v["despesa_financeira"]
 
     # --------------------------------------------------------------------------------
     # 3) MONTA O VETOR DE RETORNO
@@ -864,37 +643,48 @@ def gerar_dados_empresa(fake, segmento, data_registro, dados_anteriores=None):
         despesa_financeira                   # 88
     ]
 
+# Índices (na lista retornada por gerar_dados_empresa) das colunas que podem receber outliers
+INDICES_OUTLIERS = [
+    8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22,
+    33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46,
+    47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60,
+    61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74,
+    75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88
+]
+
+# Após o outlier, estas colunas mantêm valor mínimo 1...
+INDICES_OUTLIERS_MINIMO_1 = [
+    8, 9, 10, 16, 17, 18, 19, 22, 33, 34, 35, 36, 40, 41, 42,
+    43, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 56, 57, 60,
+    61, 63, 64, 66, 67, 69, 70, 71, 72, 73, 74, 75, 76, 77,
+    78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88
+]
+
+# ...e estas ficam entre 0 e 100
+INDICES_OUTLIERS_0_A_100 = [13, 38, 55, 58, 59, 62, 65, 68, 72]
+
+# Os mesmos conjuntos pelo nome da coluna (motor em lote e armazenamento colunar); os índices se referem à lista
+# de gerar_dados_empresa, que não tem a coluna registro_id
+COLUNAS_OUTLIERS = [CABECALHO_ORIGINAL[indice + 1] for indice in INDICES_OUTLIERS]
+COLUNAS_OUTLIERS_MINIMO_1 = frozenset(CABECALHO_ORIGINAL[indice + 1] for indice in INDICES_OUTLIERS_MINIMO_1)
+COLUNAS_OUTLIERS_0_A_100 = frozenset(CABECALHO_ORIGINAL[indice + 1] for indice in INDICES_OUTLIERS_0_A_100)
+
 def gerar_dados_com_outliers(dados, probabilidade_outlier=0.01):
     """
     Aplica outliers em certas colunas numéricas, com determinada probabilidade.
     """
-    if random.random() < probabilidade_outlier:
-        # Índices das colunas que podem ter outliers
-        indices_numericos = [
-            8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22,
-            33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46,
-            47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60,
-            61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74,
-            75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88
-        ]
-
-        indice_outlier = random.choice(indices_numericos)
-        fator_outlier = np.random.uniform(0.5, 2.0)
-
-        if isinstance(dados[indice_outlier], (int, float)):
-            valor_modificado = dados[indice_outlier] * fator_outlier
-            dados[indice_outlier] = round(valor_modificado, 2)
-
-            # Ajustes para manter valores mínimos
-            if indice_outlier in [
-                8, 9, 10, 16, 17, 18, 19, 22, 33, 34, 35, 36, 40, 41, 42,
-                43, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 56, 57, 60,
-                61, 63, 64, 66, 67, 69, 70, 71, 72, 73, 74, 75, 76, 77,
-                78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88
-            ]:
-                dados[indice_outlier] = max(1, dados[indice_outlier])
-            elif indice_outlier in [13, 38, 55, 58, 59, 62, 65, 68, 72]:
-                # Exemplo de indices que precisam ficar >= 0 e <= 100
-                dados[indice_outlier] = max(0.0, min(dados[indice_outlier], 100.0))
-
-    return dados
+    return aplicar_outlier_linha(dados, INDICES_OUTLIERS, INDICES_OUTLIERS_MINIMO_1, INDICES_OUTLIERS_0_A_100,
+                                 probabilidade_outlier)
+
+def gerar_dados_com_outliers_colunar(colunas, tipos, probabilidade_outlier=0.01, rng=np.random,
+                                     inicio=0, fim=None):
+    """
+    Versão vetorizada de `gerar_dados_com_outliers`, aplicada a colunas NumPy (dicionário nome -> array).
+    Cada linha do intervalo [inicio, fim) é sorteada com a probabilidade informada e, para as sorteadas,
+    uma coluna de INDICES_OUTLIERS é multiplicada por um fator entre 0.5 e 2.0 e ajustada aos mesmos limites.
+    - tipos: dicionário nome -> tipo lógico (TIPOS_COLUNAS_ORIGINAL); colunas não numéricas são ignoradas,
+      assim como na versão por linha.
+    - rng: numpy.random.Generator ou o próprio módulo numpy.random.
+    """
+    return aplicar_outliers_colunar(colunas, tipos, COLUNAS_OUTLIERS, COLUNAS_OUTLIERS_MINIMO_1,
+                                    COLUNAS_OUTLIERS_0_A_100, probabilidade_outlier, rng, inicio, fim)
@@ -0,0 +1,437 @@
+# geradores_lote.py
+
+"""
+geradores_lote.py
+
+Descrição:
+-----------
+Este módulo implementa o "motor em lote" (vetorizado) dos dois modos de geração. Em vez de gerar uma linha por vez
+com chamadas escalares ao `random`/`numpy.random` e ao Faker, cada coluna do dataset é gerada inteira, com uma
+única chamada a um `numpy.random.Generator`. O resultado é um dicionário {nome_da_coluna: numpy.ndarray}, na ordem
+do cabeçalho do modo, que pode ser convertido diretamente em DataFrame (dataframes.py) sem passar por listas de
+linhas Python.
+
+Funcionalidades:
+-----------------
+1. gerar_colunas_original(registros, segmentos, data_inicio, data_fim, outliers, rng, pool):
+   - Gera as 90 colunas do modo original (CABECALHO_ORIGINAL), com as mesmas distribuições do bloco inicial de
+     `gerar_dados_empresa` (sem autocorrelação: cada linha é sorteada de forma independente).
+   - As métricas específicas de segmento vêm do registro de segmentos (segmentos.py): as linhas são agrupadas por
+     segmento e cada métrica de cada grupo é sorteada com uma única chamada.
+   - Com `correlacionar=True`, os blocos de métricas de correlacao.py são sorteados juntos (uma multiplicação pelo
+     fator de Cholesky por bloco).
+   - Com `entidades=N`, gera séries diárias de N empresas: a matriz de estado (empresas × métricas) avança um dia
+     por chamada do motor AR (autorregressivo.py), com as regras de AUTOCORRELACAO_EMPRESA.
+   - As datas vêm do amostrador nucleo.Datas (`calendario`): posições inteiras de uma dimensão de datas sorteadas
+     em uma chamada, com pesos por dia da semana/mês e calendário de dias úteis opcionais.
+   - Com `dimensoes` (dimensoes.py), as linhas guardam as chaves empresa_id e cidade_id, sorteadas de dimensões
+     de cardinalidade fixa (uniforme ou Zipf), em vez de nomes novos a cada linha.
+   - Aplica outliers com `gerar_dados_com_outliers_colunar` e ordena as linhas por data (ordenação estável),
+     assim como o main.py.
+
+2. gerar_colunas_hotel(nome_hotel, total_quartos, data_inicio, data_fim, max_clientes_por_dia, rng, pool):
+   - Gera as 31 colunas do modo hotel único (CABECALHO_HOTEL), com as mesmas regras de `gerar_dados_hotel_unico`:
+     número de clientes por dia, estadias de várias noites reservadas no inventário (`reservas.py`, avaliando as
+     chegadas de cada dia em conjunto), tarifas do calendário por tipo de quarto (`tarifas.py`), despesas diárias e
+     métricas de cada noite (do hotel e de cada tipo de quarto) replicadas para as linhas do dia.
+
+3. gerar_tabelas_hotel(...):
+   - Mesmos dados de `gerar_colunas_hotel`, no layout normalizado: tabela de hóspedes (CABECALHO_HOTEL_HOSPEDES) e
+     tabela de KPIs diários (CABECALHO_HOTEL_KPIS_DIARIOS), com uma linha por dia. `gerar_colunas_hotel` monta o
+     layout desnormalizado a partir dessas duas tabelas.
+   - Com `dimensoes`, os hóspedes guardam a chave hospede_id da dimensão de hóspedes (com hóspedes que retornam).
+
+Representação das Colunas:
+---------------------------
+- "data": datetime64[D]; "inteiro": int64; "decimal": float64 (None vira NaN).
+- "categoria": `ColunaCategorica` (códigos inteiros + dicionário compartilhado, ver categorias.py); os textos só
+  são materializados na saída.
+- "texto": arrays de objetos (str).
+
+Observações:
+-------------
+- Os nomes (empresa, cidade, estado, cliente) são sorteados de um `PoolFaker` (pool_faker.py); se nenhum pool
+  for informado, um pool padrão é criado uma única vez por processo.
+- Com a mesma semente do Generator, o resultado é sempre o mesmo. Os valores seguem as mesmas distribuições dos
+  geradores escalares, mas não são idênticos linha a linha, pois a sequência de sorteios é diferente.
+- O contexto de geração (Generator, pool e pesos), os amostradores, as funções de coluna e a etapa de outliers vêm
+  do núcleo compartilhado (nucleo.py); as distribuições vêm dos modelos de cada modo (`DISTRIBUICOES_EMPRESA` em
+  geradores.py e as constantes do modelo do hotel em geradores_hotel.py), as mesmas usadas pelo motor escalar.
+"""
+
+import numpy as np
+
+from categorias import ColunaCategorica, categoria_constante
+from config import (
+    CABECALHO_HOTEL, CABECALHO_HOTEL_HOSPEDES, CABECALHO_HOTEL_KPIS_DIARIOS, CABECALHO_ORIGINAL, COLUNAS_DIARIAS_HOTEL,
+    TIPOS_COLUNAS_ORIGINAL,
+)
+from correlacao import amostrar_correlacionados
+from dimensoes import com_chaves
+from geradores import DISTRIBUICOES_EMPRESA, gerar_dados_com_outliers_colunar, motor_autocorrelacao
+from geradores_hotel import DESPESAS_DIARIAS_HOTEL, DIARIAS_POR_RESERVA, OUTROS_CONSUMOS, QUARTOS_POR_RESERVA
+from nucleo import ContextoGeracao, Inteiro, colunas_de_data, dia_numpy, dividir, onde
+from segmentos import METRICAS_SEGMENTO, amostrar_por_segmento, validade_segmento
+from tarifas import CalendarioTarifas, kpis_noites_por_tipo, reservar_por_tipo
+
+
+def gerar_colunas_original(registros, segmentos, data_inicio, data_fim, outliers=0.01, rng=None, pool=None,
+                           pesos_categorias=None, correlacionar=False, entidades=None, calendario=None,
+                           dimensoes=None, primeiro_id=1):
+    """
+    Gera as colunas do modo original de forma vetorizada.
+    - registros: quantidade de linhas.
+    - segmentos: lista de segmentos sorteados uniformemente para cada linha.
+    - data_inicio, data_fim: intervalo das datas (datetime, date ou "YYYY-MM-DD").
+    - outliers: probabilidade de outlier por linha.
+    - rng: numpy.random.Generator (padrão: numpy.random.default_rng()).
+    - pool: PoolFaker para os nomes (padrão: pool do processo).
+    - pesos_categorias: dicionário coluna -> pesos das categorias (opcional; padrão uniforme).
+    - correlacionar: sorteia as métricas dos blocos de correlacao.py juntas (cópula gaussiana).
+    - entidades: com um número de empresas, gera séries diárias (empresas × dias do período, ignorando
+      `registros`): cada empresa mantém segmento, nome e cidade, e as métricas de AUTOCORRELACAO_EMPRESA evoluem
+      dia a dia com o motor AR (autorregressivo.py).
+    - calendario: amostrador nucleo.Datas das datas (pesos por dia da semana/mês, dias úteis); padrão: uniforme
+      entre data_inicio e data_fim. Com `entidades`, as séries usam os dias da dimensão do calendário.
+    - dimensoes: dimensoes.Dimensoes (opcional); as colunas empresa e cidade dão lugar às chaves empresa_id e
+      cidade_id, sorteadas das dimensões, e as tabelas de empresas e cidades ficam em `dimensoes.tabelas`.
+    - primeiro_id: registro_id da primeira linha gerada (pedaços de uma geração maior numeram sem repetição).
+    Retorna um dicionário {coluna: numpy.ndarray ou ColunaCategorica} na ordem de CABECALHO_ORIGINAL (com
+    `dimensoes`, de com_chaves(CABECALHO_ORIGINAL)), ordenado por data.
+    """
+    ctx = ContextoGeracao(rng, pool, pesos_categorias)
+    rng = ctx.rng
+    # Segmentos repetidos na lista mantêm o peso maior (como no random.choice), mas o dicionário é único
+    dicionario_segmentos = list(dict.fromkeys(segmentos))
+    posicoes = np.array([dicionario_segmentos.index(nome) for nome in segmentos])
+
+    if entidades is None:
+        n = registros
+        datas = ctx.datas(data_inicio, data_fim, n, calendario)
+        if dimensoes is None:
+            codigos_segmento = posicoes[rng.integers(0, len(segmentos), n)]
+            empresa, cidade = ctx.nomes("company", n), ctx.nomes("city", n)
+        else:
+            # O segmento é da empresa: cada linha repete o segmento da empresa sorteada
+            sorteio = dimensoes.gerador(rng).integers(0, len(segmentos), dimensoes.cardinalidades["empresas"])
+            codigos_empresa = posicoes[sorteio]
+            empresa = dimensoes.chaves(rng, "empresas", n)
+            codigos_segmento = codigos_empresa[empresa - 1]
+            cidade = dimensoes.chaves(rng, "cidades", n)
+        prontas = amostrar_correlacionados(rng, n, DISTRIBUICOES_EMPRESA) if correlacionar else {}
+    else:
+        # Séries: linhas em ordem de dia e, em cada dia, de empresa
+        dias = calendario.dias if calendario is not None else np.arange(dia_numpy(data_inicio),
+                                                                          dia_numpy(data_fim) + 1)
+        n = entidades * len(dias)
+        datas = np.repeat(dias, entidades)
+        linha_entidade = np.tile(np.arange(entidades), len(dias))
+        codigos_entidade = posicoes[rng.integers(0, len(segmentos), entidades)]
+        codigos_segmento = codigos_entidade[linha_entidade]
+        if dimensoes is None:
+            empresa = ctx.nomes("company", entidades)[linha_entidade]
+            cidade = ctx.nomes("city", entidades)[linha_entidade]
+        else:
+            codigos_empresa = codigos_entidade
+            empresa = linha_entidade + 1
+            cidade = dimensoes.chaves(rng, "cidades", entidades)[linha_entidade]
+        prontas = _series_autocorrelacionadas(ctx, len(dias), dicionario_segmentos, codigos_entidade, correlacionar)
+
+    def amostrar(nome):
+        if nome in prontas:
+            return prontas[nome]
+        return ctx.amostrar(DISTRIBUICOES_EMPRESA[nome], n)
+
+    def categoria(nome):
+        return ctx.categoria(nome, n)
+
+    segmento = ColunaCategorica(codigos_segmento, dicionario_segmentos)
+    # Métricas e categorias de segmento (segmentos.py): uma chamada por métrica para cada grupo de segmento
+    s = amostrar_por_segmento(ctx, dicionario_segmentos, codigos_segmento)
+    s.update({metrica: prontas[metrica] for metrica in METRICAS_SEGMENTO if metrica in prontas})
+
+    c = {}
+    ano, mes, dia = colunas_de_data(datas)
+    c["data"], c["ano"], c["mes"], c["dia"] = datas, ano, mes, dia
+    c["segmento"] = segmento
+    c["empresa"] = empresa
+    c["cidade"] = cidade
+    if dimensoes is not None:
+        dimensoes.gerar(ctx, "empresas", segmento=ColunaCategorica(codigos_empresa, dicionario_segmentos))
+        dimensoes.gerar(ctx, "cidades")
+
+    # -- MÉTRICAS BÁSICAS --
+    numero_clientes = amostrar("numero_clientes")
+    ticket_medio = amostrar("ticket_medio")
+    receita = np.round(numero_clientes * ticket_medio, 2)
+    custo = np.round(receita * amostrar("fator_custo"), 2)
+    lucro = np.round(receita - custo, 2)
+    c["numero_clientes"], c["ticket_medio"] = numero_clientes, ticket_medio
+    c["receita"], c["custo"], c["lucro"] = receita, custo, lucro
+    c["indice_satisfacao"] = amostrar("indice_satisfacao")
+    c["taxa_ocupacao"] = s["taxa_ocupacao"]
+    c["taxa_crescimento"] = amostrar("taxa_crescimento")
+    custo_marketing = np.round(receita * amostrar("fator_custo_marketing"), 2)
+    investimento_publicidade = amostrar("investimento_publicidade")
+    c["custo_marketing"], c["investimento_publicidade"] = custo_marketing, investimento_publicidade
+    c["previsao_vendas"] = np.round(receita * (1 + amostrar("fator_previsao_vendas")), 2)
+    c["previsao_custos"] = np.round(custo * (1 + amostrar("fator_previsao_custos")), 2)
+    c["sensibilidade_negocios"] = amostrar("sensibilidade_negocios")
+    c["indice_correcao"] = amostrar("indice_correcao")
+    c["programacao_linear"] = amostrar("programacao_linear")
+
+    # -- DADOS GERAIS --
+    c["regiao"] = ctx.nomes_categoria("estado_nome", n)
+    c["estado"] = ctx.nomes_categoria("estado_sigla", n)
+    c["pais"] = categoria_constante("Brasil", n)
+    c["tipo_cliente"] = categoria("tipo_cliente")
+    c["canal_venda"] = categoria("canal_venda")
+    c["categoria_produto"] = s["categoria_produto"]
+    c["tipo_servico"] = s["tipo_servico"]
+    c["plano"] = s["plano"]
+    c["faixa_etaria"] = categoria("faixa_etaria")
+    c["genero"] = categoria("genero")
+    c["fonte_trafego"] = categoria("fonte_trafego")
+    c["dispositivo"] = categoria("dispositivo")
+    c["sistema_operacional"] = categoria("sistema_operacional")
+    c["navegador"] = categoria("navegador")
+
+    # -- MÉTRICAS NOVAS --
+    c["quantidade_produtos"] = s["quantidade_produtos"]
+    c["custo_por_cliente"] = dividir(custo, numero_clientes)
+    c["receita_por_cliente"] = dividir(receita, numero_clientes)
+    c["lucro_por_cliente"] = dividir(lucro, numero_clientes)
+    desconto_medio = amostrar("desconto_medio")
+    c["desconto_medio"] = desconto_medio
+    c["percentual_desconto"] = np.round(dividir(desconto_medio, ticket_medio + desconto_medio, 6) * 100, 2)
+    c["taxa_conversao"] = amostrar("taxa_conversao")
+    vendas_por_vendedor = s["vendas_por_vendedor"]
+    c["vendas_por_vendedor"] = vendas_por_vendedor
+    c["comissao_vendas"] = onde(vendas_por_vendedor > 0, np.round(receita * s["fator_comissao_vendas"], 2), 0.0)
+    c["valor_impostos"] = np.round(receita * amostrar("fator_impostos"), 2)
+    c["frete_medio"] = s["frete_medio"]
+    c["pedidos_por_cliente"] = amostrar("pedidos_por_cliente")
+    c["LTV"] = amostrar("LTV")
+    c["CAC"] = amostrar("CAC")
+    MRR = np.round(receita * s["fator_MRR"], 2)
+    c["MRR"] = MRR
+    c["ARR"] = onde(MRR > 0, np.round(MRR * 12, 2), 0.0)
+
+    # -- MÉTRICAS DE MARKETING --
+    c["receita_media_diaria"] = np.round(receita / 30, 2)
+    c["custo_por_clique"] = amostrar("custo_por_clique")
+    c["custo_por_mil_impressoes"] = amostrar("custo_por_mil_impressoes")
+    taxa_de_clique = amostrar("taxa_de_clique")
+    impressoes = amostrar("impressoes")
+    leads_gerados = amostrar("leads_gerados")
+    c["taxa_de_clique"], c["impressoes"] = taxa_de_clique, impressoes
+    c["cliques"] = (impressoes * (taxa_de_clique / 100)).astype(np.int64)
+    c["leads_gerados"] = leads_gerados
+    c["custo_por_lead"] = dividir(custo_marketing, leads_gerados)
+    c["ROAS"] = dividir(receita, investimento_publicidade)
+
+    # -- MÉTRICAS DE SATISFAÇÃO --
+    c["avaliacao_media"] = amostrar("avaliacao_media")
+    c["numero_avaliacoes"] = amostrar("numero_avaliacoes")
+    c["NPS"] = amostrar("NPS")
+    c["CSAT"] = amostrar("CSAT")
+    c["reclamacoes"] = amostrar("reclamacoes")
+    c["tempo_medio_resposta"] = amostrar("tempo_medio_resposta")
+
+    # -- MÉTRICAS DE OPERAÇÕES/LOGÍSTICA --
+    c["tempo_medio_entrega"] = amostrar("tempo_medio_entrega")
+    c["taxa_devolucao"] = amostrar("taxa_devolucao")
+    nivel_estoque = s["nivel_estoque"]
+    com_estoque = nivel_estoque > 0
+    c["nivel_estoque"] = nivel_estoque
+    c["giro_estoque"] = onde(com_estoque, s["giro_estoque"], 0.0)
+    c["custo_estoque"] = onde(com_estoque, np.round(nivel_estoque * s["fator_custo_estoque"], 2), 0.0)
+    c["numero_fornecedores"] = amostrar("numero_fornecedores")
+    c["taxa_de_defeito"] = amostrar("taxa_de_defeito")
+
+    # -- MÉTRICAS DE USO DE PRODUTO/SERVIÇO --
+    c["usuarios_ativos"] = s["usuarios_ativos"]
+    c["tempo_medio_sessao"] = amostrar("tempo_medio_sessao")
+    c["taxa_retencao"] = amostrar("taxa_retencao")
+    c["churn_rate"] = amostrar("churn_rate")
+    c["funcionalidade_mais_usada"] = s["funcionalidade_mais_usada"]
+    c["numero_sessoes"] = amostrar("numero_sessoes")
+
+    # -- MÉTRICAS ESPECÍFICAS --
+    c["RevPAR"] = s["RevPAR"]
+    c["taxa_evasao"] = s["taxa_evasao"]
+    c["tempo_medio_atendimento"] = s["tempo_medio_atendimento"]
+
+    # -- DESPESAS --
+    c["despesa_administrativa"] = amostrar("despesa_administrativa")
+    c["despesa_com_pessoal"] = amostrar("despesa_com_pessoal")
+    c["despesa_fixa"] = amostrar("despesa_fixa")
+    c["despesa_variavel"] = amostrar("despesa_variavel")
+    c["despesa_tributaria"] = np.round(receita * amostrar("fator_despesa_tributaria"), 2)
+    c["despesa_financeira"] = amostrar("despesa_financeira")
+
+    # Colunas inteiras passam a decimal ao receber outliers; aqui elas são mantidas inteiras (arredondadas)
+    gerar_dados_com_outliers_colunar(c, TIPOS_COLUNAS_ORIGINAL, outliers, rng=rng, inicio=0, fim=n)
+
+    # Ordena por data (estável), numerando os registros na ordem de geração, como no main.py
+    c["registro_id"] = np.arange(primeiro_id, primeiro_id + n)
+    ordem = np.argsort(datas, kind="stable")
+    if dimensoes is not None:
+        return {chave: c[nome][ordem] for nome, chave in zip(CABECALHO_ORIGINAL, com_chaves(CABECALHO_ORIGINAL))}
+    return {nome: c[nome][ordem] for nome in CABECALHO_ORIGINAL}
+
+
+def _series_autocorrelacionadas(ctx, n_dias, dicionario_segmentos, codigos_entidade, correlacionar=False):
+    """
+    Simula as métricas de AUTOCORRELACAO_EMPRESA para cada empresa: o primeiro dia vem das distribuições iniciais
+    (DISTRIBUICOES_EMPRESA, perfis de segmento e, com `correlacionar`, os blocos correlacionados); os seguintes,
+    de um passo do motor AR por dia para todas as empresas. Métricas que o segmento não declara ficam com o padrão.
+    Retorna {metrica: array de n_dias × empresas}.
+    """
+    motor = motor_autocorrelacao()
+    entidades = len(codigos_entidade)
+    correlacionados = amostrar_correlacionados(ctx.rng, entidades, DISTRIBUICOES_EMPRESA) if correlacionar else {}
+    s = amostrar_por_segmento(ctx, dicionario_segmentos, codigos_entidade)
+
+    inicial = np.empty((entidades, len(motor.colunas)))
+    mascara = np.ones(inicial.shape, dtype=bool)
+    for j, coluna in enumerate(motor.colunas):
+        if coluna in METRICAS_SEGMENTO:
+            inicial[:, j] = s[coluna]
+            mascara[:, j] = validade_segmento(dicionario_segmentos, codigos_entidade, coluna)
+        elif coluna in correlacionados:
+            inicial[:, j] = correlacionados[coluna]
+        else:
+            inicial[:, j] = ctx.amostrar(DISTRIBUICOES_EMPRESA[coluna], entidades)
+    return motor.simular(inicial, n_dias, ctx.rng, mascara)
+
+
+def gerar_colunas_hotel(nome_hotel="Hotel Fictício", total_quartos=100, data_inicio=None, data_fim=None,
+                        max_clientes_por_dia=5, rng=None, pool=None, pesos_categorias=None, demanda=None,
+                        acumulador=None, dimensoes=None):
+    """
+    Gera as colunas do modo hotel único de forma vetorizada (uma linha por cliente, com as métricas do dia
+    replicadas em cada linha).
+    Os parâmetros têm o mesmo significado de `gerar_dados_hotel_unico` (incluindo `demanda` e `acumulador`); rng e
+    pool como em `gerar_colunas_original`; dimensoes como em `gerar_tabelas_hotel`.
+    Retorna um dicionário {coluna: numpy.ndarray ou ColunaCategorica} na ordem de CABECALHO_HOTEL (com
+    `dimensoes`, de com_chaves(CABECALHO_HOTEL)).
+    """
+    hospedes, kpis_diarios = gerar_tabelas_hotel(nome_hotel, total_quartos, data_inicio, data_fim,
+                                                 max_clientes_por_dia, rng, pool, pesos_categorias, demanda,
+                                                 acumulador, dimensoes)
+    indice_dia = (hospedes["data"] - kpis_diarios["data"][0]).astype(np.int64)
+    c = dict(hospedes)
+    c.update({nome: kpis_diarios[nome][indice_dia] for nome in COLUNAS_DIARIAS_HOTEL})
+    return {nome: c[nome] for nome in (CABECALHO_HOTEL if dimensoes is None else com_chaves(CABECALHO_HOTEL))}
+
+
+def gerar_tabelas_hotel(nome_hotel="Hotel Fictício", total_quartos=100, data_inicio=None, data_fim=None,
+                        max_clientes_por_dia=5, rng=None, pool=None, pesos_categorias=None, demanda=None,
+                        acumulador=None, dimensoes=None):
+    """
+    Gera o modo hotel único no layout normalizado: uma tabela de fatos por hóspede e uma tabela de KPIs com uma
+    linha por dia do período (inclusive dias sem chegadas), calculada em uma única passagem de agregação.
+    Os parâmetros são os mesmos de `gerar_colunas_hotel`, mais:
+    - dimensoes: dimensoes.Dimensoes (opcional); a coluna nome_cliente dá lugar à chave hospede_id, sorteada da
+      dimensão de hóspedes (as chaves repetidas são hóspedes que retornam), e a tabela de hóspedes fica em
+      `dimensoes.tabelas`.
+    Retorna (hospedes, kpis_diarios): dicionários de colunas na ordem de CABECALHO_HOTEL_HOSPEDES (com
+    `dimensoes`, de com_chaves(CABECALHO_HOTEL_HOSPEDES)) e CABECALHO_HOTEL_KPIS_DIARIOS.
+    """
+    if data_inicio is None or data_fim is None:
+        raise ValueError("Informe data_inicio e data_fim para gerar dados do hotel único.")
+    ctx = ContextoGeracao(rng, pool, pesos_categorias)
+    rng = ctx.rng
+
+    inicio = dia_numpy(data_inicio)
+    n_dias = int((dia_numpy(data_fim) - inicio).astype(np.int64)) + 1
+    datas_periodo = inicio + np.arange(n_dias)
+
+    # Despesas diárias (uma vez por dia)
+    despesas = {nome: ctx.amostrar(amostrador, n_dias) for nome, amostrador in DESPESAS_DIARIAS_HOTEL.items()}
+    custo_total_dia = sum(despesas.values())
+
+    # Chegadas de cada dia; cada estadia ocupa os quartos do seu tipo em todas as suas noites (reservas.py) e
+    # a tarifa vem do calendário pré-calculado (tarifas.py). Sem pesos de tipo_de_quarto no modelo, a procura
+    # por tipo segue o inventário.
+    calendario = CalendarioTarifas(total_quartos, inicio, n_dias)
+    if demanda is not None:
+        clientes_por_dia = demanda.chegadas(rng, inicio, n_dias, total_quartos)
+    else:
+        clientes_por_dia = ctx.amostrar(Inteiro(1, max_clientes_por_dia), n_dias)
+    indice_dia = np.repeat(np.arange(n_dias), clientes_por_dia)
+    tipo_de_quarto = ctx.categoria("tipo_de_quarto", len(indice_dia), calendario.tipos, calendario.procura)
+    qtd_quartos = ctx.amostrar(QUARTOS_POR_RESERVA, len(indice_dia))
+    quantidade_diarias = ctx.amostrar(DIARIAS_POR_RESERVA, len(indice_dia))
+    qtd_quartos, valor_diaria, inventarios = reservar_por_tipo(calendario, indice_dia, tipo_de_quarto.codigos,
+                                                               quantidade_diarias, qtd_quartos)
+    atendidos = qtd_quartos > 0
+    indice_dia, qtd_quartos, tipo_de_quarto = indice_dia[atendidos], qtd_quartos[atendidos], tipo_de_quarto[atendidos]
+    quantidade_diarias, valor_diaria = quantidade_diarias[atendidos], valor_diaria[atendidos]
+    n = len(indice_dia)
+
+    valor_total_diarias = np.round(qtd_quartos * quantidade_diarias * valor_diaria, 2)
+    valor_outros_consumos = ctx.amostrar(OUTROS_CONSUMOS, n)
+    total_pago = np.round(valor_total_diarias + valor_outros_consumos, 2)
+
+    # Métricas de cada noite (inventário) + outros consumos no dia da chegada
+    noites, noites_por_tipo = kpis_noites_por_tipo(inventarios, calendario.tipos)
+    quartos_ocupados_dia = noites["quartos_ocupados"]
+    receita_quartos_dia = noites["receita_quartos"]
+    receita_total_dia = receita_quartos_dia + np.bincount(indice_dia, valor_outros_consumos, n_dias)
+    ocupacao_diaria = np.round(noites["ocupacao"], 2)
+    lucro_operacional_bruto_dia = np.round(receita_total_dia - custo_total_dia, 2)
+    adr_dia = np.round(noites["adr"], 2)
+
+    c = {}
+    datas = datas_periodo[indice_dia]
+    ano, mes, dia = colunas_de_data(datas)
+    c["id_registro"] = np.arange(1, n + 1)
+    c["data"], c["ano"], c["mes"], c["dia"] = datas, ano, mes, dia
+    c["nome_hotel"] = categoria_constante(nome_hotel, n)
+    c["total_quartos"] = np.full(n, total_quartos, dtype=np.int64)
+    if dimensoes is None:
+        c["nome_cliente"] = ctx.nomes("name", n)
+    else:
+        c["nome_cliente"] = dimensoes.chaves(rng, "hospedes", n)
+        dimensoes.gerar(ctx, "hospedes")
+    c["tipo_de_quarto"] = tipo_de_quarto
+    c["forma_de_pagamento"] = ctx.categoria("forma_de_pagamento", n)
+    c["quantidade_quartos"] = qtd_quartos
+    c["quantidade_diarias"] = quantidade_diarias
+    c["valor_diaria"] = valor_diaria
+    c["valor_total_diarias"] = valor_total_diarias
+    c["valor_outros_consumos"] = valor_outros_consumos
+    c["total_pago"] = total_pago
+    if dimensoes is None:
+        hospedes = {nome: c[nome] for nome in CABECALHO_HOTEL_HOSPEDES}
+    else:
+        hospedes = {chave: c[nome] for nome, chave in zip(CABECALHO_HOTEL_HOSPEDES,
+                                                          com_chaves(CABECALHO_HOTEL_HOSPEDES))}
+
+    # Tabela de KPIs: uma linha por dia
+    d = {}
+    d["data"] = datas_periodo
+    d["ano"], d["mes"], d["dia"] = colunas_de_data(datas_periodo)
+    d["nome_hotel"] = categoria_constante(nome_hotel, n_dias)
+    d["total_quartos"] = np.full(n_dias, total_quartos, dtype=np.int64)
+    d["ocupacao_diaria"] = ocupacao_diaria
+    d.update(despesas)
+    d["quartos_ocupados_dia"] = quartos_ocupados_dia
+    d["receita_quartos_dia"] = np.round(receita_quartos_dia, 2)
+    d["receita_total_dia"] = np.round(receita_total_dia, 2)
+    d["custo_total_dia"] = np.round(custo_total_dia, 2)
+    d["lucro_operacional_bruto_dia"] = lucro_operacional_bruto_dia
+    d["adr_dia"] = adr_dia
+    d["revpar_dia"] = np.round(noites["revpar"], 2)
+    d["trevpar_dia"] = np.round(receita_total_dia / total_quartos, 2)
+    d["goppar_dia"] = np.round(lucro_operacional_bruto_dia / total_quartos, 2)
+    for tipo, kpis in noites_por_tipo.items():
+        d[f"ocupacao_{tipo.lower()}_dia"] = np.round(kpis["ocupacao"], 2)
+        d[f"receita_quartos_{tipo.lower()}_dia"] = np.round(kpis["receita_quartos"], 2)
+    kpis_diarios = {nome: d[nome] for nome in CABECALHO_HOTEL_KPIS_DIARIOS}
+    if acumulador is not None:
+        acumulador.adicionar_dias(datas_periodo, total_quartos, quartos_ocupados_dia, receita_quartos_dia,
+                                  receita_total_dia, custo_total_dia)
+    return hospedes, kpis_diarios
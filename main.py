@@ -40,6 +40,28 @@ Funcionalidades:
        • --nome_hotel: Nome do hotel.
        • --total_quartos: Total de quartos disponíveis no hotel (este valor é configurável e não fixo).
        • --max_clientes_por_dia: Número máximo de clientes que podem chegar por dia.
+       • --demanda: Modelo de chegadas ('uniforme', 'poisson' ou 'binomial_negativa'), com --media_chegadas_dia,
+         --ocupacao_alvo, --dispersao_demanda e --feriados (ver demanda.py).
+       • --layout_hotel normalizado: grava os hóspedes em --arquivo_saida e os KPIs diários (uma linha por dia) em
+         --arquivo_kpis_diarios, em vez de repetir as métricas do dia em cada hóspede (padrão: desnormalizado).
+       • --rollups: grava os KPIs por semana, mês e ano (somas aditivas acumuladas durante a geração); com
+         --estado_rollups, os dias de execuções seguintes são acrescentados aos períodos já acumulados.
+   - --motor lote: gera as colunas inteiras com numpy (geradores_lote.py), com as colunas categóricas codificadas
+     por dicionário (categorias.py); o padrão é o motor escalar, linha a linha.
+   - --particionar [COLUNA ...]: grava o modo original em diretórios "ano=2022/mes=03/segmento=Varejo/" (estilo
+     Hive, particionamento.py) em vez de um único CSV, com --manifesto_particoes para o resumo dos arquivos.
+   - --estatisticas: grava <arquivo_saida>_estatisticas.json com as estatísticas de cada coluna (média, desvio,
+     mínimo, máximo, nulos, quantis e frequências), calculadas durante a gravação (estatisticas.py).
+   - --pesos_dia_semana / --pesos_mes / --dias_uteis: sorteio das datas do modo original com pesos por dia da semana
+     e mês e apenas dias úteis (fora dos feriados nacionais e de --feriados), pelo amostrador nucleo.Datas.
+   - --dimensoes: com --motor lote, grava as tabelas de dimensão de empresas e cidades (modo original) ou de
+     hóspedes (modo hotel) em <arquivo_saida>_dim_<dimensao>.csv, e os fatos guardam apenas as chaves inteiras
+     (dimensoes.py), com cardinalidades --num_empresas / --num_cidades / --num_hospedes e --zipf opcional.
+   - --fator_escala (--scale-factor) SF: presets no estilo TPC (SF1 = 1 milhão de linhas) que definem registros,
+     dimensões, período e hotéis e geram pedaços em paralelo (--trabalhadores) no diretório <arquivo_saida sem
+     extensão>, com o resumo e a vazão em escala.json (escala.py).
+   - --armazenamento colunar: mantém o modo original em colunas NumPy tipadas na memória (armazenamento.py), em vez
+     de uma lista de linhas com objetos Python; com 'mmap', as colunas ficam em arquivos (--diretorio_mmap).
        
 2. Integração com os Módulos de Geração:
    - Importa funções de "geradores.py" para o modo original e de "geradores_hotel.py" para o modo hotel único.
@@ -67,7 +89,8 @@ Observações:
 -------------
 - O script está preparado para lidar tanto com segmentos pré-definidos (como "Varejo", "Hotelaria", "TI", "Saúde", etc.)
   quanto com segmentos novos. Para segmentos sem tratamento específico, as métricas exclusivas permanecerão com valores
-  padrão ou `None`.
+  padrão ou `None`; com `--segmentos "Pousada=Hotelaria"`, o segmento novo recebe as métricas do segmento base
+  (registro de segmentos em segmentos.py).
 - No modo hotel único, os dados diários agregados (ex.: ocupacao_diaria, ADR, RevPAR, TRevPAR, GOPPAR) são calculados
   e adicionados a cada registro do dia, permitindo que dashboards de Revenue Management possam agrupar os dados por data
   sem precisar recalcular os indicadores.
@@ -81,30 +104,130 @@ Desenvolvido para facilitar a geração de dados realistas e apoiar o desenvolvi
 
 import argparse
 from datetime import datetime
+import os
 import random
+import numpy as np
 from faker import Faker
 
 # Importa as funções para o modo original e para o modo hotel único
+from armazenamento import TAMANHO_BLOCO_ANEXAR, ArmazenamentoColunar
+from config import (CABECALHO_HOTEL, CABECALHO_HOTEL_HOSPEDES, CABECALHO_HOTEL_KPIS_DIARIOS, CABECALHO_ORIGINAL,
+                    SEGMENTOS_PADRAO, TIPOS_COLUNAS_HOTEL, TIPOS_COLUNAS_ORIGINAL)
+from demanda import MODELOS_DEMANDA, ModeloDemanda, feriados_nacionais
+from dimensoes import TIPOS_COLUNAS_CHAVE, Dimensoes
+from estatisticas import AcumuladorEstatisticas
 from geradores import gerar_data_aleatoria, gerar_dados_empresa, gerar_dados_com_outliers
 from geradores_hotel import gerar_dados_hotel_unico
-from util import criar_arquivo_csv
+from geradores_lote import gerar_colunas_hotel, gerar_colunas_original, gerar_tabelas_hotel
+from pool_faker import PoolFaker
+from rollups import GRANULARIDADES, AcumuladorPeriodos
+from modelo import aplicar_modelo, carregar_modelo, salvar_modelo
+from nucleo import Datas, dia_numpy
+from particionamento import COLUNAS_PARTICAO_PADRAO, MAX_ARQUIVOS_ABERTOS, EscritorParticionado, criar_particoes_csv
+from segmentos import especificacao_segmento
+from util import criar_arquivo_csv, definir_semente, quantidade_linhas
 
-def main():
+def construir_parser():
+    """
+    Cria o parser de argumentos da linha de comando.
+    Também é utilizado pelo servidor de geração e pelo executor de lotes, garantindo que todos aceitem
+    exatamente os mesmos parâmetros. O arquivo de `--modelo` e os segmentos "Nome=Base" são aplicados depois da
+    leitura, em `preparar_argumentos`, e as validações entre opções ficam em `validar_argumentos`.
+    """
     parser = argparse.ArgumentParser(
         description="Gera dados sintéticos de KPIs empresariais ou dados detalhados para um único hotel."
     )
     # Parâmetros para o modo original:
     parser.add_argument("--registros", type=int, default=2000, help="Número de registros para o modo original.")
-    parser.add_argument("--segmentos", nargs="+",
-                        default=["Educação", "Hotelaria", "Saúde", "TI", "Varejo", "Serviços", "Finanças", "Indústria", "Banco", "Hospital"],
-                        help="Segmentos para o modo original.")
+    parser.add_argument("--segmentos", nargs="+", type=str, default=SEGMENTOS_PADRAO,
+                        help="Segmentos para o modo original. Use \"Nome=Base\" para que um segmento novo receba "
+                             "as métricas específicas de um segmento registrado (ex.: \"Pousada=Hotelaria\").")
     # Parâmetros comuns (datas, outliers, arquivo de saída)
+    parser.add_argument("--modelo", type=str, default=None,
+                        help="Arquivo JSON/YAML com os parâmetros das distribuições (modelo.py); as entradas "
+                             "ausentes mantêm os padrões.")
+    parser.add_argument("--exportar_modelo", type=str, default=None,
+                        help="Grava o modelo em uso (padrões + --modelo) neste arquivo JSON/YAML e encerra.")
     parser.add_argument("--data_inicio", type=lambda s: datetime.strptime(s, '%Y-%m-%d'),
                         default="2020-01-01", help="Data de início (YYYY-MM-DD).")
     parser.add_argument("--data_fim", type=lambda s: datetime.strptime(s, '%Y-%m-%d'),
                         default="2020-12-31", help="Data de fim (YYYY-MM-DD).")
-    parser.add_argument("--outliers", type=float, default=0.01, help="Probabilidade de outliers (0.01 = 1%).")
+    parser.add_argument("--pesos_dia_semana", type=float, nargs=7, default=None, metavar="PESO",
+                        help="Modo original: pesos das datas por dia da semana (segunda a domingo).")
+    parser.add_argument("--pesos_mes", type=float, nargs=12, default=None, metavar="PESO",
+                        help="Modo original: pesos das datas por mês (janeiro a dezembro).")
+    parser.add_argument("--dias_uteis", action="store_true",
+                        help="Modo original: sorteia apenas dias úteis (segunda a sexta, fora dos feriados nacionais "
+                             "e de --feriados).")
+    parser.add_argument("--outliers", type=float, default=0.01, help="Probabilidade de outliers (0.01 = 1%%).")
     parser.add_argument("--arquivo_saida", type=str, default="dados.csv", help="Nome do arquivo CSV de saída.")
+    parser.add_argument("--semente", type=int, default=None,
+                        help="Semente dos geradores aleatórios, para resultados reprodutíveis.")
+    parser.add_argument("--entidades", type=int, default=None,
+                        help="Com --motor lote: gera séries diárias de N empresas (N × dias do período, em vez de "
+                             "--registros linhas independentes), com as métricas evoluindo pelo motor AR "
+                             "(autorregressivo.py).")
+    parser.add_argument("--correlacionar", action="store_true",
+                        help="Com --motor lote, sorteia juntos os blocos de métricas correlacionadas (correlacao.py), "
+                             "como aquisição (clientes, investimento, impressões, leads, CAC) e satisfação (índice, "
+                             "NPS, CSAT).")
+    parser.add_argument("--particionar", nargs="*", choices=CABECALHO_ORIGINAL, metavar="COLUNA", default=None,
+                        help="Grava o modo original em diretórios particionados no estilo Hive "
+                             "(ex.: ano=2022/mes=03/segmento=Varejo/parte-00000.csv) em vez de um único arquivo. "
+                             "Sem colunas, usa: " + " ".join(COLUNAS_PARTICAO_PADRAO) + ".")
+    parser.add_argument("--diretorio_particoes", type=str, default=None,
+                        help="Raiz das partições de --particionar (padrão: <arquivo_saida> sem a extensão); "
+                             "precisa estar vazia ou não existir.")
+    parser.add_argument("--manifesto_particoes", action="store_true",
+                        help="Grava _manifesto.json na raiz das partições, com as linhas e as datas mínima e "
+                             "máxima de cada arquivo.")
+    parser.add_argument("--max_arquivos_abertos", type=int, default=MAX_ARQUIVOS_ABERTOS,
+                        help="Máximo de arquivos de partição abertos ao mesmo tempo.")
+    parser.add_argument("--estatisticas", action="store_true",
+                        help="Grava um JSON com as estatísticas de cada coluna do arquivo principal (média, desvio, "
+                             "mínimo, máximo, nulos, quantis aproximados e frequências), calculadas durante a "
+                             "gravação, sem uma segunda leitura do CSV.")
+    parser.add_argument("--arquivo_estatisticas", type=str, default=None,
+                        help="Arquivo JSON de --estatisticas (padrão: <arquivo_saida>_estatisticas.json).")
+    parser.add_argument("--armazenamento", choices=["memoria", "colunar", "mmap"], default="memoria",
+                        help="Onde manter os dados antes da exportação (modo original): 'memoria' (lista de linhas), "
+                             "'colunar' (colunas NumPy tipadas na memória, com uma fração da memória da lista) ou "
+                             "'mmap' (colunas em arquivos mapeados em memória, para datasets maiores que a RAM).")
+    parser.add_argument("--diretorio_mmap", type=str, default="dados_mmap",
+                        help="Diretório dos arquivos de colunas quando --armazenamento mmap.")
+    parser.add_argument("--motor", choices=["escalar", "lote"], default="escalar",
+                        help="Motor de geração: 'escalar' (uma linha por vez, com autocorrelação) ou 'lote' "
+                             "(colunas inteiras com numpy, categorias codificadas por dicionário).")
+    parser.add_argument("--dimensoes", action="store_true",
+                        help="Com --motor lote: grava as tabelas de dimensão (empresas e cidades no modo original, "
+                             "hóspedes no modo hotel) em <arquivo_saida>_dim_<dimensao>.csv, e os fatos guardam "
+                             "apenas as chaves (empresa_id, cidade_id, hospede_id).")
+    parser.add_argument("--num_empresas", type=int, default=1000,
+                        help="Linhas da dimensão de empresas de --dimensoes (com --entidades, as próprias entidades).")
+    parser.add_argument("--num_cidades", type=int, default=500, help="Linhas da dimensão de cidades de --dimensoes.")
+    parser.add_argument("--num_hospedes", type=int, default=10_000,
+                        help="Linhas da dimensão de hóspedes de --dimensoes (chaves repetidas são hóspedes que "
+                             "retornam).")
+    parser.add_argument("--zipf", type=float, default=None,
+                        help="Expoente s da distribuição de Zipf das chaves de --dimensoes (a chave k aparece com "
+                             "peso 1 / k^s); sem ele, as chaves são uniformes.")
+    parser.add_argument("--semente_dimensoes", type=int, default=None,
+                        help="Semente própria das tabelas de --dimensoes: gerações com sementes diferentes "
+                             "compartilham as mesmas tabelas (padrão: as tabelas usam a semente dos fatos).")
+    parser.add_argument("--omitir_tabelas_dimensao", action="store_true",
+                        help="Com --dimensoes, grava apenas os fatos (as tabelas são gravadas por outra geração "
+                             "com a mesma --semente_dimensoes, como nos pedaços de --fator_escala).")
+    parser.add_argument("--primeiro_id", type=int, default=1,
+                        help="registro_id da primeira linha do modo original com --motor lote (pedaços de uma "
+                             "geração maior numeram os registros sem repetição).")
+    parser.add_argument("--fator_escala", "--scale-factor", type=float, default=None, metavar="SF",
+                        help="Fator de escala (SF1 = 1 milhão de linhas, SF100 = 100 milhões): define registros, "
+                             "dimensões, período e hotéis e gera pedaços em paralelo no diretório "
+                             "<arquivo_saida sem extensão> (escala.py).")
+    parser.add_argument("--trabalhadores", type=int, default=None,
+                        help="Processos da geração de --fator_escala (padrão: número de CPUs).")
+    parser.add_argument("--tamanho_pool_faker", type=int, default=0,
+                        help="Quantidade de valores pré-gerados por método do Faker (0 = usa o Faker diretamente).")
     
     # Parâmetros específicos para o modo hotel único:
     parser.add_argument("--modo_hotel_unico", action="store_true",
@@ -115,9 +238,95 @@ def main():
                         help="Total de quartos do hotel (modo hotel único).")
     parser.add_argument("--max_clientes_por_dia", type=int, default=5,
                         help="Máximo de clientes que podem chegar por dia (modo hotel único).")
-    
-    args = parser.parse_args()
-    fake = Faker("pt_BR")
+    parser.add_argument("--demanda", choices=("uniforme",) + MODELOS_DEMANDA, default="uniforme",
+                        help="Modelo de chegadas diárias (modo hotel único): 'uniforme' (entre 1 e "
+                             "--max_clientes_por_dia), 'poisson' ou 'binomial_negativa', com curvas de dia da "
+                             "semana, mês e feriados.")
+    parser.add_argument("--media_chegadas_dia", type=float, default=None,
+                        help="Chegadas esperadas em um dia neutro (padrão: calculada pela --ocupacao_alvo).")
+    parser.add_argument("--ocupacao_alvo", type=float, default=0.75,
+                        help="Ocupação média desejada (0 a 1), usada quando --media_chegadas_dia não é informada.")
+    parser.add_argument("--dispersao_demanda", type=float, default=5.0,
+                        help="Parâmetro de dispersão k da binomial negativa (menor = mais dispersa).")
+    parser.add_argument("--feriados", nargs="*", default=[],
+                        help="Datas adicionais de feriado (YYYY-MM-DD), além dos feriados nacionais (demanda do "
+                             "hotel e --dias_uteis).")
+    parser.add_argument("--layout_hotel", choices=["desnormalizado", "normalizado"], default="desnormalizado",
+                        help="Layout do modo hotel único: 'desnormalizado' (métricas do dia repetidas em cada "
+                             "hóspede) ou 'normalizado' (tabela de hóspedes + tabela de KPIs com uma linha por dia).")
+    parser.add_argument("--arquivo_kpis_diarios", type=str, default=None,
+                        help="Arquivo CSV dos KPIs diários no layout normalizado "
+                             "(padrão: <arquivo_saida>_kpis_diarios.csv).")
+    parser.add_argument("--rollups", action="store_true",
+                        help="Grava também os KPIs por semana, mês e ano do modo hotel único "
+                             "(<arquivo_saida>_rollup_<periodo>.csv), calculados a partir de somas aditivas.")
+    parser.add_argument("--estado_rollups", type=str, default=None,
+                        help="Arquivo JSON com o estado dos rollups: se existir, os novos dias são somados aos "
+                             "períodos já acumulados (as datas devem ser posteriores, senão a execução é recusada "
+                             "antes da geração); o estado é regravado ao final.")
+    return parser
+
+def criar_modelo_demanda(args):
+    """
+    Cria o modelo de demanda do modo hotel único a partir dos argumentos (None = chegadas uniformes).
+    """
+    if args.demanda == "uniforme":
+        return None
+    return ModeloDemanda(args.demanda, media=args.media_chegadas_dia, dispersao=args.dispersao_demanda,
+                         ocupacao_alvo=args.ocupacao_alvo, feriados=args.feriados)
+
+def calendario_datas(args):
+    """
+    Cria o amostrador de datas do modo original (nucleo.Datas) a partir dos argumentos. Retorna None sem
+    --pesos_dia_semana, --pesos_mes e --dias_uteis (datas uniformes, como em `gerar_data_aleatoria`).
+    """
+    if args.pesos_dia_semana is None and args.pesos_mes is None and not args.dias_uteis:
+        return None
+    feriados = ()
+    if args.dias_uteis:
+        anos = range(args.data_inicio.year, args.data_fim.year + 1)
+        feriados = np.concatenate((feriados_nacionais(anos), np.array(args.feriados, dtype="datetime64[D]")))
+    return Datas(args.data_inicio, args.data_fim, args.pesos_dia_semana, args.pesos_mes, args.dias_uteis, feriados)
+
+def criar_dimensoes(args):
+    """
+    Cria o objeto Dimensoes de --dimensoes (None sem a opção).
+    """
+    if not args.dimensoes:
+        return None
+    return Dimensoes(args.num_empresas, args.num_cidades, args.num_hospedes, args.zipf, args.semente_dimensoes)
+
+def arquivo_dimensao(args, dimensao):
+    """
+    Retorna o nome do arquivo CSV de uma tabela de dimensão (--dimensoes).
+    """
+    return f"{os.path.splitext(args.arquivo_saida)[0]}_dim_{dimensao}.csv"
+
+def gerar_dataset(args, fake, acumulador=None, dimensoes=None):
+    """
+    Gera o dataset conforme os argumentos (já processados por `construir_parser`).
+    - acumulador: AcumuladorPeriodos (opcional) que recebe os componentes de cada dia no modo hotel único.
+    - dimensoes: Dimensoes (opcional) que recebe as tabelas de dimensão de --dimensoes (padrão: criado a partir
+      dos argumentos).
+    Retorna uma tupla (cabecalho, dados), onde dados é uma lista de listas ou, com --motor lote, um dicionário
+    {coluna: array} (aceito pelas funções de saída de util.py).
+    """
+    if args.motor == "lote":
+        rng = np.random.default_rng(args.semente)
+        pool = fake if isinstance(fake, PoolFaker) else None
+        if dimensoes is None:
+            dimensoes = criar_dimensoes(args)
+        if args.modo_hotel_unico:
+            colunas = gerar_colunas_hotel(args.nome_hotel, args.total_quartos, args.data_inicio, args.data_fim,
+                                          args.max_clientes_por_dia, rng=rng, pool=pool,
+                                          demanda=criar_modelo_demanda(args), acumulador=acumulador,
+                                          dimensoes=dimensoes)
+            return list(colunas), colunas
+        colunas = gerar_colunas_original(args.registros, args.segmentos, args.data_inicio, args.data_fim,
+                                         args.outliers, rng=rng, pool=pool, correlacionar=args.correlacionar,
+                                         entidades=args.entidades, calendario=calendario_datas(args),
+                                         dimensoes=dimensoes, primeiro_id=args.primeiro_id)
+        return list(colunas), colunas
 
     if args.modo_hotel_unico:
         # Modo Hotel Único: gera dados detalhados para um único hotel, com as métricas diárias agregadas.
@@ -127,65 +336,346 @@ def main():
             total_quartos=args.total_quartos,
             data_inicio=args.data_inicio,
             data_fim=args.data_fim,
-            max_clientes_por_dia=args.max_clientes_por_dia
+            max_clientes_por_dia=args.max_clientes_por_dia,
+            demanda=criar_modelo_demanda(args),
+            acumulador=acumulador
+        )
+        return CABECALHO_HOTEL, dados
+
+    # Modo Original: gera dados agregados para diversos segmentos.
+    dados = []
+    dados_anteriores = None
+    calendario = calendario_datas(args)
+    for i in range(1, args.registros + 1):
+        if calendario is not None:
+            data_registro = calendario.sortear()
+        else:
+            data_registro = gerar_data_aleatoria(args.data_inicio, args.data_fim)
+        segmento = random.choice(args.segmentos)
+        linha = gerar_dados_empresa(fake, segmento, data_registro, dados_anteriores)
+        gerar_dados_com_outliers(linha, args.outliers)
+        dados.append([i] + linha)
+        dados_anteriores = linha
+
+    dados.sort(key=lambda x: x[1])
+    return CABECALHO_ORIGINAL, dados
+
+def arquivo_kpis_diarios(args):
+    """
+    Retorna o nome do arquivo da tabela de KPIs diários (layout normalizado do modo hotel único).
+    """
+    if args.arquivo_kpis_diarios:
+        return args.arquivo_kpis_diarios
+    return f"{os.path.splitext(args.arquivo_saida)[0]}_kpis_diarios.csv"
+
+def arquivo_estatisticas(args):
+    """
+    Retorna o nome do arquivo JSON de estatísticas (--estatisticas).
+    """
+    if args.arquivo_estatisticas:
+        return args.arquivo_estatisticas
+    return f"{os.path.splitext(args.arquivo_saida)[0]}_estatisticas.json"
+
+def acumulador_estatisticas(args, cabecalho):
+    """
+    Cria o AcumuladorEstatisticas do arquivo principal (None sem --estatisticas).
+    """
+    if not args.estatisticas:
+        return None
+    tipos = TIPOS_COLUNAS_HOTEL if args.modo_hotel_unico else TIPOS_COLUNAS_ORIGINAL
+    return AcumuladorEstatisticas(cabecalho, {**tipos, **TIPOS_COLUNAS_CHAVE}, rng=np.random.default_rng(args.semente))
+
+def arquivo_rollup(args, granularidade):
+    """
+    Retorna o nome do arquivo CSV dos KPIs de uma granularidade de --rollups.
+    """
+    return f"{os.path.splitext(args.arquivo_saida)[0]}_rollup_{granularidade}.csv"
+
+def arquivos_saida(args):
+    """
+    Retorna os caminhos (arquivos e diretórios) gravados por uma geração com estes argumentos: o arquivo
+    principal ou o diretório das partições e os arquivos derivados (KPIs diários, rollups e o seu estado,
+    estatísticas, dimensões e colunas mmap). Usado para impedir que trabalhos em paralelo gravem no mesmo lugar.
+    """
+    caminhos = [diretorio_particoes(args) if args.particionar is not None else args.arquivo_saida]
+    if args.armazenamento == "mmap":
+        caminhos.append(args.diretorio_mmap)
+    if args.estatisticas:
+        caminhos.append(arquivo_estatisticas(args))
+    if args.dimensoes and not args.omitir_tabelas_dimensao:
+        dimensoes = ("hospedes",) if args.modo_hotel_unico else ("empresas", "cidades")
+        caminhos.extend(arquivo_dimensao(args, dimensao) for dimensao in dimensoes)
+    if args.modo_hotel_unico and args.layout_hotel == "normalizado":
+        caminhos.append(arquivo_kpis_diarios(args))
+    if args.modo_hotel_unico and args.rollups:
+        caminhos.extend(arquivo_rollup(args, granularidade) for granularidade in GRANULARIDADES)
+        if args.estado_rollups:
+            caminhos.append(args.estado_rollups)
+    return caminhos
+
+def diretorio_particoes(args):
+    """
+    Retorna a raiz das partições de --particionar.
+    """
+    return args.diretorio_particoes or os.path.splitext(args.arquivo_saida)[0]
+
+def escritor_particionado(args, cabecalho):
+    """
+    Cria o EscritorParticionado de --particionar (usado na exportação do armazenamento colunar).
+    """
+    diretorio = diretorio_particoes(args)
+    os.makedirs(diretorio, exist_ok=True)
+    return EscritorParticionado(diretorio, cabecalho, args.particionar or COLUNAS_PARTICAO_PADRAO,
+                                args.max_arquivos_abertos, manifesto=args.manifesto_particoes)
+
+def gerar_dataset_normalizado(args, fake, acumulador=None, dimensoes=None):
+    """
+    Gera o modo hotel único no layout normalizado (dimensoes como em `gerar_dataset`).
+    Retorna ((cabecalho_hospedes, hospedes), (cabecalho_kpis, kpis_diarios)).
+    """
+    if args.motor == "lote":
+        hospedes, kpis_diarios = gerar_tabelas_hotel(
+            args.nome_hotel, args.total_quartos, args.data_inicio, args.data_fim, args.max_clientes_por_dia,
+            rng=np.random.default_rng(args.semente), pool=fake if isinstance(fake, PoolFaker) else None,
+            demanda=criar_modelo_demanda(args), acumulador=acumulador,
+            dimensoes=dimensoes if dimensoes is not None else criar_dimensoes(args)
         )
-        cabecalho = [
-            "id_registro", "data", "ano", "mes", "dia",
-            "nome_hotel", "total_quartos", "ocupacao_diaria",
-            "nome_cliente", "tipo_de_quarto", "forma_de_pagamento",
-            "quantidade_quartos", "quantidade_diarias", "valor_diaria",
-            "valor_total_diarias", "valor_outros_consumos", "total_pago",
-            "despesa_fixa", "despesa_variavel", "despesa_mao_obra_direta",
-            "despesa_financeira", "despesa_administrativa",
-            "quartos_ocupados_dia", "receita_quartos_dia", "receita_total_dia",
-            "custo_total_dia", "lucro_operacional_bruto_dia", "adr_dia",
-            "revpar_dia", "trevpar_dia", "goppar_dia"
-        ]
-        criar_arquivo_csv(args.arquivo_saida, cabecalho, dados)
-        print(f"Arquivo '{args.arquivo_saida}' criado no modo hotel único com {len(dados)} registros.")
+        return (list(hospedes), hospedes), (CABECALHO_HOTEL_KPIS_DIARIOS, kpis_diarios)
+    hospedes, kpis_diarios = gerar_dados_hotel_unico(
+        fake=fake,
+        nome_hotel=args.nome_hotel,
+        total_quartos=args.total_quartos,
+        data_inicio=args.data_inicio,
+        data_fim=args.data_fim,
+        max_clientes_por_dia=args.max_clientes_por_dia,
+        demanda=criar_modelo_demanda(args),
+        normalizado=True,
+        acumulador=acumulador
+    )
+    return (CABECALHO_HOTEL_HOSPEDES, hospedes), (CABECALHO_HOTEL_KPIS_DIARIOS, kpis_diarios)
+
+def salvar_dataset(args, fake):
+    """
+    Gera o dataset conforme os argumentos e grava o(s) arquivo(s) CSV de saída.
+    No layout normalizado do modo hotel único, grava também a tabela de KPIs diários.
+    Com --rollups (modo hotel único), grava também as tabelas de KPIs por semana, mês e ano.
+    Com --particionar, o arquivo principal é gravado em diretórios particionados.
+    Com --estatisticas, grava também o JSON de estatísticas por coluna do arquivo principal.
+    Com --dimensoes, grava também as tabelas de dimensão (exceto com --omitir_tabelas_dimensao).
+    Retorna a quantidade de linhas do arquivo principal.
+    """
+    acumulador = None
+    if args.modo_hotel_unico and args.rollups:
+        if args.estado_rollups and os.path.exists(args.estado_rollups):
+            acumulador = AcumuladorPeriodos.carregar(args.estado_rollups)
+        else:
+            acumulador = AcumuladorPeriodos()
+
+    dimensoes = criar_dimensoes(args)
+    if args.modo_hotel_unico and args.layout_hotel == "normalizado":
+        (cabecalho, dados), (cabecalho_kpis, kpis_diarios) = gerar_dataset_normalizado(args, fake, acumulador,
+                                                                                       dimensoes)
+        criar_arquivo_csv(arquivo_kpis_diarios(args), cabecalho_kpis, kpis_diarios)
+    else:
+        cabecalho, dados = gerar_dataset(args, fake, acumulador, dimensoes)
+    if dimensoes is not None and not args.omitir_tabelas_dimensao:
+        for dimensao, tabela in dimensoes.tabelas.items():
+            criar_arquivo_csv(arquivo_dimensao(args, dimensao), list(tabela), tabela)
+    # As estatísticas recebem cada bloco no momento em que ele é gravado
+    estatisticas = acumulador_estatisticas(args, cabecalho)
+    if args.particionar is not None:
+        criar_particoes_csv(diretorio_particoes(args), cabecalho, dados, args.particionar or COLUNAS_PARTICAO_PADRAO,
+                            args.max_arquivos_abertos, args.manifesto_particoes, estatisticas)
     else:
-        # Modo Original: gera dados agregados para diversos segmentos.
-        dados = []
-        cabecalho = [
-            "registro_id", "data", "ano", "mes", "dia", "segmento", "empresa", "cidade",
-            "numero_clientes", "ticket_medio", "receita", "custo", "lucro",
-            "indice_satisfacao", "taxa_ocupacao", "taxa_crescimento",
-            "custo_marketing", "investimento_publicidade",
-            "previsao_vendas", "previsao_custos",
-            "sensibilidade_negocios", "indice_correcao", "programacao_linear",
-            "regiao", "estado", "pais", "tipo_cliente", "canal_venda",
-            "categoria_produto", "tipo_servico", "plano", "faixa_etaria",
-            "genero", "fonte_trafego", "dispositivo", "sistema_operacional",
-            "navegador", "quantidade_produtos", "custo_por_cliente",
-            "receita_por_cliente", "lucro_por_cliente", "desconto_medio",
-            "percentual_desconto", "taxa_conversao", "vendas_por_vendedor",
-            "comissao_vendas", "valor_impostos", "frete_medio",
-            "pedidos_por_cliente", "LTV", "CAC", "MRR", "ARR",
-            "receita_media_diaria", "custo_por_clique", "custo_por_mil_impressoes",
-            "taxa_de_clique", "impressoes", "cliques", "leads_gerados",
-            "custo_por_lead", "ROAS", "avaliacao_media", "numero_avaliacoes",
-            "NPS", "CSAT", "reclamacoes", "tempo_medio_resposta",
-            "tempo_medio_entrega", "taxa_devolucao", "nivel_estoque",
-            "giro_estoque", "custo_estoque", "numero_fornecedores",
-            "taxa_de_defeito", "usuarios_ativos", "tempo_medio_sessao",
-            "taxa_retencao", "churn_rate", "funcionalidade_mais_usada",
-            "numero_sessoes", "RevPAR", "taxa_evasao",
-            "tempo_medio_atendimento", "despesa_administrativa",
-            "despesa_com_pessoal", "despesa_fixa", "despesa_variavel",
-            "despesa_tributaria", "despesa_financeira"
-        ]
-        dados_anteriores = None
-        for i in range(1, args.registros + 1):
+        criar_arquivo_csv(args.arquivo_saida, cabecalho, dados, estatisticas)
+    if estatisticas is not None:
+        estatisticas.salvar(arquivo_estatisticas(args))
+
+    if acumulador is not None:
+        for granularidade in GRANULARIDADES:
+            tabela = acumulador.tabela(granularidade)
+            criar_arquivo_csv(arquivo_rollup(args, granularidade), list(tabela), tabela)
+        if args.estado_rollups:
+            acumulador.salvar(args.estado_rollups)
+    return quantidade_linhas(dados)
+
+def gerar_dataset_colunar(args, fake):
+    """
+    Gera o dataset do modo original em um armazenamento colunar (armazenamento.py): colunas tipadas na memória
+    (--armazenamento colunar) ou em arquivos mapeados em memória (--armazenamento mmap).
+    As linhas são geradas como em `gerar_dataset` (inclusive os outliers de cada linha, que seguem para a
+    autocorrelação da linha seguinte) e gravadas em blocos; em seguida, a ordem por data é calculada diretamente
+    sobre as colunas. Com a mesma semente, o CSV é idêntico ao de --armazenamento memoria.
+    Retorna o ArmazenamentoColunar.
+    """
+    diretorio = args.diretorio_mmap if args.armazenamento == "mmap" else None
+    armazenamento = ArmazenamentoColunar(diretorio, CABECALHO_ORIGINAL, TIPOS_COLUNAS_ORIGINAL, args.registros)
+    bloco = []
+    dados_anteriores = None
+    calendario = calendario_datas(args)
+    for i in range(1, args.registros + 1):
+        if calendario is not None:
+            data_registro = calendario.sortear()
+        else:
             data_registro = gerar_data_aleatoria(args.data_inicio, args.data_fim)
-            segmento = random.choice(args.segmentos)
-            linha = gerar_dados_empresa(fake, segmento, data_registro, dados_anteriores)
-            gerar_dados_com_outliers(linha, args.outliers)
-            dados.append([i] + linha)
-            dados_anteriores = linha
-
-        dados.sort(key=lambda x: x[1])
-        criar_arquivo_csv(args.arquivo_saida, cabecalho, dados)
-        print(f"Arquivo '{args.arquivo_saida}' criado no modo original com {args.registros} registros.")
+        segmento = random.choice(args.segmentos)
+        linha = gerar_dados_empresa(fake, segmento, data_registro, dados_anteriores)
+        gerar_dados_com_outliers(linha, args.outliers)
+        bloco.append([i] + linha)
+        dados_anteriores = linha
+        if len(bloco) == TAMANHO_BLOCO_ANEXAR:
+            armazenamento.anexar(bloco)
+            bloco = []
+    armazenamento.anexar(bloco)
+
+    armazenamento.ordenar("data")
+    if diretorio is not None:
+        armazenamento.salvar_metadados()
+    return armazenamento
+
+def executar_fator_escala(parser, args, segmentos):
+    """
+    Gera o dataset de --fator_escala em paralelo (escala.py), no diretório <arquivo_saida sem extensão>, com as
+    demais opções informadas valendo para todos os pedaços, e imprime a vazão medida e a vazão alvo.
+    - segmentos: valores de --segmentos como informados (com "Nome=Base"), repassados aos pedaços.
+    """
+    # Importado aqui: escala.py usa os processos trabalhadores, que importam este módulo
+    from escala import executar_escala
+
+    opcoes = {nome: valor for nome, valor in vars(args).items()
+              if valor != parser.get_default(nome) and nome not in ("fator_escala", "trabalhadores",
+                                                                    "tamanho_pool_faker", "semente")}
+    if segmentos != parser.get_default("segmentos"):
+        opcoes["segmentos"] = segmentos
+    diretorio = os.path.splitext(args.arquivo_saida)[0]
+    resumo = executar_escala(args.fator_escala, opcoes, diretorio, args.trabalhadores,
+                             args.tamanho_pool_faker or 5000, args.semente)
+    print(f"SF{args.fator_escala:g} ({resumo['modo']}): {resumo['linhas']} linhas em "
+          f"{len(resumo['trabalhos'])} arquivos em '{diretorio}' ({resumo['tempo_total']:.1f}s, "
+          f"{resumo['linhas_por_segundo']:.0f} linhas/s; {resumo['linhas_por_segundo_por_processo']:.0f} linhas/s "
+          f"por processo, alvo {resumo['vazao_alvo_por_nucleo']}).")
+    if resumo["falhas"]:
+        parser.exit(1, f"{resumo['falhas']} trabalhos falharam (ver '{diretorio}/escala.json').\n")
+
+def preparar_argumentos(parser, args):
+    """
+    Aplica o arquivo de `--modelo` (modelo.py) e, em seguida, registra os segmentos "Nome=Base" de `--segmentos`,
+    que passam a conter apenas os nomes; assim, a cópia do perfil da base usa o perfil do arquivo de modelo.
+    Um arquivo ou segmento inválido encerra com `parser.error`. É usada pelo main.py, pela validação e pelos
+    processos trabalhadores, logo depois de `parse_args`.
+    """
+    if args.modelo is not None:
+        try:
+            aplicar_modelo(carregar_modelo(args.modelo))
+        except (OSError, ValueError, RuntimeError) as erro:
+            parser.error(f"--modelo: arquivo de modelo '{args.modelo}' inválido: {erro}")
+    try:
+        args.segmentos = [especificacao_segmento(segmento) for segmento in args.segmentos]
+    except ValueError as erro:
+        parser.error(f"--segmentos: {erro}")
+
+def validar_argumentos(parser, args):
+    """
+    Verifica as combinações de opções que o argparse não valida sozinho, chamando `parser.error` (que encerra
+    com a mensagem de uso) na primeira combinação inválida. É usada pelo main.py e pelos processos
+    trabalhadores (servidor e executor de lotes), que convertem o erro em ValueError.
+    """
+    if args.fator_escala is not None:
+        if args.fator_escala <= 0:
+            parser.error("--fator_escala deve ser maior que zero.")
+        if (args.particionar is not None or args.entidades is not None or args.armazenamento != "memoria"
+                or args.estado_rollups or args.arquivo_kpis_diarios or args.arquivo_estatisticas):
+            parser.error("--fator_escala grava um arquivo por pedaço com o motor em lote e não aceita --particionar, "
+                         "--entidades, --armazenamento, --estado_rollups, --arquivo_kpis_diarios e "
+                         "--arquivo_estatisticas.")
+        return  # os pedaços usam o motor em lote e são validados um a um pelos processos trabalhadores
+    if args.armazenamento != "memoria" and args.modo_hotel_unico:
+        parser.error(f"--armazenamento {args.armazenamento} está disponível apenas no modo original.")
+    if args.armazenamento != "memoria" and args.motor == "lote":
+        parser.error(f"--armazenamento {args.armazenamento} está disponível apenas com --motor escalar.")
+    if args.entidades is not None and (args.motor != "lote" or args.modo_hotel_unico):
+        parser.error("--entidades está disponível apenas no modo original com --motor lote.")
+    if args.primeiro_id != 1 and (args.motor != "lote" or args.modo_hotel_unico):
+        parser.error("--primeiro_id está disponível apenas no modo original com --motor lote.")
+    if args.particionar is not None and args.modo_hotel_unico:
+        parser.error("--particionar está disponível apenas no modo original.")
+    if args.particionar is not None:
+        # Partições de uma execução anterior que não recebessem linhas ficariam misturadas ao novo dataset
+        diretorio = diretorio_particoes(args)
+        if os.path.isdir(diretorio) and os.listdir(diretorio):
+            parser.error(f"--particionar: o diretório '{diretorio}' não está vazio; remova-o ou use outro "
+                         "--diretorio_particoes.")
+    if args.max_arquivos_abertos < 1:
+        parser.error("--max_arquivos_abertos deve ser pelo menos 1.")
+    if args.layout_hotel == "normalizado" and not args.modo_hotel_unico:
+        parser.error("--layout_hotel normalizado está disponível apenas no modo hotel único.")
+    if args.dimensoes and args.motor != "lote":
+        parser.error("--dimensoes está disponível apenas com --motor lote.")
+    if args.correlacionar and args.motor != "lote":
+        parser.error("--correlacionar está disponível apenas com --motor lote.")
+    if args.modo_hotel_unico and (args.pesos_dia_semana or args.pesos_mes or args.dias_uteis):
+        parser.error("--pesos_dia_semana, --pesos_mes e --dias_uteis estão disponíveis apenas no modo original.")
+    try:
+        # Pesos negativos, todos nulos ou um período sem dias úteis deixam o amostrador de datas sem datas
+        calendario_datas(args)
+    except ValueError as erro:
+        parser.error(str(erro))
+    if args.modo_hotel_unico and args.rollups and args.estado_rollups and os.path.exists(args.estado_rollups):
+        # Os rollups só aceitam dias posteriores aos já acumulados: a sobreposição é recusada antes da geração
+        try:
+            ultimo_dia = AcumuladorPeriodos.carregar(args.estado_rollups).ultimo_dia
+        except (OSError, ValueError, KeyError) as erro:
+            parser.error(f"--estado_rollups: arquivo '{args.estado_rollups}' inválido: {erro}")
+        if ultimo_dia is not None and dia_numpy(args.data_inicio) <= ultimo_dia:
+            parser.error(f"--estado_rollups: os dias acumulados vão até {ultimo_dia}; use uma --data_inicio "
+                         f"posterior (recebido {args.data_inicio:%Y-%m-%d}).")
+
+def main():
+    parser = construir_parser()
+    args = parser.parse_args()
+    especificacoes = args.segmentos  # os pedaços de --fator_escala registram os segmentos "Nome=Base" de novo
+    preparar_argumentos(parser, args)
+    if args.exportar_modelo:
+        salvar_modelo(args.exportar_modelo)
+        print(f"Modelo gravado em '{args.exportar_modelo}'.")
+        return
+    validar_argumentos(parser, args)
+    if args.fator_escala is not None:
+        executar_fator_escala(parser, args, especificacoes)
+        return
+    fake = Faker("pt_BR")
+    if args.tamanho_pool_faker > 0:
+        fake = PoolFaker(fake, args.tamanho_pool_faker)
+    definir_semente(args.semente, fake)
+
+    if args.armazenamento != "memoria":
+        armazenamento = gerar_dataset_colunar(args, fake)
+        estatisticas = acumulador_estatisticas(args, CABECALHO_ORIGINAL)
+        if args.particionar is not None:
+            armazenamento.exportar_particionado(escritor_particionado(args, CABECALHO_ORIGINAL),
+                                                estatisticas=estatisticas)
+            destino = f"Partições em '{diretorio_particoes(args)}' criadas"
+        else:
+            armazenamento.exportar_csv(args.arquivo_saida, estatisticas=estatisticas)
+            destino = f"Arquivo '{args.arquivo_saida}' criado"
+        if estatisticas is not None:
+            estatisticas.salvar(arquivo_estatisticas(args))
+        if args.armazenamento == "mmap":
+            local = f"colunas em '{args.diretorio_mmap}'"
+        else:
+            local = f"colunas tipadas: {armazenamento.memoria_utilizada() / 2**20:.1f} MB"
+        print(f"{destino} no modo original com {armazenamento.tamanho} registros ({local}).")
+        return
+
+    registros = salvar_dataset(args, fake)
+    if args.modo_hotel_unico:
+        print(f"Arquivo '{args.arquivo_saida}' criado no modo hotel único com {registros} registros.")
+        if args.layout_hotel == "normalizado":
+            print(f"Arquivo '{arquivo_kpis_diarios(args)}' criado com os KPIs diários do hotel.")
+    elif args.particionar is not None:
+        print(f"Partições em '{diretorio_particoes(args)}' criadas no modo original com {registros} registros.")
+    else:
+        print(f"Arquivo '{args.arquivo_saida}' criado no modo original com {registros} registros.")
 
 if __name__ == "__main__":
     main()
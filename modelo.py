@@ -0,0 +1,259 @@
+# modelo.py
+
+"""
+modelo.py
+
+Descrição:
+-----------
+Este módulo lê e grava o arquivo de modelo (JSON ou YAML) com os parâmetros das distribuições dos geradores. Os
+parâmetros ficavam como literais no código (`lognormal(mean=4.6, sigma=0.8)`, `uniform(0.6, 0.95)`,
+`normal(7.5, 1.5)`, ...), e ajustar um dataset para outro cliente exigia editar geradores.py.
+
+Na inicialização (`--modelo arquivo.json`), o arquivo é compilado em amostradores do núcleo de geração
+(nucleo.py), que substituem os padrões do código:
+- "empresa": distribuições gerais do modo original (DISTRIBUICOES_EMPRESA, geradores.py);
+- "segmentos": perfis do registro de segmentos (segmentos.py), com métricas, categorias e um segmento "base"
+  opcional;
+- "despesas_diarias_hotel": despesas diárias do modo hotel único (DESPESAS_DIARIAS_HOTEL, geradores_hotel.py);
+- "correlacoes": blocos de métricas correlacionadas de `--correlacionar` (correlacao.py), cada um com a lista de
+  "metricas" (de "empresa") e a matriz de "correlacao"; um bloco com valor null é removido;
+- "autocorrelacao": regras AR(1) das métricas (AUTOCORRELACAO_EMPRESA, geradores.py), com os campos de
+  autorregressivo.PassoAR: {"ruido": "normal", "escala": 2.0, "coeficiente": 0.9, "media": 75, "minimo": 0, ...};
+- "categorias": pesos das colunas categóricas (PESOS_CATEGORIAS, categorias.py), como {valor: peso}
+  (ex.: {"dispositivo": {"Mobile": 70, "Desktop": 25, "Tablet": 5}}); valores omitidos recebem peso 0, e uma
+  coluna com valor null volta ao sorteio uniforme. Em "tipo_de_quarto", os pesos definem a procura dos hóspedes
+  nos dois motores do modo hotel (padrão: a proporção de quartos de cada tipo, tarifas.py); o inventário de
+  cada tipo não muda.
+
+Cada distribuição é um objeto com a chave "distribuicao" e os parâmetros do amostrador correspondente:
+
+   {"distribuicao": "lognormal", "media": 4.6, "sigma": 0.8, "inteiro": true}
+   {"distribuicao": "uniforme", "minimo": 0.6, "maximo": 0.95, "casas": null}
+   {"distribuicao": "normal", "media": 7.5, "desvio": 1.5, "minimo": 1.0, "maximo": 10.0}
+   {"distribuicao": "inteiro", "minimo": 1, "maximo": 50}
+   {"distribuicao": "constante", "valor": 10}
+
+Funcionalidades:
+-----------------
+- DISTRIBUICOES: nome da distribuição -> classe de amostrador (Uniforme, Inteiro, LogNormal, Normal, Constante).
+- compilar_amostrador(especificacao) / descrever_amostrador(amostrador): conversão entre o objeto do arquivo e o
+  amostrador (compilar_passo / descrever_passo: o mesmo para as regras de autocorrelação).
+- modelo_atual(): o modelo em uso, como dicionário (ponto de partida para um arquivo novo).
+- aplicar_modelo(modelo): compila e aplica um modelo (as seções e entradas ausentes mantêm os valores atuais).
+- carregar_modelo(caminho) / salvar_modelo(caminho, modelo): leitura e gravação (YAML para .yaml/.yml).
+- restaurar_modelo_padrao(): volta aos padrões do código (usado pelos processos trabalhadores entre pedidos).
+
+Uso:
+-----
+   python main.py --exportar_modelo modelo_cliente.json
+   python main.py --modelo modelo_cliente.json --motor lote --registros 1000000
+
+Observações:
+-------------
+- Os amostradores compilados geram colunas inteiras em uma chamada no motor em lote; o arquivo é lido uma única
+  vez, logo depois da leitura dos argumentos (`main.preparar_argumentos`, usada também pelos processos
+  trabalhadores).
+- Os segmentos "Nome=Base" de `--segmentos` são registrados depois de aplicado o modelo: a cópia usa o perfil da
+  base definido no arquivo, qualquer que seja a ordem dos argumentos.
+- O suporte a YAML depende do pacote opcional PyYAML (`pip install pyyaml`).
+"""
+
+import json
+import os
+
+from autorregressivo import PassoAR
+from categorias import DICIONARIOS, PESOS_CATEGORIAS, pesos_categoria
+from correlacao import BLOCOS_CORRELACAO, BlocoCorrelacionado, verificar_blocos
+from geradores import AUTOCORRELACAO_EMPRESA, DISTRIBUICOES_EMPRESA
+from geradores_hotel import DESPESAS_DIARIAS_HOTEL
+from nucleo import Constante, Inteiro, LogNormal, Normal, Uniforme
+from segmentos import REGISTRO_SEGMENTOS, registrar_segmento
+
+try:
+    import yaml
+except ImportError:  # dependência opcional
+    yaml = None
+
+DISTRIBUICOES = {
+    "uniforme": Uniforme,
+    "inteiro": Inteiro,
+    "lognormal": LogNormal,
+    "normal": Normal,
+    "constante": Constante,
+}
+
+SECOES_MODELO = ("empresa", "segmentos", "despesas_diarias_hotel", "correlacoes", "autocorrelacao", "categorias")
+
+
+def compilar_amostrador(especificacao):
+    """
+    Converte um objeto do arquivo de modelo ({"distribuicao": ..., parâmetros}) em amostrador.
+    """
+    parametros = dict(especificacao)
+    nome = parametros.pop("distribuicao", None)
+    if nome not in DISTRIBUICOES:
+        raise ValueError(f"Distribuição '{nome}' inválida em {especificacao}. Use uma de {sorted(DISTRIBUICOES)}.")
+    try:
+        return DISTRIBUICOES[nome](**parametros)
+    except TypeError as erro:
+        raise ValueError(f"Parâmetros inválidos para a distribuição '{nome}': {especificacao} ({erro}).") from None
+
+
+def descrever_amostrador(amostrador):
+    """
+    Converte um amostrador no objeto equivalente do arquivo de modelo.
+    """
+    for nome, classe in DISTRIBUICOES.items():
+        if type(amostrador) is classe:
+            return {"distribuicao": nome, **{campo: getattr(amostrador, campo) for campo in classe.__slots__}}
+    raise ValueError(f"Amostrador sem representação no arquivo de modelo: {amostrador!r}.")
+
+
+def compilar_passo(especificacao):
+    """
+    Converte um objeto da seção "autocorrelacao" em autorregressivo.PassoAR.
+    """
+    try:
+        return PassoAR(**especificacao)
+    except TypeError as erro:
+        raise ValueError(f"Regra de autocorrelação inválida: {especificacao} ({erro}).") from None
+
+
+def descrever_passo(passo):
+    """
+    Converte um PassoAR no objeto equivalente da seção "autocorrelacao".
+    """
+    return {campo: getattr(passo, campo) for campo in PassoAR.__slots__}
+
+
+def _compilar_distribuicoes(secao, especificacoes, permitidas):
+    desconhecidas = set(especificacoes) - set(permitidas)
+    if desconhecidas:
+        raise ValueError(f"Seção '{secao}' do modelo: entradas desconhecidas {sorted(desconhecidas)}.")
+    return {nome: compilar_amostrador(especificacao) for nome, especificacao in especificacoes.items()}
+
+
+def modelo_atual():
+    """
+    Retorna o modelo em uso (padrões do código, mais os modelos já aplicados) como dicionário.
+    """
+    return {
+        "empresa": {nome: descrever_amostrador(a) for nome, a in DISTRIBUICOES_EMPRESA.items()},
+        "segmentos": {
+            nome: {
+                "metricas": {metrica: descrever_amostrador(a) for metrica, a in perfil.metricas.items()},
+                "categorias": sorted(perfil.categorias),
+            }
+            for nome, perfil in REGISTRO_SEGMENTOS.items()
+        },
+        "despesas_diarias_hotel": {nome: descrever_amostrador(a) for nome, a in DESPESAS_DIARIAS_HOTEL.items()},
+        "correlacoes": {
+            nome: {"metricas": list(bloco.metricas), "correlacao": bloco.correlacao.tolist()}
+            for nome, bloco in BLOCOS_CORRELACAO.items()
+        },
+        "autocorrelacao": {nome: descrever_passo(passo) for nome, passo in AUTOCORRELACAO_EMPRESA.items()},
+        "categorias": {nome: dict(zip(DICIONARIOS[nome], pesos)) for nome, pesos in PESOS_CATEGORIAS.items()},
+    }
+
+
+def aplicar_modelo(modelo):
+    """
+    Compila o modelo e substitui as distribuições correspondentes dos geradores.
+    Todo o modelo é validado antes de qualquer substituição; um segmento informado substitui o perfil inteiro
+    (com "base", parte do perfil do segmento base).
+    """
+    desconhecidas = set(modelo) - set(SECOES_MODELO)
+    if desconhecidas:
+        raise ValueError(f"Seções desconhecidas no modelo: {sorted(desconhecidas)}. Use {SECOES_MODELO}.")
+
+    empresa = _compilar_distribuicoes("empresa", modelo.get("empresa", {}), DISTRIBUICOES_EMPRESA)
+    despesas = _compilar_distribuicoes("despesas_diarias_hotel", modelo.get("despesas_diarias_hotel", {}),
+                                       DESPESAS_DIARIAS_HOTEL)
+    segmentos = []
+    for nome, perfil in modelo.get("segmentos", {}).items():
+        metricas = {metrica: compilar_amostrador(e) for metrica, e in perfil.get("metricas", {}).items()}
+        segmentos.append((nome, metricas, perfil.get("categorias", ()), perfil.get("base")))
+    blocos = dict(BLOCOS_CORRELACAO)
+    for nome, bloco in modelo.get("correlacoes", {}).items():
+        if bloco is None:
+            blocos.pop(nome, None)
+            continue
+        desconhecidas = set(bloco.get("metricas", ())) - set(DISTRIBUICOES_EMPRESA)
+        if desconhecidas:
+            raise ValueError(f"Bloco de correlação '{nome}': métricas desconhecidas {sorted(desconhecidas)}.")
+        blocos[nome] = BlocoCorrelacionado(nome, bloco.get("metricas", ()), bloco.get("correlacao", ()))
+    verificar_blocos(blocos.values())
+    autocorrelacao = modelo.get("autocorrelacao", {})
+    desconhecidas = set(autocorrelacao) - set(AUTOCORRELACAO_EMPRESA)
+    if desconhecidas:
+        raise ValueError(f"Seção 'autocorrelacao' do modelo: entradas desconhecidas {sorted(desconhecidas)}.")
+    passos = {nome: compilar_passo(especificacao) for nome, especificacao in autocorrelacao.items()}
+    pesos_categorias = {nome: None if pesos is None else pesos_categoria(nome, pesos)
+                        for nome, pesos in modelo.get("categorias", {}).items()}
+
+    DISTRIBUICOES_EMPRESA.update(empresa)
+    AUTOCORRELACAO_EMPRESA.update(passos)
+    DESPESAS_DIARIAS_HOTEL.update(despesas)
+    for nome, metricas, categorias, base in segmentos:
+        registrar_segmento(nome, metricas, categorias, base)
+    BLOCOS_CORRELACAO.clear()
+    BLOCOS_CORRELACAO.update(blocos)
+    for nome, pesos in pesos_categorias.items():
+        if pesos is None:
+            PESOS_CATEGORIAS.pop(nome, None)
+        else:
+            PESOS_CATEGORIAS[nome] = pesos
+
+
+def _usa_yaml(caminho):
+    if not caminho.lower().endswith((".yaml", ".yml")):
+        return False
+    if yaml is None:
+        raise RuntimeError("Arquivos de modelo YAML requerem o pacote PyYAML: pip install pyyaml")
+    return True
+
+
+def carregar_modelo(caminho):
+    """
+    Lê um arquivo de modelo (JSON, ou YAML para .yaml/.yml).
+    """
+    with open(caminho, encoding="utf-8") as arquivo:
+        if not _usa_yaml(caminho):
+            modelo = json.load(arquivo)
+        else:
+            try:
+                modelo = yaml.safe_load(arquivo)
+            except yaml.YAMLError as erro:
+                raise ValueError(f"YAML inválido em '{caminho}': {erro}") from None
+    if not isinstance(modelo, dict):
+        raise ValueError(f"O arquivo de modelo '{caminho}' deve conter um objeto com as seções {SECOES_MODELO}.")
+    return modelo
+
+
+def salvar_modelo(caminho, modelo=None):
+    """
+    Grava o modelo (padrão: o modelo em uso) em JSON, ou YAML para .yaml/.yml.
+    """
+    modelo = modelo_atual() if modelo is None else modelo
+    diretorio = os.path.dirname(caminho)
+    if diretorio:
+        os.makedirs(diretorio, exist_ok=True)
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        if _usa_yaml(caminho):
+            yaml.safe_dump(modelo, arquivo, allow_unicode=True, sort_keys=False)
+        else:
+            json.dump(modelo, arquivo, ensure_ascii=False, indent=2)
+
+
+# Padrões do código, registrados antes de qualquer arquivo de modelo
+_MODELO_PADRAO = modelo_atual()
+
+
+def restaurar_modelo_padrao():
+    """
+    Descarta os modelos aplicados (e os segmentos registrados depois da importação) e volta aos padrões do código.
+    """
+    REGISTRO_SEGMENTOS.clear()
+    BLOCOS_CORRELACAO.clear()
+    PESOS_CATEGORIAS.clear()
+    aplicar_modelo(_MODELO_PADRAO)
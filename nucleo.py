@@ -0,0 +1,548 @@
+# nucleo.py
+
+"""
+nucleo.py
+
+Descrição:
+-----------
+Este módulo é o núcleo de geração compartilhado pelos dois modos (original e hotel único) e pelos dois motores
+(escalar, linha a linha, e em lote). Antes, o geradores_hotel.py mantinha cópias próprias de
+`gerar_data_aleatoria`, `_safe_randint`, `gerar_dados_com_outliers`, `_gerar_dados_gerais` e de uma versão
+resumida de `gerar_dados_empresa`, com distribuições e índices de colunas diferentes dos de geradores.py, e as
+peças do motor em lote ficavam presas em geradores_lote.py: cada otimização precisava ser feita duas vezes.
+
+Aqui ficam as peças comuns; os módulos de cada modo (geradores.py, geradores_hotel.py e geradores_lote.py) apenas
+descrevem o seu modelo (colunas e distribuições) sobre elas.
+
+Funcionalidades:
+-----------------
+1. Contexto de geração:
+   - ContextoGeracao(rng, pool, pesos_categorias): reúne o numpy.random.Generator, o PoolFaker e os pesos das
+     categorias de uma geração em lote, com atalhos para sortear colunas inteiras (amostradores, categorias,
+     nomes do pool e datas).
+
+2. Amostradores em lote:
+   - Uniforme, Inteiro, LogNormal, Normal e Constante: descrevem a distribuição de uma coluna.
+     * amostrar(rng, n): gera a coluna inteira em uma única chamada (motor em lote).
+     * sortear(rng): gera um único valor Python (motor escalar; padrão: numpy.random global).
+     * transformar(z): converte normais padrão em valores da distribuição (cópula gaussiana, correlacao.py).
+     * fda(x): P(valor <= x) dos valores gerados (já arredondados/truncados), usada nos testes de aderência da
+       validação (validacao.py).
+   - Datas(inicio, fim, pesos_dia_semana, pesos_mes, dias_uteis, feriados): datas sorteadas como posições
+     inteiras de uma dimensão de datas calculada uma vez (com pesos por dia da semana e mês e calendário de dias
+     úteis opcionais), sem criar um datetime por linha.
+
+3. Esquema das colunas:
+   - colunas_de_data(datas): ano, mes e dia a partir de um array datetime64[D].
+   - dia_numpy(data): converte datetime/date/str em numpy.datetime64[D].
+   - dia_semana(datas): dia da semana (0 = segunda, ..., 6 = domingo) de um array datetime64[D].
+   - onde(mascara, valores, padrao) / dividir(numerador, denominador): operações por coluna usadas pelos modelos.
+   - fda_normal(z): função de distribuição acumulada da normal padrão, vetorizada (sem scipy).
+
+4. Etapa de outliers:
+   - aplicar_outlier_linha(...): outlier em uma linha (lista), com a probabilidade informada.
+   - aplicar_outliers_colunar(...): a mesma regra, vetorizada, sobre um dicionário de colunas.
+
+5. Utilidades escalares:
+   - gerar_data_aleatoria(inicio, fim) e randint_seguro(a, b).
+
+Observações:
+-------------
+- Os amostradores aceitam tanto um numpy.random.Generator quanto o próprio módulo numpy.random, de modo que os
+  motores escalares continuam reprodutíveis com `util.definir_semente`.
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import numpy as np
+from faker import Faker
+
+from categorias import PESOS_CATEGORIAS, ColunaCategorica, amostrar_categoria, de_valores
+from pool_faker import PoolFaker
+
+# --------------------------------------------------------------------------------
+# Utilidades escalares
+# --------------------------------------------------------------------------------
+
+def gerar_data_aleatoria(inicio, fim):
+    """
+    Gera uma data aleatória entre 'inicio' e 'fim'.
+    """
+    delta = fim - inicio
+    dias_delta = delta.days
+    return inicio + timedelta(days=random.randint(0, dias_delta))
+
+
+def randint_seguro(a, b):
+    """
+    Versão segura de random.randint, que converte 'a' e 'b' para int,
+    e troca se 'a' ficar maior que 'b'.
+    """
+    a = int(a)
+    b = int(b)
+    if a > b:
+        a, b = b, a
+    return random.randint(a, b)
+
+
+# --------------------------------------------------------------------------------
+# Amostradores em lote
+# --------------------------------------------------------------------------------
+
+def _inteiros(rng, minimo, maximo, n):
+    """
+    Sorteia n inteiros em [minimo, maximo] com um Generator ou com o módulo numpy.random.
+    """
+    if hasattr(rng, "integers"):
+        return rng.integers(minimo, maximo + 1, n)
+    return rng.randint(minimo, maximo + 1, n).astype(np.int64)
+
+
+def _arredondar(valores, casas):
+    return valores if casas is None else np.round(valores, casas)
+
+
+def _pesos(pesos, quantidade, nome):
+    """
+    Valida um vetor de pesos (quantidade fixa, valores não negativos).
+    """
+    pesos = np.asarray(pesos, dtype=np.float64)
+    if pesos.shape != (quantidade,) or np.any(pesos < 0):
+        raise ValueError(f"{nome} deve ter {quantidade} pesos não negativos.")
+    return pesos
+
+
+def _meia_casa(casas):
+    """
+    Metade da última casa decimal: um valor arredondado x vem de um valor original menor que x + _meia_casa.
+    """
+    return 0.0 if casas is None else 0.5 * 10.0 ** -casas
+
+
+def fda_normal(z):
+    """
+    Função de distribuição acumulada da normal padrão, vetorizada (aproximação de Abramowitz e Stegun 7.1.26 para
+    a função erro; erro absoluto < 1.5e-7).
+    """
+    x = np.abs(z) / np.sqrt(2.0)
+    t = 1.0 / (1.0 + 0.3275911 * x)
+    polinomio = t * (0.254829592 + t * (-0.284496736 + t * (1.421413741 + t * (-1.453152027 + t * 1.061405429))))
+    erf = 1.0 - polinomio * np.exp(-x * x)
+    return 0.5 * (1.0 + np.sign(z) * erf)
+
+
+class Amostrador:
+    """
+    Distribuição de uma coluna. As subclasses implementam `amostrar(rng, n)` e `transformar(z)`.
+    """
+
+    __slots__ = ()
+
+    def amostrar(self, rng, n):
+        raise NotImplementedError
+
+    def transformar(self, z):
+        """
+        Converte normais padrão (possivelmente correlacionadas) em valores desta distribuição, preservando a
+        ordem (cópula gaussiana; usado por correlacao.py).
+        """
+        raise NotImplementedError
+
+    def fda(self, x):
+        """
+        Função de distribuição acumulada dos valores gerados (considerando o arredondamento), vetorizada.
+        """
+        raise NotImplementedError
+
+    def sortear(self, rng=np.random):
+        """
+        Gera um único valor (int ou float do Python), para o motor escalar.
+        """
+        return self.amostrar(rng, 1)[0].item()
+
+
+class Uniforme(Amostrador):
+    """
+    Uniforme entre minimo e maximo, arredondada em `casas` casas decimais (None = sem arredondamento).
+    """
+
+    __slots__ = ("minimo", "maximo", "casas")
+
+    def __init__(self, minimo, maximo, casas=2):
+        self.minimo, self.maximo, self.casas = minimo, maximo, casas
+
+    def amostrar(self, rng, n):
+        return _arredondar(rng.uniform(self.minimo, self.maximo, n), self.casas)
+
+    def transformar(self, z):
+        return _arredondar(self.minimo + fda_normal(z) * (self.maximo - self.minimo), self.casas)
+
+    def fda(self, x):
+        x = np.asarray(x, dtype=np.float64) + _meia_casa(self.casas)
+        return np.clip((x - self.minimo) / (self.maximo - self.minimo), 0.0, 1.0)
+
+
+class Inteiro(Amostrador):
+    """
+    Inteiro uniforme entre minimo e maximo (inclusive).
+    """
+
+    __slots__ = ("minimo", "maximo")
+
+    def __init__(self, minimo, maximo):
+        self.minimo, self.maximo = int(min(minimo, maximo)), int(max(minimo, maximo))
+
+    def amostrar(self, rng, n):
+        return _inteiros(rng, self.minimo, self.maximo, n)
+
+    def transformar(self, z):
+        valores = self.minimo + np.floor(fda_normal(z) * (self.maximo - self.minimo + 1)).astype(np.int64)
+        return np.minimum(valores, self.maximo)
+
+    def fda(self, x):
+        x = np.floor(np.asarray(x, dtype=np.float64))
+        return np.clip((x - self.minimo + 1) / (self.maximo - self.minimo + 1), 0.0, 1.0)
+
+
+class LogNormal(Amostrador):
+    """
+    Log-normal (parâmetros da normal subjacente). Com inteiro=True, a parte inteira do valor.
+    """
+
+    __slots__ = ("media", "sigma", "casas", "inteiro")
+
+    def __init__(self, media, sigma, casas=2, inteiro=False):
+        self.media, self.sigma, self.casas, self.inteiro = media, sigma, casas, inteiro
+
+    def amostrar(self, rng, n):
+        return self._finalizar(rng.lognormal(mean=self.media, sigma=self.sigma, size=n))
+
+    def transformar(self, z):
+        return self._finalizar(np.exp(self.media + self.sigma * np.asarray(z)))
+
+    def _finalizar(self, valores):
+        if self.inteiro:
+            return valores.astype(np.int64)
+        return _arredondar(valores, self.casas)
+
+    def fda(self, x):
+        x = np.asarray(x, dtype=np.float64)
+        # inteiro: parte inteira k <= x  <=>  valor < floor(x) + 1
+        limite = np.floor(x) + 1 if self.inteiro else x + _meia_casa(self.casas)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z = (np.log(np.maximum(limite, 0.0)) - self.media) / self.sigma
+        return np.where(limite > 0, fda_normal(z), 0.0)
+
+
+class Normal(Amostrador):
+    """
+    Normal arredondada em `casas` casas e limitada a [minimo, maximo] (limites opcionais).
+    """
+
+    __slots__ = ("media", "desvio", "casas", "minimo", "maximo")
+
+    def __init__(self, media, desvio, casas=1, minimo=None, maximo=None):
+        self.media, self.desvio, self.casas = media, desvio, casas
+        self.minimo, self.maximo = minimo, maximo
+
+    def amostrar(self, rng, n):
+        return self._limitar(_arredondar(rng.normal(self.media, self.desvio, n), self.casas))
+
+    def transformar(self, z):
+        return self._limitar(_arredondar(self.media + self.desvio * np.asarray(z), self.casas))
+
+    def _limitar(self, valores):
+        if self.minimo is not None or self.maximo is not None:
+            valores = np.clip(valores, self.minimo, self.maximo)
+        return valores
+
+    def fda(self, x):
+        x = np.asarray(x, dtype=np.float64)
+        f = fda_normal((x + _meia_casa(self.casas) - self.media) / self.desvio)
+        if self.minimo is not None:
+            f = np.where(x < self.minimo, 0.0, f)
+        if self.maximo is not None:
+            f = np.where(x >= self.maximo, 1.0, f)
+        return f
+
+
+class Constante(Amostrador):
+    """
+    Valor fixo (ex.: métricas já sorteadas em um bloco correlacionado, ou fixadas no arquivo de modelo).
+    """
+
+    __slots__ = ("valor",)
+
+    def __init__(self, valor):
+        self.valor = valor
+
+    def amostrar(self, rng, n):
+        return np.full(n, self.valor)
+
+    def transformar(self, z):
+        return np.full(len(z), self.valor)
+
+    def fda(self, x):
+        return np.where(np.asarray(x) >= self.valor, 1.0, 0.0)
+
+
+class Datas(Amostrador):
+    """
+    Datas (datetime64[D]) entre inicio e fim, inclusive, sorteadas como posições da dimensão `dias`.
+    - pesos_dia_semana: 7 pesos (segunda a domingo), opcional.
+    - pesos_mes: 12 pesos (janeiro a dezembro), opcional.
+    - dias_uteis: mantém na dimensão apenas segunda a sexta, fora dos `feriados`.
+    - feriados: datas excluídas com dias_uteis (datetime64[D], date ou "YYYY-MM-DD").
+    Sem pesos, o sorteio é uma única chamada de `integers`; com pesos, uma única chamada de `random`, localizada na
+    distribuição acumulada da dimensão (busca binária). Dias com peso zero ficam fora da dimensão.
+    """
+
+    __slots__ = ("dias", "acumulada", "_datas_python")
+
+    def __init__(self, inicio, fim, pesos_dia_semana=None, pesos_mes=None, dias_uteis=False, feriados=()):
+        dias = np.arange(dia_numpy(inicio), dia_numpy(fim) + 1)
+        if dias_uteis:
+            dias = dias[np.is_busday(dias, holidays=np.array(list(feriados), dtype="datetime64[D]"))]
+        pesos = np.ones(len(dias))
+        if pesos_dia_semana is not None:
+            pesos = pesos * _pesos(pesos_dia_semana, 7, "pesos_dia_semana")[dia_semana(dias)]
+        if pesos_mes is not None:
+            pesos = pesos * _pesos(pesos_mes, 12, "pesos_mes")[dias.astype("datetime64[M]").astype(np.int64) % 12]
+        positivos = pesos > 0
+        if not positivos.any():
+            raise ValueError("Nenhuma data do período pode ser sorteada (verifique as datas, os pesos e os dias "
+                             "úteis).")
+        self.dias = dias[positivos]
+        uniforme = pesos_dia_semana is None and pesos_mes is None
+        self.acumulada = None if uniforme else np.cumsum(pesos[positivos])
+        self._datas_python = None
+
+    def _posicoes(self, u):
+        """
+        Converte uniformes em [0, 1) em posições da dimensão.
+        """
+        if self.acumulada is None:
+            posicoes = np.floor(u * len(self.dias)).astype(np.int64)
+        else:
+            posicoes = np.searchsorted(self.acumulada, u * self.acumulada[-1], side="right")
+        return np.minimum(posicoes, len(self.dias) - 1)
+
+    def indices(self, rng, n):
+        """
+        Sorteia n posições da dimensão `dias` em uma única chamada.
+        """
+        if self.acumulada is None:
+            return _inteiros(rng, 0, len(self.dias) - 1, n)
+        return self._posicoes(rng.random(n))
+
+    def amostrar(self, rng, n):
+        return self.dias[self.indices(rng, n)]
+
+    def transformar(self, z):
+        return self.dias[self._posicoes(fda_normal(np.asarray(z)))]
+
+    def fda(self, x):
+        contagem = np.searchsorted(self.dias, np.asarray(x, dtype="datetime64[D]"), side="right")
+        acumulada = np.arange(len(self.dias) + 1.0) if self.acumulada is None else np.append(0.0, self.acumulada)
+        return acumulada[contagem] / acumulada[-1]
+
+    def sortear(self, rng=np.random):
+        """
+        Gera uma única data (datetime, como `gerar_data_aleatoria`) para o motor escalar; os datetimes são criados
+        uma vez para toda a dimensão.
+        """
+        if self._datas_python is None:
+            self._datas_python = self.dias.astype("datetime64[us]").tolist()
+        return self._datas_python[int(self.indices(rng, 1)[0])]
+
+
+# --------------------------------------------------------------------------------
+# Contexto de geração
+# --------------------------------------------------------------------------------
+
+_pool_padrao = None
+
+
+def obter_pool(pool=None):
+    """
+    Retorna o pool informado ou o pool padrão do processo (criado na primeira chamada).
+    """
+    global _pool_padrao
+    if pool is not None:
+        return pool
+    if _pool_padrao is None:
+        _pool_padrao = PoolFaker(Faker("pt_BR"))
+    return _pool_padrao
+
+
+class ContextoGeracao:
+    """
+    Estado de uma geração em lote.
+    - rng: numpy.random.Generator (padrão: numpy.random.default_rng()).
+    - pool: PoolFaker para os nomes (padrão: pool do processo).
+    - pesos_categorias: dicionário coluna -> pesos das categorias (opcional; padrão uniforme).
+    """
+
+    def __init__(self, rng=None, pool=None, pesos_categorias=None):
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.pool = obter_pool(pool)
+        self.pesos_categorias = pesos_categorias or {}
+
+    def amostrar(self, amostrador, n):
+        """
+        Gera n valores de um amostrador.
+        """
+        return amostrador.amostrar(self.rng, n)
+
+    def categoria(self, nome, n, dicionario=None, pesos=None):
+        """
+        Sorteia uma coluna categórica; sem `pesos`, usa os pesos configurados para a coluna no contexto ou, para as
+        colunas de DICIONARIOS, em categorias.PESOS_CATEGORIAS (se houver).
+        - dicionario: valores possíveis (padrão: categorias.DICIONARIOS[nome]).
+        """
+        if nome in self.pesos_categorias:
+            pesos = self.pesos_categorias[nome]
+        elif pesos is None and dicionario is None:
+            pesos = PESOS_CATEGORIAS.get(nome)
+        return amostrar_categoria(self.rng, dicionario if dicionario is not None else nome, n, pesos)
+
+    def nomes(self, metodo, n):
+        """
+        Sorteia n valores pré-gerados de um método do PoolFaker (array de objetos).
+        """
+        valores = self.pool.valores(metodo)
+        return np.array(valores, dtype=object)[self.rng.integers(0, len(valores), n)]
+
+    def nomes_categoria(self, metodo, n):
+        """
+        Sorteia n valores pré-gerados de um método do PoolFaker como ColunaCategorica. Usado para métodos com
+        poucos valores distintos (estado_nome, estado_sigla); a distribuição é a mesma do sorteio direto no pool.
+        """
+        base = de_valores(self.pool.valores(metodo))
+        return base[self.rng.integers(0, len(base), n)]
+
+    def datas(self, inicio, fim, n, calendario=None):
+        """
+        Sorteia n datas (datetime64[D]) entre inicio e fim, inclusive, ou do amostrador `calendario` (Datas).
+        """
+        return (calendario if calendario is not None else Datas(inicio, fim)).amostrar(self.rng, n)
+
+
+# --------------------------------------------------------------------------------
+# Esquema das colunas
+# --------------------------------------------------------------------------------
+
+def onde(mascara, valores, padrao):
+    """
+    Mantém os valores onde a máscara é verdadeira e usa o padrão nas demais posições
+    (para colunas categóricas, o padrão é sempre None).
+    """
+    if isinstance(valores, ColunaCategorica):
+        return valores.onde(mascara)
+    if valores.dtype == object:
+        resultado = np.full(len(mascara), padrao, dtype=object)
+        resultado[mascara] = valores[mascara]
+        return resultado
+    return np.where(mascara, valores, padrao)
+
+
+def dividir(numerador, denominador, casas=2):
+    """
+    Divide arredondando, retornando 0.0 quando o denominador não é positivo.
+    """
+    resultado = np.zeros(len(numerador))
+    positivos = denominador > 0
+    resultado[positivos] = numerador[positivos] / denominador[positivos]
+    return np.round(resultado, casas)
+
+
+def colunas_de_data(datas):
+    """
+    Retorna (ano, mes, dia) como arrays de inteiros a partir de um array datetime64[D].
+    """
+    anos = datas.astype("datetime64[Y]")
+    meses = datas.astype("datetime64[M]")
+    ano = anos.astype(np.int64) + 1970
+    mes = meses.astype(np.int64) % 12 + 1
+    dia = (datas - meses).astype(np.int64) + 1
+    return ano, mes, dia
+
+
+def dia_numpy(data):
+    """
+    Converte datetime/date/str (YYYY-MM-DD) em numpy.datetime64[D].
+    """
+    if isinstance(data, datetime):
+        data = data.date()
+    return np.datetime64(data, "D")
+
+
+def dia_semana(datas):
+    """
+    Retorna o dia da semana (0 = segunda, ..., 6 = domingo) de um array datetime64[D], como `date.weekday()`.
+    """
+    return (np.asarray(datas, dtype="datetime64[D]").astype(np.int64) + 3) % 7  # 1970-01-01 foi uma quinta-feira
+
+
+# --------------------------------------------------------------------------------
+# Etapa de outliers
+# --------------------------------------------------------------------------------
+
+def aplicar_outlier_linha(dados, candidatas, minimo_1=(), de_0_a_100=(), probabilidade_outlier=0.01):
+    """
+    Com a probabilidade informada, multiplica uma posição de `candidatas` da linha por um fator entre 0.5 e 2.0.
+    Posições de `minimo_1` ficam com valor mínimo 1 e as de `de_0_a_100` entre 0 e 100.
+    Valores não numéricos (None, textos) não são alterados; valores inteiros continuam inteiros (arredondados),
+    como em `aplicar_outliers_colunar`.
+    """
+    if random.random() < probabilidade_outlier:
+        indice_outlier = random.choice(candidatas)
+        fator_outlier = np.random.uniform(0.5, 2.0)
+
+        valor = dados[indice_outlier]
+        if isinstance(valor, (int, float)):
+            valor_modificado = round(valor * fator_outlier, 2)
+
+            # Ajustes para manter valores mínimos
+            if indice_outlier in minimo_1:
+                valor_modificado = max(1.0, valor_modificado)
+            elif indice_outlier in de_0_a_100:
+                valor_modificado = max(0.0, min(valor_modificado, 100.0))
+            dados[indice_outlier] = round(valor_modificado) if isinstance(valor, int) else valor_modificado
+
+    return dados
+
+
+def aplicar_outliers_colunar(colunas, tipos, candidatas, minimo_1=(), de_0_a_100=(), probabilidade_outlier=0.01,
+                             rng=np.random, inicio=0, fim=None):
+    """
+    Versão vetorizada de `aplicar_outlier_linha`, aplicada a colunas NumPy (dicionário nome -> array).
+    Cada linha do intervalo [inicio, fim) é sorteada com a probabilidade informada e, para as sorteadas,
+    uma coluna de `candidatas` (nomes) é multiplicada por um fator entre 0.5 e 2.0 e ajustada aos limites.
+    - tipos: dicionário nome -> tipo lógico; colunas que não são "inteiro" nem "decimal" são ignoradas.
+    - rng: numpy.random.Generator ou o próprio módulo numpy.random.
+    Colunas inteiras são arredondadas para o inteiro mais próximo.
+    """
+    if fim is None:
+        fim = len(colunas[next(iter(colunas))])
+    sorteadas = np.flatnonzero(rng.random(fim - inicio) < probabilidade_outlier)
+    if len(sorteadas) == 0:
+        return colunas
+    candidatas = np.array(candidatas, dtype=object)
+    colunas_sorteadas = rng.choice(len(candidatas), size=len(sorteadas))
+    fatores = rng.uniform(0.5, 2.0, size=len(sorteadas))
+    for posicao in np.unique(colunas_sorteadas):
+        nome = candidatas[posicao]
+        if tipos[nome] not in ("inteiro", "decimal"):
+            continue
+        selecao = colunas_sorteadas == posicao
+        linhas = inicio + sorteadas[selecao]
+        coluna = colunas[nome]
+        valores = np.round(coluna[linhas] * fatores[selecao], 2)
+        if nome in minimo_1:
+            valores = np.maximum(valores, 1)
+        elif nome in de_0_a_100:
+            valores = np.clip(valores, 0.0, 100.0)
+        coluna[linhas] = np.rint(valores) if tipos[nome] == "inteiro" else valores
+    return colunas
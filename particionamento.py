@@ -0,0 +1,283 @@
+# particionamento.py
+
+"""
+particionamento.py
+
+Descrição:
+-----------
+Este módulo grava o dataset em uma árvore de diretórios particionada no estilo Hive, em vez de um único arquivo
+CSV. Com `criar_arquivo_csv`, uma consulta sobre um único mês ou segmento precisa ler o arquivo inteiro do
+período (ex.: `dados_modo_original_2022.csv`); com as partições, o motor de consulta lê apenas os diretórios
+correspondentes ao filtro:
+
+   dados_2022/
+     ano=2022/mes=03/segmento=Varejo/parte-00000.csv
+     ano=2022/mes=03/segmento=TI/parte-00000.csv
+     ...
+     _manifesto.json
+
+Os valores das colunas de partição ficam no caminho e são removidos das linhas dos arquivos, como no Hive.
+
+Funcionalidades:
+-----------------
+- caminho_particao(colunas_particao, valores): caminho relativo "coluna=valor/..." de uma partição (mes com dois
+  dígitos; caracteres reservados escapados como %XX; None vira __HIVE_DEFAULT_PARTITION__).
+- EscritorParticionado(diretorio, cabecalho, colunas_particao, max_arquivos_abertos, tamanho_buffer, manifesto):
+  - escrever(linhas): distribui uma lista de linhas (na ordem do cabeçalho) entre as partições.
+  - escrever_colunas(colunas): o mesmo para um dicionário {coluna: array} do motor em lote; as partições de
+    cada bloco são agrupadas com numpy, sem montar uma chave por linha.
+  - fechar(): descarrega os buffers, fecha os arquivos e grava o manifesto (se solicitado); retorna a lista de
+    arquivos com linhas e datas mínima/máxima.
+- criar_particoes_csv(diretorio, cabecalho, dados, colunas_particao, ..., estatisticas): equivalente particionado
+  de `criar_arquivo_csv` (dados como lista de linhas ou dicionário de colunas, gravados em blocos; cada bloco
+  também é acumulado no AcumuladorEstatisticas opcional).
+
+Observações:
+-------------
+- Cada partição acumula as linhas em um buffer próprio, gravado com uma única chamada a `writerows` quando atinge
+  `tamanho_buffer` linhas (ou quando o total em buffers passa de `tamanho_buffer × max_arquivos_abertos`).
+- No máximo `max_arquivos_abertos` arquivos ficam abertos ao mesmo tempo; o arquivo usado há mais tempo é fechado
+  e reaberto em modo de acréscimo quando a sua partição voltar a receber linhas.
+- O manifesto ("_manifesto.json", ignorado pelos motores de consulta por começar com "_") lista cada arquivo com
+  os valores da partição, a quantidade de linhas e as datas mínima e máxima da coluna `data`.
+- O diretório de destino precisa estar vazio (ou não existir): um diretório com arquivos é recusado com
+  ValueError, para que partições de uma execução anterior que não recebam linhas não se misturem ao novo dataset.
+  O main.py faz a mesma verificação com `parser.error` antes da geração.
+"""
+
+import csv
+import json
+import os
+from collections import OrderedDict
+
+import numpy as np
+
+from categorias import ColunaCategorica
+from util import TAMANHO_BLOCO_ESCRITA, fatiar, quantidade_linhas, valores_python
+
+COLUNAS_PARTICAO_PADRAO = ("ano", "mes", "segmento")
+MAX_ARQUIVOS_ABERTOS = 64
+TAMANHO_BUFFER_PARTICAO = 5_000
+ARQUIVO_MANIFESTO = "_manifesto.json"
+NOME_ARQUIVO_PARTE = "parte-00000.csv"
+PARTICAO_NULA = "__HIVE_DEFAULT_PARTITION__"
+
+# Caracteres escapados nos nomes de diretório (os mesmos do Hive)
+_RESERVADOS = set('"#%\'*/:=?\\\x7f{[]^')
+
+
+def _formatar_valor(coluna, valor):
+    """
+    Converte o valor de uma coluna de partição no texto usado no nome do diretório.
+    """
+    if valor is None or (isinstance(valor, float) and np.isnan(valor)):
+        return PARTICAO_NULA
+    if coluna == "mes":
+        return f"{int(valor):02d}"
+    texto = str(valor)
+    return "".join(f"%{ord(c):02X}" if c in _RESERVADOS or ord(c) < 32 else c for c in texto)
+
+
+def caminho_particao(colunas_particao, valores):
+    """
+    Retorna o caminho relativo da partição ("ano=2022/mes=03/segmento=Varejo").
+    """
+    return os.path.join(*(f"{coluna}={_formatar_valor(coluna, valor)}"
+                          for coluna, valor in zip(colunas_particao, valores)))
+
+
+def _codigos_particao(valores):
+    """
+    Converte um trecho de coluna de partição em códigos inteiros (iguais para valores iguais).
+    """
+    if isinstance(valores, ColunaCategorica):
+        return valores.codigos.astype(np.int64)
+    valores = np.asarray(valores)
+    if valores.dtype.kind in "iub":
+        return valores.astype(np.int64)
+    if valores.dtype.kind == "M":
+        return valores.astype("datetime64[D]").astype(np.int64)
+    return np.unique(valores.astype(str), return_inverse=True)[1].astype(np.int64)
+
+
+class EscritorParticionado:
+    """
+    Grava linhas em uma árvore de diretórios particionada ("coluna=valor/...").
+    - diretorio: raiz das partições.
+    - cabecalho: colunas das linhas recebidas.
+    - colunas_particao: colunas do cabeçalho usadas nos diretórios (removidas dos arquivos).
+    - max_arquivos_abertos: limite de arquivos abertos ao mesmo tempo.
+    - tamanho_buffer: linhas acumuladas por partição antes de cada gravação.
+    - manifesto: grava "_manifesto.json" em `fechar`.
+    """
+
+    def __init__(self, diretorio, cabecalho, colunas_particao=COLUNAS_PARTICAO_PADRAO,
+                 max_arquivos_abertos=MAX_ARQUIVOS_ABERTOS, tamanho_buffer=TAMANHO_BUFFER_PARTICAO,
+                 manifesto=False, coluna_data="data"):
+        cabecalho = list(cabecalho)
+        desconhecidas = [coluna for coluna in colunas_particao if coluna not in cabecalho]
+        if desconhecidas or not colunas_particao:
+            raise ValueError(f"Colunas de partição inválidas: {list(colunas_particao)} (cabeçalho: {cabecalho}).")
+        if max_arquivos_abertos < 1:
+            raise ValueError("max_arquivos_abertos deve ser pelo menos 1.")
+        if os.path.isdir(diretorio) and os.listdir(diretorio):
+            raise ValueError(f"O diretório de partições '{diretorio}' não está vazio.")
+        self.diretorio = diretorio
+        self.colunas_particao = tuple(colunas_particao)
+        self.cabecalho = [coluna for coluna in cabecalho if coluna not in self.colunas_particao]
+        self.max_arquivos_abertos = max_arquivos_abertos
+        self.tamanho_buffer = tamanho_buffer
+        self.manifesto = manifesto
+        self._indices_particao = [cabecalho.index(coluna) for coluna in self.colunas_particao]
+        self._indices_arquivo = [cabecalho.index(coluna) for coluna in self.cabecalho]
+        self._indice_data = self.cabecalho.index(coluna_data) if coluna_data in self.cabecalho else None
+
+        self._buffers = {}
+        self._em_buffer = 0
+        self._abertos = OrderedDict()  # partição -> (arquivo, writer), do uso mais antigo ao mais recente
+        self._arquivos = {}  # partição -> entrada do manifesto
+
+    # ------------------------------------------------------------------
+    # Entrada
+    # ------------------------------------------------------------------
+
+    def escrever(self, linhas):
+        """
+        Distribui uma lista de linhas (na ordem do cabeçalho) entre as partições.
+        """
+        indices_particao, indices_arquivo = self._indices_particao, self._indices_arquivo
+        for linha in linhas:
+            self._acumular(tuple(linha[i] for i in indices_particao), [[linha[i] for i in indices_arquivo]])
+
+    def escrever_colunas(self, colunas, tamanho_bloco=TAMANHO_BLOCO_ESCRITA):
+        """
+        Distribui um dicionário {coluna: array} entre as partições, um bloco de linhas por vez.
+        """
+        total = quantidade_linhas(colunas)
+        for inicio in range(0, total, tamanho_bloco):
+            fim = min(inicio + tamanho_bloco, total)
+            chaves = np.column_stack([_codigos_particao(colunas[coluna][inicio:fim])
+                                      for coluna in self.colunas_particao])
+            _, primeiras, grupos = np.unique(chaves, axis=0, return_index=True, return_inverse=True)
+            grupos = grupos.reshape(-1)
+            ordem = np.argsort(grupos, kind="stable")
+            limites = np.cumsum(np.bincount(grupos))
+            for grupo, indices in enumerate(np.split(ordem, limites[:-1])):
+                primeira = inicio + primeiras[grupo]
+                particao = tuple(valores_python(colunas[coluna][primeira:primeira + 1])[0]
+                                 for coluna in self.colunas_particao)
+                bloco = [valores_python(colunas[coluna][inicio:fim][indices]) for coluna in self.cabecalho]
+                self._acumular(particao, [list(linha) for linha in zip(*bloco)])
+
+    def _acumular(self, particao, linhas):
+        buffer = self._buffers.setdefault(particao, [])
+        buffer.extend(linhas)
+        self._em_buffer += len(linhas)
+        if len(buffer) >= self.tamanho_buffer:
+            self._descarregar(particao)
+        if self._em_buffer >= self.tamanho_buffer * self.max_arquivos_abertos:
+            self._descarregar_todos()
+
+    # ------------------------------------------------------------------
+    # Saída
+    # ------------------------------------------------------------------
+
+    def _writer(self, particao):
+        """
+        Retorna o writer da partição, abrindo o arquivo (e fechando o usado há mais tempo) se necessário.
+        """
+        if particao in self._abertos:
+            self._abertos.move_to_end(particao)
+            return self._abertos[particao][1]
+        if len(self._abertos) >= self.max_arquivos_abertos:
+            _, (antigo, _) = self._abertos.popitem(last=False)
+            antigo.close()
+
+        entrada = self._arquivos.get(particao)
+        if entrada is None:
+            relativo = os.path.join(caminho_particao(self.colunas_particao, particao), NOME_ARQUIVO_PARTE)
+            os.makedirs(os.path.join(self.diretorio, os.path.dirname(relativo)), exist_ok=True)
+            entrada = self._arquivos[particao] = {
+                "arquivo": relativo.replace(os.sep, "/"),
+                "particao": {coluna: _formatar_valor(coluna, valor)
+                             for coluna, valor in zip(self.colunas_particao, particao)},
+                "linhas": 0, "data_minima": None, "data_maxima": None,
+            }
+            arquivo = open(os.path.join(self.diretorio, relativo), mode="w", newline="", encoding="utf-8")
+            writer = csv.writer(arquivo)
+            writer.writerow(self.cabecalho)
+        else:
+            arquivo = open(os.path.join(self.diretorio, entrada["arquivo"]), mode="a", newline="", encoding="utf-8")
+            writer = csv.writer(arquivo)
+        self._abertos[particao] = (arquivo, writer)
+        return writer
+
+    def _descarregar(self, particao):
+        linhas = self._buffers.pop(particao, None)
+        if not linhas:
+            return
+        self._writer(particao).writerows(linhas)
+        self._em_buffer -= len(linhas)
+
+        entrada = self._arquivos[particao]
+        entrada["linhas"] += len(linhas)
+        if self._indice_data is not None:
+            datas = [linha[self._indice_data] for linha in linhas if linha[self._indice_data] is not None]
+            if datas:
+                menor, maior = str(min(datas)), str(max(datas))
+                if entrada["data_minima"] is None or menor < entrada["data_minima"]:
+                    entrada["data_minima"] = menor
+                if entrada["data_maxima"] is None or maior > entrada["data_maxima"]:
+                    entrada["data_maxima"] = maior
+
+    def _descarregar_todos(self):
+        for particao in list(self._buffers):
+            self._descarregar(particao)
+
+    def fechar(self):
+        """
+        Descarrega os buffers, fecha os arquivos e grava o manifesto (se solicitado).
+        Retorna a lista de arquivos gravados (caminho, partição, linhas e datas mínima/máxima).
+        """
+        self._descarregar_todos()
+        for arquivo, _ in self._abertos.values():
+            arquivo.close()
+        self._abertos.clear()
+
+        arquivos = sorted(self._arquivos.values(), key=lambda entrada: entrada["arquivo"])
+        if self.manifesto:
+            with open(os.path.join(self.diretorio, ARQUIVO_MANIFESTO), "w", encoding="utf-8") as arquivo:
+                json.dump({"colunas_particao": list(self.colunas_particao), "cabecalho": self.cabecalho,
+                           "total_linhas": sum(entrada["linhas"] for entrada in arquivos), "arquivos": arquivos},
+                          arquivo, ensure_ascii=False, indent=2)
+        return arquivos
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+
+def criar_particoes_csv(diretorio, cabecalho, dados, colunas_particao=COLUNAS_PARTICAO_PADRAO,
+                        max_arquivos_abertos=MAX_ARQUIVOS_ABERTOS, manifesto=False, estatisticas=None):
+    """
+    Grava os dados em CSVs particionados (equivalente particionado de `criar_arquivo_csv`).
+    - dados: lista de listas (na ordem do cabeçalho) ou dicionário {coluna: array}.
+    - estatisticas: AcumuladorEstatisticas (opcional) que recebe cada bloco gravado.
+    Retorna a lista de arquivos gravados (ver EscritorParticionado.fechar).
+    """
+    os.makedirs(diretorio, exist_ok=True)
+    escritor = EscritorParticionado(diretorio, cabecalho, colunas_particao, max_arquivos_abertos,
+                                    manifesto=manifesto)
+    try:
+        for bloco in fatiar(dados):
+            if estatisticas is not None:
+                estatisticas.atualizar(bloco)
+            if isinstance(bloco, dict):
+                escritor.escrever_colunas(bloco)
+            else:
+                escritor.escrever(bloco)
+    finally:
+        arquivos = escritor.fechar()
+    return arquivos
@@ -0,0 +1,77 @@
+# pool_faker.py
+
+"""
+pool_faker.py
+
+Descrição:
+-----------
+Este módulo fornece a classe `PoolFaker`, um "pool" de valores pré-gerados pelo Faker. Cada chamada a
+`fake.company()`, `fake.city()` ou `fake.name()` executa os provedores do Faker (templates, formatação, sorteios
+internos), o que custa dezenas de microssegundos por valor e domina o tempo de geração em datasets pequenos.
+
+O `PoolFaker` gera, uma única vez, um conjunto fixo de valores para cada método utilizado pelos geradores e, a
+partir daí, apenas sorteia um dos valores já prontos com `random.choice`. Ele expõe os mesmos métodos do Faker
+usados nos geradores (`company`, `city`, `name`, `estado_nome`, `estado_sigla`), podendo ser passado no lugar do
+objeto `fake` para `gerar_dados_empresa` e `gerar_dados_hotel_unico` sem nenhuma alteração nesses módulos.
+
+Funcionalidades:
+-----------------
+- PoolFaker(fake, tamanho, semente):
+  - Pré-gera `tamanho` valores para cada método de `METODOS_POOL`.
+  - O pool é gerado com uma semente fixa (padrão 0), de modo que dois processos diferentes criam exatamente o
+    mesmo pool. Assim, o resultado de uma geração depende apenas da semente do `random`, e não do processo
+    que a executou (importante para o servidor e para o executor de lotes).
+- valores(metodo): retorna a tupla de valores pré-gerados para um método.
+
+Observações:
+-------------
+- O sorteio usa o módulo `random` global, o mesmo usado pelos geradores; portanto `random.seed(...)` torna a
+  geração com pool totalmente reprodutível.
+- Quanto maior o pool, maior a variedade de nomes; 5000 valores por método já são suficientes para a maioria
+  dos usos e levam poucos décimos de segundo para serem criados.
+"""
+
+import random
+
+METODOS_POOL = ("company", "city", "name", "estado_nome", "estado_sigla")
+
+
+class PoolFaker:
+    """
+    Substituto do objeto Faker com valores pré-gerados.
+    - fake: instância de Faker usada para gerar o pool.
+    - tamanho: quantidade de valores pré-gerados por método.
+    - semente: semente usada na criação do pool (None para não fixar).
+    """
+
+    def __init__(self, fake, tamanho=5000, semente=0):
+        if tamanho <= 0:
+            raise ValueError("O tamanho do pool do Faker deve ser positivo.")
+        if semente is not None:
+            fake.seed_instance(semente)
+        self.tamanho = tamanho
+        self._valores = {
+            metodo: tuple(getattr(fake, metodo)() for _ in range(tamanho))
+            for metodo in METODOS_POOL
+        }
+
+    def valores(self, metodo):
+        """
+        Retorna a tupla de valores pré-gerados para o método informado.
+        """
+        return self._valores[metodo]
+
+    def company(self):
+        return random.choice(self._valores["company"])
+
+    def city(self):
+        return random.choice(self._valores["city"])
+
+    def name(self):
+        return random.choice(self._valores["name"])
+
+    def estado_nome(self):
+        return random.choice(self._valores["estado_nome"])
+
+    def estado_sigla(self):
+        return random.choice(self._valores["estado_sigla"])
@@ -0,0 +1,163 @@
+# reservas.py
+
+"""
+reservas.py
+
+Descrição:
+-----------
+Este módulo implementa o motor de reservas do modo hotel único. Nos geradores anteriores, a `quantidade_diarias`
+de um hóspede só consumia os quartos do dia da chegada: uma estadia de 5 noites não ocupava os 4 dias seguintes,
+e a ocupação, o ADR e o RevPAR ignoravam as estadias sobrepostas.
+
+Aqui o inventário é mantido por noite, para todo o período: cada reserva ocupa `quantidade_quartos` quartos em
+todas as noites da estadia (da chegada até a véspera da saída), e só é aceita se houver quartos livres em todas
+essas noites. Os KPIs de cada noite (quartos ocupados, receita de quartos, ocupação, ADR e RevPAR) são calculados
+a partir desse inventário.
+
+Funcionalidades:
+-----------------
+- InventarioReservas(total_quartos, n_dias, max_diarias):
+  - quartos_livres(dia, diarias): menor quantidade de quartos livres entre as noites da estadia.
+  - reservar(dia, diarias, quartos, valor_diaria): reserva uma estadia (uso linha a linha, geradores_hotel.py).
+    Se não houver quartos suficientes em todas as noites, reserva apenas os disponíveis; retorna os quartos
+    efetivamente reservados (0 = reserva recusada).
+  - reservar_lote(dias, diarias, quartos, valores_diaria): reserva um lote de estadias ordenado por dia de chegada
+    (uso no motor em lote, geradores_lote.py). As chegadas de cada dia são avaliadas juntas, com uma matriz
+    chegadas × noites, em vez de uma a uma.
+  - ocupacao_previa: quartos já reservados em cada noite antes das chegadas do próprio dia (preenchido por
+    `reservar_lote`; usado no yield das tarifas, ver tarifas.py).
+  - adicionar_receita(dias, diarias, valores): soma a receita das estadias em cada noite.
+  - kpis_noites(): métricas por noite do período (quartos_ocupados, receita_quartos, ocupacao, adr, revpar).
+
+- calcular_kpis_noites(ocupados, receita, total_quartos): ocupação, ADR e RevPAR a partir dos componentes.
+
+- acumular_estadias(dias, diarias, valores, n_noites):
+  - Soma, para cada noite, os valores das estadias que a ocupam, usando um array de diferenças (+valor na chegada,
+    -valor na saída, seguido de uma soma acumulada). O custo é O(reservas + noites), independentemente da duração
+    das estadias.
+
+Regras:
+--------
+- Uma estadia que chega no dia d com n diárias ocupa as noites d, d+1, ..., d+n-1.
+- Como no gerador original, quando o hotel lota, o hóspede que não cabe inteiro recebe os quartos que restam
+  (se houver) e os demais hóspedes do mesmo dia são recusados.
+- As estadias podem terminar depois de data_fim: o inventário cobre também as `max_diarias` noites seguintes,
+  mas os KPIs são informados apenas para as noites do período.
+"""
+
+import numpy as np
+
+MAX_DIARIAS = 7
+
+
+def acumular_estadias(dias, diarias, valores, n_noites):
+    """
+    Soma os valores das estadias em cada noite, com um array de diferenças.
+    - dias: índice da noite de chegada de cada estadia.
+    - diarias: número de noites de cada estadia.
+    - valores: valor somado em cada noite da estadia (ex.: quartos ou quartos × valor_diaria).
+    - n_noites: tamanho do resultado (noites além do limite são descartadas).
+    """
+    dias = np.asarray(dias, dtype=np.int64)
+    saidas = dias + np.asarray(diarias, dtype=np.int64)
+    valores = np.asarray(valores, dtype=np.float64)
+    diferencas = np.zeros(n_noites + 1)
+    np.add.at(diferencas, np.minimum(dias, n_noites), valores)
+    np.add.at(diferencas, np.minimum(saidas, n_noites), -valores)
+    return np.cumsum(diferencas[:-1])
+
+
+def calcular_kpis_noites(ocupados, receita, total_quartos):
+    """
+    Calcula as métricas de cada noite a partir dos quartos ocupados e da receita de quartos.
+    """
+    return {
+        "quartos_ocupados": ocupados,
+        "receita_quartos": receita,
+        "ocupacao": ocupados / total_quartos * 100 if total_quartos > 0 else np.zeros(len(ocupados)),
+        "adr": np.where(ocupados > 0, receita / np.maximum(ocupados, 1), 0.0),
+        "revpar": receita / total_quartos if total_quartos > 0 else np.zeros(len(ocupados)),
+    }
+
+
+class InventarioReservas:
+    """
+    Inventário de quartos por noite de um hotel.
+    - total_quartos: quartos disponíveis em cada noite.
+    - n_dias: número de dias do período (noites com KPIs).
+    - max_diarias: duração máxima de uma estadia.
+    """
+
+    def __init__(self, total_quartos, n_dias, max_diarias=MAX_DIARIAS):
+        self.total_quartos = total_quartos
+        self.n_dias = n_dias
+        self.max_diarias = max_diarias
+        self.ocupacao = np.zeros(n_dias + max_diarias, dtype=np.int64)
+        self.receita = np.zeros(n_dias + max_diarias)
+        self.ocupacao_previa = np.zeros(n_dias, dtype=np.int64)
+
+    def quartos_livres(self, dia, diarias):
+        """
+        Retorna a menor quantidade de quartos livres entre as noites [dia, dia + diarias).
+        """
+        return int(self.total_quartos - self.ocupacao[dia:dia + diarias].max())
+
+    def reservar(self, dia, diarias, quartos, valor_diaria=0.0):
+        """
+        Reserva `quartos` quartos nas noites [dia, dia + diarias). Se não houver quartos suficientes em todas as
+        noites, reserva apenas os disponíveis. Retorna a quantidade de quartos reservados (0 = recusada).
+        """
+        quartos = max(0, min(quartos, self.quartos_livres(dia, diarias)))
+        if quartos:
+            self.ocupacao[dia:dia + diarias] += quartos
+            self.receita[dia:dia + diarias] += quartos * valor_diaria
+        return quartos
+
+    def reservar_lote(self, dias, diarias, quartos, valores_diaria=None):
+        """
+        Reserva um lote de estadias, ordenado por dia de chegada. Retorna os quartos reservados de cada estadia
+        (0 = recusada), com as mesmas regras de `reservar` aplicadas na ordem do lote.
+        """
+        dias = np.asarray(dias, dtype=np.int64)
+        diarias = np.asarray(diarias, dtype=np.int64)
+        quartos = np.asarray(quartos, dtype=np.int64)
+        reservados = np.zeros(len(dias), dtype=np.int64)
+        noites = np.arange(self.max_diarias)
+        limites = np.searchsorted(dias, np.arange(self.n_dias + 1))
+
+        for dia in range(self.n_dias):
+            self.ocupacao_previa[dia] = self.ocupacao[dia]
+            inicio, fim = limites[dia], limites[dia + 1]
+            if inicio == fim:
+                continue
+            estadia = noites < diarias[inicio:fim, None]
+            demanda = estadia * quartos[inicio:fim, None]
+            antes = np.cumsum(demanda, axis=0) - demanda
+            livres = self.total_quartos - self.ocupacao[dia:dia + self.max_diarias] - antes
+            disponivel = np.where(estadia, livres, self.total_quartos).min(axis=1)
+
+            # Aceita as estadias em ordem até a primeira que não cabe inteira, que recebe o que resta
+            aceitos = np.maximum(0, np.minimum(quartos[inicio:fim], disponivel))
+            falta = np.flatnonzero(aceitos < quartos[inicio:fim])
+            if len(falta):
+                aceitos[falta[0] + 1:] = 0
+            reservados[inicio:fim] = aceitos
+            self.ocupacao[dia:dia + self.max_diarias] += (estadia * aceitos[:, None]).sum(axis=0)
+
+        if valores_diaria is not None:
+            self.adicionar_receita(dias, diarias, reservados * np.asarray(valores_diaria))
+        return reservados
+
+    def adicionar_receita(self, dias, diarias, valores):
+        """
+        Soma a receita de quartos das estadias (valor por noite) em cada noite em que elas ocupam o hotel.
+        """
+        self.receita += acumular_estadias(dias, diarias, valores, len(self.receita))
+
+    def kpis_noites(self):
+        """
+        Retorna um dicionário com as métricas de cada noite do período:
+        quartos_ocupados, receita_quartos, ocupacao (%), adr e revpar.
+        """
+        return calcular_kpis_noites(self.ocupacao[:self.n_dias].copy(), self.receita[:self.n_dias].copy(),
+                                    self.total_quartos)
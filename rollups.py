@@ -0,0 +1,164 @@
+# rollups.py
+
+"""
+rollups.py
+
+Descrição:
+-----------
+Este módulo mantém os agregados por período (semana, mês e ano) dos KPIs do modo hotel único enquanto os dados
+são gerados. Os dashboards de Revenue Management recalculavam o ADR, o RevPAR, o TRevPAR e o GOPPAR mensais a
+partir das linhas diárias; aqui, o gerador acumula, para cada período, apenas componentes aditivos:
+
+   dias, quartos_disponiveis (quartos × noites), quartos_vendidos, receita_quartos, receita_total e custo_total
+
+Os indicadores de razão são calculados a partir dessas somas no momento da saída (ADR = receita_quartos /
+quartos_vendidos, RevPAR = receita_quartos / quartos_disponiveis, ...), o que os mantém corretos para qualquer
+período — a média dos ADRs diários, por exemplo, não é o ADR do mês.
+
+Funcionalidades:
+-----------------
+- GRANULARIDADES: "semana" (início na segunda-feira), "mes" e "ano".
+- AcumuladorPeriodos():
+  - adicionar_dias(datas, quartos_disponiveis, quartos_vendidos, receita_quartos, receita_total, custo_total):
+    soma os componentes de um ou mais dias (arrays), agrupados por período de forma vetorizada.
+  - adicionar_kpis_diarios(kpis): o mesmo, a partir de uma tabela de KPIs diários (CABECALHO_HOTEL_KPIS_DIARIOS).
+  - tabela(granularidade): tabela de rollup {coluna: array} na ordem de CABECALHO_ROLLUP.
+  - salvar(caminho) / carregar(caminho): estado em JSON, para acrescentar dias em execuções seguintes.
+
+Atualização Incremental:
+-------------------------
+Os dias só podem ser acrescentados depois do último dia já acumulado (somente anexação); assim, um período que
+começou em uma execução é completado na seguinte sem contar nenhum dia duas vezes.
+"""
+
+import json
+
+import numpy as np
+
+from nucleo import dia_semana
+
+GRANULARIDADES = ("semana", "mes", "ano")
+
+COMPONENTES = ("dias", "quartos_disponiveis", "quartos_vendidos", "receita_quartos", "receita_total", "custo_total")
+
+CABECALHO_ROLLUP = [
+    "periodo", *COMPONENTES, "lucro_operacional_bruto",
+    "ocupacao", "adr", "revpar", "trevpar", "goppar",
+]
+
+
+def chaves_periodo(datas, granularidade):
+    """
+    Retorna a chave do período de cada data (datetime64[D]):
+    semana -> data da segunda-feira (YYYY-MM-DD); mes -> YYYY-MM; ano -> YYYY.
+    """
+    datas = np.asarray(datas, dtype="datetime64[D]")
+    if granularidade == "semana":
+        segunda = datas - dia_semana(datas)
+        return np.datetime_as_string(segunda, unit="D")
+    if granularidade == "mes":
+        return np.datetime_as_string(datas.astype("datetime64[M]"), unit="M")
+    if granularidade == "ano":
+        return np.datetime_as_string(datas.astype("datetime64[Y]"), unit="Y")
+    raise ValueError(f"Granularidade '{granularidade}' inválida. Use uma de {GRANULARIDADES}.")
+
+
+def _dividir(numerador, denominador):
+    return np.round(np.where(denominador > 0, numerador / np.maximum(denominador, 1e-12), 0.0), 2)
+
+
+class AcumuladorPeriodos:
+    """
+    Agregados aditivos por semana, mês e ano, atualizados à medida que os dias são gerados.
+    """
+
+    def __init__(self):
+        self.somas = {granularidade: {} for granularidade in GRANULARIDADES}
+        self.ultimo_dia = None
+
+    def adicionar_dias(self, datas, quartos_disponiveis, quartos_vendidos, receita_quartos, receita_total,
+                       custo_total):
+        """
+        Soma os componentes de um ou mais dias consecutivos (posteriores ao último dia já acumulado).
+        """
+        datas = np.atleast_1d(np.asarray(datas, dtype="datetime64[D]"))
+        if len(datas) == 0:
+            return
+        if np.any(np.diff(datas.astype(np.int64)) <= 0):
+            raise ValueError("As datas devem estar em ordem crescente e sem repetição.")
+        if self.ultimo_dia is not None and datas[0] <= self.ultimo_dia:
+            raise ValueError(f"Os dias acumulados vão até {self.ultimo_dia}; "
+                             f"só é possível acrescentar dias posteriores (recebido {datas[0]}).")
+
+        valores = np.column_stack([
+            np.ones(len(datas)),
+            *(np.broadcast_to(np.asarray(componente, dtype=np.float64), len(datas))
+              for componente in (quartos_disponiveis, quartos_vendidos, receita_quartos, receita_total,
+                                 custo_total))
+        ])
+        for granularidade in GRANULARIDADES:
+            chaves, indices = np.unique(chaves_periodo(datas, granularidade), return_inverse=True)
+            somas = np.zeros((len(chaves), len(COMPONENTES)))
+            np.add.at(somas, indices, valores)
+            acumulado = self.somas[granularidade]
+            for chave, soma in zip(chaves.tolist(), somas):
+                acumulado[chave] = acumulado[chave] + soma if chave in acumulado else soma
+        self.ultimo_dia = datas[-1]
+
+    def adicionar_kpis_diarios(self, kpis):
+        """
+        Soma os componentes a partir de uma tabela de KPIs diários ({coluna: array}, CABECALHO_HOTEL_KPIS_DIARIOS).
+        """
+        self.adicionar_dias(kpis["data"], kpis["total_quartos"], kpis["quartos_ocupados_dia"],
+                            kpis["receita_quartos_dia"], kpis["receita_total_dia"], kpis["custo_total_dia"])
+
+    def tabela(self, granularidade):
+        """
+        Retorna a tabela de rollup do período, {coluna: array} na ordem de CABECALHO_ROLLUP, com os indicadores
+        de razão calculados a partir das somas.
+        """
+        if granularidade not in GRANULARIDADES:
+            raise ValueError(f"Granularidade '{granularidade}' inválida. Use uma de {GRANULARIDADES}.")
+        acumulado = self.somas[granularidade]
+        chaves = sorted(acumulado)
+        somas = np.array([acumulado[chave] for chave in chaves]).reshape(len(chaves), len(COMPONENTES))
+        t = {"periodo": np.array(chaves, dtype=object)}
+        for indice, nome in enumerate(COMPONENTES):
+            t[nome] = np.round(somas[:, indice], 2)
+        t["dias"] = t["dias"].astype(np.int64)
+        t["quartos_disponiveis"] = t["quartos_disponiveis"].astype(np.int64)
+        t["quartos_vendidos"] = t["quartos_vendidos"].astype(np.int64)
+        lucro = somas[:, 4] - somas[:, 5]
+        t["lucro_operacional_bruto"] = np.round(lucro, 2)
+        t["ocupacao"] = _dividir(somas[:, 2] * 100, somas[:, 1])
+        t["adr"] = _dividir(somas[:, 3], somas[:, 2])
+        t["revpar"] = _dividir(somas[:, 3], somas[:, 1])
+        t["trevpar"] = _dividir(somas[:, 4], somas[:, 1])
+        t["goppar"] = _dividir(lucro, somas[:, 1])
+        return t
+
+    def salvar(self, caminho):
+        """
+        Grava o estado (somas por período e último dia) em JSON.
+        """
+        estado = {
+            "ultimo_dia": None if self.ultimo_dia is None else str(self.ultimo_dia),
+            "somas": {granularidade: {chave: soma.tolist() for chave, soma in acumulado.items()}
+                      for granularidade, acumulado in self.somas.items()},
+        }
+        with open(caminho, "w", encoding="utf-8") as arquivo:
+            json.dump(estado, arquivo, ensure_ascii=False)
+
+    @classmethod
+    def carregar(cls, caminho):
+        """
+        Lê um estado gravado por `salvar`.
+        """
+        with open(caminho, encoding="utf-8") as arquivo:
+            estado = json.load(arquivo)
+        acumulador = cls()
+        if estado["ultimo_dia"] is not None:
+            acumulador.ultimo_dia = np.datetime64(estado["ultimo_dia"], "D")
+        for granularidade, acumulado in estado["somas"].items():
+            acumulador.somas[granularidade] = {chave: np.array(soma) for chave, soma in acumulado.items()}
+        return acumulador
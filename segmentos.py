@@ -0,0 +1,226 @@
+# segmentos.py
+
+"""
+segmentos.py
+
+Descrição:
+-----------
+Este módulo implementa o registro de segmentos do modo original. Antes, `gerar_dados_empresa` decidia as métricas
+específicas de cada segmento com testes `segmento in [...]` repetidos em cada linha (Hotelaria -> taxa_ocupacao e
+RevPAR, Educação -> taxa_evasao, Saúde/Hospital -> tempo_medio_atendimento, SaaS/TI -> MRR/ARR, ...), e um segmento
+novo informado em `--segmentos` nunca recebia métricas próprias.
+
+Aqui, cada segmento declara um `PerfilSegmento`: as métricas específicas que possui, com as suas distribuições
+(amostradores de nucleo.py), e as colunas categóricas que se aplicam a ele. Os geradores consultam o perfil:
+- motor escalar: uma busca no registro por linha, em vez das listas de segmentos;
+- motor em lote: as linhas são agrupadas por segmento e cada métrica de cada grupo é gerada com uma única chamada
+  vetorizada (`amostrar_por_segmento`); as linhas de segmentos sem a métrica recebem o valor padrão.
+
+Funcionalidades:
+-----------------
+- METRICAS_SEGMENTO: métricas que dependem do segmento e o valor padrão para segmentos que não as declaram.
+  As entradas "fator_*" multiplicam outra métrica (MRR = receita × fator_MRR; comissao_vendas = receita ×
+  fator_comissao_vendas; custo_estoque = nivel_estoque × fator_custo_estoque).
+- CATEGORIAS_SEGMENTO: colunas categóricas que só existem para alguns segmentos (None nos demais).
+- registrar_segmento(nome, metricas, categorias, base): declara (ou substitui) o perfil de um segmento; com `base`,
+  o perfil parte das métricas e categorias de outro segmento já registrado.
+- perfil_segmento(nome): perfil do segmento (segmentos não registrados recebem um perfil vazio).
+- especificacao_segmento("Nome=Base"): usado para o `--segmentos` do main.py (main.preparar_argumentos); registra
+  "Nome" com o perfil de "Base" e retorna "Nome".
+- amostrar_por_segmento(ctx, dicionario_segmentos, codigos_segmento): colunas das métricas e categorias de
+  segmento para um lote inteiro.
+- validade_segmento(dicionario_segmentos, codigos_segmento, coluna): máscara de validade de uma coluna de segmento
+  para um lote, obtida do vetor de segmentos (uma consulta ao perfil por segmento, e não por linha).
+- PerfilSegmento.validade(colunas): a mesma máscara para uma linha (motor escalar), calculada uma vez por perfil.
+
+Exemplo:
+---------
+   python main.py --segmentos Varejo "Pousada=Hotelaria" "Fintech=SaaS"
+
+Observações:
+-------------
+- O registro é do processo: os segmentos de `--segmentos` são registrados logo depois da leitura dos argumentos,
+  inclusive nos processos trabalhadores (trabalhadores.py), que usam o mesmo parser e a mesma preparação.
+"""
+
+import numpy as np
+
+from categorias import DICIONARIOS, ColunaCategorica
+from nucleo import Inteiro, LogNormal, Uniforme
+
+# métrica -> valor para segmentos que não a declaram
+METRICAS_SEGMENTO = {
+    "taxa_ocupacao": None,
+    "RevPAR": None,
+    "taxa_evasao": None,
+    "tempo_medio_atendimento": None,
+    "quantidade_produtos": 0,
+    "nivel_estoque": 0,
+    "giro_estoque": 0.0,
+    "fator_custo_estoque": 0.0,
+    "vendas_por_vendedor": 0,
+    "fator_comissao_vendas": 0.0,
+    "frete_medio": 0.0,
+    "fator_MRR": 0.0,
+    "usuarios_ativos": 0,
+}
+
+CATEGORIAS_SEGMENTO = ("categoria_produto", "tipo_servico", "plano", "funcionalidade_mais_usada")
+
+# Distribuições das métricas de segmento (as mesmas para todos os segmentos que as declaram)
+_HOTELARIA = {"taxa_ocupacao": Uniforme(60.0, 100.0), "RevPAR": Uniforme(50, 200)}
+_ESTOQUE = {
+    "quantidade_produtos": Inteiro(1, 200),
+    "nivel_estoque": Inteiro(100, 1000),
+    "giro_estoque": Uniforme(1, 10),
+    "fator_custo_estoque": Uniforme(5, 20, casas=None),
+}
+_VENDAS = {"vendas_por_vendedor": Inteiro(1, 50), "fator_comissao_vendas": Uniforme(0.01, 0.05, casas=None)}
+_RECORRENCIA = {"fator_MRR": Uniforme(0.8, 1.2, casas=None)}
+_USO_PRODUTO = {"usuarios_ativos": LogNormal(5, 0.9, inteiro=True)}
+_ATENDIMENTO = {"tempo_medio_atendimento": Uniforme(15, 60)}
+
+
+class PerfilSegmento:
+    """
+    Métricas e categorias específicas de um segmento.
+    - metricas: dicionário métrica (de METRICAS_SEGMENTO) -> amostrador.
+    - categorias: colunas de CATEGORIAS_SEGMENTO que se aplicam ao segmento.
+    """
+
+    __slots__ = ("nome", "metricas", "categorias", "_validade")
+
+    def __init__(self, nome, metricas=None, categorias=()):
+        metricas = dict(metricas or {})
+        desconhecidas = (set(metricas) - set(METRICAS_SEGMENTO)) | (set(categorias) - set(CATEGORIAS_SEGMENTO))
+        if desconhecidas:
+            raise ValueError(f"Segmento '{nome}': métricas ou categorias desconhecidas: {sorted(desconhecidas)}.")
+        self.nome = nome
+        self.metricas = metricas
+        self.categorias = frozenset(categorias)
+        self._validade = {}
+
+    def tem(self, coluna):
+        """
+        Indica se a métrica ou a coluna categórica se aplica ao segmento.
+        """
+        return coluna in self.metricas or coluna in self.categorias
+
+    def validade(self, colunas):
+        """
+        Máscara booleana das colunas que têm valor neste segmento: as colunas gerais e as métricas e categorias de
+        segmento que o perfil declara. Calculada uma vez por tupla de colunas.
+        """
+        mascara = self._validade.get(colunas)
+        if mascara is None:
+            mascara = self._validade[colunas] = np.array(
+                [(coluna not in METRICAS_SEGMENTO and coluna not in CATEGORIAS_SEGMENTO) or self.tem(coluna)
+                 for coluna in colunas], dtype=bool)
+        return mascara
+
+    def sortear(self, metrica):
+        """
+        Sorteia um valor da métrica (motor escalar) ou retorna o padrão, se o segmento não a declara.
+        """
+        amostrador = self.metricas.get(metrica)
+        return METRICAS_SEGMENTO[metrica] if amostrador is None else amostrador.sortear()
+
+
+REGISTRO_SEGMENTOS = {}
+
+
+def registrar_segmento(nome, metricas=None, categorias=(), base=None):
+    """
+    Declara o perfil de um segmento (substitui o perfil anterior, se houver) e o retorna.
+    - base: segmento já registrado cujas métricas e categorias são herdadas (as informadas aqui prevalecem).
+    """
+    if base is not None:
+        herdado = perfil_segmento(base)
+        metricas = {**herdado.metricas, **(metricas or {})}
+        categorias = herdado.categorias | frozenset(categorias)
+    perfil = PerfilSegmento(nome, metricas, categorias)
+    REGISTRO_SEGMENTOS[nome] = perfil
+    return perfil
+
+
+def perfil_segmento(nome):
+    """
+    Retorna o perfil do segmento; segmentos não registrados têm apenas as métricas gerais.
+    """
+    perfil = REGISTRO_SEGMENTOS.get(nome)
+    return perfil if perfil is not None else PerfilSegmento(nome)
+
+
+def especificacao_segmento(texto):
+    """
+    Interpreta um valor de `--segmentos`: "Nome" ou "Nome=Base" (registra Nome com o perfil de Base).
+    Retorna o nome do segmento.
+    """
+    nome, separador, base = texto.partition("=")
+    nome, base = nome.strip(), base.strip()
+    if separador:
+        if not nome or base not in REGISTRO_SEGMENTOS:
+            raise ValueError(f"Segmento '{texto}' inválido: use Nome=Base, com Base entre "
+                             f"{sorted(REGISTRO_SEGMENTOS)}.")
+        registrar_segmento(nome, base=base)
+    return nome
+
+
+def validade_segmento(dicionario_segmentos, codigos_segmento, coluna):
+    """
+    Máscara de validade de uma coluna de segmento para um lote: True nas linhas cujo segmento declara a coluna.
+    """
+    aplica = np.array([perfil_segmento(nome).tem(coluna) for nome in dicionario_segmentos], dtype=bool)
+    return aplica[codigos_segmento]
+
+
+def amostrar_por_segmento(ctx, dicionario_segmentos, codigos_segmento):
+    """
+    Gera as métricas e categorias de segmento para um lote (motor em lote).
+    - ctx: nucleo.ContextoGeracao.
+    - dicionario_segmentos: nomes dos segmentos; codigos_segmento: posição do segmento de cada linha.
+    As linhas são agrupadas por segmento e cada métrica do grupo é sorteada com uma única chamada.
+    Retorna {coluna: array} para METRICAS_SEGMENTO (None vira NaN) e {coluna: ColunaCategorica} para
+    CATEGORIAS_SEGMENTO.
+    """
+    n = len(codigos_segmento)
+    colunas = {}
+    for metrica, padrao in METRICAS_SEGMENTO.items():
+        if padrao is None:
+            colunas[metrica] = np.full(n, np.nan)
+        else:
+            colunas[metrica] = np.full(n, padrao, dtype=np.int64 if isinstance(padrao, int) else np.float64)
+    codigos_categorias = {coluna: np.full(n, -1, dtype=np.int64) for coluna in CATEGORIAS_SEGMENTO}
+
+    ordem = np.argsort(codigos_segmento, kind="stable")
+    limites = np.searchsorted(codigos_segmento[ordem], np.arange(len(dicionario_segmentos) + 1))
+    for posicao, nome in enumerate(dicionario_segmentos):
+        linhas = ordem[limites[posicao]:limites[posicao + 1]]
+        if len(linhas) == 0:
+            continue
+        perfil = perfil_segmento(nome)
+        for metrica, amostrador in perfil.metricas.items():
+            colunas[metrica][linhas] = ctx.amostrar(amostrador, len(linhas))
+        for coluna in perfil.categorias:
+            codigos_categorias[coluna][linhas] = ctx.categoria(coluna, len(linhas)).codigos
+
+    for coluna, codigos in codigos_categorias.items():
+        colunas[coluna] = ColunaCategorica(codigos, DICIONARIOS[coluna])
+    return colunas
+
+
+# --------------------------------------------------------------------------------
+# Segmentos pré-definidos (as mesmas regras dos geradores anteriores)
+# --------------------------------------------------------------------------------
+registrar_segmento("Hotelaria", _HOTELARIA)
+registrar_segmento("Educação", {"taxa_evasao": Uniforme(5, 20)}, ["tipo_servico"])
+registrar_segmento("Saúde", _ATENDIMENTO, ["tipo_servico"])
+registrar_segmento("Hospital", _ATENDIMENTO, ["tipo_servico"])
+registrar_segmento("Varejo", {**_ESTOQUE, **_VENDAS, "frete_medio": Uniforme(5, 50)}, ["categoria_produto"])
+registrar_segmento("Indústria", _ESTOQUE, ["categoria_produto"])
+registrar_segmento("Serviços", _VENDAS, ["tipo_servico", "plano"])
+registrar_segmento("TI", {**_RECORRENCIA, **_USO_PRODUTO}, ["tipo_servico", "plano", "funcionalidade_mais_usada"])
+registrar_segmento("SaaS", {**_RECORRENCIA, **_USO_PRODUTO}, ["plano", "funcionalidade_mais_usada"])
+registrar_segmento("Aplicativo", _USO_PRODUTO, ["funcionalidade_mais_usada"])
+registrar_segmento("Consultoria", categorias=["tipo_servico"])
+registrar_segmento("Banco", categorias=["tipo_servico"])
@@ -0,0 +1,310 @@
+# servidor.py
+
+"""
+servidor.py
+
+Descrição:
+-----------
+Este script implementa o "modo serviço" do gerador: um servidor HTTP local (TCP ou Unix socket), com front-end
+assíncrono (asyncio), que mantém um conjunto de processos trabalhadores "aquecidos". Cada trabalhador já tem os
+geradores importados, o Faker criado e o pool de valores do Faker pré-gerado (ver trabalhadores.py), de forma
+que um pedido de geração pequeno é atendido em milissegundos, sem o custo de iniciar o `python main.py`.
+
+Funcionalidades:
+-----------------
+1. Rotas HTTP:
+   - GET /saude: retorna "ok" (útil para verificar se o servidor está no ar).
+   - POST /gerar: recebe um JSON com os parâmetros da geração e devolve o dataset gerado.
+
+2. Corpo do pedido (JSON):
+   - modo: "original" (padrão) ou "hotel" (equivale a --modo_hotel_unico).
+   - formato: "csv" (padrão) ou "arrow" (requer pyarrow).
+   - Qualquer outro parâmetro do main.py, sem os "--": registros, segmentos, data_inicio, data_fim, semente,
+     outliers, nome_hotel, total_quartos, max_clientes_por_dia, etc.
+
+3. Resposta:
+   - Enviada em streaming com `Transfer-Encoding: chunked`: o trabalhador serializa o dataset em blocos de
+     `util.LINHAS_POR_BLOCO_ENVIO` linhas e cada bloco é enviado ao cliente assim que fica pronto, por uma fila
+     (multiprocessing.Manager) de até `BLOCOS_EM_ESPERA` blocos; a resposta inteira não é montada na memória.
+   - Conexões keep-alive são mantidas, permitindo muitos pedidos pequenos pela mesma conexão.
+   - Erros de parâmetros retornam 400 com a mensagem em texto; erros inesperados, 500. Um erro depois do início
+     do envio encerra a conexão sem o bloco final, para que o cliente perceba a resposta incompleta.
+
+Uso:
+-----
+Iniciar o servidor (TCP):
+   python servidor.py --porta 8765 --trabalhadores 4
+
+Iniciar o servidor (Unix socket):
+   python servidor.py --unix_socket /tmp/gerador.sock
+
+Exemplo de pedido:
+   curl -X POST http://127.0.0.1:8765/gerar \
+      -d '{"modo": "hotel", "data_inicio": "2020-01-01", "data_fim": "2020-01-31", "semente": 42}'
+
+Observações:
+-------------
+- O servidor foi pensado para uso local (testes automatizados, notebooks); não há autenticação.
+- A mesma semente produz o mesmo dataset, independentemente do trabalhador que atender o pedido.
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import queue
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from trabalhadores import executar_geracao, executar_geracao_em_fila, inicializar_trabalhador
+
+BLOCOS_EM_ESPERA = 4
+INTERVALO_FILA = 0.1
+
+TIPOS_CONTEUDO = {
+    "csv": "text/csv; charset=utf-8",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+
+MENSAGENS_STATUS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    500: "Internal Server Error",
+}
+
+
+def _cabecalho_resposta(status, tipo_conteudo, manter_conexao, extras=None):
+    """
+    Monta o cabeçalho HTTP de uma resposta com corpo em blocos (chunked).
+    """
+    linhas = [
+        f"HTTP/1.1 {status} {MENSAGENS_STATUS[status]}",
+        f"Content-Type: {tipo_conteudo}",
+        "Transfer-Encoding: chunked",
+        f"Connection: {'keep-alive' if manter_conexao else 'close'}",
+    ]
+    for nome, valor in (extras or {}).items():
+        linhas.append(f"{nome}: {valor}")
+    return ("\r\n".join(linhas) + "\r\n\r\n").encode("latin-1")
+
+
+def _bloco_http(bloco):
+    """
+    Codifica um bloco do corpo no formato chunked.
+    """
+    return b"%x\r\n" % len(bloco) + bloco + b"\r\n"
+
+
+async def _enviar_resposta(writer, status, corpo, tipo_conteudo, manter_conexao, extras=None):
+    """
+    Envia uma resposta curta (texto de saúde ou de erro) em um único bloco.
+    """
+    writer.write(_cabecalho_resposta(status, tipo_conteudo, manter_conexao, extras))
+    if corpo:
+        writer.write(_bloco_http(corpo))
+    writer.write(b"0\r\n\r\n")
+    await writer.drain()
+
+
+def _ler_fila(fila, futuro):
+    """
+    Lê o próximo item da fila de um pedido (executado em uma thread). Se o trabalhador terminar sem enviar mais
+    nada (ex.: processo encerrado), retorna a exceção do trabalho em vez de esperar para sempre.
+    """
+    while True:
+        try:
+            return fila.get(timeout=INTERVALO_FILA)
+        except queue.Empty:
+            if futuro.done():
+                return futuro.exception() or RuntimeError("O trabalhador terminou sem enviar a resposta.")
+
+
+def _descartar_fila(fila, futuro):
+    """
+    Consome o restante da fila de um pedido abandonado, para que o trabalhador não fique esperando espaço na fila.
+    """
+    item = b""
+    while isinstance(item, bytes):
+        item = _ler_fila(fila, futuro)
+
+
+async def _gerar_e_enviar(writer, executor, gerenciador, opcoes, formato, manter_conexao):
+    """
+    Executa o pedido em um trabalhador e envia cada bloco assim que ele é serializado
+    (trabalhadores.executar_geracao_em_fila). Retorna False se a conexão precisar ser encerrada.
+    """
+    loop = asyncio.get_running_loop()
+    fila = gerenciador.Queue(maxsize=BLOCOS_EM_ESPERA)
+    try:
+        futuro = executor.submit(executar_geracao_em_fila, opcoes, formato, fila)
+    except Exception as erro:  # ex.: pool de processos encerrado; mantém o servidor no ar
+        await _enviar_resposta(writer, 500, repr(erro).encode("utf-8"), "text/plain; charset=utf-8", manter_conexao)
+        return True
+    item = await loop.run_in_executor(None, _ler_fila, fila, futuro)
+    if isinstance(item, (ValueError, RuntimeError)):
+        await _enviar_resposta(writer, 400, str(item).encode("utf-8"), "text/plain; charset=utf-8", manter_conexao)
+        return True
+    if isinstance(item, BaseException):
+        await _enviar_resposta(writer, 500, repr(item).encode("utf-8"), "text/plain; charset=utf-8", manter_conexao)
+        return True
+
+    concluido = False
+    try:
+        writer.write(_cabecalho_resposta(200, TIPOS_CONTEUDO[formato], manter_conexao, {"X-Linhas": item}))
+        while True:
+            bloco = await loop.run_in_executor(None, _ler_fila, fila, futuro)
+            if bloco is None:
+                break
+            if isinstance(bloco, BaseException):
+                # O status 200 já foi enviado: sem o bloco final, o cliente percebe a resposta incompleta
+                return False
+            writer.write(_bloco_http(bloco))
+            await writer.drain()
+        concluido = True
+    finally:
+        if not concluido:
+            loop.run_in_executor(None, _descartar_fila, fila, futuro)
+    writer.write(b"0\r\n\r\n")
+    await writer.drain()
+    return True
+
+
+async def _ler_pedido(reader):
+    """
+    Lê um pedido HTTP/1.1. Retorna (metodo, caminho, cabecalhos, corpo) ou None se a conexão foi fechada.
+    """
+    linha_inicial = await reader.readline()
+    if not linha_inicial:
+        return None
+    metodo, caminho, _versao = linha_inicial.decode("latin-1").split()
+    cabecalhos = {}
+    while True:
+        linha = await reader.readline()
+        if linha in (b"\r\n", b"\n", b""):
+            break
+        nome, _, valor = linha.decode("latin-1").partition(":")
+        cabecalhos[nome.strip().lower()] = valor.strip()
+    tamanho = int(cabecalhos.get("content-length", 0))
+    corpo = await reader.readexactly(tamanho) if tamanho else b""
+    return metodo.upper(), caminho, cabecalhos, corpo
+
+
+def _pedido_para_opcoes(corpo):
+    """
+    Converte o corpo JSON do pedido em (opcoes_do_main, formato).
+    """
+    pedido = json.loads(corpo or b"{}")
+    if not isinstance(pedido, dict):
+        raise ValueError("O corpo do pedido deve ser um objeto JSON.")
+    formato = pedido.pop("formato", "csv")
+    modo = pedido.pop("modo", "original")
+    if modo not in ("original", "hotel"):
+        raise ValueError(f"Modo '{modo}' inválido. Use 'original' ou 'hotel'.")
+    pedido["modo_hotel_unico"] = modo == "hotel"
+    return pedido, formato
+
+
+async def _atender_conexao(reader, writer, executor, gerenciador):
+    """
+    Atende todos os pedidos de uma conexão (keep-alive) até que o cliente a encerre.
+    """
+    try:
+        while True:
+            try:
+                pedido = await _ler_pedido(reader)
+            except (ValueError, asyncio.IncompleteReadError):
+                break
+            if pedido is None:
+                break
+            metodo, caminho, cabecalhos, corpo = pedido
+            manter_conexao = cabecalhos.get("connection", "").lower() != "close"
+
+            if caminho == "/saude":
+                await _enviar_resposta(writer, 200, b"ok", "text/plain", manter_conexao)
+            elif caminho != "/gerar":
+                await _enviar_resposta(writer, 404, b"rota inexistente", "text/plain", manter_conexao)
+            elif metodo != "POST":
+                await _enviar_resposta(writer, 405, b"use POST", "text/plain", manter_conexao)
+            else:
+                try:
+                    opcoes, formato = _pedido_para_opcoes(corpo)
+                except ValueError as erro:
+                    await _enviar_resposta(writer, 400, str(erro).encode("utf-8"),
+                                           "text/plain; charset=utf-8", manter_conexao)
+                else:
+                    if not await _gerar_e_enviar(writer, executor, gerenciador, opcoes, formato, manter_conexao):
+                        break
+            if not manter_conexao:
+                break
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def iniciar_servidor(host="127.0.0.1", porta=8765, unix_socket=None, trabalhadores=None,
+                           tamanho_pool_faker=5000):
+    """
+    Cria o pool de processos aquecidos e o gerenciador das filas de resposta e inicia o servidor (TCP ou Unix
+    socket; com porta 0, o sistema escolhe uma porta livre).
+    Retorna a tupla (servidor, executor, gerenciador); quem chama é responsável por encerrá-los.
+    """
+    quantidade = trabalhadores or os.cpu_count()
+    gerenciador = multiprocessing.Manager()
+    executor = ProcessPoolExecutor(
+        max_workers=quantidade,
+        initializer=inicializar_trabalhador,
+        initargs=(tamanho_pool_faker,),
+    )
+    # Aquece todos os trabalhadores antes de aceitar conexões
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(*[
+        loop.run_in_executor(executor, partial(executar_geracao, {"registros": 1}))
+        for _ in range(quantidade)
+    ])
+
+    atender = partial(_atender_conexao, executor=executor, gerenciador=gerenciador)
+    if unix_socket:
+        servidor = await asyncio.start_unix_server(atender, path=unix_socket)
+    else:
+        servidor = await asyncio.start_server(atender, host=host, port=porta)
+    return servidor, executor, gerenciador
+
+
+async def _executar(args):
+    servidor, executor, gerenciador = await iniciar_servidor(
+        host=args.host, porta=args.porta, unix_socket=args.unix_socket,
+        trabalhadores=args.trabalhadores, tamanho_pool_faker=args.tamanho_pool_faker,
+    )
+    endereco = args.unix_socket or f"http://{args.host}:{args.porta}"
+    print(f"Servidor de geração em {endereco} com {args.trabalhadores or os.cpu_count()} trabalhadores.")
+    try:
+        async with servidor:
+            await servidor.serve_forever()
+    finally:
+        executor.shutdown(cancel_futures=True)
+        gerenciador.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor local de geração de dados sintéticos.")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="Endereço TCP do servidor.")
+    parser.add_argument("--porta", type=int, default=8765, help="Porta TCP do servidor.")
+    parser.add_argument("--unix_socket", type=str, default=None,
+                        help="Caminho de um Unix socket (substitui host/porta).")
+    parser.add_argument("--trabalhadores", type=int, default=None,
+                        help="Quantidade de processos trabalhadores (padrão: número de CPUs).")
+    parser.add_argument("--tamanho_pool_faker", type=int, default=5000,
+                        help="Valores pré-gerados por método do Faker em cada trabalhador.")
+    args = parser.parse_args()
+    try:
+        asyncio.run(_executar(args))
+    except KeyboardInterrupt:
+        print("Servidor encerrado.")
+
+
+if __name__ == "__main__":
+    main()
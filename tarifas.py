@@ -0,0 +1,159 @@
+# tarifas.py
+
+"""
+tarifas.py
+
+Descrição:
+-----------
+Este módulo implementa o inventário por tipo de quarto e o calendário de tarifas do modo hotel único. Nos
+geradores anteriores, o `tipo_de_quarto` era sorteado de forma uniforme e o `valor_diaria` vinha de
+`uniform(50, 300)`, sem relação com o tipo de quarto, a data ou a demanda.
+
+Aqui, o total de quartos do hotel é dividido entre os tipos (Standard, Duplo, Suite), cada tipo com o seu próprio
+inventário de reservas (reservas.py), e as tarifas são pré-calculadas uma única vez por execução, para todos os
+tipos e dias do período:
+
+   tarifa = tarifa_base(tipo) × multiplicador(dia da semana) × multiplicador(mês) × yield(ocupação)
+
+O multiplicador de yield depende da ocupação já reservada do tipo de quarto na noite da chegada (antes das
+chegadas do dia): quanto mais cheio o hotel, maior a tarifa. A tarifa de cada hóspede é obtida por índice
+(tipo, dia) no calendário, sem sorteios por hóspede.
+
+Funcionalidades:
+-----------------
+- TIPOS_QUARTO_PADRAO: proporção dos quartos e tarifa base de cada tipo.
+- MULTIPLICADORES_DIA_SEMANA / MULTIPLICADORES_MES: sazonalidade semanal (segunda a domingo) e anual.
+- FAIXAS_YIELD / MULTIPLICADORES_YIELD: faixas de ocupação e o multiplicador de cada faixa.
+- distribuir_quartos(total_quartos, proporcoes): divide os quartos entre os tipos (maiores restos).
+- CalendarioTarifas(total_quartos, data_inicio, n_dias, tipos_quarto):
+  - procura: probabilidade de cada tipo ser pedido por um hóspede (pesos de "tipo_de_quarto" em
+    categorias.PESOS_CATEGORIAS, se configurados; senão, a proporção dos quartos).
+  - tarifas: matriz tipos × dias (base × dia da semana × mês), calculada de forma vetorizada.
+  - tarifa(tipo, dia, ocupacao): tarifa final com yield; aceita escalares ou arrays.
+- reservar_por_tipo(calendario, dias, tipos, diarias, quartos): reserva um lote de estadias no inventário de cada
+  tipo de quarto e retorna (quartos reservados, valor_diaria, inventários).
+- kpis_noites_por_tipo(inventarios, tipos): métricas de cada noite do hotel (somando os tipos) e de cada tipo.
+
+Observações:
+-------------
+- Os tipos de TIPOS_QUARTO_PADRAO seguem a ordem de `categorias.DICIONARIOS["tipo_de_quarto"]`; no motor em lote,
+  os códigos da coluna categórica `tipo_de_quarto` são o índice do tipo no calendário.
+- Os pesos de "tipo_de_quarto" do arquivo de modelo (seção "categorias") mudam apenas a procura; o inventário de
+  cada tipo continua seguindo a proporção de TIPOS_QUARTO_PADRAO.
+"""
+
+import numpy as np
+
+from categorias import DICIONARIOS, PESOS_CATEGORIAS
+from nucleo import dia_semana
+from reservas import InventarioReservas, calcular_kpis_noites
+
+# tipo: (proporção dos quartos, tarifa base)
+TIPOS_QUARTO_PADRAO = {
+    "Standard": (0.6, 120.0),
+    "Duplo": (0.3, 180.0),
+    "Suite": (0.1, 300.0),
+}
+
+MULTIPLICADORES_DIA_SEMANA = (0.9, 0.9, 0.95, 1.0, 1.15, 1.25, 1.0)  # segunda a domingo
+MULTIPLICADORES_MES = (1.3, 1.25, 1.1, 1.0, 0.9, 0.9, 1.2, 1.0, 0.95, 1.0, 1.05, 1.3)  # janeiro a dezembro
+
+FAIXAS_YIELD = (0.5, 0.7, 0.85, 0.95)  # ocupação (fração) em que cada faixa começa
+MULTIPLICADORES_YIELD = (0.9, 1.0, 1.1, 1.25, 1.4)
+
+
+def distribuir_quartos(total_quartos, proporcoes):
+    """
+    Divide o total de quartos entre os tipos conforme as proporções, pelo método dos maiores restos
+    (a soma é sempre igual ao total).
+    """
+    proporcoes = np.asarray(proporcoes, dtype=np.float64)
+    cotas = total_quartos * proporcoes / proporcoes.sum()
+    quartos = np.floor(cotas).astype(np.int64)
+    restantes = total_quartos - quartos.sum()
+    quartos[np.argsort(quartos - cotas, kind="stable")[:restantes]] += 1
+    return quartos
+
+
+def _dias_numpy(data_inicio, n_dias):
+    inicio = np.datetime64(data_inicio, "D")
+    return inicio + np.arange(n_dias)
+
+
+class CalendarioTarifas:
+    """
+    Calendário de tarifas por tipo de quarto e dia, com o inventário (quartos) de cada tipo.
+    - total_quartos: total de quartos do hotel.
+    - data_inicio: primeiro dia do período (datetime, date ou "YYYY-MM-DD").
+    - n_dias: número de dias do período.
+    - tipos_quarto: dicionário tipo -> (proporção dos quartos, tarifa base).
+    """
+
+    def __init__(self, total_quartos, data_inicio, n_dias, tipos_quarto=None):
+        tipos_quarto = tipos_quarto or TIPOS_QUARTO_PADRAO
+        self.tipos = tuple(tipos_quarto)
+        proporcoes = np.array([tipos_quarto[tipo][0] for tipo in self.tipos])
+        tarifas_base = np.array([tipos_quarto[tipo][1] for tipo in self.tipos])
+        self.proporcoes = proporcoes / proporcoes.sum()
+        self.quartos = distribuir_quartos(total_quartos, proporcoes)
+        self.procura = self.proporcoes
+        if "tipo_de_quarto" in PESOS_CATEGORIAS:
+            pesos = dict(zip(DICIONARIOS["tipo_de_quarto"], PESOS_CATEGORIAS["tipo_de_quarto"]))
+            procura = np.array([pesos.get(tipo, 0.0) for tipo in self.tipos])
+            if procura.sum() > 0:
+                self.procura = procura / procura.sum()
+
+        dias = _dias_numpy(data_inicio, n_dias)
+        mes = dias.astype("datetime64[M]").astype(np.int64) % 12
+        sazonalidade = (np.asarray(MULTIPLICADORES_DIA_SEMANA)[dia_semana(dias)]
+                        * np.asarray(MULTIPLICADORES_MES)[mes])
+        self.tarifas = tarifas_base[:, None] * sazonalidade[None, :]
+
+    def tarifa(self, tipo, dia, ocupacao):
+        """
+        Retorna a tarifa (valor_diaria) do tipo de quarto no dia, com o multiplicador de yield da ocupação
+        (fração de 0 a 1 dos quartos do tipo já reservados). Aceita escalares ou arrays.
+        """
+        faixa = np.searchsorted(FAIXAS_YIELD, ocupacao, side="right")
+        return np.round(self.tarifas[tipo, dia] * np.asarray(MULTIPLICADORES_YIELD)[faixa], 2)
+
+
+def reservar_por_tipo(calendario, dias, tipos, diarias, quartos):
+    """
+    Reserva um lote de estadias (ordenado por dia de chegada) no inventário do seu tipo de quarto.
+    - tipos: índice do tipo de cada estadia no calendário.
+    Retorna (quartos reservados, valor_diaria, lista de InventarioReservas por tipo). A tarifa usa a ocupação
+    do tipo na noite da chegada antes das chegadas do dia.
+    """
+    dias = np.asarray(dias, dtype=np.int64)
+    reservados = np.zeros(len(dias), dtype=np.int64)
+    valor_diaria = np.zeros(len(dias))
+    n_dias = calendario.tarifas.shape[1]
+    inventarios = []
+    for indice, quartos_tipo in enumerate(calendario.quartos):
+        selecionados = np.flatnonzero(tipos == indice)
+        dias_tipo = dias[selecionados]
+        inventario = InventarioReservas(int(quartos_tipo), n_dias)
+        reservados[selecionados] = inventario.reservar_lote(dias_tipo, diarias[selecionados],
+                                                            quartos[selecionados])
+        ocupacao = inventario.ocupacao_previa[dias_tipo] / max(int(quartos_tipo), 1)
+        valor_diaria[selecionados] = calendario.tarifa(indice, dias_tipo, ocupacao)
+        inventario.adicionar_receita(dias_tipo, diarias[selecionados],
+                                     reservados[selecionados] * valor_diaria[selecionados])
+        inventarios.append(inventario)
+    return reservados, valor_diaria, inventarios
+
+
+def kpis_noites_por_tipo(inventarios, tipos):
+    """
+    Combina os inventários de cada tipo de quarto. Retorna (kpis do hotel, kpis por tipo), onde os kpis do hotel
+    têm as mesmas chaves de `InventarioReservas.kpis_noites` e os kpis por tipo são {tipo: kpis do tipo}.
+    """
+    por_tipo = {tipo: inventario.kpis_noites() for tipo, inventario in zip(tipos, inventarios)}
+    hotel = calcular_kpis_noites(
+        sum(kpis["quartos_ocupados"] for kpis in por_tipo.values()),
+        sum(kpis["receita_quartos"] for kpis in por_tipo.values()),
+        sum(inventario.total_quartos for inventario in inventarios),
+    )
+    return hotel, por_tipo
+
@@ -0,0 +1,118 @@
+# testes/test_armazenamento.py
+import os
+import random
+import tempfile
+import unittest
+from datetime import datetime
+
+import numpy as np
+from faker import Faker
+
+from armazenamento import ArmazenamentoColunar
+from config import CABECALHO_ORIGINAL, TIPOS_COLUNAS_ORIGINAL
+from geradores import gerar_data_aleatoria, gerar_dados_empresa
+from main import construir_parser, gerar_dataset_colunar, salvar_dataset
+from util import definir_semente
+
+
+class TestArmazenamentoColunar(unittest.TestCase):
+
+    def setUp(self):
+        """Gera algumas linhas do modo original com semente fixa."""
+        fake = Faker("pt_BR")
+        definir_semente(5, fake)
+        self.dados = []
+        dados_anteriores = None
+        for i in range(1, 1001):
+            segmento = random.choice(["TI", "Varejo", "Hotelaria", "Educação"])
+            data_registro = gerar_data_aleatoria(datetime(2020, 1, 1), datetime(2020, 3, 1))
+            linha = gerar_dados_empresa(fake, segmento, data_registro, dados_anteriores)
+            self.dados.append([i] + linha)
+            dados_anteriores = linha
+        self.diretorio = tempfile.mkdtemp()
+
+    def test_ordenacao_igual_a_lista_em_memoria(self):
+        """A ordem calculada em blocos deve ser a mesma da ordenação estável em memória."""
+        armazenamento = ArmazenamentoColunar(self.diretorio, CABECALHO_ORIGINAL, TIPOS_COLUNAS_ORIGINAL, 1200)
+        for inicio in range(0, len(self.dados), 170):
+            armazenamento.anexar(self.dados[inicio:inicio + 170])
+        armazenamento.ordenar("data", tamanho_bloco=97)
+
+        esperado = sorted(self.dados, key=lambda x: x[1])
+        self.assertEqual(armazenamento.ler_bloco(0, 1200), esperado)
+
+    def test_mesmo_csv_em_qualquer_armazenamento(self):
+        """Com a mesma semente, memoria, colunar e mmap gravam o mesmo CSV, inclusive com outliers."""
+        conteudos = []
+        for armazenamento in ("memoria", "colunar", "mmap"):
+            caminho = os.path.join(self.diretorio, f"{armazenamento}.csv")
+            args = construir_parser().parse_args([
+                "--registros", "1500", "--semente", "7", "--outliers", "0.2", "--armazenamento", armazenamento,
+                "--arquivo_saida", caminho, "--diretorio_mmap", os.path.join(self.diretorio, "colunas")])
+            fake = Faker("pt_BR")
+            definir_semente(args.semente, fake)
+            if armazenamento == "memoria":
+                salvar_dataset(args, fake)
+            else:
+                gerar_dataset_colunar(args, fake).exportar_csv(caminho)
+            with open(caminho, "rb") as arquivo:
+                conteudos.append(arquivo.read())
+        self.assertEqual(conteudos[0], conteudos[1])
+        self.assertEqual(conteudos[0], conteudos[2])
+
+    def test_reabrir_e_outliers(self):
+        """O armazenamento reaberto mantém a ordem, e os outliers respeitam os limites."""
+        armazenamento = ArmazenamentoColunar(self.diretorio, CABECALHO_ORIGINAL, TIPOS_COLUNAS_ORIGINAL, 1000)
+        armazenamento.anexar(self.dados)
+        armazenamento.ordenar("data")
+        armazenamento.salvar_metadados()
+
+        reaberto = ArmazenamentoColunar.abrir(self.diretorio)
+        definir_semente(1)
+        reaberto.aplicar_outliers(1.0)
+        linhas = reaberto.ler_bloco(0, 1000)
+        self.assertEqual([linha[0] for linha in linhas],
+                         [linha[0] for linha in sorted(self.dados, key=lambda x: x[1])])
+        self.assertTrue(all(linha[8] >= 1 for linha in linhas))  # numero_clientes
+
+    def test_colunas_tipadas_na_memoria(self):
+        """Sem diretório, as colunas usam tipos estreitos e devolvem as mesmas linhas do armazenamento em arquivos."""
+        memoria = ArmazenamentoColunar(None, CABECALHO_ORIGINAL, TIPOS_COLUNAS_ORIGINAL, 1001)
+        arquivos = ArmazenamentoColunar(self.diretorio, CABECALHO_ORIGINAL, TIPOS_COLUNAS_ORIGINAL, 1001)
+        for armazenamento in (memoria, arquivos):
+            for inicio in range(0, len(self.dados), 170):
+                armazenamento.anexar(self.dados[inicio:inicio + 170])
+            definir_semente(2)
+            armazenamento.aplicar_outliers(0.3)
+            armazenamento.ordenar("data")
+        self.assertEqual(memoria.ler_bloco(0, 1000), arquivos.ler_bloco(0, 1000))
+        self.assertEqual((memoria.colunas["mes"].dtype, memoria.colunas["segmento"].dtype), (np.int8, np.int8))
+        self.assertIn(memoria.colunas["receita"].dtype, (np.int16, np.int32))
+        self.assertLess(sum(coluna.nbytes for coluna in memoria.colunas.values()),
+                        sum(coluna.nbytes for coluna in arquivos.colunas.values()) / 3)
+
+        # um valor com mais de duas casas decimais passa a coluna para float64, sem alterar as linhas anteriores
+        antes, ordem = memoria.colunas_bloco(0, 1000)["receita"], memoria.ordem
+        linha = list(self.dados[0])
+        linha[CABECALHO_ORIGINAL.index("receita")] = 1.2345
+        memoria.anexar([linha])
+        self.assertEqual(memoria.colunas["receita"].dtype, np.float64)
+        self.assertEqual(memoria.ler_bloco(1000, 1001)[0][CABECALHO_ORIGINAL.index("receita")], 1.2345)
+        np.testing.assert_array_equal(memoria.colunas["receita"][:1000][ordem], antes)
+
+    def test_bitmap_de_validade(self):
+        """Na memória, os None das métricas de segmento ficam em um bitmap de 1 bit por linha, não nos valores."""
+        memoria = ArmazenamentoColunar(None, CABECALHO_ORIGINAL, TIPOS_COLUNAS_ORIGINAL, 1000)
+        for inicio in range(0, len(self.dados), 333):
+            memoria.anexar(self.dados[inicio:inicio + 333])
+        evasao = CABECALHO_ORIGINAL.index("taxa_evasao")
+        self.assertEqual([linha[evasao] for linha in memoria.ler_bloco(0, 1000)],
+                         [linha[evasao] for linha in self.dados])
+        self.assertEqual(memoria.validade["taxa_evasao"].nbytes, 125)
+        nulos = np.array([linha[evasao] is None for linha in self.dados])
+        self.assertTrue(np.all(memoria.colunas["taxa_evasao"][nulos] == 0))
+        self.assertNotIn("receita", memoria.validade)
+
+
+if __name__ == "__main__":
+    unittest.main()
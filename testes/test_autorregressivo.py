@@ -0,0 +1,48 @@
+# testes/test_autorregressivo.py
+import unittest
+
+import numpy as np
+
+from autorregressivo import MotorAR, PassoAR
+from geradores_lote import gerar_colunas_original
+
+
+class TestAutorregressivo(unittest.TestCase):
+
+    def test_passo_do_motor(self):
+        """Um passo respeita reversão à média, janelas inteiras, limites, valores ausentes e a máscara."""
+        motor = MotorAR({
+            "media": PassoAR("normal", 0.0, coeficiente=0.5, media=50.0),
+            "janela": PassoAR("uniforme", 2, minimo=0, maximo=5, inteiro=True),
+            "lognormal": PassoAR("lognormal", 0.2),
+        })
+        estado = np.array([[10.0, 5.0, 100.0]] * 5000)
+        estado[0, 2] = 0.0  # lognormal: <= 0 conta como ausente
+        mascara = np.ones(estado.shape, dtype=bool)
+        mascara[1, :] = False
+        novo = motor.avancar(estado, np.random.default_rng(4), mascara)
+
+        self.assertTrue(np.all(novo[2:, 0] == 30.0))
+        self.assertEqual(set(np.unique(novo[2:, 1])), {3.0, 4.0, 5.0})
+        self.assertTrue(np.isnan(novo[0, 2]))
+        np.testing.assert_array_equal(novo[1], estado[1])
+
+    def test_series_em_lote(self):
+        """Com `entidades`, cada empresa tem uma linha por dia e as métricas variam dentro das janelas."""
+        colunas = gerar_colunas_original(0, ["Hotelaria", "Varejo"], "2023-01-01", "2023-03-31", outliers=0.0,
+                                         rng=np.random.default_rng(3), entidades=20)
+        self.assertEqual(len(colunas["data"]), 20 * 90)
+        self.assertTrue(np.all(np.diff(colunas["data"].astype(np.int64)) >= 0))
+
+        segmento = colunas["segmento"].valores().reshape(90, 20)
+        self.assertTrue(np.all(segmento == segmento[0]))
+        nps = colunas["NPS"].reshape(90, 20)
+        self.assertTrue(np.all(np.abs(np.diff(nps, axis=0)) <= 20))
+        ocupacao = colunas["taxa_ocupacao"].reshape(90, 20)
+        hotelaria = segmento[0] == "Hotelaria"
+        self.assertTrue(np.all(np.isnan(ocupacao[:, ~hotelaria])))
+        self.assertTrue(np.all(np.abs(np.diff(ocupacao[:, hotelaria], axis=0)) < 15))
+
+
+if __name__ == "__main__":
+    unittest.main()
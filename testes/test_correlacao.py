@@ -0,0 +1,46 @@
+# testes/test_correlacao.py
+import unittest
+
+import numpy as np
+
+from correlacao import BlocoCorrelacionado, fixar_correlacionados
+from geradores import DISTRIBUICOES_EMPRESA
+from geradores_lote import gerar_colunas_original
+from nucleo import Constante
+
+
+class TestCorrelacao(unittest.TestCase):
+
+    def test_blocos_correlacionados_em_lote(self):
+        """As métricas do bloco variam juntas e mantêm as marginais (limites) das distribuições."""
+        parametros = dict(registros=20000, segmentos=["Varejo"], data_inicio="2023-01-01", data_fim="2023-12-31",
+                          outliers=0.0)
+        independentes = gerar_colunas_original(rng=np.random.default_rng(8), **parametros)
+        colunas = gerar_colunas_original(rng=np.random.default_rng(8), correlacionar=True, **parametros)
+
+        def r(dados, a, b):
+            return np.corrcoef(dados[a], dados[b])[0, 1]
+
+        self.assertLess(abs(r(independentes, "investimento_publicidade", "impressoes")), 0.05)
+        self.assertGreater(r(colunas, "investimento_publicidade", "impressoes"), 0.6)
+        self.assertLess(r(colunas, "taxa_retencao", "churn_rate"), -0.6)
+        self.assertEqual((colunas["NPS"].min(), colunas["NPS"].max()), (-100, 100))
+        self.assertTrue(np.all((colunas["avaliacao_media"] >= 1.0) & (colunas["avaliacao_media"] <= 5.0)))
+        self.assertEqual(colunas["numero_clientes"].dtype, np.int64)
+
+    def test_matriz_invalida_e_motor_escalar(self):
+        """Matrizes inválidas são rejeitadas; no motor escalar, as métricas dos blocos viram constantes."""
+        with self.assertRaises(ValueError):
+            BlocoCorrelacionado("x", ["NPS", "CSAT"], [[1.0, 0.5], [0.4, 1.0]])
+        with self.assertRaises(ValueError):
+            BlocoCorrelacionado("x", ["NPS", "CSAT"], [[1.0, 1.5], [1.5, 1.0]])
+
+        np.random.seed(2)
+        fixadas = fixar_correlacionados(DISTRIBUICOES_EMPRESA)
+        self.assertIsInstance(fixadas["NPS"], Constante)
+        self.assertIs(fixadas["fator_custo"], DISTRIBUICOES_EMPRESA["fator_custo"])
+        self.assertIsInstance(fixadas["numero_clientes"].sortear(), int)
+
+
+if __name__ == "__main__":
+    unittest.main()
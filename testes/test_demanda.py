@@ -0,0 +1,36 @@
+# testes/test_demanda.py
+import unittest
+
+import numpy as np
+
+from demanda import ModeloDemanda, feriados_nacionais
+
+
+class TestDemanda(unittest.TestCase):
+
+    def test_feriados_moveis(self):
+        """Carnaval, Sexta-feira Santa e Corpus Christi calculados a partir da Páscoa."""
+        feriados = feriados_nacionais([2024]).astype(str).tolist()
+        self.assertIn("2024-02-13", feriados)
+        self.assertIn("2024-03-29", feriados)
+        self.assertIn("2024-05-30", feriados)
+
+    def test_chegadas_seguem_intensidade(self):
+        """As chegadas sorteadas têm, em média, a intensidade do modelo, com mais dispersão na binomial negativa."""
+        rng = np.random.default_rng(7)
+        for modelo in ("poisson", "binomial_negativa"):
+            demanda = ModeloDemanda(modelo, media=40.0, dispersao=4.0)
+            intensidade = demanda.intensidades("2023-01-01", 365, total_quartos=100)
+            chegadas = np.stack([demanda.chegadas(rng, "2023-01-01", 365, 100) for _ in range(200)])
+            self.assertLess(abs(chegadas.mean() / intensidade.mean() - 1), 0.02)
+        self.assertGreater(intensidade[5], intensidade[1])  # sexta-feira 06/01 > segunda-feira 02/01
+        self.assertGreater(chegadas.var(axis=0).mean(), intensidade.mean() * 2)
+
+    def test_media_pela_ocupacao_alvo(self):
+        demanda = ModeloDemanda("poisson", ocupacao_alvo=0.75)
+        # 01/03/2023: quarta-feira (0.9) em março (1.0); 600 × 0.75 / (4 diárias × 1.5 quartos) = 75
+        self.assertAlmostEqual(demanda.intensidades("2023-03-01", 1, total_quartos=600)[0], 75.0 * 0.9)
+
+
+if __name__ == "__main__":
+    unittest.main()
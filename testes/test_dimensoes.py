@@ -0,0 +1,46 @@
+# testes/test_dimensoes.py
+import unittest
+
+import numpy as np
+
+from config import CABECALHO_HOTEL_HOSPEDES, CABECALHO_ORIGINAL
+from dimensoes import Dimensoes, com_chaves
+from geradores_lote import gerar_colunas_original, gerar_tabelas_hotel
+
+
+class TestDimensoes(unittest.TestCase):
+
+    def test_fatos_do_modo_original_com_chaves(self):
+        """Os fatos guardam chaves das dimensões; o segmento de cada linha é o da empresa sorteada."""
+        dimensoes = Dimensoes(empresas=200, cidades=30, zipf=1.2)
+        colunas = gerar_colunas_original(20_000, ["TI", "Varejo", "SaaS"], "2023-01-01", "2023-12-31",
+                                         rng=np.random.default_rng(6), dimensoes=dimensoes)
+        self.assertEqual(list(colunas), com_chaves(CABECALHO_ORIGINAL))
+        self.assertEqual(colunas["empresa_id"].dtype, np.int64)
+        self.assertTrue(np.all((colunas["cidade_id"] >= 1) & (colunas["cidade_id"] <= 30)))
+
+        empresas = dimensoes.tabelas["empresas"]
+        self.assertEqual(list(empresas), ["empresa_id", "empresa", "segmento"])
+        np.testing.assert_array_equal(empresas["empresa_id"], np.arange(1, 201))
+        np.testing.assert_array_equal(empresas["segmento"].valores()[colunas["empresa_id"] - 1],
+                                      colunas["segmento"].valores())
+        # Zipf: P(chave 1) = 1 / soma(1 / k^1.2) para k = 1..200
+        esperado = 1.0 / np.sum(1.0 / np.arange(1, 201) ** 1.2)
+        self.assertAlmostEqual(np.mean(colunas["empresa_id"] == 1), esperado, delta=0.01)
+
+    def test_hospedes_que_retornam(self):
+        """No hotel, a chave hospede_id vem de uma dimensão menor do que o número de hóspedes."""
+        dimensoes = Dimensoes(hospedes=100)
+        hospedes, _ = gerar_tabelas_hotel(total_quartos=30, data_inicio="2023-01-01", data_fim="2023-06-30",
+                                          rng=np.random.default_rng(7), dimensoes=dimensoes)
+        self.assertEqual(list(hospedes), com_chaves(CABECALHO_HOTEL_HOSPEDES))
+        self.assertNotIn("nome_cliente", hospedes)
+        self.assertLessEqual(len(np.unique(hospedes["hospede_id"])), 100)
+        self.assertGreater(len(hospedes["hospede_id"]), 100)
+        self.assertEqual(len(dimensoes.tabelas["hospedes"]["nome_cliente"]), 100)
+        with self.assertRaises(ValueError):
+            Dimensoes(zipf=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+# testes/test_equivalencia.py
+import argparse
+import unittest
+from datetime import datetime
+
+import numpy as np
+
+from config import TIPOS_COLUNAS_ORIGINAL
+from equivalencia import CENARIOS, comparar_datasets, ks_duas_amostras, qui_quadrado
+from geradores_lote import gerar_colunas_original
+
+
+class TestEquivalencia(unittest.TestCase):
+
+    def test_comparacao_por_coluna(self):
+        """Colunas exatas, numéricas e categóricas: diferenças reais são detectadas e sementes distintas passam."""
+        parametros = (20_000, ["Varejo", "TI", "SaaS"], "2022-01-01", "2022-12-31", 0.0)
+        referencia = gerar_colunas_original(*parametros, rng=np.random.default_rng(1))
+        candidata = gerar_colunas_original(*parametros, rng=np.random.default_rng(2))
+        resultados = comparar_datasets(referencia, candidata, TIPOS_COLUNAS_ORIGINAL)
+        self.assertEqual([nome for nome, _, aprovada, _ in resultados if not aprovada], [])
+        metodos = {nome: metodo for nome, metodo, _, _ in resultados}
+        self.assertEqual((metodos["receita"], metodos["data"], metodos["segmento"], metodos["empresa"]),
+                         ("ks", "ks", "qui_quadrado", "ignorada"))
+
+        candidata["receita"] = candidata["receita"] * 1.05
+        copia = dict(referencia, lucro=referencia["lucro"].copy())
+        copia["lucro"][7] = -1.0
+        reprovadas = {nome: detalhe for nome, _, aprovada, detalhe in
+                      comparar_datasets(referencia, candidata, TIPOS_COLUNAS_ORIGINAL) if not aprovada}
+        self.assertEqual(list(reprovadas), ["receita"])
+        exatas = [(nome, detalhe) for nome, _, aprovada, detalhe in
+                  comparar_datasets(referencia, copia, TIPOS_COLUNAS_ORIGINAL, exatas=True) if not aprovada]
+        self.assertEqual(exatas, [("lucro", "1 de 20000 valores diferentes (primeira linha: 7)")])
+
+        self.assertEqual(ks_duas_amostras(np.arange(10.0), np.arange(10.0)), 0.0)
+        self.assertAlmostEqual(ks_duas_amostras(np.arange(10.0), np.arange(5.0, 15.0)), 0.5)
+        self.assertGreater(qui_quadrado({"a": 500, "b": 500}, {"a": 510, "b": 490})[2], 0.5)
+        self.assertLess(qui_quadrado({"a": 500, "b": 500}, {"a": 600, "b": 400})[2], 1e-4)
+
+    def test_cenarios(self):
+        """Os cenários de referência × otimizado são equivalentes em pequena escala."""
+        opcoes = argparse.Namespace(registros=3000, segmentos=["Varejo", "Educação", "SaaS"],
+                                    data_inicio=datetime(2022, 1, 1), data_fim=datetime(2022, 6, 30),
+                                    total_quartos=30, max_clientes_por_dia=12, outliers=0.2, semente=5)
+        for cenario, executar in CENARIOS.items():
+            with self.subTest(cenario=cenario):
+                referencia, candidata, parametros = executar(opcoes)
+                resultados = comparar_datasets(referencia, candidata, **parametros)
+                self.assertEqual([nome for nome, _, aprovada, _ in resultados if not aprovada], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+# testes/test_escala.py
+import unittest
+
+import numpy as np
+
+from dimensoes import Dimensoes
+from escala import LINHAS_POR_PEDACO, parametros_escala, trabalhos_escala
+from geradores_lote import gerar_colunas_original
+
+
+class TestEscala(unittest.TestCase):
+
+    def test_parametros_e_pedacos(self):
+        """O fator define os parâmetros de forma determinística; os pedaços somam os registros sem repetir ids."""
+        sf1, sf100 = parametros_escala(1), parametros_escala(100)
+        self.assertEqual(sf1["registros"], 1_000_000)
+        self.assertEqual(sf100["registros"], 100_000_000)
+        self.assertEqual((sf1["data_inicio"], sf1["data_fim"]), ("2020-01-01", "2020-12-31"))
+        self.assertEqual(sf100["data_fim"], "2022-12-31")
+        self.assertEqual((sf1["num_empresas"], sf1["num_cidades"]), (10_000, 500))
+        self.assertEqual(sf100["num_cidades"], 5000)
+        self.assertEqual(parametros_escala(1), sf1)
+        with self.assertRaises(ValueError):
+            parametros_escala(0)
+
+        trabalhos = trabalhos_escala(1.1, {"zipf": 1.1}, "sf", semente=3)
+        self.assertEqual(len(trabalhos), 5)
+        self.assertTrue(all(t["registros"] <= LINHAS_POR_PEDACO and t["zipf"] == 1.1 for t in trabalhos))
+        self.assertEqual(sum(t["registros"] for t in trabalhos), 1_100_000)
+        self.assertEqual([t["primeiro_id"] for t in trabalhos[:2]], [1, 1 + trabalhos[0]["registros"]])
+        self.assertEqual(len({t["semente"] for t in trabalhos}), 5)
+        self.assertEqual(len({t["semente_dimensoes"] for t in trabalhos}), 1)
+        self.assertEqual([t["omitir_tabelas_dimensao"] for t in trabalhos], [False] + [True] * 4)
+        self.assertEqual(trabalhos, trabalhos_escala(1.1, {"zipf": 1.1}, "sf", semente=3))
+
+        hoteis = trabalhos_escala(1, {"modo_hotel_unico": True}, "sf", semente=3)
+        self.assertEqual(len(hoteis), sf1["hoteis"])
+        self.assertEqual(hoteis[0]["demanda"], "poisson")
+        self.assertEqual(len({t["nome_hotel"] for t in hoteis}), len(hoteis))
+
+    def test_pedacos_compartilham_dimensoes(self):
+        """Com a semente das dimensões, pedaços com sementes diferentes geram as mesmas tabelas de dimensão."""
+        dimensoes = [Dimensoes(50, 20, semente=9), Dimensoes(50, 20, semente=9)]
+        primeiro, segundo = [gerar_colunas_original(1000, ["TI", "Varejo", "SaaS"], "2020-01-01", "2020-12-31",
+                                                    rng=np.random.default_rng(semente), dimensoes=d,
+                                                    primeiro_id=primeiro_id)
+                             for semente, d, primeiro_id in ((1, dimensoes[0], 1), (2, dimensoes[1], 1001))]
+        np.testing.assert_array_equal(np.sort(np.concatenate([primeiro["registro_id"], segundo["registro_id"]])),
+                                      np.arange(1, 2001))
+        self.assertFalse(np.array_equal(primeiro["receita"], segundo["receita"]))
+        for dimensao in ("empresas", "cidades"):
+            for coluna, valores in dimensoes[0].tabelas[dimensao].items():
+                outros = dimensoes[1].tabelas[dimensao][coluna]
+                if coluna == "segmento":
+                    valores, outros = valores.valores(), outros.valores()
+                self.assertEqual(list(valores), list(outros))
+
+
+if __name__ == "__main__":
+    unittest.main()
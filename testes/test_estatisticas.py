@@ -0,0 +1,76 @@
+# testes/test_estatisticas.py
+import os
+import tempfile
+import unittest
+from functools import partial
+
+import numpy as np
+
+from config import CABECALHO_ORIGINAL, TIPOS_COLUNAS_ORIGINAL
+from estatisticas import AcumuladorEstatisticas
+from geradores_lote import gerar_colunas_original
+from particionamento import criar_particoes_csv
+from util import criar_arquivo_csv, linhas_de_colunas
+
+
+class TestEstatisticas(unittest.TestCase):
+
+    def test_colunas_e_linhas_em_blocos(self):
+        """As estatísticas acumuladas em blocos coincidem com o cálculo direto, em colunas ou em linhas."""
+        colunas = gerar_colunas_original(4000, ["Varejo", "Educação", "SaaS"], "2022-01-01", "2022-12-31",
+                                         rng=np.random.default_rng(8))
+        por_colunas = AcumuladorEstatisticas(CABECALHO_ORIGINAL, TIPOS_COLUNAS_ORIGINAL)
+        por_colunas.atualizar(colunas, tamanho_bloco=700)
+        por_linhas = AcumuladorEstatisticas(CABECALHO_ORIGINAL, TIPOS_COLUNAS_ORIGINAL)
+        por_linhas.atualizar(list(linhas_de_colunas(CABECALHO_ORIGINAL, colunas)), tamanho_bloco=700)
+        resultado = por_colunas.resultado()
+        self.assertEqual(resultado, por_linhas.resultado())
+
+        receita = resultado["colunas"]["receita"]
+        self.assertEqual(receita["contagem"], 4000)
+        self.assertAlmostEqual(receita["media"], colunas["receita"].mean(), places=4)
+        self.assertAlmostEqual(receita["desvio"], colunas["receita"].std(ddof=1), places=4)
+        self.assertEqual(receita["maximo"], colunas["receita"].max())
+        # menos valores do que o reservatório: quantis exatos
+        self.assertAlmostEqual(receita["quantis"]["p50"], np.median(colunas["receita"]), places=4)
+
+        evasao = resultado["colunas"]["taxa_evasao"]
+        educacao = colunas["segmento"].valores() == "Educação"
+        self.assertEqual((evasao["contagem"], evasao["nulos"]), (educacao.sum(), 4000 - educacao.sum()))
+        segmento = resultado["colunas"]["segmento"]
+        self.assertEqual(segmento["frequencias"]["SaaS"], (colunas["segmento"].valores() == "SaaS").sum())
+        self.assertEqual(resultado["colunas"]["data"]["minimo"], str(colunas["data"].min()))
+
+    def test_reservatorio_e_alta_cardinalidade(self):
+        """Os quantis vêm de uma amostra limitada; colunas com muitos valores distintos deixam as frequências."""
+        rng = np.random.default_rng(3)
+        acumulador = AcumuladorEstatisticas(["valor", "nome"], {"valor": "decimal", "nome": "texto"},
+                                            tamanho_reservatorio=2000, max_categorias=50)
+        for _ in range(20):
+            valores = rng.normal(100.0, 10.0, 5000)
+            acumulador.atualizar({"valor": valores, "nome": np.array([f"n{i}" for i in rng.integers(0, 80, 5000)],
+                                                                     dtype=object)})
+        resultado = acumulador.resultado()["colunas"]
+        self.assertEqual(len(acumulador.colunas["valor"].amostra), 2000)
+        self.assertAlmostEqual(resultado["valor"]["media"], 100.0, delta=0.2)
+        self.assertAlmostEqual(resultado["valor"]["quantis"]["p95"], 100.0 + 1.645 * 10.0, delta=1.5)
+        self.assertNotIn("frequencias", resultado["nome"])
+        self.assertEqual(resultado["nome"]["contagem"], 100_000)
+
+    def test_estatisticas_durante_a_gravacao(self):
+        """Os blocos gravados no CSV (único ou particionado) alimentam as estatísticas, como o cálculo direto."""
+        colunas = gerar_colunas_original(60_000, ["Varejo", "TI"], "2022-01-01", "2022-12-31",
+                                         rng=np.random.default_rng(2))
+        direto = AcumuladorEstatisticas(CABECALHO_ORIGINAL, TIPOS_COLUNAS_ORIGINAL, rng=np.random.default_rng(1))
+        direto.atualizar(colunas)
+        with tempfile.TemporaryDirectory() as diretorio:
+            for gravar in (partial(criar_arquivo_csv, os.path.join(diretorio, "dados.csv")),
+                           partial(criar_particoes_csv, os.path.join(diretorio, "particoes"))):
+                gravadas = AcumuladorEstatisticas(CABECALHO_ORIGINAL, TIPOS_COLUNAS_ORIGINAL,
+                                                  rng=np.random.default_rng(1))
+                gravar(CABECALHO_ORIGINAL, colunas, estatisticas=gravadas)
+                self.assertEqual(gravadas.resultado(), direto.resultado())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+# testes/test_executor_lote.py
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+
+from executor_lote import carregar_manifesto, executar_lote
+
+
+class TestExecutorLote(unittest.TestCase):
+
+    def _manifesto(self, diretorio, conteudo):
+        caminho = os.path.join(diretorio, "manifesto.json")
+        with open(caminho, "w", encoding="utf-8") as arquivo:
+            json.dump(conteudo, arquivo)
+        return caminho
+
+    def test_carregar_manifesto(self):
+        """Os valores de "padrao" valem para todos os trabalhos; arquivos derivados repetidos são recusados."""
+        with tempfile.TemporaryDirectory() as diretorio:
+            trabalhos, trabalhadores = carregar_manifesto(self._manifesto(diretorio, {
+                "trabalhadores": 2,
+                "padrao": {"registros": 10, "semente": 1},
+                "trabalhos": [{"nome": "a", "arquivo_saida": "a.csv"},
+                              {"registros": 20, "arquivo_saida": "b.csv"}],
+            }))
+            self.assertEqual(trabalhadores, 2)
+            self.assertEqual(trabalhos, [
+                {"registros": 10, "semente": 1, "nome": "a", "arquivo_saida": "a.csv"},
+                {"registros": 20, "semente": 1, "arquivo_saida": "b.csv"},
+            ])
+
+            # Arquivos principais diferentes, mas o mesmo estado dos rollups
+            hotel = {"modo_hotel_unico": True, "rollups": True, "estado_rollups": "estado.json"}
+            with self.assertRaisesRegex(ValueError, "estado.json"):
+                carregar_manifesto(self._manifesto(diretorio, [
+                    {**hotel, "arquivo_saida": "h1.csv"}, {**hotel, "arquivo_saida": "h2.csv"},
+                ]))
+
+    def test_trabalho_com_erro(self):
+        """Um trabalho com opções inválidas falha com a mensagem de validação sem interromper os demais."""
+        with tempfile.TemporaryDirectory() as diretorio:
+            valido = os.path.join(diretorio, "valido.csv")
+            trabalhos = [
+                {"nome": "valido", "registros": 5, "semente": 1, "arquivo_saida": valido},
+                {"nome": "invalido", "registros": 5, "entidades": 3,
+                 "arquivo_saida": os.path.join(diretorio, "invalido.csv")},
+            ]
+            resultados = {r["nome"]: r for r in asyncio.run(executar_lote(trabalhos, 1, tamanho_pool_faker=50))}
+            self.assertIsNone(resultados["valido"]["erro"])
+            self.assertEqual(resultados["valido"]["linhas"], 5)
+            self.assertTrue(os.path.exists(valido))
+            self.assertIn("--entidades", resultados["invalido"]["erro"])
+            self.assertFalse(os.path.exists(os.path.join(diretorio, "invalido.csv")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+# testes/test_geradores_lote.py
+import unittest
+
+import numpy as np
+
+from config import CABECALHO_HOTEL, CABECALHO_HOTEL_KPIS_DIARIOS, CABECALHO_ORIGINAL
+from dataframes import gerar_dataframe, pd
+from dimensoes import Dimensoes
+from geradores_lote import gerar_colunas_hotel, gerar_colunas_original, gerar_tabelas_hotel
+from util import serializar_csv
+
+
+class TestGeradoresLote(unittest.TestCase):
+
+    def test_colunas_original(self):
+        """Testa colunas, ordenação por data e métricas específicas de segmento."""
+        colunas = gerar_colunas_original(5000, ["TI", "Hotelaria", "Varejo"], "2023-01-01", "2023-12-31",
+                                         rng=np.random.default_rng(1))
+        self.assertEqual(list(colunas), CABECALHO_ORIGINAL)
+        self.assertTrue(all(len(valores) == 5000 for valores in colunas.values()))
+        self.assertTrue(np.all(np.diff(colunas["data"].astype(np.int64)) >= 0))
+        hotelaria = colunas["segmento"].valores() == "Hotelaria"
+        self.assertTrue(np.all(np.isnan(colunas["taxa_ocupacao"][~hotelaria])))
+        self.assertFalse(np.any(np.isnan(colunas["taxa_ocupacao"][hotelaria])))
+
+    def test_colunas_hotel_respeitam_quartos(self):
+        """Os quartos ocupados no dia nunca passam do total de quartos do hotel."""
+        colunas = gerar_colunas_hotel(total_quartos=4, data_inicio="2023-01-01", data_fim="2023-03-31",
+                                      max_clientes_por_dia=6, rng=np.random.default_rng(2))
+        self.assertEqual(list(colunas), CABECALHO_HOTEL)
+        self.assertTrue(np.all(colunas["quartos_ocupados_dia"] <= 4))
+        self.assertTrue(np.all(colunas["ocupacao_diaria"] <= 100))
+
+    def test_tabelas_hotel_normalizadas(self):
+        """A tabela de KPIs tem uma linha por dia e, junto aos hóspedes, reproduz o layout desnormalizado."""
+        parametros = dict(total_quartos=10, data_inicio="2023-01-01", data_fim="2023-02-28")
+        hospedes, kpis = gerar_tabelas_hotel(rng=np.random.default_rng(6), **parametros)
+        colunas = gerar_colunas_hotel(rng=np.random.default_rng(6), **parametros)
+        self.assertEqual(list(kpis), CABECALHO_HOTEL_KPIS_DIARIOS)
+        self.assertEqual(len(kpis["data"]), 59)
+        indice_dia = (hospedes["data"] - kpis["data"][0]).astype(np.int64)
+        for nome in ("ocupacao_diaria", "adr_dia", "goppar_dia", "receita_quartos_suite_dia"):
+            np.testing.assert_array_equal(kpis[nome][indice_dia], colunas[nome])
+        np.testing.assert_array_equal(hospedes["total_pago"], colunas["total_pago"])
+
+    def test_categorias_codificadas(self):
+        """Colunas categóricas usam códigos int8 e são escritas como texto no CSV."""
+        colunas = gerar_colunas_original(200, ["TI", "Varejo"], "2023-01-01", "2023-01-31",
+                                         rng=np.random.default_rng(4),
+                                         pesos_categorias={"genero": [1, 0, 0]})
+        self.assertEqual(colunas["genero"].codigos.dtype, np.int8)
+        self.assertEqual(set(colunas["genero"].valores()), {"Masculino"})
+        linhas = serializar_csv(CABECALHO_ORIGINAL, colunas).decode("utf-8").splitlines()
+        self.assertEqual(len(linhas), 201)
+        plano = CABECALHO_ORIGINAL.index("plano")
+        esperado = [valor or "" for valor in colunas["plano"].valores()]
+        self.assertEqual([linha.split(",")[plano] for linha in linhas[1:]], esperado)
+
+    @unittest.skipIf(pd is None, "pandas não instalado")
+    def test_dataframe_pandas(self):
+        """O DataFrame tem colunas categóricas e é reprodutível com a mesma semente."""
+        df = gerar_dataframe("hotel", semente=3, data_inicio="2023-01-01", data_fim="2023-01-31")
+        self.assertEqual(str(df["tipo_de_quarto"].dtype), "category")
+        self.assertTrue(df.equals(gerar_dataframe("hotel", semente=3, data_inicio="2023-01-01",
+                                                  data_fim="2023-01-31")))
+
+    @unittest.skipIf(pd is None, "pandas não instalado")
+    def test_dataframe_com_dimensoes(self):
+        """Com as tabelas de dimensão, as colunas de chave entram no DataFrame como inteiros."""
+        df = gerar_dataframe("original", semente=3, registros=50, dimensoes=Dimensoes(20, 10, 30, semente=1))
+        self.assertTrue((df["empresa_id"].between(1, 20) & df["cidade_id"].between(1, 10)).all())
+        self.assertEqual(df["empresa_id"].dtype.kind, "i")
+        df = gerar_dataframe("hotel", semente=3, data_inicio="2023-01-01", data_fim="2023-01-31",
+                             dimensoes=Dimensoes(20, 10, 30, semente=1))
+        self.assertTrue(df["hospede_id"].between(1, 30).all())
+        self.assertEqual(df["hospede_id"].dtype.kind, "i")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+# testes/test_modelo.py
+import os
+import tempfile
+import unittest
+
+import random
+from datetime import datetime
+
+import numpy as np
+from faker import Faker
+
+from categorias import PESOS_CATEGORIAS, TabelaAlias, sortear_categoria
+from geradores import DISTRIBUICOES_EMPRESA
+from geradores_hotel import gerar_dados_hotel_unico
+from geradores_lote import gerar_colunas_hotel, gerar_colunas_original
+from modelo import aplicar_modelo, carregar_modelo, modelo_atual, restaurar_modelo_padrao, salvar_modelo, yaml
+from segmentos import perfil_segmento
+
+
+class TestModelo(unittest.TestCase):
+
+    def tearDown(self):
+        restaurar_modelo_padrao()
+
+    def test_modelo_exportado_e_recarregado(self):
+        """O modelo gravado (JSON e YAML) é lido e compilado nas mesmas distribuições."""
+        extensoes = [".json"] + ([".yaml"] if yaml is not None else [])
+        with tempfile.TemporaryDirectory() as diretorio:
+            for extensao in extensoes:
+                caminho = os.path.join(diretorio, "modelo" + extensao)
+                salvar_modelo(caminho)
+                modelo = carregar_modelo(caminho)
+                self.assertEqual(modelo, modelo_atual())
+                aplicar_modelo(modelo)
+                self.assertEqual(modelo_atual(), modelo)
+
+    def test_modelo_substitui_distribuicoes(self):
+        """As entradas do arquivo substituem os padrões; as ausentes são mantidas."""
+        padrao_ticket = DISTRIBUICOES_EMPRESA["ticket_medio"]
+        aplicar_modelo({
+            "empresa": {"numero_clientes": {"distribuicao": "inteiro", "minimo": 7, "maximo": 7}},
+            "segmentos": {"Varejo": {"metricas": {"frete_medio": {"distribuicao": "uniforme", "minimo": 99,
+                                                                  "maximo": 99}}}},
+        })
+        self.assertIs(DISTRIBUICOES_EMPRESA["ticket_medio"], padrao_ticket)
+        self.assertFalse(perfil_segmento("Varejo").tem("categoria_produto"))
+        colunas = gerar_colunas_original(500, ["Varejo"], "2023-01-01", "2023-12-31", outliers=0.0,
+                                         rng=np.random.default_rng(5))
+        self.assertTrue(np.all(colunas["numero_clientes"] == 7))
+        self.assertTrue(np.all(colunas["frete_medio"] == 99))
+
+        with self.assertRaises(ValueError):
+            aplicar_modelo({"empresa": {"NPS": {"distribuicao": "beta", "a": 1}}})
+        with self.assertRaises(ValueError):
+            aplicar_modelo({"empresa": {"metrica_inexistente": {"distribuicao": "inteiro", "minimo": 1,
+                                                                "maximo": 2}}})
+
+        restaurar_modelo_padrao()
+        self.assertTrue(perfil_segmento("Varejo").tem("categoria_produto"))
+
+    def test_pesos_das_categorias(self):
+        """Os pesos da seção "categorias" valem nos dois motores, sorteados pela tabela de alias."""
+        tabela = TabelaAlias([0.0, 7.0, 2.0, 1.0])
+        frequencias = np.bincount(tabela.amostrar(np.random.default_rng(1), 200_000), minlength=4) / 200_000
+        np.testing.assert_allclose(frequencias, [0.0, 0.7, 0.2, 0.1], atol=0.005)
+
+        aplicar_modelo({"categorias": {"dispositivo": {"Mobile": 70, "Desktop": 25, "Tablet": 5},
+                                       "forma_de_pagamento": {"PIX": 1}}})
+        self.assertEqual(modelo_atual()["categorias"]["forma_de_pagamento"]["Dinheiro"], 0.0)
+        colunas = gerar_colunas_original(50_000, ["TI"], "2023-01-01", "2023-12-31", outliers=0.0,
+                                         rng=np.random.default_rng(2))
+        self.assertAlmostEqual(np.mean(colunas["dispositivo"].valores() == "Mobile"), 0.7, delta=0.01)
+        random.seed(3)
+        escalar = [sortear_categoria("dispositivo") for _ in range(20_000)]
+        self.assertAlmostEqual(escalar.count("Tablet") / 20_000, 0.05, delta=0.01)
+        self.assertEqual({sortear_categoria("forma_de_pagamento") for _ in range(100)}, {"PIX"})
+
+        with self.assertRaises(ValueError):
+            aplicar_modelo({"categorias": {"dispositivo": {"Smartwatch": 1}}})
+        aplicar_modelo({"categorias": {"dispositivo": None}})
+        self.assertEqual(list(PESOS_CATEGORIAS), ["forma_de_pagamento"])
+        restaurar_modelo_padrao()
+        self.assertEqual(PESOS_CATEGORIAS, {})
+
+    def test_pesos_do_tipo_de_quarto(self):
+        """Os pesos de "tipo_de_quarto" definem a procura dos hóspedes nos dois motores do modo hotel."""
+        aplicar_modelo({"categorias": {"tipo_de_quarto": {"Suite": 1}}})
+        colunas = gerar_colunas_hotel("Hotel", 50, "2023-01-01", "2023-01-31", rng=np.random.default_rng(4))
+        self.assertEqual(set(colunas["tipo_de_quarto"].valores()), {"Suite"})
+        random.seed(4)
+        linhas = gerar_dados_hotel_unico(Faker("pt_BR"), "Hotel", 50, datetime(2023, 1, 1), datetime(2023, 1, 31))
+        self.assertEqual({linha[9] for linha in linhas}, {"Suite"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+# testes/test_nucleo.py
+import unittest
+
+import numpy as np
+
+from config import TIPOS_COLUNAS_ORIGINAL
+from geradores import COLUNAS_OUTLIERS, DISTRIBUICOES_EMPRESA, gerar_dados_com_outliers_colunar
+from nucleo import Datas, Inteiro, LogNormal, Normal, Uniforme, dia_semana
+
+
+class TestNucleo(unittest.TestCase):
+
+    def test_amostradores_lote_e_escalar(self):
+        """O mesmo amostrador gera colunas inteiras (Generator) e valores únicos (numpy.random)."""
+        rng = np.random.default_rng(3)
+        inteiros = Inteiro(5, 1).amostrar(rng, 10_000)
+        self.assertEqual((inteiros.min(), inteiros.max()), (1, 5))
+        normal = Normal(7.5, 1.5, casas=1, minimo=1.0, maximo=10.0).amostrar(rng, 10_000)
+        self.assertTrue(np.all((normal >= 1.0) & (normal <= 10.0)))
+        self.assertEqual(LogNormal(4.6, 0.8, inteiro=True).amostrar(rng, 5).dtype, np.int64)
+
+        np.random.seed(0)
+        valor = Uniforme(1, 10).sortear()
+        self.assertIsInstance(valor, float)
+        self.assertEqual(valor, round(valor, 2))
+        self.assertIsInstance(DISTRIBUICOES_EMPRESA["NPS"].sortear(), int)
+
+    def test_outliers_colunar_respeita_limites(self):
+        """Com probabilidade 1, toda linha recebe um outlier e os limites das colunas são mantidos."""
+        n = 2000
+        colunas = {nome: np.full(n, 50.0) for nome in COLUNAS_OUTLIERS}
+        colunas["data"] = np.zeros(n)
+        gerar_dados_com_outliers_colunar(colunas, TIPOS_COLUNAS_ORIGINAL, 1.0, np.random.default_rng(1))
+        alterados = sum(int(np.sum(colunas[nome] != 50.0)) for nome in COLUNAS_OUTLIERS)
+        self.assertGreater(alterados, n * 0.8)  # colunas categóricas sorteadas não são alteradas
+        self.assertTrue(np.all(colunas["taxa_ocupacao"] <= 100.0))
+        self.assertTrue(np.all(colunas["ticket_medio"] >= 1))
+
+    def test_datas_com_pesos_e_dias_uteis(self):
+        """As datas vêm da dimensão do calendário, com os pesos por dia da semana e sem fins de semana e feriados."""
+        uniforme = Datas("2020-01-01", "2020-12-31")
+        np.testing.assert_array_equal(uniforme.amostrar(np.random.default_rng(4), 1000),
+                                      np.datetime64("2020-01-01") + np.random.default_rng(4).integers(0, 366, 1000))
+
+        datas = Datas("2024-01-01", "2024-12-31", pesos_dia_semana=[1, 1, 1, 1, 2, 5, 5], dias_uteis=True,
+                      feriados=["2024-12-25"])
+        self.assertEqual(len(datas.dias), 261)
+        amostra = datas.amostrar(np.random.default_rng(5), 200_000)
+        por_dia = np.bincount(dia_semana(amostra), minlength=7)
+        self.assertEqual(por_dia[5:].sum(), 0)
+        self.assertAlmostEqual(por_dia[4] / por_dia[0], 2.0, delta=0.1)
+        self.assertNotIn(np.datetime64("2024-12-25"), amostra)
+        self.assertEqual(datas.fda(np.datetime64("2024-12-31")), 1.0)
+        np.random.seed(0)
+        self.assertIn(np.datetime64(datas.sortear(), "D"), datas.dias)
+        with self.assertRaises(ValueError):
+            Datas("2024-01-06", "2024-01-07", dias_uteis=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+# testes/test_particionamento.py
+import csv
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
+
+import numpy as np
+
+import main
+from config import CABECALHO_ORIGINAL
+from geradores_lote import gerar_colunas_original
+from particionamento import ARQUIVO_MANIFESTO, EscritorParticionado, caminho_particao, criar_particoes_csv
+from util import linhas_de_colunas
+
+
+def _ler_particoes(diretorio):
+    """Lê todas as partições, devolvendo {caminho relativo: linhas (sem o cabeçalho)}."""
+    arquivos = {}
+    for raiz, _, nomes in os.walk(diretorio):
+        for nome in nomes:
+            if nome.endswith(".csv"):
+                with open(os.path.join(raiz, nome), newline="", encoding="utf-8") as arquivo:
+                    arquivos[os.path.relpath(os.path.join(raiz, nome), diretorio)] = list(csv.reader(arquivo))[1:]
+    return arquivos
+
+
+class TestParticionamento(unittest.TestCase):
+
+    def test_colunas_e_linhas_geram_as_mesmas_particoes(self):
+        """As partições do motor em lote (colunas) e de uma lista de linhas têm o mesmo conteúdo e manifesto."""
+        colunas = gerar_colunas_original(3000, ["Varejo", "TI", "Educação"], "2022-01-01", "2022-04-30",
+                                         rng=np.random.default_rng(2))
+        linhas = list(linhas_de_colunas(CABECALHO_ORIGINAL, colunas))
+        with tempfile.TemporaryDirectory() as diretorio:
+            de_colunas, de_linhas = os.path.join(diretorio, "colunas"), os.path.join(diretorio, "linhas")
+            criar_particoes_csv(de_colunas, CABECALHO_ORIGINAL, colunas, manifesto=True)
+            arquivos = criar_particoes_csv(de_linhas, CABECALHO_ORIGINAL, linhas)
+            self.assertEqual(_ler_particoes(de_colunas), _ler_particoes(de_linhas))
+            self.assertEqual(len(arquivos), 12)
+
+            with open(os.path.join(de_colunas, ARQUIVO_MANIFESTO), encoding="utf-8") as arquivo:
+                manifesto = json.load(arquivo)
+            self.assertEqual(manifesto["total_linhas"], 3000)
+            self.assertEqual(manifesto["arquivos"], arquivos)
+            marco = [linha for linha in linhas if linha[3] == 3 and linha[5] == "TI"]
+            entrada = next(e for e in arquivos if e["arquivo"] == "ano=2022/mes=03/segmento=TI/parte-00000.csv")
+            self.assertEqual(entrada["linhas"], len(marco))
+            self.assertEqual(entrada["data_minima"], min(linha[1] for linha in marco))
+            self.assertEqual(entrada["data_maxima"], max(linha[1] for linha in marco))
+
+    def test_limite_de_arquivos_abertos(self):
+        """Com poucos arquivos abertos, as partições são reabertas em modo de acréscimo sem perder linhas."""
+        cabecalho = ["data", "segmento", "valor"]
+        linhas = [["2022-01-%02d" % (i % 28 + 1), f"S{i % 5}", i] for i in range(200)]
+        with tempfile.TemporaryDirectory() as diretorio:
+            escritor = EscritorParticionado(diretorio, cabecalho, ["segmento"], max_arquivos_abertos=2,
+                                            tamanho_buffer=3)
+            escritor.escrever(linhas)
+            self.assertLessEqual(len(escritor._abertos), 2)
+            escritor.fechar()
+            particoes = _ler_particoes(diretorio)
+            self.assertEqual(len(particoes), 5)
+            self.assertEqual(particoes[os.path.join("segmento=S3", "parte-00000.csv")],
+                             [[linha[0], str(linha[2])] for linha in linhas if linha[1] == "S3"])
+
+        self.assertEqual(caminho_particao(["ano", "mes", "segmento"], [2022, 3, "A/B"]),
+                         os.path.join("ano=2022", "mes=03", "segmento=A%2FB"))
+
+    def test_diretorio_nao_vazio_recusado(self):
+        """Uma nova execução no diretório de partições de outra é recusada, sem apagar nem misturar partições."""
+        with tempfile.TemporaryDirectory() as diretorio:
+            destino = os.path.join(diretorio, "vendas")
+
+            def executar(data_inicio, data_fim):
+                argv = ["main.py", "--registros", "200", "--particionar", "--data_inicio", data_inicio,
+                        "--data_fim", data_fim, "--arquivo_saida", destino + ".csv"]
+                with mock.patch("sys.argv", argv), redirect_stdout(io.StringIO()):
+                    main.main()
+
+            executar("2020-01-01", "2020-12-31")
+            anteriores = _ler_particoes(destino)
+            erros = io.StringIO()
+            with redirect_stderr(erros), self.assertRaises(SystemExit) as saida:
+                executar("2021-01-01", "2021-12-31")
+            self.assertEqual(saida.exception.code, 2)
+            self.assertIn("não está vazio", erros.getvalue())
+            self.assertEqual(_ler_particoes(destino), anteriores)
+            self.assertTrue(all(caminho.startswith("ano=2020") for caminho in anteriores))
+
+            with self.assertRaises(ValueError):
+                EscritorParticionado(destino, CABECALHO_ORIGINAL)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+# testes/test_reservas.py
+import unittest
+
+import numpy as np
+
+from reservas import InventarioReservas, acumular_estadias
+
+
+class TestReservas(unittest.TestCase):
+
+    def test_estadia_ocupa_noites_seguintes(self):
+        """Uma estadia de várias noites bloqueia os quartos nas noites seguintes."""
+        inventario = InventarioReservas(total_quartos=3, n_dias=10)
+        self.assertEqual(inventario.reservar(0, 4, 2, valor_diaria=100.0), 2)
+        self.assertEqual(inventario.quartos_livres(3, 1), 1)
+        self.assertEqual(inventario.reservar(2, 3, 2), 1)  # só resta 1 quarto nas noites 2 e 3
+        self.assertEqual(inventario.reservar(3, 1, 1), 0)
+        noites = inventario.kpis_noites()
+        self.assertEqual(noites["quartos_ocupados"][:6].tolist(), [2, 2, 3, 3, 1, 0])
+        self.assertEqual(noites["adr"][0], 100.0)
+
+    def test_lote_equivale_a_reservas_em_ordem(self):
+        """reservar_lote chega ao mesmo inventário que reservar chamado estadia a estadia."""
+        rng = np.random.default_rng(5)
+        dias = np.sort(rng.integers(0, 60, 900))
+        diarias = rng.integers(1, 8, 900)
+        quartos = rng.integers(1, 3, 900)
+        lote = InventarioReservas(25, 60)
+        reservados = lote.reservar_lote(dias, diarias, quartos)
+
+        escalar = InventarioReservas(25, 60)
+        esperado = np.zeros(900, dtype=np.int64)
+        lotado_em = None
+        for i, (dia, noites, qtd) in enumerate(zip(dias, diarias, quartos)):
+            if dia == lotado_em:
+                continue
+            esperado[i] = escalar.reservar(dia, noites, qtd)
+            if esperado[i] < qtd:
+                lotado_em = dia
+        np.testing.assert_array_equal(reservados, esperado)
+        np.testing.assert_array_equal(lote.ocupacao, escalar.ocupacao)
+        self.assertTrue(np.all(lote.ocupacao <= 25))
+        np.testing.assert_array_equal(acumular_estadias(dias, diarias, reservados, 67), lote.ocupacao)
+
+
+if __name__ == "__main__":
+    unittest.main()
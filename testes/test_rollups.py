@@ -0,0 +1,81 @@
+# testes/test_rollups.py
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
+
+import numpy as np
+
+import main
+from rollups import AcumuladorPeriodos, chaves_periodo
+
+
+class TestRollups(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(8)
+        self.datas = np.datetime64("2023-01-01") + np.arange(120)
+        self.vendidos = rng.integers(0, 50, 120)
+        self.receita = self.vendidos * rng.uniform(100, 200, 120)
+        self.custo = rng.uniform(1000, 5000, 120)
+
+    def _adicionar(self, acumulador, inicio, fim):
+        acumulador.adicionar_dias(self.datas[inicio:fim], 50, self.vendidos[inicio:fim], self.receita[inicio:fim],
+                                  self.receita[inicio:fim] * 1.1, self.custo[inicio:fim])
+
+    def test_incremental_igual_ao_lote(self):
+        """Acrescentar os dias em partes gera os mesmos rollups que acumular tudo de uma vez."""
+        completo, incremental = AcumuladorPeriodos(), AcumuladorPeriodos()
+        self._adicionar(completo, 0, 120)
+        for inicio, fim in ((0, 10), (10, 45), (45, 120)):
+            self._adicionar(incremental, inicio, fim)
+        for granularidade in ("semana", "mes", "ano"):
+            esperado, obtido = completo.tabela(granularidade), incremental.tabela(granularidade)
+            for nome in esperado:
+                np.testing.assert_array_equal(esperado[nome], obtido[nome])
+        with self.assertRaises(ValueError):
+            self._adicionar(incremental, 100, 110)
+
+    def test_razoes_a_partir_das_somas(self):
+        """O ADR mensal é receita / quartos vendidos do mês, não a média dos ADRs diários."""
+        acumulador = AcumuladorPeriodos()
+        self._adicionar(acumulador, 0, 120)
+        mes = acumulador.tabela("mes")
+        self.assertEqual(mes["periodo"].tolist(), ["2023-01", "2023-02", "2023-03", "2023-04"])
+        janeiro = slice(0, 31)
+        self.assertAlmostEqual(mes["adr"][0], round(self.receita[janeiro].sum() / self.vendidos[janeiro].sum(), 2))
+        self.assertEqual(mes["quartos_disponiveis"][0], 31 * 50)
+        self.assertEqual(chaves_periodo(np.array(["2023-01-05"], dtype="datetime64[D]"), "semana")[0], "2023-01-02")
+
+    def test_estado_sobreposto_recusado_na_linha_de_comando(self):
+        """Uma execução que repete dias do estado dos rollups termina com erro de uso, antes de gerar dados."""
+        with tempfile.TemporaryDirectory() as diretorio:
+            estado = os.path.join(diretorio, "estado.json")
+
+            def executar(data_inicio, data_fim, arquivo):
+                argv = ["main.py", "--modo_hotel_unico", "--rollups", "--estado_rollups", estado,
+                        "--data_inicio", data_inicio, "--data_fim", data_fim, "--tamanho_pool_faker", "50",
+                        "--arquivo_saida", os.path.join(diretorio, arquivo)]
+                with mock.patch("sys.argv", argv), redirect_stdout(io.StringIO()):
+                    main.main()
+
+            executar("2024-01-01", "2024-01-31", "janeiro.csv")
+            with open(estado, encoding="utf-8") as arquivo:
+                conteudo = arquivo.read()
+            erros = io.StringIO()
+            with redirect_stderr(erros), self.assertRaises(SystemExit) as saida:
+                executar("2024-01-15", "2024-02-10", "sobreposto.csv")
+            self.assertEqual(saida.exception.code, 2)
+            self.assertIn("2024-01-31", erros.getvalue())
+            self.assertFalse(os.path.exists(os.path.join(diretorio, "sobreposto.csv")))
+            with open(estado, encoding="utf-8") as arquivo:
+                self.assertEqual(arquivo.read(), conteudo)
+
+            executar("2024-02-01", "2024-02-10", "fevereiro.csv")
+            self.assertEqual(str(AcumuladorPeriodos.carregar(estado).ultimo_dia), "2024-02-10")
+
+
+if __name__ == "__main__":
+    unittest.main()
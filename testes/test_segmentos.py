@@ -0,0 +1,73 @@
+# testes/test_segmentos.py
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime
+
+import numpy as np
+from faker import Faker
+
+from config import CABECALHO_ORIGINAL
+from geradores import gerar_dados_empresa
+from geradores_lote import gerar_colunas_original
+from main import construir_parser, preparar_argumentos
+from modelo import restaurar_modelo_padrao
+from segmentos import REGISTRO_SEGMENTOS, especificacao_segmento, perfil_segmento, validade_segmento
+
+
+class TestSegmentos(unittest.TestCase):
+
+    def test_colunas_de_segmento_em_lote(self):
+        """Cada grupo de segmento recebe apenas as métricas e categorias declaradas no seu perfil."""
+        colunas = gerar_colunas_original(6000, ["Educação", "SaaS", "Consultoria"], "2023-01-01", "2023-12-31",
+                                         outliers=0.0, rng=np.random.default_rng(4))
+        segmento = colunas["segmento"].valores()
+        educacao, saas = segmento == "Educação", segmento == "SaaS"
+        self.assertTrue(np.all((colunas["taxa_evasao"][educacao] >= 5) & (colunas["taxa_evasao"][educacao] <= 20)))
+        self.assertTrue(np.all(np.isnan(colunas["taxa_evasao"][~educacao])))
+        self.assertTrue(np.all(colunas["MRR"][saas] > 0))
+        self.assertTrue(np.all(colunas["MRR"][~saas] == 0))
+        self.assertTrue(np.all(colunas["usuarios_ativos"][~saas] == 0))
+        plano = colunas["plano"].valores()
+        self.assertTrue(all(valor is not None for valor in plano[saas]))
+        self.assertTrue(all(valor is None for valor in plano[~saas]))
+        validos = validade_segmento(colunas["segmento"].dicionario, colunas["segmento"].codigos, "taxa_evasao")
+        np.testing.assert_array_equal(validos, educacao)
+
+    def test_segmento_com_base(self):
+        """"Nome=Base" registra um segmento novo com o perfil do segmento base."""
+        parser = construir_parser()
+        args = parser.parse_args(["--segmentos", "Pousada=Hotelaria", "Aviação"])
+        preparar_argumentos(parser, args)
+        self.assertEqual(args.segmentos, ["Pousada", "Aviação"])
+        self.assertTrue(perfil_segmento("Pousada").tem("RevPAR"))
+        self.assertFalse(perfil_segmento("Aviação").tem("RevPAR"))
+        with self.assertRaises(ValueError):
+            especificacao_segmento("Fintech=Inexistente")
+
+        # a linha do motor escalar não inclui o registro_id
+        registro = gerar_dados_empresa(Faker("pt_BR"), "Pousada", datetime(2023, 6, 1))
+        self.assertIsNotNone(registro[CABECALHO_ORIGINAL.index("RevPAR") - 1])
+        del REGISTRO_SEGMENTOS["Pousada"]
+
+    def test_segmento_com_base_usa_o_modelo(self):
+        """O segmento "Nome=Base" copia o perfil da base do arquivo de modelo, em qualquer ordem dos argumentos."""
+        with tempfile.TemporaryDirectory() as diretorio:
+            caminho = os.path.join(diretorio, "modelo.json")
+            with open(caminho, "w", encoding="utf-8") as arquivo:
+                json.dump({"segmentos": {"Hotelaria": {"metricas": {
+                    "RevPAR": {"distribuicao": "uniforme", "minimo": 5, "maximo": 5}}}}}, arquivo)
+            parser = construir_parser()
+            args = parser.parse_args(["--segmentos", "Pousada=Hotelaria", "--modelo", caminho])
+            preparar_argumentos(parser, args)
+        try:
+            colunas = gerar_colunas_original(100, args.segmentos, "2023-01-01", "2023-12-31", outliers=0.0,
+                                             rng=np.random.default_rng(1))
+            self.assertTrue(np.all(colunas["RevPAR"] == 5))
+        finally:
+            restaurar_modelo_padrao()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+# testes/test_servidor.py
+import asyncio
+import json
+import multiprocessing
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from unittest import mock
+
+import servidor
+from servidor import _atender_conexao, _ler_pedido, _pedido_para_opcoes, iniciar_servidor
+
+
+async def _pedir(reader, writer, metodo, caminho, corpo=None):
+    """Envia um pedido HTTP/1.1 (keep-alive) e lê a resposta chunked: (status, cabeçalhos, corpo, blocos)."""
+    dados = json.dumps(corpo).encode("utf-8") if corpo is not None else b""
+    writer.write(f"{metodo} {caminho} HTTP/1.1\r\nHost: teste\r\nContent-Length: {len(dados)}\r\n\r\n"
+                 .encode("latin-1") + dados)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    cabecalhos = {}
+    while (linha := await reader.readline()) != b"\r\n":
+        nome, _, valor = linha.decode("latin-1").partition(":")
+        cabecalhos[nome.strip().lower()] = valor.strip()
+    blocos = []
+    while tamanho := int((await reader.readline()).strip(), 16):
+        blocos.append(await reader.readexactly(tamanho))
+        await reader.readexactly(2)
+    await reader.readexactly(2)
+    return status, cabecalhos, b"".join(blocos), len(blocos)
+
+
+async def _encerrar(writer):
+    """Fecha a conexão do cliente e dá ao servidor a chance de encerrar o atendimento dela."""
+    writer.close()
+    await writer.wait_closed()
+    await asyncio.sleep(0.1)
+
+
+class TestServidor(unittest.TestCase):
+
+    def test_leitura_do_pedido(self):
+        """Linha inicial, cabeçalhos (em minúsculas) e corpo pelo Content-Length; None na conexão encerrada."""
+        async def ler():
+            reader = asyncio.StreamReader()
+            reader.feed_data(b'post /gerar HTTP/1.1\r\nContent-Length: 16\r\nConnection: close\r\n\r\n'
+                             b'{"modo":"hotel"}')
+            reader.feed_eof()
+            return await _ler_pedido(reader), await _ler_pedido(reader)
+
+        pedido, fim = asyncio.run(ler())
+        self.assertEqual(pedido, ("POST", "/gerar", {"content-length": "16", "connection": "close"},
+                                  b'{"modo":"hotel"}'))
+        self.assertIsNone(fim)
+        self.assertEqual(_pedido_para_opcoes(pedido[3]), ({"modo_hotel_unico": True}, "csv"))
+        for corpo in (b"[1, 2]", b'{"modo": "fazenda"}'):
+            with self.assertRaises(ValueError):
+                _pedido_para_opcoes(corpo)
+
+    def test_pedidos_na_mesma_conexao(self):
+        """Vários pedidos em uma conexão keep-alive: resposta em vários blocos, 400 e 404 sem fechar a conexão."""
+        async def executar():
+            srv, executor, gerenciador = await iniciar_servidor(porta=0, trabalhadores=1, tamanho_pool_faker=50)
+            try:
+                reader, writer = await asyncio.open_connection("127.0.0.1", srv.sockets[0].getsockname()[1])
+                respostas = [
+                    await _pedir(reader, writer, "GET", "/saude"),
+                    await _pedir(reader, writer, "POST", "/gerar", {"registros": 12_000, "semente": 3}),
+                    await _pedir(reader, writer, "POST", "/gerar", {"registros": 12_000, "semente": 3}),
+                    await _pedir(reader, writer, "POST", "/gerar", {"registros": 3, "entidades": 4}),
+                    await _pedir(reader, writer, "GET", "/inexistente"),
+                ]
+                await _encerrar(writer)
+                return respostas
+            finally:
+                srv.close()
+                executor.shutdown()
+                gerenciador.shutdown()
+
+        saude, gerar, repetido, invalido, inexistente = asyncio.run(executar())
+        self.assertEqual(saude[::2], (200, b"ok"))
+        status, cabecalhos, corpo, blocos = gerar
+        self.assertEqual((status, cabecalhos["x-linhas"]), (200, "12000"))
+        self.assertEqual(corpo, repetido[2])
+        self.assertTrue(corpo.startswith(b"registro_id,data,"))
+        self.assertEqual(len(corpo.splitlines()), 12_001)
+        self.assertGreater(blocos, 1)
+        self.assertEqual(invalido[0], 400)
+        self.assertIn("--entidades", invalido[2].decode("utf-8"))
+        self.assertEqual(inexistente[0], 404)
+
+    def test_erro_inesperado_retorna_500(self):
+        """Uma exceção que não é de parâmetros vira 500, e a conexão continua atendendo pedidos."""
+        def falhar(opcoes, formato, fila):
+            fila.put(KeyError("coluna"))
+
+        async def executar():
+            with ThreadPoolExecutor(1) as executor, multiprocessing.Manager() as gerenciador:
+                srv = await asyncio.start_server(
+                    partial(_atender_conexao, executor=executor, gerenciador=gerenciador), "127.0.0.1", 0)
+                reader, writer = await asyncio.open_connection("127.0.0.1", srv.sockets[0].getsockname()[1])
+                with mock.patch.object(servidor, "executar_geracao_em_fila", falhar):
+                    erro = await _pedir(reader, writer, "POST", "/gerar", {})
+                saude = await _pedir(reader, writer, "GET", "/saude")
+                await _encerrar(writer)
+                srv.close()
+                return erro, saude
+
+        erro, saude = asyncio.run(executar())
+        self.assertEqual(erro[0], 500)
+        self.assertIn("KeyError", erro[2].decode("utf-8"))
+        self.assertEqual(saude[0], 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,28 @@
+# testes/test_tarifas.py
+import unittest
+
+import numpy as np
+
+from tarifas import CalendarioTarifas, distribuir_quartos
+
+
+class TestTarifas(unittest.TestCase):
+
+    def test_distribuir_quartos(self):
+        """A divisão dos quartos entre os tipos sempre soma o total."""
+        for total in (1, 7, 100, 333):
+            self.assertEqual(distribuir_quartos(total, [0.6, 0.3, 0.1]).sum(), total)
+        self.assertEqual(distribuir_quartos(100, [0.6, 0.3, 0.1]).tolist(), [60, 30, 10])
+
+    def test_calendario(self):
+        """Tarifas por tipo, dia da semana e yield da ocupação."""
+        calendario = CalendarioTarifas(100, "2023-03-01", 31)  # 01/03/2023 foi uma quarta-feira
+        self.assertEqual(calendario.tarifas.shape, (3, 31))
+        self.assertTrue(np.all(calendario.tarifas[2] > calendario.tarifas[0]))  # Suite > Standard
+        self.assertGreater(calendario.tarifas[0, 3], calendario.tarifas[0, 0])  # sábado > quarta
+        tarifas = calendario.tarifa(0, np.array([0, 0, 0]), np.array([0.2, 0.8, 0.99]))
+        self.assertTrue(np.all(np.diff(tarifas) > 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+# testes/test_trabalhadores.py
+import unittest
+
+from trabalhadores import executar_geracao, opcoes_para_argv
+
+
+class TestTrabalhadores(unittest.TestCase):
+
+    def test_opcoes_para_argv(self):
+        """Testa a conversão de um dicionário de opções em argumentos do main.py."""
+        argv = opcoes_para_argv({
+            "registros": 10, "segmentos": ["TI", "Varejo"],
+            "modo_hotel_unico": False, "semente": None,
+        })
+        self.assertEqual(argv, ["--registros", "10", "--segmentos", "TI", "Varejo"])
+        self.assertEqual(opcoes_para_argv({"modo_hotel_unico": True}), ["--modo_hotel_unico"])
+
+    def test_mesma_semente_mesmo_resultado(self):
+        """Dois pedidos com a mesma semente devem gerar o mesmo CSV."""
+        opcoes = {"registros": 20, "semente": 7}
+        conteudo_1, linhas_1 = executar_geracao(opcoes)
+        conteudo_2, _ = executar_geracao(opcoes)
+        self.assertEqual(linhas_1, 20)
+        self.assertEqual(conteudo_1, conteudo_2)
+
+    def test_opcoes_invalidas(self):
+        """Opções inválidas devem gerar ValueError (e não encerrar o processo)."""
+        with self.assertRaises(ValueError):
+            executar_geracao({"registros": "abc"})
+        with self.assertRaises(ValueError):
+            executar_geracao({"registros": 1}, formato="xml")
+
+    def test_combinacoes_invalidas(self):
+        """As validações entre opções do main.py valem também para os pedidos (e não são ignoradas)."""
+        invalidos = [
+            {"registros": 3, "entidades": 4},
+            {"modo_hotel_unico": True, "armazenamento": "mmap"},
+            {"modo_hotel_unico": True, "dias_uteis": True},
+            {"exportar_modelo": "modelo_exportado.json"},
+            {"motor": "lote", "dimensoes": True},
+            {"correlacionar": True},
+            {"pesos_dia_semana": [0, 0, 0, 0, 0, 0, 0]},
+            {"dias_uteis": True, "data_inicio": "2024-12-25", "data_fim": "2024-12-25"},
+        ]
+        for opcoes in invalidos:
+            with self.subTest(opcoes=opcoes), self.assertRaises(ValueError):
+                executar_geracao(opcoes)
+
+
+if __name__ == "__main__":
+    unittest.main()
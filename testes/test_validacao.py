@@ -0,0 +1,50 @@
+# testes/test_validacao.py
+import unittest
+from datetime import datetime
+
+import numpy as np
+from faker import Faker
+
+from config import CABECALHO_HOTEL
+from geradores_hotel import gerar_dados_hotel_unico
+from geradores_lote import gerar_colunas_hotel, gerar_colunas_original
+from nucleo import LogNormal
+from util import definir_semente
+from validacao import colunas_de_linhas, estatistica_ks, verificar_hotel, verificar_original
+
+
+class TestValidacao(unittest.TestCase):
+
+    def test_original_em_lote(self):
+        """As colunas do motor em lote passam nas verificações; distribuições e identidades erradas são detectadas."""
+        colunas = gerar_colunas_original(200_000, ["Varejo", "TI", "SaaS", "Hotelaria"], "2022-01-01", "2022-12-31",
+                                         outliers=0.0, rng=np.random.default_rng(11))
+        resultados = verificar_original(colunas)
+        self.assertEqual([nome for nome, aprovado, _ in resultados if not aprovado], [])
+
+        d, n = estatistica_ks(colunas["numero_clientes"], LogNormal(4.6, 0.8, inteiro=True))
+        d_errada, _ = estatistica_ks(colunas["numero_clientes"], LogNormal(4.7, 0.8, inteiro=True))
+        self.assertLess(d, 0.01)
+        self.assertGreater(d_errada, 0.03)
+
+        colunas["lucro"] = colunas["lucro"].copy()
+        colunas["lucro"][::1000] += 1.0
+        reprovadas = [nome for nome, aprovado, _ in verificar_original(colunas, aderencia=False) if not aprovado]
+        self.assertEqual(reprovadas, ["lucro = receita - custo"])
+
+    def test_hotel_nos_dois_motores(self):
+        """As métricas diárias do hotel são coerentes no motor em lote e no escalar (linhas convertidas)."""
+        colunas = gerar_colunas_hotel(total_quartos=40, data_inicio="2023-01-01", data_fim="2023-12-31",
+                                      max_clientes_por_dia=30, rng=np.random.default_rng(12))
+        self.assertTrue(all(aprovado for _, aprovado, _ in verificar_hotel(colunas)))
+
+        fake = Faker("pt_BR")
+        definir_semente(12, fake)
+        linhas = gerar_dados_hotel_unico(fake, total_quartos=20, data_inicio=datetime(2023, 1, 1),
+                                         data_fim=datetime(2023, 2, 28), max_clientes_por_dia=8)
+        resultados = verificar_hotel(colunas_de_linhas(CABECALHO_HOTEL, linhas))
+        self.assertEqual([nome for nome, aprovado, _ in resultados if not aprovado], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,209 @@
+# trabalhadores.py
+
+"""
+trabalhadores.py
+
+Descrição:
+-----------
+Este módulo contém o código executado dentro dos processos "trabalhadores" (workers) utilizados pelo servidor de
+geração (servidor.py) e pelo executor de lotes (executor_lote.py). Cada processo é inicializado uma única vez: importa os geradores, cria a instância do
+Faker com o locale "pt_BR" e pré-gera um `PoolFaker`. A partir daí, cada pedido de geração reutiliza esse estado
+"aquecido", evitando repetir a importação dos módulos e a configuração do Faker a cada execução, como acontece ao
+chamar `python main.py` repetidas vezes.
+
+Funcionalidades:
+-----------------
+- inicializar_trabalhador(tamanho_pool_faker):
+  - Função usada como `initializer` do `ProcessPoolExecutor`. Cria o Faker e o pool de valores do processo.
+
+- opcoes_para_argv(opcoes):
+  - Converte um dicionário de opções (por exemplo, vindo de um JSON) na lista de argumentos aceita pelo
+    `main.py`, de forma que os mesmos parâmetros e validações da linha de comando sejam reaproveitados.
+    Exemplo: {"registros": 100, "modo_hotel_unico": true} -> ["--registros", "100", "--modo_hotel_unico"].
+
+- executar_geracao(opcoes, formato):
+  - Executa uma geração completa no processo trabalhador e retorna (bytes serializados, quantidade de linhas).
+  - formato: "csv" ou "arrow".
+
+- executar_geracao_em_fila(opcoes, formato, fila):
+  - Executa uma geração e envia a resposta pela fila à medida que ela é serializada (util.blocos_csv /
+    util.blocos_arrow): a quantidade de linhas, os blocos de bytes e, ao final, None. Usada pelo servidor para
+    enviar cada bloco assim que ele fica pronto, sem montar a resposta inteira no trabalhador.
+
+- arquivos_do_trabalho(opcoes):
+  - Retorna os caminhos absolutos que um trabalho grava (main.arquivos_saida), para o executor de lotes
+    recusar trabalhos que gravariam no mesmo arquivo.
+
+- executar_trabalho(opcoes):
+  - Executa uma geração completa e grava o CSV em `arquivo_saida` (e a tabela de KPIs diários, no layout
+    normalizado do modo hotel), como o `main.py` faria.
+  - Retorna (quantidade de linhas, duração da geração em segundos).
+
+Observações:
+-------------
+- A semente (`semente`) informada no pedido é aplicada antes de cada geração; como o pool do Faker é criado com
+  semente fixa, o mesmo pedido produz o mesmo resultado em qualquer processo trabalhador.
+- O modelo de distribuições (modelo.py) volta aos padrões antes de cada pedido; o `modelo` de um pedido vale
+  apenas para ele.
+- As combinações de opções passam pelas mesmas verificações da linha de comando (`main.validar_argumentos`); uma
+  combinação inválida gera ValueError (400 no servidor, erro do trabalho no executor de lotes), em vez de a opção
+  ser ignorada. `exportar_modelo` e `fator_escala` não geram um dataset e também são recusados.
+- `executar_geracao` e `executar_geracao_em_fila` enviam uma única tabela: o layout normalizado, os rollups, a
+  saída particionada, o arquivo de estatísticas e as tabelas de dimensão (`dimensoes`) só estão disponíveis em
+  `executar_trabalho`, que grava os arquivos.
+"""
+
+import io
+import os
+import time
+from contextlib import redirect_stderr
+from itertools import chain
+
+from faker import Faker
+
+from main import (arquivos_saida, construir_parser, gerar_dataset, preparar_argumentos, salvar_dataset,
+                  validar_argumentos)
+from modelo import restaurar_modelo_padrao
+from pool_faker import PoolFaker
+from util import blocos_arrow, blocos_csv, definir_semente, quantidade_linhas
+
+FORMATOS = {
+    "csv": blocos_csv,
+    "arrow": blocos_arrow,
+}
+
+# Estado do processo trabalhador (criado uma única vez por processo)
+_fake = None
+
+
+def inicializar_trabalhador(tamanho_pool_faker=5000):
+    """
+    Inicializa o processo trabalhador, criando o Faker e o pool de valores pré-gerados.
+    """
+    global _fake
+    fake = Faker("pt_BR")
+    _fake = PoolFaker(fake, tamanho_pool_faker) if tamanho_pool_faker > 0 else fake
+
+
+def opcoes_para_argv(opcoes):
+    """
+    Converte um dicionário de opções na lista de argumentos da linha de comando do main.py.
+    - Valores booleanos viram flags (incluídas apenas quando True).
+    - Listas viram argumentos múltiplos (ex.: "segmentos").
+    """
+    argv = []
+    for nome, valor in opcoes.items():
+        opcao = "--" + nome
+        if isinstance(valor, bool):
+            if valor:
+                argv.append(opcao)
+        elif isinstance(valor, (list, tuple)):
+            argv.append(opcao)
+            argv.extend(str(v) for v in valor)
+        elif valor is not None:
+            argv.extend([opcao, str(valor)])
+    return argv
+
+
+def _processar_opcoes(opcoes):
+    """
+    Processa o dicionário de opções com o parser e as validações do main.py (`validar_argumentos`),
+    convertendo erros do argparse em ValueError.
+    """
+    # Um `--modelo` (ou segmento "Nome=Base") de um pedido anterior não vale para o próximo
+    restaurar_modelo_padrao()
+    erros = io.StringIO()
+    try:
+        with redirect_stderr(erros):
+            parser = construir_parser()
+            args = parser.parse_args(opcoes_para_argv(opcoes))
+            preparar_argumentos(parser, args)
+            validar_argumentos(parser, args)
+    except SystemExit:
+        # O argparse encerra o processo em caso de erro; aqui a mensagem é devolvida a quem fez o pedido.
+        mensagem = erros.getvalue().strip().splitlines()
+        raise ValueError(mensagem[-1] if mensagem else f"Opções de geração inválidas: {opcoes}") from None
+    if args.exportar_modelo or args.fator_escala is not None:
+        raise ValueError("--exportar_modelo e --fator_escala são executados pelo main.py e não geram um dataset "
+                         "em um trabalhador.")
+    return args
+
+
+def _gerar_blocos(opcoes, formato):
+    """
+    Gera o dataset de um pedido e retorna (quantidade de linhas, iterador dos blocos de bytes serializados).
+    """
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato '{formato}' inválido. Use um destes: {', '.join(FORMATOS)}.")
+    if _fake is None:
+        inicializar_trabalhador()
+
+    args = _processar_opcoes(opcoes)
+    if args.modo_hotel_unico and (args.layout_hotel == "normalizado" or args.rollups):
+        raise ValueError("O layout normalizado e os rollups geram várias tabelas e não podem ser enviados em uma "
+                         "única resposta.")
+    if args.particionar is not None or args.estatisticas or args.dimensoes:
+        raise ValueError("A saída particionada, o arquivo de estatísticas e as tabelas de dimensão gravam vários "
+                         "arquivos e não podem ser enviados em uma única resposta.")
+    definir_semente(args.semente, _fake)
+    cabecalho, dados = gerar_dataset(args, _fake)
+    blocos = FORMATOS[formato](cabecalho, dados)
+    # O primeiro bloco é serializado aqui: erros da serialização (ex.: pyarrow ausente) surgem antes do envio
+    return quantidade_linhas(dados), chain([next(blocos, b"")], blocos)
+
+
+def executar_geracao(opcoes, formato="csv"):
+    """
+    Executa uma geração no processo trabalhador.
+    - opcoes: dicionário com os mesmos parâmetros do main.py (sem os "--").
+    - formato: "csv" ou "arrow".
+    Retorna uma tupla (conteudo_em_bytes, quantidade_de_linhas).
+    """
+    linhas, blocos = _gerar_blocos(opcoes, formato)
+    return b"".join(blocos), linhas
+
+
+def executar_geracao_em_fila(opcoes, formato, fila):
+    """
+    Executa uma geração no processo trabalhador e envia a resposta pela fila (multiprocessing.Manager().Queue)
+    à medida que é serializada: primeiro a quantidade de linhas, depois cada bloco de bytes e, ao final, None.
+    Um erro (antes ou no meio dos blocos) é enviado como a própria exceção. Com uma fila de tamanho limitado, o
+    trabalhador espera o envio dos blocos anteriores antes de serializar os próximos.
+    """
+    try:
+        linhas, blocos = _gerar_blocos(opcoes, formato)
+        fila.put(linhas)
+        for bloco in blocos:
+            fila.put(bloco)
+    except Exception as erro:  # o erro é entregue a quem lê a fila
+        fila.put(erro)
+    else:
+        fila.put(None)
+
+
+def arquivos_do_trabalho(opcoes):
+    """
+    Retorna os caminhos absolutos gravados por um trabalho (arquivo principal e derivados).
+    Opções inválidas retornam uma lista vazia: o erro é relatado quando o trabalho for executado.
+    """
+    try:
+        args = _processar_opcoes(opcoes)
+    except ValueError:
+        return []
+    return [os.path.abspath(caminho) for caminho in arquivos_saida(args)]
+
+
+def executar_trabalho(opcoes):
+    """
+    Executa uma geração no processo trabalhador e grava o resultado em CSV (opção "arquivo_saida").
+    - opcoes: dicionário com os mesmos parâmetros do main.py (sem os "--").
+    Retorna uma tupla (quantidade_de_linhas, duracao_em_segundos).
+    """
+    if _fake is None:
+        inicializar_trabalhador()
+
+    args = _processar_opcoes(opcoes)
+    inicio = time.perf_counter()
+    definir_semente(args.semente, _fake)
+    linhas = salvar_dataset(args, _fake)
+    return linhas, time.perf_counter() - inicio
@@ -13,7 +13,7 @@ estruturada, consistente e compatível com diversas ferramentas de análise e Bu
 
 Funcionalidades:
 -----------------
-- criar_arquivo_csv(nome_arquivo, cabecalho, dados):
+- criar_arquivo_csv(nome_arquivo, cabecalho, dados, estatisticas):
   - **Descrição:** Recebe o nome do arquivo de destino, uma lista de cabeçalhos (nomes das colunas) e os dados 
     (geralmente uma lista de listas, onde cada sublista representa uma linha do dataset) e cria um arquivo CSV 
     com estes dados.
@@ -23,6 +23,43 @@ Funcionalidades:
       importante para a compatibilidade do CSV em diferentes sistemas operacionais.
     - Se o arquivo já existir, ele será sobrescrito.
 
+  - Os dados também podem ser um dicionário {coluna: array} (motor em lote, geradores_lote.py); nesse caso as
+    linhas são montadas bloco a bloco por `linhas_de_colunas`, e as colunas categóricas (códigos + dicionário,
+    ver categorias.py) só são convertidas em texto no momento da escrita.
+  - Com `estatisticas` (AcumuladorEstatisticas, estatisticas.py), cada bloco gravado também é acumulado nas
+    estatísticas, sem uma segunda passagem pelos dados.
+
+- fatiar(dados, tamanho_bloco):
+  - **Descrição:** Divide uma lista de linhas ou um dicionário de colunas em blocos de até `tamanho_bloco` linhas.
+
+- linhas_de_colunas(cabecalho, colunas, tamanho_bloco):
+  - **Descrição:** Converte um dicionário de colunas em linhas (listas), um bloco por vez, sem materializar o
+    dataset inteiro como lista de listas.
+
+- valores_python(valores):
+  - **Descrição:** Converte um trecho de coluna do motor em lote nos valores Python gravados no CSV (categorias
+    em texto, NaN em vazio, datas em YYYY-MM-DD); também usado pela saída particionada (particionamento.py).
+
+- quantidade_linhas(dados):
+  - **Descrição:** Retorna o número de linhas de uma lista de linhas ou de um dicionário de colunas.
+
+- serializar_csv(cabecalho, dados):
+  - **Descrição:** Gera o mesmo conteúdo de `criar_arquivo_csv`, mas em memória (bytes UTF-8), para ser enviado
+    pela rede (servidor de geração) sem passar pelo disco.
+
+- blocos_csv(cabecalho, dados, linhas_por_bloco) / blocos_arrow(cabecalho, dados, linhas_por_bloco):
+  - **Descrição:** Geram o mesmo conteúdo de `serializar_csv` / `serializar_arrow` em blocos de bytes, um a cada
+    `linhas_por_bloco` linhas, sem montar a resposta inteira na memória (envio em streaming pelo servidor).
+
+- serializar_arrow(cabecalho, dados):
+  - **Descrição:** Serializa os dados no formato Apache Arrow (IPC stream). Requer a biblioteca opcional
+    `pyarrow`; se ela não estiver instalada, uma exceção `RuntimeError` é lançada com a instrução de instalação.
+    Colunas categóricas são gravadas como `DictionaryArray`, reaproveitando os códigos sem convertê-los em texto.
+
+- definir_semente(semente, fake=None):
+  - **Descrição:** Fixa as sementes do `random`, do `numpy.random` e, opcionalmente, do Faker, tornando a
+    geração reprodutível.
+
 Uso:
 -----
 Este módulo pode ser importado por outros scripts, como o "main.py", para salvar os datasets gerados 
@@ -43,15 +80,183 @@ de análise.
 """
 
 import csv
+import io
+import random
+from itertools import islice
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+except ImportError:  # dependência opcional, usada apenas na saída Arrow
+    pa = None
+
+from categorias import ColunaCategorica
+
+TAMANHO_BLOCO_ESCRITA = 50_000
+LINHAS_POR_BLOCO_ENVIO = 5_000
+
+
+def valores_python(valores):
+    """
+    Converte um trecho de coluna em lista de valores Python prontos para o CSV
+    (categorias -> texto, NaN -> None, datas -> YYYY-MM-DD).
+    """
+    if isinstance(valores, ColunaCategorica):
+        return valores.valores().tolist()
+    if valores.dtype.kind == "f":
+        return np.where(np.isnan(valores), None, valores).tolist()
+    if valores.dtype.kind == "M":
+        return np.datetime_as_string(valores, unit="D").tolist()
+    return valores.tolist()
+
+
+def linhas_de_colunas(cabecalho, colunas, tamanho_bloco=TAMANHO_BLOCO_ESCRITA):
+    """
+    Gera as linhas (listas) de um dicionário de colunas, convertendo um bloco de linhas por vez.
+    """
+    total = quantidade_linhas(colunas)
+    for inicio in range(0, total, tamanho_bloco):
+        fim = min(inicio + tamanho_bloco, total)
+        bloco = [valores_python(colunas[nome][inicio:fim]) for nome in cabecalho]
+        yield from (list(linha) for linha in zip(*bloco))
+
+
+def quantidade_linhas(dados):
+    """
+    Retorna o número de linhas de uma lista de linhas ou de um dicionário de colunas.
+    """
+    if isinstance(dados, dict):
+        return len(next(iter(dados.values()))) if dados else 0
+    return len(dados)
+
+
+def _linhas(cabecalho, dados):
+    return linhas_de_colunas(cabecalho, dados) if isinstance(dados, dict) else dados
+
+
+def fatiar(dados, tamanho_bloco=TAMANHO_BLOCO_ESCRITA):
+    """
+    Divide uma lista de linhas ou um dicionário de colunas em blocos de até `tamanho_bloco` linhas.
+    """
+    for inicio in range(0, quantidade_linhas(dados), tamanho_bloco):
+        if isinstance(dados, dict):
+            yield {nome: valores[inicio:inicio + tamanho_bloco] for nome, valores in dados.items()}
+        else:
+            yield dados[inicio:inicio + tamanho_bloco]
 
-def criar_arquivo_csv(nome_arquivo, cabecalho, dados):
+
+def criar_arquivo_csv(nome_arquivo, cabecalho, dados, estatisticas=None):
     """
     Cria um arquivo CSV com os dados fornecidos.
     - nome_arquivo: nome (ou caminho) do arquivo CSV.
     - cabecalho: lista com os nomes das colunas.
-    - dados: lista de listas, onde cada sublista representa uma linha.
+    - dados: lista de listas, onde cada sublista representa uma linha, ou dicionário {coluna: array}.
+    - estatisticas: AcumuladorEstatisticas (opcional) que recebe cada bloco gravado.
     """
     with open(nome_arquivo, mode="w", newline="", encoding="utf-8") as arquivo:
         writer = csv.writer(arquivo)
         writer.writerow(cabecalho)
-        writer.writerows(dados)
\ No newline at end of file
+        if estatisticas is None:
+            writer.writerows(_linhas(cabecalho, dados))
+            return
+        for bloco in fatiar(dados):
+            estatisticas.atualizar(bloco)
+            writer.writerows(_linhas(cabecalho, bloco))
+
+
+def _esvaziar(buffer):
+    """
+    Retorna o conteúdo acumulado no buffer e o esvazia.
+    """
+    conteudo = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    return conteudo
+
+
+def blocos_csv(cabecalho, dados, linhas_por_bloco=LINHAS_POR_BLOCO_ENVIO):
+    """
+    Gera o CSV (bytes UTF-8) em blocos de até `linhas_por_bloco` linhas; o primeiro bloco inclui o cabeçalho.
+    - dados: lista de listas, onde cada sublista representa uma linha, ou dicionário {coluna: array}.
+    """
+    buffer = io.StringIO(newline="")
+    writer = csv.writer(buffer)
+    writer.writerow(cabecalho)
+    linhas = iter(linhas_de_colunas(cabecalho, dados, linhas_por_bloco) if isinstance(dados, dict) else dados)
+    while True:
+        bloco = list(islice(linhas, linhas_por_bloco))
+        writer.writerows(bloco)
+        conteudo = _esvaziar(buffer)
+        if conteudo:
+            yield conteudo.encode("utf-8")
+        if len(bloco) < linhas_por_bloco:
+            return
+
+
+def serializar_csv(cabecalho, dados):
+    """
+    Serializa os dados no formato CSV e retorna os bytes (UTF-8).
+    - cabecalho: lista com os nomes das colunas.
+    - dados: lista de listas, onde cada sublista representa uma linha, ou dicionário {coluna: array}.
+    """
+    return b"".join(blocos_csv(cabecalho, dados))
+
+
+def blocos_arrow(cabecalho, dados, linhas_por_bloco=LINHAS_POR_BLOCO_ENVIO):
+    """
+    Gera o stream Arrow (IPC) em blocos de bytes: o esquema com o primeiro lote de até `linhas_por_bloco`
+    linhas, um bloco por lote seguinte e, por último, o marcador de fim do stream.
+    """
+    if pa is None:
+        raise RuntimeError("A saída Arrow requer a biblioteca 'pyarrow' (pip install pyarrow).")
+    if isinstance(dados, dict):
+        tabela = pa.table({nome: _array_arrow(dados[nome]) for nome in cabecalho})
+    else:
+        colunas = list(zip(*dados)) if dados else [[] for _ in cabecalho]
+        tabela = pa.table({nome: list(valores) for nome, valores in zip(cabecalho, colunas)})
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, tabela.schema) as writer:
+        for lote in tabela.to_batches(max_chunksize=linhas_por_bloco):
+            writer.write_batch(lote)
+            yield _esvaziar(sink)
+    yield _esvaziar(sink)
+
+
+def serializar_arrow(cabecalho, dados):
+    """
+    Serializa os dados no formato Apache Arrow (IPC stream) e retorna os bytes.
+    - cabecalho: lista com os nomes das colunas.
+    - dados: lista de listas, onde cada sublista representa uma linha, ou dicionário {coluna: array}.
+    """
+    return b"".join(blocos_arrow(cabecalho, dados))
+
+
+def _array_arrow(valores):
+    """
+    Converte uma coluna do motor em lote em array Arrow (categorias como DictionaryArray, NaN como nulo).
+    """
+    if isinstance(valores, ColunaCategorica):
+        codigos = valores.codigos
+        return pa.DictionaryArray.from_arrays(
+            pa.array(np.maximum(codigos, 0), mask=codigos < 0), pa.array(list(valores.dicionario))
+        )
+    if valores.dtype.kind == "f":
+        return pa.array(valores, from_pandas=True)
+    if valores.dtype == object:
+        return pa.array(valores.tolist())
+    return pa.array(valores)
+
+
+def definir_semente(semente, fake=None):
+    """
+    Fixa as sementes dos geradores aleatórios utilizados no projeto.
+    - semente: valor inteiro da semente (None mantém a geração não determinística).
+    - fake: instância de Faker (opcional) que também terá a semente fixada.
+    """
+    if semente is None:
+        return
+    random.seed(semente)
+    np.random.seed(semente)
+    if fake is not None and hasattr(fake, "seed_instance"):
+        fake.seed_instance(semente)
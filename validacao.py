@@ -0,0 +1,236 @@
+# validacao.py
+
+"""
+validacao.py
+
+Descrição:
+-----------
+Este script valida, de forma vetorizada e em amostras grandes (1M+ linhas), que os datasets gerados seguem as
+distribuições e as relações pretendidas. Os testes de testes/test_geradores.py apenas conferem que
+`gerar_dados_empresa` devolve uma linha; aqui, cada verificação é uma operação numpy sobre colunas inteiras, rápida
+o bastante para acompanhar cada otimização dos geradores (CI) sem laços Python por linha.
+
+Verificações:
+--------------
+- Modo original (`verificar_original`):
+  - identidades: receita = numero_clientes × ticket_medio, lucro = receita - custo, ARR = 12 × MRR,
+    receita_media_diaria = receita / 30 (com a tolerância do arredondamento em 2 casas);
+  - aderência (teste de Kolmogorov-Smirnov): cada coluna sorteada diretamente de DISTRIBUICOES_EMPRESA (ex.:
+    numero_clientes ~ LogNormal(4.6, 0.8), parte inteira) é comparada com a `fda` do seu amostrador (nucleo.py),
+    que já considera o arredondamento/truncamento.
+- Modo hotel único (`verificar_hotel`):
+  - 0 <= ocupacao_diaria <= 100 e quartos_ocupados_dia <= total_quartos;
+  - ocupacao_diaria, adr_dia, revpar_dia e trevpar_dia coerentes com quartos_ocupados_dia, receita_quartos_dia e
+    receita_total_dia, como em `gerar_dados_hotel_unico`;
+  - somas diárias: receita_quartos_dia = soma das receitas por tipo de quarto, custo_total_dia = soma das
+    despesas, lucro_operacional_bruto_dia = receita_total_dia - custo_total_dia e receita_total_dia -
+    receita_quartos_dia = soma dos outros consumos dos hóspedes do dia;
+  - por hóspede: valor_total_diarias = quartos × diárias × valor_diaria e total_pago = diárias + consumos.
+
+Funcionalidades:
+-----------------
+- colunas_de_linhas(cabecalho, linhas): converte a lista de linhas do motor escalar em dicionário de colunas.
+- estatistica_ks(valores, amostrador): estatística D de Kolmogorov-Smirnov contra a `fda` do amostrador.
+- verificar_original(colunas, aderencia, alfa) / verificar_hotel(colunas): listas de (nome, aprovado, detalhe).
+- main(): gera o dataset com os mesmos parâmetros do main.py (sempre sem outliers), executa as verificações e
+  termina com código 1 se alguma falhar.
+
+Uso:
+-----
+   python validacao.py --motor lote --registros 1000000 --semente 1
+   python validacao.py --motor lote --modo_hotel_unico --total_quartos 300 --max_clientes_por_dia 80 \\
+      --data_inicio 2020-01-01 --data_fim 2024-12-31 --semente 1
+
+Observações:
+-------------
+- Os outliers são desligados (`--outliers 0`), pois alteram as colunas de propósito.
+- A aderência só é verificada no motor em lote sem `--entidades`: no motor escalar (e nas séries), cada linha
+  evolui a partir da anterior (autocorrelação) e as colunas não seguem as distribuições marginais.
+- Com `--correlacionar`, as marginais são preservadas pela cópula e a aderência continua válida.
+- Para amostras discretas, o teste de Kolmogorov-Smirnov é conservador (rejeita menos do que o nível `alfa`).
+"""
+
+import sys
+import time
+
+import numpy as np
+from faker import Faker
+
+from categorias import ColunaCategorica
+from config import CABECALHO_HOTEL, CABECALHO_ORIGINAL
+from geradores import DISTRIBUICOES_EMPRESA
+from main import construir_parser, gerar_dataset, preparar_argumentos, validar_argumentos
+from util import definir_semente
+
+ALFA_KS = 0.001
+TOLERANCIA = 0.011  # uma unidade da segunda casa decimal, mais folga para a representação em ponto flutuante
+
+
+def colunas_de_linhas(cabecalho, linhas):
+    """
+    Converte uma lista de linhas em dicionário {coluna: numpy.ndarray} (float com NaN para colunas numéricas,
+    objetos para as demais).
+    """
+    colunas = {}
+    for nome, valores in zip(cabecalho, zip(*linhas) if linhas else [() for _ in cabecalho]):
+        objetos = np.array(valores, dtype=object)
+        try:
+            colunas[nome] = objetos.astype(np.float64)
+        except (TypeError, ValueError):
+            colunas[nome] = objetos
+    return colunas
+
+
+def _numeros(valores):
+    return np.asarray(valores, dtype=np.float64)
+
+
+def _identidade(nome, obtido, esperado, tolerancia=TOLERANCIA):
+    """
+    Verifica obtido ≈ esperado linha a linha (linhas com NaN em qualquer lado são ignoradas).
+    """
+    obtido, esperado = _numeros(obtido), _numeros(esperado)
+    validas = ~(np.isnan(obtido) | np.isnan(esperado))
+    diferenca = np.abs(obtido[validas] - esperado[validas])
+    falhas = int(np.count_nonzero(diferenca > tolerancia + 1e-9 * np.abs(esperado[validas])))
+    maior = float(diferenca.max()) if len(diferenca) else 0.0
+    return nome, falhas == 0, f"{falhas} de {len(diferenca)} linhas fora da tolerância (maior diferença {maior:.4g})"
+
+
+def _condicao(nome, mascara):
+    """
+    Verifica uma condição booleana em todas as linhas.
+    """
+    falhas = int(np.count_nonzero(~mascara))
+    return nome, falhas == 0, f"{falhas} de {len(mascara)} linhas violam a condição"
+
+
+def estatistica_ks(valores, amostrador):
+    """
+    Estatística D de Kolmogorov-Smirnov entre os valores (NaN ignorados) e a `fda` do amostrador, avaliada nos
+    valores distintos da amostra. Retorna (D, n).
+    """
+    valores = _numeros(valores)
+    valores = valores[~np.isnan(valores)]
+    distintos, contagens = np.unique(valores, return_counts=True)
+    empirica = np.cumsum(contagens) / len(valores)
+    teorica = amostrador.fda(distintos)
+    # lado esquerdo de cada degrau: P(X < x) empírica contra a teórica no valor distinto anterior
+    anterior_empirica = np.concatenate(([0.0], empirica[:-1]))
+    anterior_teorica = np.concatenate(([0.0], teorica[:-1]))
+    d = max(np.abs(empirica - teorica).max(), np.abs(anterior_empirica - anterior_teorica).max())
+    return float(d), len(valores)
+
+
+def _aderencia(nome, valores, amostrador, alfa):
+    d, n = estatistica_ks(valores, amostrador)
+    limite = np.sqrt(-np.log(alfa / 2) / 2) / np.sqrt(n)
+    return f"aderencia:{nome}", bool(d <= limite), f"D = {d:.5f} (limite {limite:.5f}, n = {n})"
+
+
+def verificar_original(colunas, aderencia=True, alfa=ALFA_KS):
+    """
+    Verifica as identidades do modo original e, com `aderencia`, as distribuições de DISTRIBUICOES_EMPRESA.
+    - colunas: dicionário de colunas (motor em lote ou `colunas_de_linhas`), sem outliers.
+    Retorna a lista de (nome, aprovado, detalhe).
+    """
+    receita, mrr = _numeros(colunas["receita"]), _numeros(colunas["MRR"])
+    resultados = [
+        _identidade("receita = numero_clientes × ticket_medio", receita,
+                    np.round(_numeros(colunas["numero_clientes"]) * _numeros(colunas["ticket_medio"]), 2)),
+        _identidade("lucro = receita - custo", colunas["lucro"], receita - _numeros(colunas["custo"])),
+        _identidade("ARR = 12 × MRR", colunas["ARR"], np.where(mrr > 0, mrr * 12, 0.0)),
+        _identidade("receita_media_diaria = receita / 30", colunas["receita_media_diaria"], receita / 30),
+    ]
+    if aderencia:
+        resultados.extend(_aderencia(nome, colunas[nome], amostrador, alfa)
+                          for nome, amostrador in DISTRIBUICOES_EMPRESA.items() if nome in colunas)
+    return resultados
+
+
+def verificar_hotel(colunas):
+    """
+    Verifica os limites e a coerência das métricas diárias e dos valores por hóspede do modo hotel único.
+    - colunas: dicionário de colunas no layout desnormalizado (CABECALHO_HOTEL), sem outliers.
+    Retorna a lista de (nome, aprovado, detalhe).
+    """
+    n = {nome: _numeros(valores) for nome, valores in colunas.items()
+         if not isinstance(valores, ColunaCategorica) and np.asarray(valores).dtype.kind in "iuf"}
+    total_quartos, ocupados = n["total_quartos"], n["quartos_ocupados_dia"]
+    receita_quartos, receita_total = n["receita_quartos_dia"], n["receita_total_dia"]
+    com_ocupacao = ocupados > 0
+    despesas = ("despesa_fixa", "despesa_variavel", "despesa_mao_obra_direta", "despesa_financeira",
+                "despesa_administrativa")
+    por_tipo = [nome for nome in n if nome.startswith("receita_quartos_") and nome != "receita_quartos_dia"]
+
+    # Soma dos outros consumos dos hóspedes de cada dia, repetida em cada linha do dia
+    _, indice_dia = np.unique(np.asarray(colunas["data"]), return_inverse=True)
+    indice_dia = indice_dia.reshape(-1)
+    consumos_dia = np.bincount(indice_dia, n["valor_outros_consumos"])[indice_dia]
+
+    return [
+        _condicao("0 <= ocupacao_diaria <= 100", (n["ocupacao_diaria"] >= 0) & (n["ocupacao_diaria"] <= 100)),
+        _condicao("quartos_ocupados_dia <= total_quartos", ocupados <= total_quartos),
+        _identidade("ocupacao_diaria = quartos_ocupados_dia / total_quartos × 100", n["ocupacao_diaria"],
+                    ocupados / total_quartos * 100),
+        _identidade("adr_dia = receita_quartos_dia / quartos_ocupados_dia", n["adr_dia"],
+                    np.where(com_ocupacao, receita_quartos / np.where(com_ocupacao, ocupados, 1), 0.0)),
+        _identidade("revpar_dia = receita_quartos_dia / total_quartos", n["revpar_dia"],
+                    receita_quartos / total_quartos),
+        _identidade("trevpar_dia = receita_total_dia / total_quartos", n["trevpar_dia"],
+                    receita_total / total_quartos),
+        _identidade("receita_quartos_dia = soma por tipo de quarto", receita_quartos,
+                    sum(n[nome] for nome in por_tipo), tolerancia=len(por_tipo) * TOLERANCIA),
+        _identidade("custo_total_dia = soma das despesas", n["custo_total_dia"],
+                    sum(n[nome] for nome in despesas), tolerancia=2 * TOLERANCIA),
+        _identidade("lucro_operacional_bruto_dia = receita_total_dia - custo_total_dia",
+                    n["lucro_operacional_bruto_dia"], receita_total - n["custo_total_dia"],
+                    tolerancia=2 * TOLERANCIA),
+        _identidade("receita_total_dia - receita_quartos_dia = outros consumos do dia", receita_total - receita_quartos,
+                    consumos_dia, tolerancia=2 * TOLERANCIA),
+        _identidade("valor_total_diarias = quartos × diárias × valor_diaria", n["valor_total_diarias"],
+                    n["quantidade_quartos"] * n["quantidade_diarias"] * n["valor_diaria"]),
+        _identidade("total_pago = valor_total_diarias + valor_outros_consumos", n["total_pago"],
+                    n["valor_total_diarias"] + n["valor_outros_consumos"]),
+    ]
+
+
+def main():
+    parser = construir_parser()
+    parser.description = ("Gera um dataset com os parâmetros do main.py (sem outliers) e valida as distribuições e "
+                          "as relações entre as colunas.")
+    parser.set_defaults(registros=1_000_000, motor="lote")
+    args = parser.parse_args()
+    preparar_argumentos(parser, args)
+    validar_argumentos(parser, args)
+    args.outliers = 0.0
+
+    fake = Faker("pt_BR")
+    definir_semente(args.semente, fake)
+    inicio = time.perf_counter()
+    cabecalho, dados = gerar_dataset(args, fake)
+    if not isinstance(dados, dict):
+        dados = colunas_de_linhas(cabecalho, dados)
+    geracao = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    if cabecalho == CABECALHO_HOTEL:
+        resultados = verificar_hotel(dados)
+    elif cabecalho == CABECALHO_ORIGINAL:
+        resultados = verificar_original(dados, aderencia=args.motor == "lote" and args.entidades is None)
+    else:
+        parser.error("A validação cobre o modo original e o modo hotel único desnormalizado.")
+    validacao = time.perf_counter() - inicio
+
+    for nome, aprovado, detalhe in resultados:
+        print(f"[{'OK' if aprovado else 'FALHA'}] {nome}: {detalhe}")
+    falhas = sum(not aprovado for _, aprovado, _ in resultados)
+    linhas = len(next(iter(dados.values())))
+    print(f"{len(resultados) - falhas}/{len(resultados)} verificações aprovadas em {linhas} linhas "
+          f"(geração: {geracao:.2f}s, validação: {validacao:.2f}s).")
+    if falhas:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()